@@ -76,6 +76,7 @@ async def list_customers(
     is_active: Optional[bool] = Query(None, description="Filtrar por estado activo"),
     ruc: Optional[str] = Query(None, description="Filtrar por RUC"),
     address_id: Optional[UUID] = Query(None, description="Filtrar por ID de dirección"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora page"),
     container: Container = Depends(get_container),
     current_user=Depends(auth_middleware["require_auth"]),
     authorization: Optional[str] = Header(None)
@@ -93,6 +94,7 @@ async def list_customers(
         is_active=is_active,
         ruc=ruc,
         address_id=address_id,
+        cursor=cursor,
         access_token=access_token
     )
     
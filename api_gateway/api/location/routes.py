@@ -1,8 +1,10 @@
 """
 Rutas de location en el API Gateway
 """
-from fastapi import APIRouter, Query, Depends, Header
+from fastapi import APIRouter, Query, Depends, Header, HTTPException
 from typing import List, Optional
+from commons.api_client import HTTPError
+from commons.counting import CountMode
 from ..middleware import auth_middleware
 from ...domain.location.dto.responses.location_responses import (
     CountryListResponse, 
@@ -18,17 +20,29 @@ router = APIRouter()
 @router.get("/countries", response_model=CountryListResponse)
 async def list_countries(
     skip: int = Query(0, ge=0, description="Número de registros a omitir"),
-    limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros")
+    limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora skip"),
+    include_total: bool = Query(True, description="Calcular el total de resultados"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated")
 ):
     """
     Listar países disponibles
     """
     use_case = ListCountriesUseCase()
-    countries = await use_case.execute(skip=skip, limit=limit)
+    try:
+        countries, total, total_mode, next_cursor = await use_case.execute(skip=skip, limit=limit, cursor=cursor, include_total=include_total, count_mode=count_mode)
+    except HTTPError as e:
+        # Cursor inválido u otro 400 del location_service
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"message": e.message, "error_code": "LOCATION_SERVICE_ERROR"}
+        )
     
     return CountryListResponse(
         countries=countries,
-        total=len(countries),
+        total=total,
+        total_mode=total_mode,
+        next_cursor=next_cursor,
         skip=skip,
         limit=limit
     )
@@ -37,17 +51,29 @@ async def list_countries(
 async def list_states(
     skip: int = Query(0, ge=0, description="Número de registros a omitir"),
     limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora skip"),
+    include_total: bool = Query(True, description="Calcular el total de resultados"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated"),
     country_id: Optional[str] = Query(None, description="ID del país para filtrar estados")
 ):
     """
     Listar estados/provincias disponibles
     """
     use_case = ListStatesUseCase()
-    states = await use_case.execute(skip=skip, limit=limit, country_id=country_id)
+    try:
+        states, total, total_mode, next_cursor = await use_case.execute(skip=skip, limit=limit, cursor=cursor, include_total=include_total, count_mode=count_mode, country_id=country_id)
+    except HTTPError as e:
+        # Cursor inválido u otro 400 del location_service
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"message": e.message, "error_code": "LOCATION_SERVICE_ERROR"}
+        )
     
     return StateListResponse(
         states=states,
-        total=len(states),
+        total=total,
+        total_mode=total_mode,
+        next_cursor=next_cursor,
         skip=skip,
         limit=limit
     )
@@ -56,17 +82,29 @@ async def list_states(
 async def list_cities(
     skip: int = Query(0, ge=0, description="Número de registros a omitir"),
     limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora skip"),
+    include_total: bool = Query(True, description="Calcular el total de resultados"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated"),
     state_id: Optional[str] = Query(None, description="ID del estado para filtrar ciudades")
 ):
     """
     Listar ciudades disponibles
     """
     use_case = ListCitiesUseCase()
-    cities = await use_case.execute(skip=skip, limit=limit, state_id=state_id)
+    try:
+        cities, total, total_mode, next_cursor = await use_case.execute(skip=skip, limit=limit, cursor=cursor, include_total=include_total, count_mode=count_mode, state_id=state_id)
+    except HTTPError as e:
+        # Cursor inválido u otro 400 del location_service
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"message": e.message, "error_code": "LOCATION_SERVICE_ERROR"}
+        )
     
     return CityListResponse(
         cities=cities,
-        total=len(cities),
+        total=total,
+        total_mode=total_mode,
+        next_cursor=next_cursor,
         skip=skip,
         limit=limit
     )
@@ -10,6 +10,9 @@ load_dotenv()
 from commons.config import config
 from commons.service_factory import create_service_factory, ServiceConfig, RouterConfig, run_service
 from commons.api_client import HTTPError
+from commons.single_flight import get_single_flight
+from commons.http_cache import ETagMiddleware, get_http_cache
+from commons.resilience import get_resilience
 from commons.error_codes import ErrorCode
 from .user.routes import router as user_router
 from .profile.routes import router as profile_router
@@ -27,6 +30,7 @@ from .ramp.ramp_routes import router as ramp_router
 from .ramp_schedule.ramp_schedule_routes import router as ramp_schedule_router
 from .notification.notification_routes import router as notification_router
 from .auth.routes import router as auth_router
+from ..application.ramp.slots_cache import get_slots_cache
 
 
 def create_api_gateway_service() -> ServiceConfig:
@@ -110,6 +114,35 @@ def create_api_gateway_app():
             content=error_response
         )
     
+    @app.get("/coalescing-metrics", tags=["Gateway"])
+    async def get_coalescing_metrics():
+        """Métricas de coalescencia de GETs idénticos hacia los servicios upstream"""
+        return get_single_flight().get_stats()
+    
+    @app.get("/resilience-metrics", tags=["Gateway"])
+    async def get_resilience_metrics():
+        """Estado de los circuit breakers, presupuesto de reintentos y hedging hacia los upstream"""
+        return get_resilience().get_stats()
+    
+    @app.get("/cache-metrics", tags=["Gateway"])
+    async def get_cache_metrics():
+        """Métricas de las cachés en proceso del gateway"""
+        return {
+            "http_cache": get_http_cache().get_stats(),
+            "slots_cache": get_slots_cache().get_stats()
+        }
+    
+    # Validadores para los clientes: 304 Not Modified si su copia sigue vigente.
+    # no-cache obliga a revalidar siempre (la caché propia del gateway evita el viaje upstream)
+    app.add_middleware(
+        ETagMiddleware,
+        path_prefixes=[
+            f"{config.API_PREFIX}{prefix}"
+            for prefix in ("/location", "/sector-types", "/measurement-units", "/branches", "/ramps")
+        ],
+        cache_control="private, no-cache"
+    )
+    
     return app
 
 
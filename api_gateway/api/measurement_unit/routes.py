@@ -3,6 +3,8 @@ Rutas de measurement units en el API Gateway
 """
 from fastapi import APIRouter, Query, Depends, Header, HTTPException, status
 from typing import List, Optional
+from commons.api_client import HTTPError
+from commons.counting import CountMode
 from ..middleware import auth_middleware
 from ...domain.measurement_unit.dto.requests.measurement_unit_requests import CreateMeasurementUnitRequest, UpdateMeasurementUnitRequest
 from ...domain.measurement_unit.dto.responses.measurement_unit_responses import (
@@ -66,6 +68,9 @@ async def get_measurement_unit(
 async def list_measurement_units(
     skip: int = Query(0, ge=0, description="Número de registros a omitir"),
     limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora skip"),
+    include_total: bool = Query(True, description="Calcular el total de resultados"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated"),
     name: Optional[str] = Query(None, description="Filtrar por nombre"),
     code: Optional[str] = Query(None, description="Filtrar por código"),
     is_active: Optional[bool] = Query(None, description="Filtrar por estado activo")
@@ -74,11 +79,20 @@ async def list_measurement_units(
     Listar unidades de medida disponibles
     """
     use_case = ListMeasurementUnitsUseCase()
-    measurement_units = await use_case.execute(skip=skip, limit=limit, name=name, code=code, is_active=is_active)
+    try:
+        measurement_units, total, total_mode, next_cursor = await use_case.execute(skip=skip, limit=limit, cursor=cursor, include_total=include_total, count_mode=count_mode, name=name, code=code, is_active=is_active)
+    except HTTPError as e:
+        # Cursor inválido u otro 400 del location_service
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"message": e.message, "error_code": "LOCATION_SERVICE_ERROR"}
+        )
     
     return MeasurementUnitListResponse(
         items=measurement_units,
-        total=len(measurement_units),
+        total=total,
+        total_mode=total_mode,
+        next_cursor=next_cursor,
         limit=limit,
         offset=skip
     )
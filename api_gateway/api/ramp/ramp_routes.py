@@ -8,13 +8,15 @@ from datetime import datetime
 from pydantic import ValidationError
 from commons.error_codes import ErrorCode
 from commons.api_client import HTTPError
+from commons.counting import CountMode
 from ...domain.ramp.dto.requests.create_ramp_request import CreateRampRequest
 from ...domain.ramp.dto.requests.update_ramp_request import UpdateRampRequest
 from ...domain.ramp.dto.requests.ramp_filter_request import RampFilterRequest
 from ...domain.ramp.dto.responses.ramp_response import RampResponse
 from ...domain.ramp.dto.responses.ramp_list_response import RampListResponse
 from ...domain.ramp.dto.requests.ramp_slots_request import RampSlotsRequest
-from ...domain.ramp.dto.responses.ramp_slots_response import RampSlotsResponse
+from ...domain.ramp.dto.requests.ramp_slots_range_request import RampSlotsRangeRequest
+from ...domain.ramp.dto.responses.ramp_slots_response import RampSlotsResponse, RampSlotsRangeResponse
 from ...application.ramp.use_cases.create_ramp_use_case import CreateRampUseCase
 from ...application.ramp.use_cases.get_ramp_use_case import GetRampUseCase
 from ...application.ramp.use_cases.list_ramps_use_case import ListRampsUseCase
@@ -132,6 +134,67 @@ async def get_ramp_slots(
         )
 
 
+@router.get("/slots/range", response_model=RampSlotsRangeResponse, status_code=status.HTTP_200_OK)
+async def get_ramp_slots_range(
+    type: str = Query(..., description="Tipo de carga (SECO, FRIO, FLV)"),
+    branch_id: int = Query(..., gt=0, description="ID de la sucursal"),
+    start_date: str = Query(..., description="Fecha inicial del rango (YYYY-MM-DD)"),
+    end_date: str = Query(..., description="Fecha final del rango, inclusive (YYYY-MM-DD)"),
+    interval_time: int = Query(..., gt=0, description="Intervalo de tiempo en minutos para cada slot"),
+    current_user=Depends(auth_middleware["require_auth"]),
+    authorization: Optional[str] = Header(None)
+):
+    """
+    Obtener slots disponibles para rampas en cada día de un rango de fechas
+    
+    Consulta rampas, horarios y reservas una sola vez para todo el rango.
+    
+    Args:
+        type: Tipo de carga (SECO, FRIO, FLV)
+        branch_id: ID de la sucursal
+        start_date: Fecha inicial en formato YYYY-MM-DD
+        end_date: Fecha final (inclusive) en formato YYYY-MM-DD
+        interval_time: Intervalo de tiempo en minutos para cada slot
+        
+    Returns:
+        RampSlotsRangeResponse con el resumen y los slots de cada día
+    """
+    try:
+        request = RampSlotsRangeRequest(
+            type=type,
+            branch_id=branch_id,
+            start_date=start_date,
+            end_date=end_date,
+            interval_time=interval_time
+        )
+        
+        logger.info(f"📅 Obteniendo slots para tipo={request.type}, branch_id={request.branch_id}, rango={request.start_date}..{request.end_date}, intervalo={request.interval_time}min")
+        
+        access_token = authorization.replace("Bearer ", "") if authorization else ""
+        
+        use_case = GetRampSlotsUseCase()
+        result = await use_case.execute_range(request, access_token)
+        return result
+    except ValidationError as e:
+        logger.warning(f"⚠️ Error de validación de Pydantic: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": str(e), "error_code": ErrorCode.VALIDATION_ERROR.value}
+        )
+    except ValueError as e:
+        logger.warning(f"⚠️ Error de validación: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": str(e), "error_code": ErrorCode.VALIDATION_ERROR.value}
+        )
+    except Exception as e:
+        logger.error(f"❌ Error inesperado obteniendo slots del rango: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"message": "Error interno del servidor", "error_code": "INTERNAL_ERROR"}
+        )
+
+
 @router.get("/{ramp_id}", response_model=RampResponse)
 async def get_ramp(
     ramp_id: int = Path(..., gt=0, description="ID de la rampa"),
@@ -178,6 +241,9 @@ async def list_ramps(
     is_available: Optional[bool] = Query(None, description="Disponibilidad de la rampa"),
     skip: int = Query(0, ge=0, description="Número de registros a omitir"),
     limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora skip"),
+    include_total: bool = Query(True, description="Calcular el total de resultados"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated"),
     sort_by: Optional[str] = Query(None, description="Campo para ordenar"),
     sort_order: Optional[str] = Query(None, description="Orden (asc/desc)"),
     current_user=Depends(auth_middleware["require_auth"]),
@@ -193,6 +259,9 @@ async def list_ramps(
             is_available=is_available,
             skip=skip,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            count_mode=count_mode,
             sort_by=sort_by,
             sort_order=sort_order
         )
@@ -7,6 +7,7 @@ from typing import Optional, List
 from pydantic import ValidationError
 from commons.error_codes import ErrorCode
 from commons.api_client import HTTPError
+from commons.counting import CountMode
 from ...domain.ramp_schedule.dto.requests.ramp_schedule_requests import (
     CreateRampScheduleRequest,
     UpdateRampScheduleRequest,
@@ -124,6 +125,9 @@ async def list_ramp_schedules(
     is_active: Optional[bool] = Query(None, description="Filtrar por estado"),
     limit: int = Query(100, ge=1, le=1000, description="Límite"),
     offset: int = Query(0, ge=0, description="Offset"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora offset"),
+    include_total: bool = Query(True, description="Calcular el total de resultados"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated"),
     current_user=Depends(auth_middleware["require_auth"]),
     authorization: Optional[str] = Header(None)
 ):
@@ -137,7 +141,10 @@ async def list_ramp_schedules(
             name=name,
             is_active=is_active,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
+            count_mode=count_mode
         )
         
         use_case = ListRampSchedulesUseCase()
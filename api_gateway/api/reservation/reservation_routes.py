@@ -2,13 +2,16 @@
 Rutas para reservas en el API Gateway
 """
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Path, Response
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Path
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from typing import Optional, List
 from datetime import datetime
 
 from pydantic import ValidationError
 from commons.error_codes import ErrorCode
 from commons.api_client import HTTPError
+from commons.counting import CountMode
 from ...domain.reservation.dto.requests.create_reservation_request import CreateReservationRequest
 from ...domain.reservation.dto.requests.update_reservation_request import UpdateReservationRequest
 from ...domain.reservation.dto.requests.reservation_filter_request import ReservationFilterRequest
@@ -273,12 +276,15 @@ async def list_reservations(
     company_name: Optional[str] = Query(None, description="Nombre de la empresa"),
     skip: int = Query(0, ge=0, description="Número de registros a omitir"),
     limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora skip"),
+    include_total: bool = Query(True, description="Calcular el total de resultados"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated"),
     sort_by: Optional[str] = Query(None, description="Campo para ordenar"),
     sort_order: Optional[str] = Query(None, description="Orden (asc/desc)"),
     current_user=Depends(auth_middleware["require_auth"]),
     authorization: Optional[str] = Header(None)
 ):
-    """Listar reservas con filtros"""
+    """Listar reservas con filtros (por skip/limit o por cursor)"""
     try:
         access_token = authorization.replace("Bearer ", "") if authorization else ""
         
@@ -305,6 +311,9 @@ async def list_reservations(
             company_name=company_name,
             skip=skip,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            count_mode=count_mode,
             sort_by=sort_by,
             sort_order=sort_order
         )
@@ -578,14 +587,15 @@ async def export_reservations_csv(
         )
         
         use_case = ExportReservationsCsvUseCase()
-        csv_bytes = await use_case.execute(request, access_token)
+        upstream = await use_case.execute(request, access_token)
         
-        return Response(
-            content=csv_bytes,
-            media_type="text/csv; charset=utf-8",
+        return StreamingResponse(
+            upstream.iter_chunks(),
+            media_type=upstream.content_type or "text/csv; charset=utf-8",
             headers={
-                "Content-Disposition": "attachment; filename=reservas.csv"
-            }
+                "Content-Disposition": upstream.content_disposition or "attachment; filename=reservas.csv"
+            },
+            background=BackgroundTask(upstream.close)
         )
     except HTTPError as e:
         logger.error(f"❌ Error HTTP exportando reservas a CSV: {str(e)}")
@@ -661,14 +671,15 @@ async def export_reservations_xlsx(
         )
         
         use_case = ExportReservationsXlsxUseCase()
-        xlsx_bytes = await use_case.execute(request, access_token)
+        upstream = await use_case.execute(request, access_token)
         
-        return Response(
-            content=xlsx_bytes,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        return StreamingResponse(
+            upstream.iter_chunks(),
+            media_type=upstream.content_type or "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={
-                "Content-Disposition": "attachment; filename=reservas.xlsx"
-            }
+                "Content-Disposition": upstream.content_disposition or "attachment; filename=reservas.xlsx"
+            },
+            background=BackgroundTask(upstream.close)
         )
     except HTTPError as e:
         logger.error(f"❌ Error HTTP exportando reservas a XLSX: {str(e)}")
@@ -12,12 +12,14 @@ from ...domain.schedule.dto.requests.schedule_requests import (
     CreateBranchScheduleRequest,
     UpdateBranchScheduleRequest,
     GetAvailableSlotsRequest,
+    GetAvailableSlotsRangeRequest,
     GetBranchSchedulesRequest,
     DayOfWeek
 )
 from ...domain.schedule.dto.responses.schedule_responses import (
     BranchScheduleResponse,
     AvailableSlotsResponse,
+    AvailableSlotsRangeResponse,
     BranchScheduleListResponse,
     CreateBranchScheduleResponse,
     UpdateBranchScheduleResponse,
@@ -31,6 +33,7 @@ from ...application.schedule.use_cases.update_branch_schedule_use_case import Up
 from ...application.schedule.use_cases.delete_branch_schedule_with_validation_use_case import DeleteBranchScheduleWithValidationUseCase
 from ...application.schedule.use_cases.list_branch_schedules_use_case import ListBranchSchedulesUseCase
 from ...application.schedule.use_cases.get_available_slots_use_case import GetAvailableSlotsUseCase
+from ...application.schedule.use_cases.get_available_slots_range_use_case import GetAvailableSlotsRangeUseCase
 from ..middleware import auth_middleware
 
 # Configurar logging
@@ -152,6 +155,67 @@ async def get_available_slots(
         )
 
 
+@router.get("/available-slots/range", response_model=AvailableSlotsRangeResponse)
+async def get_available_slots_range(
+    branch_id: int = Query(..., gt=0, description="ID de la sucursal"),
+    start_date: date = Query(..., description="Fecha inicial del rango"),
+    end_date: date = Query(..., description="Fecha final del rango (inclusive)"),
+    current_user=Depends(auth_middleware["require_auth"]),
+    authorization: Optional[str] = Header(None)
+):
+    """Obtener slots disponibles para cada día de un rango de fechas"""
+    logger.info(f"🚀 Endpoint get_available_slots_range llamado con branch_id: {branch_id}, rango: {start_date}..{end_date}")
+    
+    try:
+        access_token = authorization.replace("Bearer ", "") if authorization else ""
+        
+        request = GetAvailableSlotsRangeRequest(
+            branch_id=branch_id,
+            start_date=start_date,
+            end_date=end_date
+        )
+        
+        use_case = GetAvailableSlotsRangeUseCase()
+        result = await use_case.execute(request, access_token)
+        logger.info(f"📊 Resultado: {len(result.days)} días, {result.total_slots} slots totales, {result.available_slots} disponibles")
+        
+        return result
+    except ValidationError as e:
+        logger.warning(f"⚠️ Error de validación de Pydantic: {str(e)}")
+        error_message = str(e)
+        if "No se puede consultar disponibilidad para fechas pasadas" in error_message:
+            error_code = ErrorCode.PAST_DATE.value
+        else:
+            error_code = ErrorCode.VALIDATION_ERROR.value
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": error_message, "error_code": error_code}
+        )
+    except HTTPError as e:
+        logger.error(f"❌ Error HTTP obteniendo slots del rango: {str(e)}")
+        
+        # Intentar parsear el mensaje de error del reservation service
+        error_message = e.message
+        try:
+            import json
+            error_data = json.loads(e.message)
+            if isinstance(error_data, dict) and "message" in error_data:
+                error_message = error_data["message"]
+        except (json.JSONDecodeError, KeyError):
+            pass
+        
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"message": error_message, "error_code": "RESERVATION_SERVICE_ERROR"}
+        )
+    except Exception as e:
+        logger.error(f"❌ Error inesperado en get_available_slots_range: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"message": "Error interno del servidor", "error_code": "INTERNAL_ERROR"}
+        )
+
+
 @router.get("/branch/{branch_id}", response_model=BranchScheduleListResponse)
 async def list_branch_schedules(
     branch_id: int,
@@ -3,6 +3,8 @@ Rutas de sectores en el API Gateway
 """
 from fastapi import APIRouter, Query, Depends, Header, HTTPException, status
 from typing import List, Optional
+from commons.api_client import HTTPError
+from commons.counting import CountMode
 from ..middleware import auth_middleware
 from ...domain.sector.dto.requests.sector_requests import CreateSectorRequest, UpdateSectorRequest
 from ...domain.sector.dto.responses.sector_responses import (
@@ -66,6 +68,9 @@ async def get_sector(
 async def list_sectors(
     skip: int = Query(0, ge=0, description="Número de registros a omitir"),
     limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora skip"),
+    include_total: bool = Query(True, description="Calcular el total de resultados"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated"),
     name: Optional[str] = Query(None, description="Filtrar por nombre"),
     branch_id: Optional[int] = Query(None, description="Filtrar por sucursal"),
     sector_type_id: Optional[int] = Query(None, description="Filtrar por tipo de sector"),
@@ -78,11 +83,20 @@ async def list_sectors(
     """
     access_token = authorization.replace("Bearer ", "") if authorization else ""
     use_case = ListSectorsUseCase()
-    sectors = await use_case.execute(skip=skip, limit=limit, name=name, branch_id=branch_id, sector_type_id=sector_type_id, is_active=is_active, access_token=access_token)
+    try:
+        sectors, total, total_mode, next_cursor = await use_case.execute(skip=skip, limit=limit, cursor=cursor, include_total=include_total, count_mode=count_mode, name=name, branch_id=branch_id, sector_type_id=sector_type_id, is_active=is_active, access_token=access_token)
+    except HTTPError as e:
+        # Cursor inválido u otro 400 del location_service
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"message": e.message, "error_code": "LOCATION_SERVICE_ERROR"}
+        )
     
     return SectorListResponse(
         sectors=sectors,
-        total=len(sectors),
+        total=total,
+        total_mode=total_mode,
+        next_cursor=next_cursor,
         limit=limit,
         offset=skip
     )
@@ -3,6 +3,8 @@ Rutas de sector types en el API Gateway
 """
 from fastapi import APIRouter, Query, Depends, Header, HTTPException, status
 from typing import List, Optional
+from commons.api_client import HTTPError
+from commons.counting import CountMode
 from ..middleware import auth_middleware
 from ...domain.sector_type.dto.requests.sector_type_requests import CreateSectorTypeRequest, UpdateSectorTypeRequest
 from ...domain.sector_type.dto.responses.sector_type_responses import (
@@ -66,6 +68,9 @@ async def get_sector_type(
 async def list_sector_types(
     skip: int = Query(0, ge=0, description="Número de registros a omitir"),
     limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora skip"),
+    include_total: bool = Query(True, description="Calcular el total de resultados"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated"),
     name: Optional[str] = Query(None, description="Filtrar por nombre"),
     code: Optional[str] = Query(None, description="Filtrar por código"),
     is_active: Optional[bool] = Query(None, description="Filtrar por estado activo")
@@ -74,11 +79,20 @@ async def list_sector_types(
     Listar tipos de sector disponibles
     """
     use_case = ListSectorTypesUseCase()
-    sector_types = await use_case.execute(skip=skip, limit=limit, name=name, code=code, is_active=is_active)
+    try:
+        sector_types, total, total_mode, next_cursor = await use_case.execute(skip=skip, limit=limit, cursor=cursor, include_total=include_total, count_mode=count_mode, name=name, code=code, is_active=is_active)
+    except HTTPError as e:
+        # Cursor inválido u otro 400 del location_service
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"message": e.message, "error_code": "LOCATION_SERVICE_ERROR"}
+        )
     
     return SectorTypeListResponse(
         items=sector_types,
-        total=len(sector_types),
+        total=total,
+        total_mode=total_mode,
+        next_cursor=next_cursor,
         limit=limit,
         offset=skip
     )
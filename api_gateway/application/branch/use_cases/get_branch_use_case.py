@@ -32,7 +32,8 @@ class GetBranchUseCase:
             if access_token:
                 headers["Authorization"] = f"Bearer {access_token}"
             
-            async with APIClient(self.location_service_url, "") as client:
+            # Lectura muy concurrente en horas pico: compartir GETs idénticos en vuelo
+            async with APIClient(self.location_service_url, "", coalesce_gets=True, http_cache=True) as client:
                 response = await client.get(
                     f"{config.API_PREFIX}/branches/{branch_id}",
                     headers=headers
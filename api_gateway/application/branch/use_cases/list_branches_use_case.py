@@ -1,8 +1,8 @@
 """
 Use case para listar sucursales desde el API Gateway
 """
-from typing import List, Optional
-from commons.api_client import APIClient
+from typing import List, Optional, Tuple
+from commons.api_client import APIClient, HTTPError
 from commons.config import config
 from ....domain.branch.dto.responses.branch_responses import BranchResponse
 
@@ -12,13 +12,16 @@ class ListBranchesUseCase:
     def __init__(self):
         self.location_service_url = config.LOCATION_SERVICE_URL
 
-    async def execute(self, skip: int = 0, limit: int = 100, name: Optional[str] = None, code: Optional[str] = None, local_id: Optional[int] = None, country_id: Optional[int] = None, state_id: Optional[int] = None, city_id: Optional[int] = None, is_active: Optional[bool] = None, access_token: str = "") -> List[BranchResponse]:
+    async def execute(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, include_total: bool = True, count_mode: Optional[str] = None, name: Optional[str] = None, code: Optional[str] = None, local_id: Optional[int] = None, country_id: Optional[int] = None, state_id: Optional[int] = None, city_id: Optional[int] = None, is_active: Optional[bool] = None, access_token: str = "") -> Tuple[List[BranchResponse], Optional[int], Optional[str], Optional[str]]:
         """
         Listar sucursales desde el location_service
         
         Args:
             skip: Número de registros a omitir
             limit: Número máximo de registros
+            cursor: Cursor de la página siguiente (next_cursor); ignora skip
+            include_total: Pedir el total al location_service
+            count_mode: Modo del total (exact, cached o estimated; None = el del location_service)
             name: Filtrar por nombre
             code: Filtrar por código
             local_id: Filtrar por local
@@ -29,14 +32,18 @@ class ListBranchesUseCase:
             access_token: Token de autorización
             
         Returns:
-            List[BranchResponse]: Lista de sucursales
+            Tuple: (lista de sucursales, total o None, modo del total, cursor de la página siguiente)
         """
         try:
             print(f"🔍 DEBUG: Conectando a {self.location_service_url}")
             print(f"🔍 DEBUG: URL completa: {self.location_service_url}{config.API_PREFIX}/branches/")
             
             # Construir parámetros de filtro
-            params = {"skip": skip, "limit": limit}
+            params = {"offset": skip, "limit": limit, "include_total": str(include_total).lower()}
+            if cursor:
+                params["cursor"] = cursor
+            if count_mode:
+                params["count_mode"] = count_mode
             if name:
                 params["name"] = name
             if code:
@@ -57,7 +64,7 @@ class ListBranchesUseCase:
             if access_token:
                 headers["Authorization"] = f"Bearer {access_token}"
             
-            async with APIClient(self.location_service_url, "") as client:
+            async with APIClient(self.location_service_url, "", http_cache=True) as client:
                 response = await client.get(
                     f"{config.API_PREFIX}/branches/",
                     params=params,
@@ -68,10 +75,17 @@ class ListBranchesUseCase:
 
                 if response and "branches" in response:
                     branches = response["branches"]
-                    return [BranchResponse(**branch) for branch in branches]
+                    return [BranchResponse(**branch) for branch in branches], response.get("total"), response.get("total_mode"), response.get("next_cursor")
 
-                return []
+                return [], 0, None, None
+
+        except HTTPError as e:
+            # Cursor inválido: propagar el 400 en lugar de devolver una lista vacía
+            if e.status_code == 400:
+                raise
+            print(f"Error obteniendo sucursales: {e}")
+            return [], 0, None, None
 
         except Exception as e:
             print(f"Error obteniendo sucursales: {e}")
-            return [] 
\ No newline at end of file
+            return [], 0, None, None 
\ No newline at end of file
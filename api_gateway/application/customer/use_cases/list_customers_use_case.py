@@ -23,6 +23,7 @@ class ListCustomersUseCase:
         is_active: Optional[bool] = None,
         ruc: Optional[str] = None,
         address_id: Optional[UUID] = None,
+        cursor: Optional[str] = None,
         access_token: str = None
     ) -> CustomerListResponse:
         """Ejecutar el use case"""
@@ -30,7 +31,10 @@ class ListCustomersUseCase:
             # Crear cliente para User Service
             async with APIClient(self.user_service_url, access_token) as client:
                 # Preparar parámetros de consulta
-                params = {"page": page, "size": size}
+                # El user_service pagina con skip/limit (o con cursor, que ignora skip)
+                params = {"skip": (page - 1) * size, "limit": size}
+                if cursor:
+                    params["cursor"] = cursor
                 if username:
                     params["username"] = username
                 if company_name:
@@ -1,8 +1,8 @@
 """
 Use case para listar locales desde el API Gateway
 """
-from typing import List, Optional
-from commons.api_client import APIClient
+from typing import List, Optional, Tuple
+from commons.api_client import APIClient, HTTPError
 from commons.config import config
 from ....domain.local.dto.responses.local_responses import LocalResponse
 
@@ -12,27 +12,34 @@ class ListLocalsUseCase:
     def __init__(self):
         self.location_service_url = config.LOCATION_SERVICE_URL
 
-    async def execute(self, skip: int = 0, limit: int = 100, name: Optional[str] = None, code: Optional[str] = None, is_active: Optional[bool] = None, access_token: str = "") -> List[LocalResponse]:
+    async def execute(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, include_total: bool = True, count_mode: Optional[str] = None, name: Optional[str] = None, code: Optional[str] = None, is_active: Optional[bool] = None, access_token: str = "") -> Tuple[List[LocalResponse], Optional[int], Optional[str], Optional[str]]:
         """
         Listar locales desde el location_service
         
         Args:
             skip: Número de registros a omitir
             limit: Número máximo de registros
+            cursor: Cursor de la página siguiente (next_cursor); ignora skip
+            include_total: Pedir el total al location_service
+            count_mode: Modo del total (exact, cached o estimated; None = el del location_service)
             name: Filtrar por nombre
             code: Filtrar por código
             is_active: Filtrar por estado activo
             access_token: Token de autorización
             
         Returns:
-            List[LocalResponse]: Lista de locales
+            Tuple: (lista de locales, total o None, modo del total, cursor de la página siguiente)
         """
         try:
             print(f"🔍 DEBUG: Conectando a {self.location_service_url}")
             print(f"🔍 DEBUG: URL completa: {self.location_service_url}{config.API_PREFIX}/locals/")
             
             # Construir parámetros de filtro
-            params = {"skip": skip, "limit": limit}
+            params = {"offset": skip, "limit": limit, "include_total": str(include_total).lower()}
+            if cursor:
+                params["cursor"] = cursor
+            if count_mode:
+                params["count_mode"] = count_mode
             if name:
                 params["name"] = name
             if code:
@@ -56,10 +63,17 @@ class ListLocalsUseCase:
 
                 if response and "locals" in response:
                     locals = response["locals"]
-                    return [LocalResponse(**local) for local in locals]
+                    return [LocalResponse(**local) for local in locals], response.get("total"), response.get("total_mode"), response.get("next_cursor")
 
-                return []
+                return [], 0, None, None
+
+        except HTTPError as e:
+            # Cursor inválido: propagar el 400 en lugar de devolver una lista vacía
+            if e.status_code == 400:
+                raise
+            print(f"Error obteniendo locales: {e}")
+            return [], 0, None, None
 
         except Exception as e:
             print(f"Error obteniendo locales: {e}")
-            return [] 
\ No newline at end of file
+            return [], 0, None, None 
\ No newline at end of file
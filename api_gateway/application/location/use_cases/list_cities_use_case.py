@@ -1,8 +1,8 @@
 """
 Use case para listar ciudades desde el API Gateway
 """
-from typing import List, Optional
-from commons.api_client import APIClient
+from typing import List, Optional, Tuple
+from commons.api_client import APIClient, HTTPError
 from commons.config import config
 from ....domain.location.dto.responses.location_responses import CityResponse
 
@@ -12,24 +12,31 @@ class ListCitiesUseCase:
     def __init__(self):
         self.location_service_url = config.LOCATION_SERVICE_URL
     
-    async def execute(self, skip: int = 0, limit: int = 100, state_id: Optional[str] = None) -> List[CityResponse]:
+    async def execute(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, include_total: bool = True, count_mode: Optional[str] = None, state_id: Optional[str] = None) -> Tuple[List[CityResponse], Optional[int], Optional[str], Optional[str]]:
         """
         Listar ciudades desde el location_service
         
         Args:
             skip: Número de registros a omitir
             limit: Número máximo de registros
+            cursor: Cursor de la página siguiente (next_cursor); ignora skip
+            include_total: Pedir el total al location_service
+            count_mode: Modo del total (exact, cached o estimated; None = el del location_service)
             state_id: ID del estado para filtrar ciudades
             
         Returns:
-            List[CityResponse]: Lista de ciudades
+            Tuple: (lista de ciudades, total o None, modo del total, cursor de la página siguiente)
         """
         try:
-            params = {"skip": skip, "limit": limit}
+            params = {"skip": skip, "limit": limit, "include_total": str(include_total).lower()}
+            if cursor:
+                params["cursor"] = cursor
+            if count_mode:
+                params["count_mode"] = count_mode
             if state_id:
                 params["state_id"] = state_id
                 
-            async with APIClient(self.location_service_url, "") as client:
+            async with APIClient(self.location_service_url, "", http_cache=True) as client:
                 response = await client.get(
                     f"{config.API_PREFIX}/cities/",
                     params=params
@@ -37,11 +44,18 @@ class ListCitiesUseCase:
                 
                 if response and "cities" in response:
                     cities = response["cities"]
-                    return [CityResponse(**city) for city in cities]
+                    return [CityResponse(**city) for city in cities], response.get("total"), response.get("total_mode"), response.get("next_cursor")
                 
-                return []
+                return [], 0, None, None
                 
+        except HTTPError as e:
+            # Cursor inválido: propagar el 400 en lugar de devolver una lista vacía
+            if e.status_code == 400:
+                raise
+            print(f"Error obteniendo ciudades: {e}")
+            return [], 0, None, None
+
         except Exception as e:
             # En caso de error, retornar lista vacía
             print(f"Error obteniendo ciudades: {e}")
-            return [] 
\ No newline at end of file
+            return [], 0, None, None 
\ No newline at end of file
@@ -1,8 +1,8 @@
 """
 Use case para listar estados desde el API Gateway
 """
-from typing import List, Optional
-from commons.api_client import APIClient
+from typing import List, Optional, Tuple
+from commons.api_client import APIClient, HTTPError
 from commons.config import config
 from ....domain.location.dto.responses.location_responses import StateResponse
 
@@ -12,24 +12,31 @@ class ListStatesUseCase:
     def __init__(self):
         self.location_service_url = config.LOCATION_SERVICE_URL
     
-    async def execute(self, skip: int = 0, limit: int = 100, country_id: Optional[str] = None) -> List[StateResponse]:
+    async def execute(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, include_total: bool = True, count_mode: Optional[str] = None, country_id: Optional[str] = None) -> Tuple[List[StateResponse], Optional[int], Optional[str], Optional[str]]:
         """
         Listar estados desde el location_service
         
         Args:
             skip: Número de registros a omitir
             limit: Número máximo de registros
+            cursor: Cursor de la página siguiente (next_cursor); ignora skip
+            include_total: Pedir el total al location_service
+            count_mode: Modo del total (exact, cached o estimated; None = el del location_service)
             country_id: ID del país para filtrar estados
             
         Returns:
-            List[StateResponse]: Lista de estados
+            Tuple: (lista de estados, total o None, modo del total, cursor de la página siguiente)
         """
         try:
-            params = {"skip": skip, "limit": limit}
+            params = {"skip": skip, "limit": limit, "include_total": str(include_total).lower()}
+            if cursor:
+                params["cursor"] = cursor
+            if count_mode:
+                params["count_mode"] = count_mode
             if country_id:
                 params["country_id"] = country_id
                 
-            async with APIClient(self.location_service_url, "") as client:
+            async with APIClient(self.location_service_url, "", http_cache=True) as client:
                 response = await client.get(
                     f"{config.API_PREFIX}/states/",
                     params=params
@@ -37,11 +44,18 @@ class ListStatesUseCase:
                 
                 if response and "states" in response:
                     states = response["states"]
-                    return [StateResponse(**state) for state in states]
+                    return [StateResponse(**state) for state in states], response.get("total"), response.get("total_mode"), response.get("next_cursor")
                 
-                return []
+                return [], 0, None, None
                 
+        except HTTPError as e:
+            # Cursor inválido: propagar el 400 en lugar de devolver una lista vacía
+            if e.status_code == 400:
+                raise
+            print(f"Error obteniendo estados: {e}")
+            return [], 0, None, None
+
         except Exception as e:
             # En caso de error, retornar lista vacía
             print(f"Error obteniendo estados: {e}")
-            return [] 
\ No newline at end of file
+            return [], 0, None, None 
\ No newline at end of file
@@ -32,7 +32,7 @@ class GetMeasurementUnitUseCase:
             if access_token:
                 headers["Authorization"] = f"Bearer {access_token}"
             
-            async with APIClient(self.location_service_url, "") as client:
+            async with APIClient(self.location_service_url, "", http_cache=True) as client:
                 response = await client.get(
                     f"{config.API_PREFIX}/measurement-units/{measurement_unit_id}",
                     headers=headers
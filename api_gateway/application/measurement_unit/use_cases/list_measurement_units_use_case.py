@@ -1,8 +1,8 @@
 """
 Use case para listar unidades de medida desde el API Gateway
 """
-from typing import List, Optional
-from commons.api_client import APIClient
+from typing import List, Optional, Tuple
+from commons.api_client import APIClient, HTTPError
 from commons.config import config
 from ....domain.measurement_unit.dto.responses.measurement_unit_responses import MeasurementUnitResponse
 
@@ -12,26 +12,33 @@ class ListMeasurementUnitsUseCase:
     def __init__(self):
         self.location_service_url = config.LOCATION_SERVICE_URL
     
-    async def execute(self, skip: int = 0, limit: int = 100, name: Optional[str] = None, code: Optional[str] = None, is_active: Optional[bool] = None) -> List[MeasurementUnitResponse]:
+    async def execute(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, include_total: bool = True, count_mode: Optional[str] = None, name: Optional[str] = None, code: Optional[str] = None, is_active: Optional[bool] = None) -> Tuple[List[MeasurementUnitResponse], Optional[int], Optional[str], Optional[str]]:
         """
         Listar unidades de medida desde el location_service
         
         Args:
             skip: Número de registros a omitir
             limit: Número máximo de registros
+            cursor: Cursor de la página siguiente (next_cursor); ignora skip
+            include_total: Pedir el total al location_service
+            count_mode: Modo del total (exact, cached o estimated; None = el del location_service)
             name: Filtrar por nombre
             code: Filtrar por código
             is_active: Filtrar por estado activo
             
         Returns:
-            List[MeasurementUnitResponse]: Lista de unidades de medida
+            Tuple: (lista de unidades de medida, total o None, modo del total, cursor de la página siguiente)
         """
         try:
             print(f"🔍 DEBUG: Conectando a {self.location_service_url}")
             print(f"🔍 DEBUG: URL completa: {self.location_service_url}{config.API_PREFIX}/measurement-units/")
             
             # Construir parámetros de filtro
-            params = {"skip": skip, "limit": limit}
+            params = {"offset": skip, "limit": limit, "include_total": str(include_total).lower()}
+            if cursor:
+                params["cursor"] = cursor
+            if count_mode:
+                params["count_mode"] = count_mode
             if name:
                 params["name"] = name
             if code:
@@ -39,7 +46,7 @@ class ListMeasurementUnitsUseCase:
             if is_active is not None:
                 params["is_active"] = str(is_active).lower()  # Convertir boolean a string
             
-            async with APIClient(self.location_service_url, "") as client:
+            async with APIClient(self.location_service_url, "", http_cache=True) as client:
                 response = await client.get(
                     f"{config.API_PREFIX}/measurement-units/",
                     params=params
@@ -49,11 +56,18 @@ class ListMeasurementUnitsUseCase:
                 
                 if response and "items" in response:
                     measurement_units = response["items"]
-                    return [MeasurementUnitResponse(**unit) for unit in measurement_units]
+                    return [MeasurementUnitResponse(**unit) for unit in measurement_units], response.get("total"), response.get("total_mode"), response.get("next_cursor")
                 
-                return []
+                return [], 0, None, None
                 
+        except HTTPError as e:
+            # Cursor inválido: propagar el 400 en lugar de devolver una lista vacía
+            if e.status_code == 400:
+                raise
+            print(f"Error obteniendo unidades de medida: {e}")
+            return [], 0, None, None
+
         except Exception as e:
             # En caso de error, retornar lista vacía
             print(f"Error obteniendo unidades de medida: {e}")
-            return [] 
\ No newline at end of file
+            return [], 0, None, None 
\ No newline at end of file
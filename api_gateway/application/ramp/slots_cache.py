@@ -0,0 +1,157 @@
+"""
+Caché de slots disponibles de rampas
+Clave: (branch_id, schedule_date, type, interval_time)
+Se invalida por sucursal al crear o modificar reservas, rampas u horarios de rampas
+Las respuestas se guardan y entregan como copias: quien las recibe puede modificarlas
+
+Cada invalidación incrementa la generación de la sucursal; un cálculo que empezó
+antes de una invalidación no guarda su resultado (ya puede estar desactualizado).
+La caché y las invalidaciones son del proceso: con varias instancias del gateway,
+las escrituras hechas en otra instancia solo se reflejan al vencer SLOTS_CACHE_TTL.
+"""
+import copy
+import logging
+import os
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from commons.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Instancia global de la caché (se inicializará cuando se necesite)
+slots_cache: Optional[TTLCache] = None
+
+# Sucursal de cada rampa usada en un cálculo de slots (para invalidar por rampa)
+_ramp_branches: Dict[int, int] = {}
+
+# Generación de invalidaciones por sucursal (None = invalidaciones de todas las sucursales)
+_generations: Dict[Optional[int], int] = {}
+
+
+def get_slots_cache() -> TTLCache:
+    """Obtener la instancia global de la caché de slots"""
+    global slots_cache
+
+    if slots_cache is None:
+        slots_cache = TTLCache(
+            max_size=int(os.getenv("SLOTS_CACHE_MAX_SIZE", "1000")),
+            ttl_seconds=float(os.getenv("SLOTS_CACHE_TTL", "30"))
+        )
+    return slots_cache
+
+
+def build_slots_cache_key(branch_id: int, schedule_date: date, cargo_type: str, interval_time: int) -> tuple:
+    """Construir la clave de caché de una consulta de slots"""
+    return (branch_id, schedule_date, cargo_type, interval_time)
+
+
+def get_cached_slots(key: tuple) -> Optional[Any]:
+    """Obtener una copia de los slots cacheados (None si no hay entrada vigente)"""
+    cached = get_slots_cache().get(key)
+    return copy.deepcopy(cached) if cached is not None else None
+
+
+def get_slots_generation(branch_id: int) -> Tuple[int, int]:
+    """Generación de invalidaciones de la sucursal (leerla antes de calcular los slots)"""
+    return _generations.get(None, 0), _generations.get(branch_id, 0)
+
+
+def cache_slots(key: tuple, response: Any, generation: Optional[Tuple[int, int]] = None) -> None:
+    """
+    Guardar una copia de los slots calculados
+
+    Args:
+        key: Clave de build_slots_cache_key
+        response: Slots calculados
+        generation: get_slots_generation() leída antes del cálculo; si la sucursal
+            se invalidó mientras tanto, el resultado no se guarda
+    """
+    if generation is not None and generation != get_slots_generation(key[0]):
+        logger.info(f"⏭️ Slots de branch_id={key[0]}, fecha={key[1]} no cacheados: la sucursal se invalidó durante el cálculo")
+        return
+    get_slots_cache().set(key, copy.deepcopy(response))
+
+
+def remember_ramp_branches(ramps: Iterable[dict]) -> None:
+    """Registrar la sucursal de las rampas que participan en un cálculo de slots"""
+    for ramp in ramps:
+        _ramp_branches[ramp["id"]] = ramp["branch_id"]
+
+
+def invalidate_branch_slots(
+    branch_id: Optional[int] = None,
+    schedule_date: Optional[Union[date, datetime]] = None
+) -> None:
+    """
+    Invalidar slots cacheados
+
+    Args:
+        branch_id: Sucursal afectada (None = todas)
+        schedule_date: Fecha afectada (None = todas las fechas de la sucursal)
+    """
+    # Descartar los cálculos en curso aunque todavía no haya nada cacheado
+    _generations[branch_id] = _generations.get(branch_id, 0) + 1
+
+    if slots_cache is None:
+        return
+
+    if isinstance(schedule_date, datetime):
+        schedule_date = schedule_date.date()
+
+    removed = slots_cache.invalidate(
+        lambda key: (branch_id is None or key[0] == branch_id)
+        and (schedule_date is None or key[1] == schedule_date)
+    )
+    if removed:
+        logger.info(f"🧹 {removed} entradas de slots invalidadas (branch_id={branch_id}, fecha={schedule_date})")
+
+
+def invalidate_ramp_slots(ramp_id: Optional[int], branch_id: Optional[int] = None) -> None:
+    """
+    Invalidar los slots afectados por un cambio en una rampa o en sus horarios
+
+    Se invalida la sucursal indicada y la registrada para la rampa (si la rampa
+    cambió de sucursal, ambas). Una rampa que no participó en ningún cálculo no
+    puede estar en la caché, salvo que se desconozca la rampa: ahí se invalida todo.
+
+    Args:
+        ramp_id: Rampa modificada (None = desconocida)
+        branch_id: Sucursal de la rampa según la respuesta del location_service
+    """
+    if ramp_id is None and branch_id is None:
+        invalidate_branch_slots()
+        return
+
+    branches = {branch_id, _ramp_branches.get(ramp_id)} - {None}
+    for branch in branches:
+        invalidate_branch_slots(branch)
+
+
+def invalidate_reservation_slots(reservation, same_date: bool = True) -> None:
+    """
+    Invalidar los slots afectados por una reserva creada o modificada
+
+    Args:
+        reservation: ReservationResponse devuelta por reservation_service
+        same_date: False si la fecha pudo cambiar (se invalida toda la sucursal)
+    """
+    branch_data = getattr(reservation, "branch_data", None)
+    branch_id = getattr(branch_data, "branch_id", None)
+    schedule_date = getattr(reservation, "reservation_date", None) if same_date else None
+
+    invalidate_branch_slots(branch_id, schedule_date)
+
+
+__all__ = [
+    'slots_cache',
+    'get_slots_cache',
+    'build_slots_cache_key',
+    'get_cached_slots',
+    'get_slots_generation',
+    'cache_slots',
+    'remember_ramp_branches',
+    'invalidate_branch_slots',
+    'invalidate_ramp_slots',
+    'invalidate_reservation_slots'
+]
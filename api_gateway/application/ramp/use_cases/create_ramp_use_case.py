@@ -6,6 +6,7 @@ from commons.api_client import HTTPError, APIClient
 from commons.config import config
 from ....domain.ramp.dto.requests.create_ramp_request import CreateRampRequest
 from ....domain.ramp.dto.responses.ramp_response import RampResponse
+from ..slots_cache import invalidate_ramp_slots
 
 logger = logging.getLogger(__name__)
 
@@ -46,4 +47,9 @@ class CreateRampUseCase:
             logger.info(f"✅ Rampa creada exitosamente")
             
             # Convertir la respuesta a RampResponse
-            return RampResponse(**result) 
\ No newline at end of file
+            ramp = RampResponse(**result)
+            
+            # La rampa cambia los slots de su sucursal (y de la anterior si se movió)
+            invalidate_ramp_slots(ramp.id, ramp.branch_id)
+            
+            return ramp 
\ No newline at end of file
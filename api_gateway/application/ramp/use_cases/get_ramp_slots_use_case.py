@@ -1,18 +1,25 @@
 """
 Caso de uso para obtener slots disponibles de rampas
 """
+import asyncio
 import logging
+import os
 import random
-from datetime import time, datetime, timedelta
-from typing import List, Set, Tuple, Dict
+from datetime import date, time, datetime, timedelta
+from typing import List, Optional, Set, Tuple, Dict
 from commons.api_client import HTTPError
+from commons.slot_engine import IntervalIndex
+from ..slots_cache import build_slots_cache_key, cache_slots, get_cached_slots, get_slots_generation, remember_ramp_branches
 from ....domain.ramp.dto.requests.ramp_slots_request import RampSlotsRequest
-from ....domain.ramp.dto.responses.ramp_slots_response import RampSlotsResponse, SlotInfo
+from ....domain.ramp.dto.requests.ramp_slots_range_request import RampSlotsRangeRequest
+from ....domain.ramp.dto.responses.ramp_slots_response import RampSlotsResponse, RampSlotsRangeResponse, SlotInfo
 from ....domain.ramp.dto.requests.ramp_filter_request import RampFilterRequest
 from ....domain.ramp_schedule.dto.requests.ramp_schedule_requests import RampScheduleFilterRequest
 from ....domain.reservation.dto.requests.reservation_period_request import ReservationPeriodRequest
+from ....domain.reservation.dto.responses.reservation_period_response import ReservationPeriodResponse
 from .list_ramps_use_case import ListRampsUseCase
 from ...ramp_schedule.use_cases.list_ramp_schedules_use_case import ListRampSchedulesUseCase
+from ...ramp_schedule.use_cases.get_branch_ramp_schedules_use_case import GetBranchRampSchedulesUseCase
 from ...reservation.use_cases.get_reservations_by_period_use_case import GetReservationsByPeriodUseCase
 
 logger = logging.getLogger(__name__)
@@ -24,7 +31,10 @@ class GetRampSlotsUseCase:
     def __init__(self):
         self.list_ramps_use_case = ListRampsUseCase()
         self.list_schedules_use_case = ListRampSchedulesUseCase()
+        self.branch_schedules_use_case = GetBranchRampSchedulesUseCase()
         self.get_reservations_by_period_use_case = GetReservationsByPeriodUseCase()
+        # Máximo de consultas de horarios simultáneas contra location_service
+        self.schedule_fetch_concurrency = int(os.getenv("RAMP_SCHEDULE_FETCH_CONCURRENCY", "8"))
     
     async def execute(self, request: RampSlotsRequest, access_token: str = "") -> RampSlotsResponse:
         """
@@ -37,149 +47,179 @@ class GetRampSlotsUseCase:
         Returns:
             RampSlotsResponse con los slots disponibles
         """
-        try:
-            logger.info(f"🔍 Obteniendo slots para tipo={request.type}, branch_id={request.branch_id}, fecha={request.schedule_date}, intervalo={request.interval_time}min")
+        cache_key = build_slots_cache_key(request.branch_id, request.schedule_date, request.type, request.interval_time)
+        
+        cached_response = get_cached_slots(cache_key)
+        if cached_response is not None:
+            logger.info(f"⚡ Slots obtenidos de caché para branch_id={request.branch_id}, fecha={request.schedule_date}")
+            return cached_response
+        
+        # Leída antes del cálculo: una invalidación concurrente descarta el resultado
+        generation = get_slots_generation(request.branch_id)
+        response, reservations_checked = await self._build_slots(request, access_token)
+        
+        # No cachear resultados calculados sin poder verificar las reservas
+        if reservations_checked:
+            cache_slots(cache_key, response, generation)
+        
+        return response
+    
+    async def execute_range(self, request: RampSlotsRangeRequest, access_token: str = "") -> RampSlotsRangeResponse:
+        """
+        Ejecutar caso de uso para obtener slots disponibles de varios días
+        
+        Consulta rampas, horarios y reservas una sola vez para todo el rango y
+        calcula los slots de cada día en memoria.
+        
+        Args:
+            request: Request con tipo, branch_id, rango de fechas e interval_time
+            access_token: Token de acceso para autenticación
             
-            # 1. Obtener todas las rampas de la sucursal usando el use case
-            logger.info(f"📞 Obteniendo rampas de la sucursal {request.branch_id}")
-            ramp_filter = RampFilterRequest(
-                branch_id=request.branch_id,
-                is_available=True,
-                skip=0,
-                limit=50
+        Returns:
+            RampSlotsRangeResponse con los slots de cada día del rango
+        """
+        days = [
+            request.start_date + timedelta(days=offset)
+            for offset in range((request.end_date - request.start_date).days + 1)
+        ]
+        
+        # Leída antes del cálculo: una invalidación concurrente descarta el resultado
+        generation = get_slots_generation(request.branch_id)
+        
+        # Las reservas del rango no dependen de las rampas: se consultan en paralelo
+        reservations_task = asyncio.create_task(
+            self._get_period_reservations(
+                request.branch_id,
+                datetime.combine(request.start_date, time.min),
+                datetime.combine(request.end_date, time.min) + timedelta(days=1),
+                access_token
             )
-            ramps_response = await self.list_ramps_use_case.execute(ramp_filter, access_token)
+        )
+        
+        try:
+            logger.info(f"🔍 Obteniendo slots para tipo={request.type}, branch_id={request.branch_id}, rango={request.start_date}..{request.end_date}, intervalo={request.interval_time}min")
+            
+            # 1. Rampas de la sucursal para el tipo de carga (una sola consulta)
+            filtered_ramps = await self._get_cargo_ramps(request.branch_id, request.type, access_token)
             
-            if not ramps_response.ramps:
-                raise ValueError(f"No hay rampas disponibles en la sucursal {request.branch_id}")
+            # 2. Horarios de todas las rampas para todos los días de la semana (una sola consulta por sucursal)
+            schedules_by_ramp = await self._get_branch_schedules(request.branch_id, access_token)
+            schedules_per_ramp = [schedules_by_ramp.get(ramp["id"], []) for ramp in filtered_ramps]
             
-            # Convertir ramps a diccionarios para compatibilidad
-            ramps = [
-                {
-                    "id": ramp.id,
-                    "name": ramp.name,
-                    "branch_id": ramp.branch_id,
-                    "is_available": ramp.is_available
-                }
-                for ramp in ramps_response.ramps
-            ]
+            # 3. Reservas del rango agrupadas por día de inicio
+            reservations_response = await reservations_task
+            reservations_per_day: Dict = {}
+            if reservations_response is not None:
+                for reservation in reservations_response.reservations:
+                    reservations_per_day.setdefault(reservation.start_time.date(), []).append(reservation)
             
-            # 2. Filtrar rampas según el tipo de carga
-            filtered_ramps = self._filter_ramps_by_cargo_type(ramps, request.type)
+            # 4. Calcular los slots de cada día con los datos ya obtenidos
+            day_responses = []
+            for day in days:
+                day_of_week = day.isoweekday()
+                time_ranges_to_ramps = self._map_time_ranges_to_ramps(
+                    filtered_ramps,
+                    [
+                        [schedule for schedule in schedules if schedule.day_of_week == day_of_week]
+                        for schedules in schedules_per_ramp
+                    ]
+                )
+                day_response = self._build_day_slots(
+                    day,
+                    time_ranges_to_ramps,
+                    reservations_per_day.get(day, []) if reservations_response is not None else None,
+                    request.interval_time
+                )
+                day_responses.append(day_response)
+                
+                # Reutilizar el cálculo para las consultas de un solo día
+                if reservations_response is not None:
+                    cache_slots(
+                        build_slots_cache_key(request.branch_id, day, request.type, request.interval_time),
+                        day_response,
+                        generation
+                    )
             
-            if not filtered_ramps:
-                raise ValueError(f"No hay rampas disponibles para el tipo de carga '{request.type}' en la sucursal {request.branch_id}")
+            response = RampSlotsRangeResponse(
+                start_date=request.start_date,
+                end_date=request.end_date,
+                days=day_responses,
+                total_slots=sum(day.total_slots for day in day_responses),
+                available_slots=sum(day.available_slots for day in day_responses)
+            )
+            
+            logger.info(f"✅ Slots obtenidos para {len(days)} días: {response.total_slots} total, {response.available_slots} disponibles")
+            return response
+            
+        except ValueError as e:
+            logger.error(f"❌ Error de validación: {str(e)}")
+            raise e
+        except HTTPError as e:
+            logger.error(f"❌ Error HTTP: {str(e)}")
+            raise e
+        except Exception as e:
+            logger.error(f"❌ Error obteniendo slots del rango: {str(e)}", exc_info=True)
+            raise
+        finally:
+            if not reservations_task.done():
+                reservations_task.cancel()
+    
+    async def _build_slots(self, request: RampSlotsRequest, access_token: str = "") -> Tuple[RampSlotsResponse, bool]:
+        """
+        Calcular los slots consultando rampas, horarios y reservas
+        
+        Returns:
+            Tupla (response, reservations_checked). reservations_checked es False si
+            no se pudieron obtener las reservas del día
+        """
+        # Las reservas del día no dependen de las rampas: se consultan en paralelo.
+        # Se consulta el día entero (y no solo la ventana de los slots) para poder
+        # lanzarla antes de conocer los horarios de las rampas
+        start_datetime = datetime.combine(request.schedule_date, time.min)
+        reservations_task = asyncio.create_task(
+            self._get_period_reservations(
+                request.branch_id,
+                start_datetime,
+                start_datetime + timedelta(days=1),
+                access_token
+            )
+        )
+        
+        try:
+            logger.info(f"🔍 Obteniendo slots para tipo={request.type}, branch_id={request.branch_id}, fecha={request.schedule_date}, intervalo={request.interval_time}min")
             
-            logger.info(f"📋 Encontradas {len(filtered_ramps)} rampas para tipo '{request.type}': {[r['name'] for r in filtered_ramps]}")
+            # 1-2. Obtener las rampas de la sucursal y filtrarlas según el tipo de carga
+            filtered_ramps = await self._get_cargo_ramps(request.branch_id, request.type, access_token)
             
             # 3. Obtener horarios de cada rampa filtrada y mapear rangos a rampas
             # Obtener el día de la semana (1=Lunes, 7=Domingo)
             day_of_week = request.schedule_date.isoweekday()
             logger.info(f"📅 Día de la semana: {day_of_week}")
             
-            # Diccionario para mapear rangos de tiempo a las rampas que los tienen
-            # Clave: (start_time, end_time), Valor: lista de rampas con ese rango
-            time_ranges_to_ramps: Dict[Tuple[time, time], List[dict]] = {}
+            # Consultar los horarios de todas las rampas en paralelo (con concurrencia acotada)
+            semaphore = asyncio.Semaphore(self.schedule_fetch_concurrency)
+            schedules_per_ramp = await asyncio.gather(*[
+                self._get_ramp_schedules(ramp["id"], day_of_week, access_token, semaphore)
+                for ramp in filtered_ramps
+            ])
             
-            for ramp in filtered_ramps:
-                ramp_id = ramp["id"]
-                ramp_name = ramp["name"]
-                
-                # Obtener horarios de esta rampa usando el use case
-                schedule_filter = RampScheduleFilterRequest(
-                    ramp_id=ramp_id,
-                    day_of_week=day_of_week,
-                    is_active=True,
-                    limit=100,
-                    offset=0
-                )
-                schedules_response = await self.list_schedules_use_case.execute(schedule_filter, access_token)
-                
-                schedules = schedules_response.schedules
-                logger.info(f"📋 Rampa '{ramp_name}' (ID: {ramp_id}): {len(schedules)} horarios encontrados")
-                
-                for schedule in schedules:
-                    start_time = self._parse_time(schedule.start_time)
-                    end_time = self._parse_time(schedule.end_time)
-                    time_range = (start_time, end_time)
-                    
-                    # Agregar esta rampa a la lista de rampas disponibles en este rango
-                    if time_range not in time_ranges_to_ramps:
-                        time_ranges_to_ramps[time_range] = []
-                    time_ranges_to_ramps[time_range].append(ramp)
-                    
-                    logger.info(f"   ⏰ {schedule.name}: {start_time} - {end_time}")
+            time_ranges_to_ramps = self._map_time_ranges_to_ramps(filtered_ramps, schedules_per_ramp)
             
             if not time_ranges_to_ramps:
                 logger.warning(f"⚠️ No hay horarios configurados para las rampas en el día {day_of_week}")
-                return RampSlotsResponse(
-                    schedule_date=request.schedule_date,
-                    slots=[],
-                    total_slots=0,
-                    available_slots=0
-                )
+                return self._build_day_slots(request.schedule_date, time_ranges_to_ramps, None, request.interval_time), True
             
-            # 4. Generar slots basados en interval_time para cada rango
-            # NO combinar rangos, generar slots por separado para cada rango
-            all_slots = self._generate_slots_with_ramps(time_ranges_to_ramps, request.interval_time)
-            logger.info(f"✅ {len(all_slots)} slots generados (antes de verificar reservas)")
-            
-            # 5. Verificar contra reservas existentes y eliminar slots ocupados
-            if all_slots:
-                # Determinar el rango de tiempo para buscar reservas
-                min_start_time = min(slot.start_time for slot in all_slots)
-                max_end_time = max(slot.end_time for slot in all_slots)
-                
-                # Crear datetime completos para la búsqueda
-                start_datetime = datetime.combine(request.schedule_date, min_start_time)
-                end_datetime = datetime.combine(request.schedule_date, max_end_time)
-                
-                logger.info(f"🔍 Verificando reservas entre {start_datetime} y {end_datetime}")
-                
-                # Obtener reservas existentes con estado PENDING o CONFIRMED
-                try:
-                    reservation_request = ReservationPeriodRequest(
-                        branch_id=request.branch_id,
-                        start_time=start_datetime,
-                        end_time=end_datetime,
-                        status="PENDING"  # Solo verificar reservas confirmadas
-                    )
-                    reservations_response = await self.get_reservations_by_period_use_case.execute(
-                        reservation_request, 
-                        access_token
-                    )
-                    
-                    logger.info(f"📋 Se encontraron {reservations_response.total} reservas confirmadas en el período")
-                    
-                    # Eliminar slots que tienen conflicto con reservas
-                    all_slots = self._remove_conflicting_slots(
-                        all_slots, 
-                        reservations_response.reservations,
-                        request.schedule_date,
-                        request.interval_time
-                    )
-                    logger.info(f"✅ {len(all_slots)} slots después de eliminar conflictos")
-                    
-                except Exception as e:
-                    logger.warning(f"⚠️ Error obteniendo reservas: {str(e)}. Continuando sin verificar conflictos.")
-            
-            # 6. Eliminar slots duplicados (mismo start_time y end_time)
-            # Preservar el primero encontrado
-            slots = self._deduplicate_slots(all_slots)
-            logger.info(f"✅ {len(slots)} slots únicos después de deduplicar")
-            
-            # 7. Contar slots disponibles
-            available_count = len([s for s in slots if s.is_available])
-            
-            response = RampSlotsResponse(
-                schedule_date=request.schedule_date,
-                slots=slots,
-                total_slots=len(slots),
-                available_slots=available_count
+            # 4-7. Generar slots, descartar los ocupados por reservas y contar disponibles
+            reservations_response = await reservations_task
+            response = self._build_day_slots(
+                request.schedule_date,
+                time_ranges_to_ramps,
+                reservations_response.reservations if reservations_response is not None else None,
+                request.interval_time
             )
             
             logger.info(f"✅ Slots obtenidos: {response.total_slots} total, {response.available_slots} disponibles")
-            return response
+            return response, reservations_response is not None
             
         except ValueError as e:
             logger.error(f"❌ Error de validación: {str(e)}")
@@ -190,6 +230,206 @@ class GetRampSlotsUseCase:
         except Exception as e:
             logger.error(f"❌ Error obteniendo slots: {str(e)}", exc_info=True)
             raise
+        finally:
+            if not reservations_task.done():
+                reservations_task.cancel()
+    
+    async def _get_cargo_ramps(self, branch_id: int, cargo_type: str, access_token: str) -> List[dict]:
+        """
+        Obtener las rampas disponibles de la sucursal que admiten el tipo de carga
+        
+        Raises:
+            ValueError: Si la sucursal no tiene rampas para el tipo de carga
+        """
+        # 1. Obtener todas las rampas de la sucursal usando el use case
+        logger.info(f"📞 Obteniendo rampas de la sucursal {branch_id}")
+        ramp_filter = RampFilterRequest(
+            branch_id=branch_id,
+            is_available=True,
+            skip=0,
+            limit=50,
+            include_total=False
+        )
+        ramps_response = await self.list_ramps_use_case.execute(ramp_filter, access_token)
+        
+        if not ramps_response.ramps:
+            raise ValueError(f"No hay rampas disponibles en la sucursal {branch_id}")
+        
+        # Convertir ramps a diccionarios para compatibilidad
+        ramps = [
+            {
+                "id": ramp.id,
+                "name": ramp.name,
+                "branch_id": ramp.branch_id,
+                "is_available": ramp.is_available
+            }
+            for ramp in ramps_response.ramps
+        ]
+        
+        # 2. Filtrar rampas según el tipo de carga
+        filtered_ramps = self._filter_ramps_by_cargo_type(ramps, cargo_type)
+        
+        if not filtered_ramps:
+            raise ValueError(f"No hay rampas disponibles para el tipo de carga '{cargo_type}' en la sucursal {branch_id}")
+        
+        logger.info(f"📋 Encontradas {len(filtered_ramps)} rampas para tipo '{cargo_type}': {[r['name'] for r in filtered_ramps]}")
+        # Los cambios en estas rampas u horarios invalidan los slots de la sucursal
+        remember_ramp_branches(ramps)
+        return filtered_ramps
+    
+    def _map_time_ranges_to_ramps(
+        self,
+        ramps: List[dict],
+        schedules_per_ramp: List[List]
+    ) -> Dict[Tuple[time, time], List[dict]]:
+        """
+        Mapear cada rango horario a las rampas que lo tienen configurado
+        
+        Args:
+            ramps: Rampas filtradas
+            schedules_per_ramp: Horarios de cada rampa (paralelo a ramps)
+            
+        Returns:
+            Diccionario (start_time, end_time) -> lista de rampas con ese rango
+        """
+        time_ranges_to_ramps: Dict[Tuple[time, time], List[dict]] = {}
+        
+        # Recorrer en el orden original de las rampas para conservar el mapeo
+        for ramp, schedules in zip(ramps, schedules_per_ramp):
+            logger.info(f"📋 Rampa '{ramp['name']}' (ID: {ramp['id']}): {len(schedules)} horarios encontrados")
+            
+            for schedule in schedules:
+                start_time = self._parse_time(schedule.start_time)
+                end_time = self._parse_time(schedule.end_time)
+                time_range = (start_time, end_time)
+                
+                # Agregar esta rampa a la lista de rampas disponibles en este rango
+                if time_range not in time_ranges_to_ramps:
+                    time_ranges_to_ramps[time_range] = []
+                time_ranges_to_ramps[time_range].append(ramp)
+                
+                logger.info(f"   ⏰ {schedule.name}: {start_time} - {end_time}")
+        
+        return time_ranges_to_ramps
+    
+    def _build_day_slots(
+        self,
+        schedule_date: date,
+        time_ranges_to_ramps: Dict[Tuple[time, time], List[dict]],
+        reservations: Optional[List],
+        interval_time: int
+    ) -> RampSlotsResponse:
+        """
+        Generar los slots de un día y descartar los ocupados por reservas
+        
+        Args:
+            schedule_date: Fecha de los slots
+            time_ranges_to_ramps: Rangos horarios del día y sus rampas
+            reservations: Reservas del día (None si no se pudieron obtener)
+            interval_time: Duración de cada slot en minutos
+        """
+        if not time_ranges_to_ramps:
+            return RampSlotsResponse(
+                schedule_date=schedule_date,
+                slots=[],
+                total_slots=0,
+                available_slots=0
+            )
+        
+        # 4. Generar slots basados en interval_time para cada rango
+        # NO combinar rangos, generar slots por separado para cada rango
+        all_slots = self._generate_slots_with_ramps(time_ranges_to_ramps, interval_time)
+        logger.info(f"✅ {len(all_slots)} slots generados para {schedule_date} (antes de verificar reservas)")
+        
+        # 5. Verificar contra reservas existentes y eliminar slots ocupados
+        if all_slots and reservations is not None:
+            all_slots = self._remove_conflicting_slots(
+                all_slots,
+                reservations,
+                schedule_date,
+                interval_time
+            )
+            logger.info(f"✅ {len(all_slots)} slots después de eliminar conflictos")
+        
+        # 6. Eliminar slots duplicados (mismo start_time y end_time)
+        # Preservar el primero encontrado
+        slots = self._deduplicate_slots(all_slots)
+        logger.info(f"✅ {len(slots)} slots únicos después de deduplicar")
+        
+        # 7. Contar slots disponibles
+        available_count = len([s for s in slots if s.is_available])
+        
+        return RampSlotsResponse(
+            schedule_date=schedule_date,
+            slots=slots,
+            total_slots=len(slots),
+            available_slots=available_count
+        )
+    
+    async def _get_ramp_schedules(
+        self,
+        ramp_id: int,
+        day_of_week: Optional[int],
+        access_token: str,
+        semaphore: asyncio.Semaphore
+    ) -> List:
+        """Obtener los horarios activos de una rampa (de un día de la semana o de todos)"""
+        schedule_filter = RampScheduleFilterRequest(
+            ramp_id=ramp_id,
+            day_of_week=day_of_week,
+            is_active=True,
+            limit=100 if day_of_week is not None else 1000,
+            offset=0,
+            include_total=False
+        )
+        async with semaphore:
+            schedules_response = await self.list_schedules_use_case.execute(schedule_filter, access_token)
+        return schedules_response.schedules
+    
+    async def _get_branch_schedules(self, branch_id: int, access_token: str) -> Dict[int, List]:
+        """Obtener los horarios activos de todas las rampas de la sucursal, agrupados por rampa"""
+        branch_schedules = await self.branch_schedules_use_case.execute(
+            branch_id,
+            day_of_week=None,
+            is_active=True,
+            access_token=access_token
+        )
+        return {item.ramp_id: item.schedules for item in branch_schedules.ramps}
+    
+    async def _get_period_reservations(
+        self,
+        branch_id: int,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        access_token: str
+    ) -> Optional[ReservationPeriodResponse]:
+        """
+        Obtener las reservas de la sucursal en un período
+        
+        Returns:
+            ReservationPeriodResponse o None si no se pudieron obtener
+        """
+        logger.info(f"🔍 Verificando reservas entre {start_datetime} y {end_datetime}")
+        
+        # Obtener reservas existentes con estado PENDING
+        try:
+            reservation_request = ReservationPeriodRequest(
+                branch_id=branch_id,
+                start_time=start_datetime,
+                end_time=end_datetime,
+                status="PENDING"  # Solo verificar reservas confirmadas
+            )
+            reservations_response = await self.get_reservations_by_period_use_case.execute(
+                reservation_request, 
+                access_token
+            )
+            
+            logger.info(f"📋 Se encontraron {reservations_response.total} reservas confirmadas en el período")
+            return reservations_response
+            
+        except Exception as e:
+            logger.warning(f"⚠️ Error obteniendo reservas: {str(e)}. Continuando sin verificar conflictos.")
+            return None
     
     def _filter_ramps_by_cargo_type(self, ramps: List[dict], cargo_type: str) -> List[dict]:
         """Filtrar rampas según el tipo de carga"""
@@ -352,50 +592,36 @@ class GetRampSlotsUseCase:
         if not reservations:
             return slots
         
-        # Crear una lista de índices de slots a eliminar
-        slots_to_remove = set()
+        # Indexar las reservas una sola vez (solo la hora; la fecha es la de los slots)
+        reservation_index = IntervalIndex(
+            (
+                reservation.start_time.time() if isinstance(reservation.start_time, datetime) else reservation.start_time,
+                reservation.end_time.time() if isinstance(reservation.end_time, datetime) else reservation.end_time
+            )
+            for reservation in reservations
+        )
         
-        for reservation in reservations:
-            logger.info(f"🔍 Verificando conflictos con reserva ID: {reservation.reservation_id}")
-            logger.info(f"   📅 Reserva: {reservation.start_time} - {reservation.end_time}")
+        # Cada reserva elimina solo UNA ocurrencia de cada horario con el que se solapa:
+        # por horario se eliminan las primeras min(ocurrencias, reservas solapadas)
+        overlaps_per_time: Dict[Tuple[time, time], int] = {}
+        removed_per_time: Dict[Tuple[time, time], int] = {}
+        filtered_slots = []
+        
+        for slot in slots:
+            time_key = (slot.start_time, slot.end_time)
             
-            # Extraer solo la hora de la reserva (ignorar la fecha)
-            reservation_start_time = reservation.start_time.time() if isinstance(reservation.start_time, datetime) else reservation.start_time
-            reservation_end_time = reservation.end_time.time() if isinstance(reservation.end_time, datetime) else reservation.end_time
+            if time_key not in overlaps_per_time:
+                overlaps_per_time[time_key] = reservation_index.count_overlaps(slot.start_time, slot.end_time)
             
-            # Contador para rastrear cuántos slots se eliminaron por esta reserva (para cada combinación única)
-            removed_per_time = {}
+            if removed_per_time.get(time_key, 0) < overlaps_per_time[time_key]:
+                removed_per_time[time_key] = removed_per_time.get(time_key, 0) + 1
+                continue
             
-            # Verificar cada slot
-            for idx, slot in enumerate(slots):
-                # Si este slot ya fue marcado para eliminar, saltar
-                if idx in slots_to_remove:
-                    continue
-                
-                # Calcular el end_time del slot basado en el interval
-                slot_start_datetime = datetime.combine(schedule_date, slot.start_time)
-                slot_end_datetime = datetime.combine(schedule_date, slot.end_time)
-                
-                # Verificar si hay solapamiento entre el slot y la reserva
-                # Hay solapamiento si:
-                # - El slot empieza antes de que termine la reserva Y
-                # - El slot termina después de que empiece la reserva
-                if slot.start_time < reservation_end_time and slot.end_time > reservation_start_time:
-                    # Crear una clave única para este horario
-                    time_key = (slot.start_time, slot.end_time)
-                    
-                    # Solo eliminar el PRIMERO de cada horario único
-                    if time_key not in removed_per_time:
-                        slots_to_remove.add(idx)
-                        removed_per_time[time_key] = True
-                        logger.info(f"   ❌ Slot {slot.start_time} - {slot.end_time} (Rampa: {slot.ramp_name}) tiene conflicto y será eliminado")
-                    else:
-                        logger.debug(f"   ⏭️ Slot {slot.start_time} - {slot.end_time} (Rampa: {slot.ramp_name}) ya fue eliminado para esta reserva, manteniendo duplicado")
-        
-        # Filtrar los slots, eliminando los que están en slots_to_remove
-        filtered_slots = [slot for idx, slot in enumerate(slots) if idx not in slots_to_remove]
-        
-        logger.info(f"📊 Slots eliminados por conflictos: {len(slots_to_remove)}")
+            filtered_slots.append(slot)
+        
+        slots_to_remove = len(slots) - len(filtered_slots)
+        
+        logger.info(f"📊 Slots eliminados por conflictos: {slots_to_remove}")
         logger.info(f"📊 Slots restantes: {len(filtered_slots)}")
         
         return filtered_slots
@@ -13,7 +13,7 @@ class GetRampUseCase:
     """Caso de uso para obtener una rampa"""
     
     def __init__(self):
-        self.location_client = APIClient(base_url=config.LOCATION_SERVICE_URL)
+        self.location_client = APIClient(base_url=config.LOCATION_SERVICE_URL, http_cache=True)
     
     async def execute(self, ramp_id: int, access_token: str = "") -> RampResponse:
         """
@@ -14,7 +14,8 @@ class ListRampsUseCase:
     """Caso de uso para listar rampas"""
     
     def __init__(self):
-        self.location_client = APIClient(base_url=config.LOCATION_SERVICE_URL)
+        # Lectura muy concurrente en horas pico: compartir GETs idénticos en vuelo
+        self.location_client = APIClient(base_url=config.LOCATION_SERVICE_URL, coalesce_gets=True, http_cache=True)
     
     async def execute(self, filter_request: RampFilterRequest, access_token: str = "") -> RampListResponse:
         """
@@ -44,6 +45,11 @@ class ListRampsUseCase:
                 params["is_available"] = filter_request.is_available
             params["skip"] = filter_request.skip
             params["limit"] = filter_request.limit
+            params["include_total"] = str(filter_request.include_total).lower()
+            if filter_request.cursor is not None:
+                params["cursor"] = filter_request.cursor
+            if filter_request.count_mode is not None:
+                params["count_mode"] = filter_request.count_mode
             if filter_request.sort_by is not None:
                 params["sort_by"] = filter_request.sort_by
             if filter_request.sort_order is not None:
@@ -6,6 +6,7 @@ from commons.api_client import HTTPError, APIClient
 from commons.config import config
 from ....domain.ramp.dto.requests.update_ramp_request import UpdateRampRequest
 from ....domain.ramp.dto.responses.ramp_response import RampResponse
+from ..slots_cache import invalidate_ramp_slots
 
 logger = logging.getLogger(__name__)
 
@@ -47,4 +48,9 @@ class UpdateRampUseCase:
             logger.info(f"✅ Rampa {ramp_id} actualizada exitosamente")
             
             # Convertir la respuesta a RampResponse
-            return RampResponse(**result) 
\ No newline at end of file
+            ramp = RampResponse(**result)
+            
+            # La rampa cambia los slots de su sucursal (y de la anterior si se movió)
+            invalidate_ramp_slots(ramp.id, ramp.branch_id)
+            
+            return ramp 
\ No newline at end of file
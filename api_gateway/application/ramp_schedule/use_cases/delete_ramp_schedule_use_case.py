@@ -1,9 +1,10 @@
 """
 Caso de uso para eliminar un horario de rampa
 """
-from commons.api_client import APIClient
+from commons.api_client import APIClient, HTTPError
 from commons.config import config
 from ....domain.ramp_schedule.dto.responses.ramp_schedule_responses import RampScheduleDeletedResponse
+from ...ramp.slots_cache import invalidate_ramp_slots
 
 
 class DeleteRampScheduleUseCase:
@@ -15,13 +16,25 @@ class DeleteRampScheduleUseCase:
     async def execute(self, schedule_id: int, access_token: str = "") -> RampScheduleDeletedResponse:
         """Ejecutar el caso de uso"""
         
+        headers = {"Authorization": f"Bearer {access_token}"} if access_token else {}
+        
         # Llamar al location_service
         async with self.location_client as client:
+            # La respuesta del borrado no trae la rampa: leerla antes para invalidar su sucursal
+            try:
+                schedule = await client.get(f"{config.API_PREFIX}/ramp-schedules/{schedule_id}", headers=headers)
+                ramp_id = schedule.get("ramp_id") if schedule else None
+            except HTTPError:
+                ramp_id = None
+            
             response = await client.delete(
                 f"{config.API_PREFIX}/ramp-schedules/{schedule_id}",
-                headers={"Authorization": f"Bearer {access_token}"} if access_token else {}
+                headers=headers
             )
         
+        # Los horarios cambian los slots de la sucursal de la rampa (desconocida: todas)
+        invalidate_ramp_slots(ramp_id)
+        
         # Retornar respuesta
         return RampScheduleDeletedResponse(**response)
 
@@ -0,0 +1,42 @@
+"""
+Caso de uso para obtener los horarios de todas las rampas de una sucursal
+"""
+from typing import Optional
+from commons.api_client import APIClient
+from commons.config import config
+from ....domain.ramp_schedule.dto.responses.ramp_schedule_responses import BranchRampSchedulesResponse
+
+
+class GetBranchRampSchedulesUseCase:
+    """Caso de uso para obtener los horarios de todas las rampas de una sucursal"""
+    
+    def __init__(self):
+        # Lectura muy concurrente en horas pico: compartir GETs idénticos en vuelo
+        self.location_client = APIClient(base_url=config.LOCATION_SERVICE_URL, coalesce_gets=True)
+    
+    async def execute(
+        self,
+        branch_id: int,
+        day_of_week: Optional[int] = None,
+        is_active: Optional[bool] = None,
+        access_token: str = ""
+    ) -> BranchRampSchedulesResponse:
+        """Ejecutar el caso de uso"""
+        
+        # Preparar query parameters
+        params = {}
+        if day_of_week is not None:
+            params["day_of_week"] = day_of_week
+        if is_active is not None:
+            params["is_active"] = str(is_active).lower()
+        
+        # Llamar al location_service (una sola consulta para toda la sucursal)
+        async with self.location_client as client:
+            response = await client.get(
+                f"{config.API_PREFIX}/ramp-schedules/branch/{branch_id}",
+                params=params,
+                headers={"Authorization": f"Bearer {access_token}"} if access_token else {}
+            )
+        
+        # Retornar respuesta
+        return BranchRampSchedulesResponse(**response)
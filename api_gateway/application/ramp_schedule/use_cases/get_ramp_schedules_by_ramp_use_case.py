@@ -11,7 +11,8 @@ class GetRampSchedulesByRampUseCase:
     """Caso de uso para obtener todos los horarios de una rampa"""
     
     def __init__(self):
-        self.location_client = APIClient(base_url=config.LOCATION_SERVICE_URL)
+        # Lectura muy concurrente en horas pico: compartir GETs idénticos en vuelo
+        self.location_client = APIClient(base_url=config.LOCATION_SERVICE_URL, coalesce_gets=True)
     
     async def execute(self, ramp_id: int, access_token: str = "") -> List[RampScheduleResponse]:
         """Ejecutar el caso de uso"""
@@ -11,7 +11,8 @@ class ListRampSchedulesUseCase:
     """Caso de uso para listar horarios de rampas"""
     
     def __init__(self):
-        self.location_client = APIClient(base_url=config.LOCATION_SERVICE_URL)
+        # Lectura muy concurrente en horas pico: compartir GETs idénticos en vuelo
+        self.location_client = APIClient(base_url=config.LOCATION_SERVICE_URL, coalesce_gets=True)
     
     async def execute(self, filter_request: RampScheduleFilterRequest, access_token: str = "") -> RampScheduleListResponse:
         """Ejecutar el caso de uso"""
@@ -28,6 +29,11 @@ class ListRampSchedulesUseCase:
             params["is_active"] = filter_request.is_active
         params["limit"] = filter_request.limit
         params["offset"] = filter_request.offset
+        params["include_total"] = str(filter_request.include_total).lower()
+        if filter_request.cursor is not None:
+            params["cursor"] = filter_request.cursor
+        if filter_request.count_mode is not None:
+            params["count_mode"] = filter_request.count_mode
         
         # Llamar al location_service
         async with self.location_client as client:
@@ -5,6 +5,7 @@ from commons.api_client import APIClient
 from commons.config import config
 from ....domain.ramp_schedule.dto.requests.ramp_schedule_requests import UpdateRampScheduleRequest
 from ....domain.ramp_schedule.dto.responses.ramp_schedule_responses import RampScheduleUpdatedResponse
+from ...ramp.slots_cache import invalidate_ramp_slots
 
 
 class UpdateRampScheduleUseCase:
@@ -37,6 +38,9 @@ class UpdateRampScheduleUseCase:
                 headers={"Authorization": f"Bearer {access_token}"} if access_token else {}
             )
         
+        # Los horarios cambian los slots de la sucursal de la rampa
+        invalidate_ramp_slots(response.get("ramp_id"))
+        
         # Retornar respuesta
         return RampScheduleUpdatedResponse(**response)
 
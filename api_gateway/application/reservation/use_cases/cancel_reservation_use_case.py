@@ -5,6 +5,7 @@ from typing import Optional
 from commons.api_client import APIClient
 from commons.config import config
 from ....domain.reservation.dto.responses.reservation_response import ReservationResponse
+from ...ramp.slots_cache import invalidate_reservation_slots
 
 
 class CancelReservationUseCase:
@@ -36,7 +37,9 @@ class CancelReservationUseCase:
                 )
                 
                 if response:
-                    return ReservationResponse(**response)
+                    reservation = ReservationResponse(**response)
+                    invalidate_reservation_slots(reservation)
+                    return reservation
                 
                 raise Exception("Error cancelando reserva")
                 
@@ -6,6 +6,7 @@ from commons.api_client import APIClient
 from commons.config import config
 from ....domain.reservation.dto.requests.create_reservation_request import CreateReservationRequest
 from ....domain.reservation.dto.responses.reservation_response import ReservationResponse
+from ...ramp.slots_cache import invalidate_reservation_slots
 
 
 class CreateReservationUseCase:
@@ -39,7 +40,9 @@ class CreateReservationUseCase:
                 )
                 
                 if response:
-                    return ReservationResponse(**response)
+                    reservation = ReservationResponse(**response)
+                    invalidate_reservation_slots(reservation)
+                    return reservation
                 
                 raise Exception("Error creando reserva")
                 
@@ -3,7 +3,7 @@ Use case para exportar reservas a XLSX desde el API Gateway
 """
 import logging
 from typing import Optional
-from commons.api_client import APIClient
+from commons.api_client import APIClient, StreamedResponse
 from commons.config import config
 from ....domain.reservation.dto.requests.reservation_filter_request import ReservationFilterRequest
 
@@ -16,7 +16,7 @@ class ExportReservationsXlsxUseCase:
     def __init__(self):
         self.reservation_service_url = config.RESERVATION_SERVICE_URL
     
-    async def execute(self, request: ReservationFilterRequest, access_token: str = "") -> bytes:
+    async def execute(self, request: ReservationFilterRequest, access_token: str = "") -> StreamedResponse:
         """
         Exportar reservas a XLSX desde el reservation_service
         
@@ -25,7 +25,7 @@ class ExportReservationsXlsxUseCase:
             access_token: Token de acceso para autenticación
             
         Returns:
-            bytes: Contenido del archivo XLSX
+            StreamedResponse: Respuesta del upstream cuyo cuerpo se transmite sin almacenarlo
         """
         try:
             headers = {}
@@ -83,13 +83,13 @@ class ExportReservationsXlsxUseCase:
             if request.cargo_type:
                 params["cargo_type"] = request.cargo_type
             
+            # La sesión del pool sigue abierta al salir del context manager
             async with APIClient(self.reservation_service_url, "") as client:
-                xlsx_bytes = await client.get_bytes(
+                return await client.stream(
                     f"{config.API_PREFIX}/reservations/export/xlsx",
                     params=params,
                     headers=headers
                 )
-                return xlsx_bytes
                     
         except Exception as e:
             logger.error(f"❌ Error exportando reservas a XLSX: {str(e)}", exc_info=True)
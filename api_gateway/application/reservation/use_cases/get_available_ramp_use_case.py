@@ -72,44 +72,30 @@ class GetAvailableRampUseCase:
                 ramps = filtered_ramps
                 logger.info(f"📋 Encontradas {len(ramps)} rampas filtradas en la sucursal")
                 
-                # 2. Obtener reservas existentes en el rango de fechas desde reservation_service
-                # Convertir fechas al formato YYYY-MM-DD para el filtro del reservation_service
-                start_date_filter = start_datetime.strftime("%Y-%m-%d")
-                end_date_filter = end_datetime.strftime("%Y-%m-%d")
-                
-                logger.info(f"🔍 Verificando reservas existentes en el rango {start_date_filter} - {end_date_filter}")
-                reservations_response = await reservation_client.get(
-                    f"{config.API_PREFIX}/reservations?branch_id={request.branch_id}&reservation_date_from={start_date_filter}&reservation_date_to={end_date_filter}&reservation_status=PENDING",
+                # 2. Obtener las rampas ocupadas en el período desde reservation_service
+                # (una consulta indexada que devuelve solo los IDs de rampas)
+                logger.info(f"🔍 Verificando rampas ocupadas entre {start_datetime} y {end_datetime}")
+                busy_response = await reservation_client.get(
+                    f"{config.API_PREFIX}/reservations/busy-ramps",
+                    params={
+                        "branch_id": request.branch_id,
+                        "start_time": start_datetime.isoformat(),
+                        "end_time": end_datetime.isoformat()
+                    },
                     headers={"Authorization": f"Bearer {access_token}"} if access_token else {}
                 )
                 
-                existing_reservations = reservations_response.get("items", [])
-                logger.info(f"📋 Encontradas {len(existing_reservations)} reservas existentes")
+                busy_ramp_ids = set(busy_response.get("busy_ramp_ids", []))
+                logger.info(f"📋 Rampas ocupadas en el período: {sorted(busy_ramp_ids)}")
                 
                 # 3. Filtrar rampas que no tienen conflictos de horario
                 available_ramps = []
                 for ramp in ramps:
-                    ramp_id = ramp["id"]
-                    has_conflict = False
-                    
-                    for reservation in existing_reservations:
-                        # main_reservations es una lista, iterar sobre ella
-                        main_reservations = reservation.get("main_reservations", [])
-                        for main_reservation in main_reservations:
-                            # Verificar si alguna main_reservation usa esta rampa
-                            sector_data = main_reservation.get("sector_data", {})
-                            logger.info(f"🔍 Sector data: {sector_data}")
-                            if sector_data.get("ramp_id") == ramp_id:
-                                has_conflict = True
-                                logger.info(f"⏭️ Rampa '{ramp['name']}' (ID: {ramp_id}) tiene conflicto de horario")
-                                break
-                        
-                        if has_conflict:
-                            break
-                    
-                    if not has_conflict:
+                    if ramp["id"] in busy_ramp_ids:
+                        logger.info(f"⏭️ Rampa '{ramp['name']}' (ID: {ramp['id']}) tiene conflicto de horario")
+                    else:
                         available_ramps.append(ramp)
-                        logger.info(f"✅ Rampa '{ramp['name']}' (ID: {ramp_id}) disponible")
+                        logger.info(f"✅ Rampa '{ramp['name']}' (ID: {ramp['id']}) disponible")
                 
                 # 4. Validar que al menos una rampa esté disponible
                 if not available_ramps:
@@ -2,7 +2,7 @@
 Use case para listar reservas desde el API Gateway
 """
 from typing import List, Optional
-from commons.api_client import APIClient
+from commons.api_client import APIClient, HTTPError
 from commons.config import config
 from ....domain.reservation.dto.requests.reservation_filter_request import ReservationFilterRequest
 from ....domain.reservation.dto.responses.reservation_list_response import ReservationListResponse
@@ -36,8 +36,14 @@ class ListReservationsUseCase:
             page = (request.skip // request.limit) + 1 if request.limit > 0 else 1
             params = {
                 "page": page,
-                "limit": request.limit
+                "limit": request.limit,
+                "include_total": str(request.include_total).lower()
             }
+            # Paginación por cursor (keyset): el reservation_service ignora page
+            if request.cursor:
+                params["cursor"] = request.cursor
+            if request.count_mode:
+                params["count_mode"] = request.count_mode
             
             # Filtros por usuario/cliente
             if request.user_id:
@@ -104,9 +110,11 @@ class ListReservationsUseCase:
                     reservations = [ReservationResponse(**reservation) for reservation in response["items"]]
                     return ReservationListResponse(
                         reservations=reservations,
-                        total=response.get("total", len(reservations)),
+                        total=response.get("total", len(reservations) if request.include_total else None),
+                        total_mode=response.get("total_mode"),
                         skip=request.skip,
-                        limit=request.limit
+                        limit=request.limit,
+                        next_cursor=response.get("next_cursor")
                     )
                 
                 return ReservationListResponse(
@@ -116,6 +124,16 @@ class ListReservationsUseCase:
                     limit=request.limit
                 )
                 
+        except HTTPError as e:
+            # Cursor inválido u otro error del cliente: propagarlo en lugar de una lista vacía
+            if e.status_code == 400:
+                raise
+            return ReservationListResponse(
+                reservations=[],
+                total=0,
+                skip=request.skip,
+                limit=request.limit
+            )
         except Exception as e:
             return ReservationListResponse(
                 reservations=[],
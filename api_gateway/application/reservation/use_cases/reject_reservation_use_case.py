@@ -8,6 +8,7 @@ from commons.api_client import HTTPError, APIClient
 from commons.config import config
 from ....domain.reservation.dto.requests.reject_reservation_request import RejectReservationRequest
 from ....domain.reservation.dto.responses.reservation_response import ReservationResponse
+from ...ramp.slots_cache import invalidate_reservation_slots
 
 logger = logging.getLogger(__name__)
 
@@ -54,4 +55,6 @@ class RejectReservationUseCase:
             logger.info(f"✅ Reserva {reservation_id} rechazada exitosamente")
             
             # Convertir la respuesta a ReservationResponse
-            return ReservationResponse(**result) 
\ No newline at end of file
+            reservation = ReservationResponse(**result)
+            invalidate_reservation_slots(reservation)
+            return reservation 
\ No newline at end of file
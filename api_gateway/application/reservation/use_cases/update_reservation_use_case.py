@@ -6,6 +6,7 @@ from commons.api_client import APIClient
 from commons.config import config
 from ....domain.reservation.dto.requests.update_reservation_request import UpdateReservationRequest
 from ....domain.reservation.dto.responses.reservation_response import ReservationResponse
+from ...ramp.slots_cache import invalidate_reservation_slots
 
 
 class UpdateReservationUseCase:
@@ -40,7 +41,10 @@ class UpdateReservationUseCase:
                 )
                 
                 if response:
-                    return ReservationResponse(**response)
+                    reservation = ReservationResponse(**response)
+                    # La fecha pudo cambiar: invalidar todos los slots de la sucursal
+                    invalidate_reservation_slots(reservation, same_date=False)
+                    return reservation
                 
                 raise Exception("Error actualizando reserva")
                 
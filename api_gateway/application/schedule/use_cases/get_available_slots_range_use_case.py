@@ -0,0 +1,72 @@
+"""
+Use case para obtener slots disponibles de un rango de fechas desde el API Gateway
+"""
+import logging
+from datetime import datetime
+from commons.api_client import APIClient
+from commons.config import config
+from ....domain.schedule.dto.requests.schedule_requests import GetAvailableSlotsRangeRequest
+from ....domain.schedule.dto.responses.schedule_responses import (
+    AvailableSlotsRangeResponse,
+    AvailableSlotsResponse,
+    AvailableSlotResponse
+)
+
+logger = logging.getLogger(__name__)
+
+
+class GetAvailableSlotsRangeUseCase:
+    """Use case para obtener slots disponibles de varios días usando reservation_service"""
+    
+    def __init__(self):
+        self.reservation_service_url = config.RESERVATION_SERVICE_URL
+    
+    async def execute(self, request: GetAvailableSlotsRangeRequest, access_token: str = "") -> AvailableSlotsRangeResponse:
+        """
+        Obtener slots disponibles de un rango desde el reservation_service (una sola llamada)
+        
+        Args:
+            request: DTO con la sucursal y el rango de fechas
+            access_token: Token de acceso para autenticación
+            
+        Returns:
+            AvailableSlotsRangeResponse: Resumen y slots de cada día
+        """
+        headers = {}
+        if access_token:
+            headers["Authorization"] = f"Bearer {access_token}"
+        
+        params = {
+            "branch_id": request.branch_id,
+            "start_date": request.start_date.isoformat(),
+            "end_date": request.end_date.isoformat()
+        }
+        
+        async with APIClient(self.reservation_service_url, "") as client:
+            response = await client.get(
+                f"{config.API_PREFIX}/schedules/available-slots/range",
+                params=params,
+                headers=headers
+            )
+        
+        days = []
+        for day in (response or {}).get("days", []):
+            slots = [AvailableSlotResponse(**slot) for slot in day.get("slots", [])]
+            days.append(AvailableSlotsResponse(
+                branch_id=day.get("branch_id", request.branch_id),
+                schedule_date=datetime.fromisoformat(day["date"]).date(),
+                slots=slots,
+                total_slots=day.get("total_slots", len(slots)),
+                available_slots=day.get("available_slots", len([s for s in slots if s.is_available]))
+            ))
+        
+        logger.info(f"✅ Slots obtenidos para {len(days)} días de la sucursal {request.branch_id}")
+        
+        return AvailableSlotsRangeResponse(
+            branch_id=request.branch_id,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            days=days,
+            total_slots=sum(day.total_slots for day in days),
+            available_slots=sum(day.available_slots for day in days)
+        )
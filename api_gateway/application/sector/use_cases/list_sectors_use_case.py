@@ -1,8 +1,8 @@
 """
 Use case para listar sectores desde el API Gateway
 """
-from typing import List, Optional
-from commons.api_client import APIClient
+from typing import List, Optional, Tuple
+from commons.api_client import APIClient, HTTPError
 from commons.config import config
 from ....domain.sector.dto.responses.sector_responses import SectorResponse
 
@@ -12,13 +12,16 @@ class ListSectorsUseCase:
     def __init__(self):
         self.location_service_url = config.LOCATION_SERVICE_URL
 
-    async def execute(self, skip: int = 0, limit: int = 100, name: Optional[str] = None, branch_id: Optional[int] = None, sector_type_id: Optional[int] = None, is_active: Optional[bool] = None, access_token: str = "") -> List[SectorResponse]:
+    async def execute(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, include_total: bool = True, count_mode: Optional[str] = None, name: Optional[str] = None, branch_id: Optional[int] = None, sector_type_id: Optional[int] = None, is_active: Optional[bool] = None, access_token: str = "") -> Tuple[List[SectorResponse], Optional[int], Optional[str], Optional[str]]:
         """
         Listar sectores desde el location_service
         
         Args:
             skip: Número de registros a omitir
             limit: Número máximo de registros
+            cursor: Cursor de la página siguiente (next_cursor); ignora skip
+            include_total: Pedir el total al location_service
+            count_mode: Modo del total (exact, cached o estimated; None = el del location_service)
             name: Filtrar por nombre
             branch_id: Filtrar por sucursal
             sector_type_id: Filtrar por tipo de sector
@@ -26,14 +29,18 @@ class ListSectorsUseCase:
             access_token: Token de autorización
             
         Returns:
-            List[SectorResponse]: Lista de sectores
+            Tuple: (lista de sectores, total o None, modo del total, cursor de la página siguiente)
         """
         try:
             print(f"🔍 DEBUG: Conectando a {self.location_service_url}")
             print(f"🔍 DEBUG: URL completa: {self.location_service_url}{config.API_PREFIX}/sectors/")
             
             # Construir parámetros de filtro
-            params = {"skip": skip, "limit": limit}
+            params = {"offset": skip, "limit": limit, "include_total": str(include_total).lower()}
+            if cursor:
+                params["cursor"] = cursor
+            if count_mode:
+                params["count_mode"] = count_mode
             if name:
                 params["name"] = name
             if branch_id:
@@ -59,10 +66,17 @@ class ListSectorsUseCase:
 
                 if response and "sectors" in response:
                     sectors = response["sectors"]
-                    return [SectorResponse(**sector) for sector in sectors]
+                    return [SectorResponse(**sector) for sector in sectors], response.get("total"), response.get("total_mode"), response.get("next_cursor")
 
-                return []
+                return [], 0, None, None
+
+        except HTTPError as e:
+            # Cursor inválido: propagar el 400 en lugar de devolver una lista vacía
+            if e.status_code == 400:
+                raise
+            print(f"Error obteniendo sectores: {e}")
+            return [], 0, None, None
 
         except Exception as e:
             print(f"Error obteniendo sectores: {e}")
-            return []
+            return [], 0, None, None
@@ -32,7 +32,7 @@ class GetSectorTypeUseCase:
             if access_token:
                 headers["Authorization"] = f"Bearer {access_token}"
             
-            async with APIClient(self.location_service_url, "") as client:
+            async with APIClient(self.location_service_url, "", http_cache=True) as client:
                 response = await client.get(
                     f"{config.API_PREFIX}/sector-types/{sector_type_id}",
                     headers=headers
@@ -50,9 +50,11 @@ class BranchResponse(BaseModel):
 class BranchListResponse(BaseModel):
     """Response para lista de sucursales"""
     branches: List[BranchResponse] = Field(..., description="Lista de sucursales")
-    total: int = Field(..., description="Total de sucursales")
+    total: Optional[int] = Field(None, description="Total de sucursales (None si include_total=false)")
+    total_mode: Optional[str] = Field(None, description="Modo que produjo el total: exact, cached o estimated")
     limit: int = Field(..., description="Límite de resultados")
     offset: int = Field(..., description="Offset para paginación")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)")
 
 
 class BranchCreatedResponse(BaseModel):
@@ -27,6 +27,7 @@ class CustomerListResponse(BaseModel):
     total: int = Field(..., description="Total de customers")
     skip: int = Field(..., description="Número de elementos omitidos")
     limit: int = Field(..., description="Límite de elementos por página")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)")
 
 
 class CustomerUpdatedResponse(BaseModel):
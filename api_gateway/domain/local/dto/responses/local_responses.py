@@ -25,9 +25,11 @@ class LocalResponse(BaseModel):
 class LocalListResponse(BaseModel):
     """Response para lista de locales"""
     locals: List[LocalResponse] = Field(..., description="Lista de locales")
-    total: int = Field(..., description="Total de locales")
+    total: Optional[int] = Field(None, description="Total de locales (None si include_total=false)")
+    total_mode: Optional[str] = Field(None, description="Modo que produjo el total: exact, cached o estimated")
     limit: int = Field(..., description="Límite de resultados")
     offset: int = Field(..., description="Offset para paginación")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)")
 
 
 class LocalCreatedResponse(BaseModel):
@@ -37,23 +37,29 @@ class CityResponse(BaseModel):
 class CountryListResponse(BaseModel):
     """DTO para respuesta de lista de países"""
     countries: List[CountryResponse]
-    total: int
+    total: Optional[int] = None
+    total_mode: Optional[str] = None
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
 
 class StateListResponse(BaseModel):
     """DTO para respuesta de lista de estados"""
     states: List[StateResponse]
-    total: int
+    total: Optional[int] = None
+    total_mode: Optional[str] = None
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
 
 class CityListResponse(BaseModel):
     """DTO para respuesta de lista de ciudades"""
     cities: List[CityResponse]
-    total: int
+    total: Optional[int] = None
+    total_mode: Optional[str] = None
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
 
 class MeasurementUnitResponse(BaseModel):
     """Response para una unidad de medida"""
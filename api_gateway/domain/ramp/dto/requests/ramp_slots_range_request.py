@@ -0,0 +1,66 @@
+"""
+Request DTO para obtener slots disponibles de rampas en un rango de fechas
+"""
+import os
+from pydantic import BaseModel, Field, field_validator, model_validator
+from datetime import date
+
+
+class RampSlotsRangeRequest(BaseModel):
+    """Request para obtener slots disponibles de rampas entre dos fechas"""
+    
+    type: str = Field(..., description="Tipo de carga (SECO, FRIO, FLV)")
+    branch_id: int = Field(..., gt=0, description="ID de la sucursal")
+    start_date: date = Field(..., description="Fecha inicial del rango (YYYY-MM-DD)")
+    end_date: date = Field(..., description="Fecha final del rango, inclusive (YYYY-MM-DD)")
+    interval_time: int = Field(..., gt=0, description="Intervalo de tiempo en minutos para cada slot")
+    
+    @field_validator("type")
+    @classmethod
+    def validate_type(cls, v: str) -> str:
+        """Validar que el tipo de carga sea válido"""
+        valid_types = ["SECO", "FRIO", "FLV"]
+        if v.upper() not in valid_types:
+            raise ValueError(f"Tipo de carga debe ser uno de: {', '.join(valid_types)}")
+        return v.upper()
+    
+    @field_validator("start_date")
+    @classmethod
+    def validate_start_date(cls, v: date) -> date:
+        """Validar que la fecha inicial no sea en el pasado"""
+        if v < date.today():
+            raise ValueError("La fecha no puede ser en el pasado")
+        return v
+    
+    @field_validator("interval_time")
+    @classmethod
+    def validate_interval_time(cls, v: int) -> int:
+        """Validar que el intervalo de tiempo sea razonable"""
+        if v < 15:
+            raise ValueError("El intervalo de tiempo debe ser al menos 15 minutos")
+        if v > 480:
+            raise ValueError("El intervalo de tiempo no puede ser mayor a 480 minutos (8 horas)")
+        return v
+    
+    @model_validator(mode="after")
+    def validate_range(self) -> "RampSlotsRangeRequest":
+        """Validar que el rango sea coherente y no exceda el máximo de días"""
+        if self.end_date < self.start_date:
+            raise ValueError("La fecha final debe ser igual o posterior a la fecha inicial")
+        
+        max_days = int(os.getenv("SLOTS_RANGE_MAX_DAYS", "31"))
+        if (self.end_date - self.start_date).days + 1 > max_days:
+            raise ValueError(f"El rango no puede exceder {max_days} días")
+        return self
+    
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "type": "SECO",
+                "branch_id": 1,
+                "start_date": "2025-11-10",
+                "end_date": "2025-11-23",
+                "interval_time": 60
+            }
+        }
+    }
@@ -2,7 +2,7 @@
 Response DTO para lista de rampas en API Gateway
 """
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 from .ramp_response import RampResponse
 
 
@@ -10,9 +10,11 @@ class RampListResponse(BaseModel):
     """Response para lista de rampas"""
     
     ramps: List[RampResponse] = Field(..., description="Lista de rampas")
-    total: int = Field(..., description="Total de registros")
+    total: Optional[int] = Field(None, description="Total de registros (None si include_total=false)")
+    total_mode: Optional[str] = Field(None, description="Modo que produjo el total: exact, cached o estimated")
     skip: int = Field(..., description="Número de registros omitidos")
     limit: int = Field(..., description="Número máximo de registros")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)")
     
     class Config:
         json_schema_extra = {
@@ -62,3 +62,46 @@ class RampSlotsResponse(BaseModel):
         }
     }
 
+
+
+class RampSlotsRangeResponse(BaseModel):
+    """Response con los slots disponibles de rampas para cada día de un rango"""
+    
+    start_date: date = Field(..., description="Fecha inicial del rango")
+    end_date: date = Field(..., description="Fecha final del rango (inclusive)")
+    days: List[RampSlotsResponse] = Field(..., description="Resumen y detalle de slots por día")
+    total_slots: int = Field(..., description="Total de slots en el rango")
+    available_slots: int = Field(..., description="Slots disponibles en el rango")
+    
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "start_date": "2025-11-10",
+                "end_date": "2025-11-11",
+                "days": [
+                    {
+                        "schedule_date": "2025-11-10",
+                        "slots": [
+                            {
+                                "start_time": "08:00:00",
+                                "end_time": "10:00:00",
+                                "is_available": True,
+                                "ramp_id": 1,
+                                "ramp_name": "Rampa 1"
+                            }
+                        ],
+                        "total_slots": 1,
+                        "available_slots": 1
+                    },
+                    {
+                        "schedule_date": "2025-11-11",
+                        "slots": [],
+                        "total_slots": 0,
+                        "available_slots": 0
+                    }
+                ],
+                "total_slots": 1,
+                "available_slots": 1
+            }
+        }
+    }
@@ -4,6 +4,7 @@ DTO de request para filtros de reserva en el API Gateway
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
+from commons.counting import CountMode
 
 
 class ReservationFilterRequest(BaseModel):
@@ -43,6 +44,9 @@ class ReservationFilterRequest(BaseModel):
     # Paginación
     skip: int = Field(default=0, ge=0, description="Número de registros a omitir")
     limit: int = Field(default=100, ge=1, le=1000, description="Número máximo de registros")
+    cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (ignora skip)")
+    include_total: bool = Field(default=True, description="Calcular el total de resultados")
+    count_mode: Optional[CountMode] = Field(None, description="Modo del total: exact, cached o estimated (None = el del servicio)")
     
     # Ordenamiento
     sort_by: Optional[str] = Field(None, description="Campo para ordenar")
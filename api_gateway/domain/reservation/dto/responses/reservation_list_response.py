@@ -2,13 +2,15 @@
 DTO de response para lista de reservas en el API Gateway
 """
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 from .reservation_response import ReservationResponse
 
 
 class ReservationListResponse(BaseModel):
     """DTO para lista de reservas"""
     reservations: List[ReservationResponse] = Field(..., description="Lista de reservas")
-    total: int = Field(..., description="Total de reservas")
+    total: Optional[int] = Field(None, description="Total de reservas (None si include_total=false)")
+    total_mode: Optional[str] = Field(None, description="Modo que produjo el total: exact, cached o estimated")
     skip: int = Field(..., description="Número de elementos omitidos")
-    limit: int = Field(..., description="Límite de elementos por página") 
\ No newline at end of file
+    limit: int = Field(..., description="Límite de elementos por página")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)") 
\ No newline at end of file
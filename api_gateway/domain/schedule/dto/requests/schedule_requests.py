@@ -14,6 +14,7 @@ Campos principales:
 - is_active: Estado activo del horario
 - schedule_date: Fecha para consultar disponibilidad
 """
+import os
 from pydantic import BaseModel, Field, validator
 from typing import Optional
 from datetime import time, date
@@ -94,6 +95,33 @@ class GetAvailableSlotsRequest(BaseModel):
         return v
 
 
+class GetAvailableSlotsRangeRequest(BaseModel):
+    """Solicitud para obtener slots disponibles de un rango de fechas"""
+    branch_id: int = Field(..., gt=0, description="ID de la sucursal")
+    start_date: date = Field(..., description="Fecha inicial del rango")
+    end_date: date = Field(..., description="Fecha final del rango (inclusive)")
+    
+    @validator('start_date')
+    def validate_date_not_past(cls, v):
+        """Validar que la fecha inicial no sea en el pasado"""
+        if v < date.today():
+            raise ValueError("No se puede consultar disponibilidad para fechas pasadas")
+        return v
+    
+    @validator('end_date')
+    def validate_range(cls, v, values):
+        """Validar que el rango sea coherente y no exceda el máximo de días"""
+        start_date = values.get('start_date')
+        if start_date is None:
+            return v
+        if v < start_date:
+            raise ValueError("La fecha final debe ser igual o posterior a la fecha inicial")
+        max_days = int(os.getenv("SLOTS_RANGE_MAX_DAYS", "31"))
+        if (v - start_date).days + 1 > max_days:
+            raise ValueError(f"El rango no puede exceder {max_days} días")
+        return v
+
+
 class GetBranchSchedulesRequest(BaseModel):
     """Solicitud para obtener horarios de una sucursal"""
     branch_id: int = Field(..., gt=0, description="ID de la sucursal")
@@ -48,6 +48,16 @@ class AvailableSlotsResponse(BaseModel):
     available_slots: int = Field(..., description="Slots disponibles")
 
 
+class AvailableSlotsRangeResponse(BaseModel):
+    """DTO para respuesta de slots disponibles de un rango de fechas"""
+    branch_id: int = Field(..., description="ID de la sucursal")
+    start_date: date = Field(..., description="Fecha inicial del rango")
+    end_date: date = Field(..., description="Fecha final del rango (inclusive)")
+    days: List[AvailableSlotsResponse] = Field(..., description="Resumen y slots de cada día")
+    total_slots: int = Field(..., description="Total de slots en el rango")
+    available_slots: int = Field(..., description="Slots disponibles en el rango")
+
+
 class BranchScheduleListResponse(BaseModel):
     """DTO para respuesta de lista de horarios de sucursal"""
     branch_id: int = Field(..., description="ID de la sucursal")
@@ -24,9 +24,11 @@ class SectorTypeResponse(BaseModel):
 class SectorTypeListResponse(BaseModel):
     """DTO para lista de tipos de sector"""
     items: List[SectorTypeResponse] = Field(..., description="Lista de tipos de sector")
-    total: int = Field(..., description="Total de tipos de sector")
+    total: Optional[int] = Field(None, description="Total de tipos de sector (None si include_total=false)")
+    total_mode: Optional[str] = Field(None, description="Modo que produjo el total: exact, cached o estimated")
     limit: int = Field(..., description="Límite de resultados")
     offset: int = Field(..., description="Offset para paginación")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)")
 
 
 class SectorTypeCreatedResponse(BaseModel):
@@ -45,6 +45,9 @@ async def lifespan(app: FastAPI):
     logging.info(f"🌐 API Version: {settings['api_version']}")
     yield
     logging.info("🛑 Cerrando Auth Service...")
+    # Importación tardía: el contenedor inicializa Firebase
+    from ..infrastructure.container import container
+    container.async_auth_provider().shutdown()
 
 
 def create_app() -> FastAPI:
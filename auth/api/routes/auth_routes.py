@@ -25,7 +25,7 @@ async def register_user(request: CreateUserRequest):
     """
     try:
         # Crear usuario en Firebase
-        auth_provider = container.auth_provider()
+        async_auth_provider = container.async_auth_provider()
         registration = UserRegistration(
             email=request.email,
             password=request.password,
@@ -34,7 +34,7 @@ async def register_user(request: CreateUserRequest):
             two_factor_enabled=request.two_factor_enabled,
             send_email_verification=request.send_email_verification
         )
-        user = auth_provider.create_user(registration)
+        user = await async_auth_provider.create_user(registration)
         
         # Convertir AuthenticatedUser a UserInfoResponse
         return UserInfoResponse(
@@ -84,7 +84,7 @@ async def update_user(user_id: str, request: UpdateUserRequest):
     """
     try:
         update_use_case = container.update_user_use_case()
-        user = update_use_case.execute(user_id, request)
+        user = await container.async_auth_provider().run(update_use_case.execute, user_id, request)
         return user
     except UserNotFoundException:
         raise_not_found_error(
@@ -122,7 +122,7 @@ async def delete_user(user_id: str):
     """
     try:
         delete_use_case = container.delete_user_use_case()
-        success = delete_use_case.execute(user_id)
+        success = await container.async_auth_provider().run(delete_use_case.execute, user_id)
         return {
             "success": success,
             "message": f"Usuario '{user_id}' eliminado correctamente"
@@ -156,7 +156,7 @@ async def validate_token_header(authorization: Optional[str] = Header(None)):
     
     try:
         validate_use_case = container.validate_token_use_case()
-        user = validate_use_case.execute(token)
+        user = await container.async_auth_provider().run(validate_use_case.execute, token)
         return {
             "valid": True,
             "message": "Token válido",
@@ -195,8 +195,8 @@ async def validate_token_quick(authorization: Optional[str] = Header(None)):
     
     try:
         # Usar validación rápida directamente
-        auth_provider = container.auth_provider()
-        is_valid = auth_provider.validate_token_quick(token)
+        async_auth_provider = container.async_auth_provider()
+        is_valid = await async_auth_provider.validate_token_quick(token)
         
         if is_valid:
             return {
@@ -232,7 +232,7 @@ async def get_user_info(authorization: Optional[str] = Header(None)):
     
     try:
         validate_use_case = container.validate_token_use_case()
-        user = validate_use_case.execute(token)
+        user = await container.async_auth_provider().run(validate_use_case.execute, token)
         return UserInfoResponse(
             user_id=user.user_id,
             email=user.email,
@@ -261,7 +261,7 @@ async def change_password(request: ChangePasswordRequest):
         logger.info(f"🔄 Solicitud de cambio de contraseña para: {request.email}")
         
         change_password_use_case = container.change_password_use_case()
-        result = change_password_use_case.execute(request)
+        result = await container.async_auth_provider().run(change_password_use_case.execute, request)
         
         return result
         
@@ -301,7 +301,7 @@ async def change_password_by_user_id(request: ChangePasswordByUserIdRequest):
         logger.info(f"🔄 Solicitud de cambio de contraseña para user_id: {request.user_id}")
         
         change_password_use_case = container.change_password_by_user_id_use_case()
-        result = change_password_use_case.execute(request)
+        result = await container.async_auth_provider().run(change_password_use_case.execute, request)
         
         return result
         
@@ -328,4 +328,12 @@ async def change_password_by_user_id(request: ChangePasswordByUserIdRequest):
         raise_internal_error(
             message=f"Error interno del servidor: {str(e)}",
             error_code=ErrorCode.INTERNAL_SERVER_ERROR.value
-        ) 
\ No newline at end of file
+        )
+
+
+@router.get("/executor-metrics")
+async def get_executor_metrics():
+    """
+    Métricas del pool de hilos de Firebase (profundidad de cola y latencias)
+    """
+    return container.async_auth_provider().get_metrics()
@@ -5,6 +5,7 @@ from dependency_injector import containers, providers
 
 from ..domain.interfaces import IAuthProvider, ITokenValidator, IUserClaimsManager
 from ..infrastructure.firebase.auth_provider import FirebaseAuthProvider
+from ..infrastructure.firebase.async_auth_provider import AsyncFirebaseAuthProvider
 from ..infrastructure.firebase.token_validator import FirebaseTokenValidator
 from ..infrastructure.firebase.claims_manager import FirebaseUserClaimsManager
 
@@ -50,6 +51,12 @@ class AuthServiceContainer(containers.DeclarativeContainer):
         auth_provider=auth_provider
     )
     
+    # Fachada asíncrona: ejecuta firebase_admin fuera del event loop
+    async_auth_provider = providers.Singleton(
+        AsyncFirebaseAuthProvider,
+        auth_provider=auth_provider
+    )
+    
     # Casos de uso
     create_user_use_case = providers.Factory(
         CreateUserUseCase,
@@ -0,0 +1,162 @@
+"""Fachada asíncrona para FirebaseAuthProvider
+
+firebase_admin es síncrono (I/O de red bloqueante). Esta fachada ejecuta las
+llamadas en un pool de hilos dedicado para no bloquear el event loop y expone
+métricas de profundidad de cola y latencia.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from auth.domain.models import UserRegistration, AuthenticatedUser, CustomClaims
+from .auth_provider import FirebaseAuthProvider
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFirebaseAuthProvider:
+    """Ejecuta las operaciones de Firebase en un pool de hilos dimensionado"""
+
+    def __init__(self, auth_provider: FirebaseAuthProvider, max_workers: Optional[int] = None):
+        """
+        Args:
+            auth_provider: Proveedor síncrono de Firebase
+            max_workers: Tamaño del pool (opcional, usa FIREBASE_EXECUTOR_WORKERS)
+        """
+        self._provider = auth_provider
+        self.max_workers = max_workers or int(os.getenv("FIREBASE_EXECUTOR_WORKERS", "16"))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="firebase"
+        )
+
+        # Métricas (se actualizan desde hilos del pool y desde el event loop)
+        self._metrics_lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._queue_wait_ms = deque(maxlen=1000)
+        self._latency_ms = deque(maxlen=1000)
+
+        logger.info(f"🔧 Pool de Firebase configurado con {self.max_workers} hilos")
+
+    def _instrumented(self, func: Callable, submitted_at: float) -> Any:
+        """Ejecutar func dentro del pool registrando espera en cola y latencia"""
+        started_at = time.perf_counter()
+        with self._metrics_lock:
+            self._queued -= 1
+            self._in_flight += 1
+            self._queue_wait_ms.append((started_at - submitted_at) * 1000)
+
+        failed = False
+        try:
+            return func()
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - started_at) * 1000
+            with self._metrics_lock:
+                self._in_flight -= 1
+                self._latency_ms.append(elapsed_ms)
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Ejecutar una función bloqueante en el pool de Firebase
+
+        Útil para casos de uso síncronos que llaman al proveedor internamente.
+        """
+        with self._metrics_lock:
+            self._queued += 1
+
+        loop = asyncio.get_running_loop()
+        call = partial(func, *args, **kwargs)
+        return await loop.run_in_executor(
+            self._executor,
+            self._instrumented,
+            call,
+            time.perf_counter()
+        )
+
+    # Operaciones del proveedor
+
+    async def create_user(self, registration: UserRegistration) -> AuthenticatedUser:
+        return await self.run(self._provider.create_user, registration)
+
+    async def verify_token(self, token: str) -> AuthenticatedUser:
+        return await self.run(self._provider.verify_token, token)
+
+    async def validate_token_quick(self, token: str) -> bool:
+        return await self.run(self._provider.validate_token_quick, token)
+
+    async def revoke_token(self, token: str) -> None:
+        return await self.run(self._provider.revoke_token, token)
+
+    async def get_user_by_id(self, user_id: str) -> Optional[AuthenticatedUser]:
+        return await self.run(self._provider.get_user_by_id, user_id)
+
+    async def get_user_by_email(self, email: str) -> Optional[AuthenticatedUser]:
+        return await self.run(self._provider.get_user_by_email, email)
+
+    async def update_user_claims(self, user_id: str, claims: CustomClaims) -> None:
+        return await self.run(self._provider.update_user_claims, user_id, claims)
+
+    async def update_user(self, user_id: str, user_data) -> AuthenticatedUser:
+        return await self.run(self._provider.update_user, user_id, user_data)
+
+    async def delete_user(self, user_id: str) -> bool:
+        return await self.run(self._provider.delete_user, user_id)
+
+    async def change_password(self, user_id: str, new_password: str) -> bool:
+        return await self.run(self._provider.change_password, user_id, new_password)
+
+    # Métricas y ciclo de vida
+
+    @staticmethod
+    def _percentile(values, percentile: float) -> float:
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        index = min(int(round(percentile * (len(ordered) - 1))), len(ordered) - 1)
+        return round(ordered[index], 2)
+
+    def get_metrics(self) -> dict:
+        """Obtener métricas del pool (cola, hilos ocupados y latencias en ms)"""
+        with self._metrics_lock:
+            latency = list(self._latency_ms)
+            queue_wait = list(self._queue_wait_ms)
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self._queued,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "failed": self._failed,
+                "latency_ms": {
+                    "p50": self._percentile(latency, 0.50),
+                    "p95": self._percentile(latency, 0.95),
+                    "p99": self._percentile(latency, 0.99),
+                    "max": round(max(latency), 2) if latency else 0.0
+                },
+                "queue_wait_ms": {
+                    "p50": self._percentile(queue_wait, 0.50),
+                    "p95": self._percentile(queue_wait, 0.95),
+                    "max": round(max(queue_wait), 2) if queue_wait else 0.0
+                }
+            }
+
+    def shutdown(self) -> None:
+        """Cerrar el pool de hilos"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("🛑 Pool de Firebase cerrado")
@@ -0,0 +1,94 @@
+"""
+Benchmark del motor de slots: comparación por pares vs IntervalIndex
+Reproduce el escenario de disponibilidad de rampas (slots de 30 minutos por
+rampa y día contra las reservas del período) y verifica que ambos métodos
+dan el mismo resultado
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/slot_engine_benchmark.py [--days 28] [--ramps 10] [--reservations 5000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+# Agregar el directorio raíz al path para poder importar commons
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from commons.slot_engine import count_overlaps
+
+SLOT_MINUTES = 30
+DAY_START_HOUR = 6
+DAY_END_HOUR = 22
+
+
+def build_slots(days: int, ramps: int, start: datetime):
+    """Slots [inicio, fin) de todas las rampas en el período"""
+    slots = []
+    for day in range(days):
+        day_start = start + timedelta(days=day, hours=DAY_START_HOUR)
+        slots_per_day = (DAY_END_HOUR - DAY_START_HOUR) * 60 // SLOT_MINUTES
+        for _ in range(ramps):
+            for index in range(slots_per_day):
+                slot_start = day_start + timedelta(minutes=index * SLOT_MINUTES)
+                slots.append((slot_start, slot_start + timedelta(minutes=SLOT_MINUTES)))
+    return slots
+
+
+def build_reservations(count: int, days: int, start: datetime, rng: random.Random):
+    """Reservas aleatorias de 15 a 120 minutos dentro del horario del período"""
+    reservations = []
+    window_minutes = (DAY_END_HOUR - DAY_START_HOUR) * 60
+    for _ in range(count):
+        day_start = start + timedelta(days=rng.randrange(days), hours=DAY_START_HOUR)
+        begin = day_start + timedelta(minutes=rng.randrange(0, window_minutes, 15))
+        reservations.append((begin, begin + timedelta(minutes=rng.choice((15, 30, 45, 60, 90, 120)))))
+    return reservations
+
+
+def pairwise_count_overlaps(slots, busy):
+    """Implementación anterior: cada slot contra cada reserva"""
+    return [
+        sum(1 for busy_start, busy_end in busy if slot_start < busy_end and busy_start < slot_end)
+        for slot_start, slot_end in slots
+    ]
+
+
+def measure(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de solapamientos slot/reserva")
+    parser.add_argument("--days", type=int, default=28, help="Días del período")
+    parser.add_argument("--ramps", type=int, default=10, help="Rampas de la sucursal")
+    parser.add_argument("--reservations", type=int, default=5000, help="Reservas del período")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla aleatoria")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    start = datetime(2030, 1, 1)
+    slots = build_slots(args.days, args.ramps, start)
+    reservations = build_reservations(args.reservations, args.days, start, rng)
+
+    print(f"📊 {len(slots)} slots contra {len(reservations)} reservas")
+
+    indexed, indexed_seconds = measure(count_overlaps, slots, reservations)
+    print(f"⚡ IntervalIndex: {indexed_seconds * 1000:.1f} ms")
+
+    pairwise, pairwise_seconds = measure(pairwise_count_overlaps, slots, reservations)
+    print(f"🐢 Por pares:     {pairwise_seconds * 1000:.1f} ms")
+
+    if indexed != pairwise:
+        print("❌ Los resultados no coinciden")
+        sys.exit(1)
+
+    print(f"✅ Resultados idénticos; aceleración x{pairwise_seconds / indexed_seconds:.0f}")
+
+
+if __name__ == "__main__":
+    main()
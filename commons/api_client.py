@@ -3,29 +3,77 @@ Utilidad para hacer solicitudes HTTP a las APIs
 """
 import aiohttp
 import asyncio
+import copy
+import hashlib
 import json
-from typing import Dict, Any, Optional
+import os
+import random
+import time
+from typing import AsyncIterator, Dict, Any, Optional, Tuple
 from urllib.parse import urljoin, urlencode
 
+from .http_cache import get_http_cache
+from .http_pool import get_http_pool
+from .resilience import get_resilience
+from .single_flight import get_single_flight
+from .internal_identity import INTERNAL_IDENTITY_HEADER, build_identity_header
+
+# Estados upstream que justifican reintentar (la solicitud no llegó a procesarse)
+RETRYABLE_STATUSES = {502, 503, 504}
+
 
 class APIClient:
     """Cliente para hacer solicitudes HTTP a las APIs"""
     
-    def __init__(self, base_url: str, access_token: Optional[str] = None, timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str,
+        access_token: Optional[str] = None,
+        timeout: int = 30,
+        use_pool: bool = True,
+        coalesce_gets: Optional[bool] = None,
+        http_cache: bool = False,
+        hedge_gets: Optional[bool] = None
+    ):
         self.base_url = base_url.rstrip('/')
         self.access_token = access_token
         self.timeout = timeout
+        self.use_pool = use_pool
+        # Compartir GETs idénticos en vuelo (opcional; por defecto según HTTP_COALESCE_GETS)
+        if coalesce_gets is None:
+            coalesce_gets = os.getenv("HTTP_COALESCE_GETS", "false").lower() == "true"
+        self.coalesce_gets = coalesce_gets
+        # Cachear GETs según Cache-Control/ETag del upstream (datos de referencia)
+        self.http_cache = http_cache
+        # Reintentos con backoff exponencial y jitter para métodos seguros; PUT/DELETE
+        # solo se reintentan si el endpoint es idempotente y el llamador lo indica (retry=True)
+        self.max_retries = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+        self.retry_backoff = float(os.getenv("HTTP_RETRY_BACKOFF", "0.1"))
+        self.retry_backoff_max = float(os.getenv("HTTP_RETRY_BACKOFF_MAX", "2"))
+        self.retry_methods = {
+            m.strip().upper() for m in os.getenv("HTTP_RETRY_METHODS", "GET,HEAD,OPTIONS").split(",") if m.strip()
+        }
+        # Hedging: lanzar un segundo GET si el primero supera el percentil de latencia del upstream
+        if hedge_gets is None:
+            hedge_gets = os.getenv("HTTP_HEDGE_GETS", "false").lower() == "true"
+        self.hedge_gets = hedge_gets
+        self.hedge_percentile = float(os.getenv("HTTP_HEDGE_PERCENTILE", "0.95"))
+        self.client_timeout = aiohttp.ClientTimeout(total=timeout)
         self.session: Optional[aiohttp.ClientSession] = None
     
     async def __aenter__(self):
         """Context manager entry"""
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        if self.use_pool:
+            # Reutilizar la sesión compartida del proceso (keep-alive entre solicitudes)
+            self.session = get_http_pool().get_session(self.base_url)
+        else:
+            self.session = aiohttp.ClientSession(timeout=self.client_timeout)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
-        if self.session:
+        # Las sesiones del pool se cierran en el shutdown del servicio
+        if self.session and not self.use_pool:
             await self.session.close()
     
     def _get_headers(self, additional_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
@@ -41,24 +89,19 @@ class APIClient:
         if additional_headers:
             headers.update(additional_headers)
         
+        # Adjuntar la identidad firmada del request en curso (validada una sola vez en el gateway)
+        authorization = headers.get('Authorization', '')
+        if authorization.startswith('Bearer ') and INTERNAL_IDENTITY_HEADER not in headers:
+            identity_header = build_identity_header(authorization[len('Bearer '):])
+            if identity_header:
+                headers[INTERNAL_IDENTITY_HEADER] = identity_header
+        
         return headers
     
-    async def _make_request(
-        self, 
-        method: str, 
-        endpoint: str, 
-        data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None,
-        additional_headers: Optional[Dict[str, str]] = None
-    ) -> Dict[str, Any]:
-        """Realizar solicitud HTTP"""
-        if not self.session:
-            raise RuntimeError("APIClient debe usarse como context manager")
-        
-        # Construir URL con parámetros codificados correctamente
+    def _build_url(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Construir la URL con los parámetros de query codificados"""
         url = urljoin(self.base_url, endpoint)
         
-        # Codificar parámetros de query si existen
         if params:
             # Filtrar parámetros None y convertir a string
             filtered_params = {}
@@ -82,20 +125,128 @@ class APIClient:
                 # Usar urlencode para codificar correctamente los parámetros
                 # Preservar la 'T' en fechas ISO usando safe='T'
                 encoded_params = urlencode(filtered_params, doseq=True, safe='T')
-                # Agregar parámetros a la URL
                 separator = '&' if '?' in url else '?'
                 url = f"{url}{separator}{encoded_params}"
         
+        return url
+    
+    async def _make_request(
+        self, 
+        method: str, 
+        endpoint: str, 
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        additional_headers: Optional[Dict[str, str]] = None,
+        retry: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """Realizar solicitud HTTP"""
+        _, body, _ = await self._send_request(method, endpoint, data, params, additional_headers, retry)
+        return body
+    
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        additional_headers: Optional[Dict[str, str]] = None,
+        retry: Optional[bool] = None
+    ) -> Tuple[int, Dict[str, Any], Any]:
+        """
+        Realizar solicitud HTTP y retornar (status, cuerpo parseado, headers de respuesta)
+        
+        Pasa por el circuit breaker del upstream y reintenta ante errores de conexión,
+        timeouts y 502/503/504 mientras quede presupuesto de reintentos.
+        self.timeout es el plazo total de la llamada, reintentos incluidos.
+        
+        Args:
+            retry: Forzar (True) o impedir (False) los reintentos de esta llamada;
+                None = según HTTP_RETRY_METHODS
+        """
+        if not self.session:
+            raise RuntimeError("APIClient debe usarse como context manager")
+        
+        # Construir URL con parámetros codificados correctamente
+        url = self._build_url(endpoint, params)
+        
         headers = self._get_headers(additional_headers)
         
+        registry = get_resilience()
+        breaker = registry.get_breaker(self.base_url)
+        if retry is None:
+            retry = method in self.retry_methods
+        max_attempts = 1 + (self.max_retries if retry else 0)
+        deadline = time.monotonic() + self.timeout
+        registry.retry_budget.record_request()
+        
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                print(f"⛔ Circuito abierto para {self.base_url}")
+                raise CircuitOpenError(f"Circuito abierto para {self.base_url}: {url}")
+            
+            try:
+                if method == 'GET' and self.hedge_gets:
+                    result = await self._hedged_attempt(url, headers, deadline)
+                else:
+                    result = await self._attempt(method, url, data, headers, deadline)
+            except HTTPError as e:
+                # Un 4xx indica que el upstream responde con normalidad
+                if e.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                if e.status_code not in RETRYABLE_STATUSES:
+                    raise
+                error = e
+            except ConnectionError as e:
+                breaker.record_failure()
+                error = e
+            except BaseException:
+                # Cancelación u otro error local: liberar el sondeo sin juzgar al upstream
+                breaker.release()
+                raise
+            else:
+                breaker.record_success()
+                return result
+            
+            attempt += 1
+            # Backoff exponencial con jitter completo
+            delay = random.uniform(0, min(self.retry_backoff_max, self.retry_backoff * (2 ** (attempt - 1))))
+            if (
+                attempt >= max_attempts
+                or time.monotonic() + delay >= deadline
+                or not registry.retry_budget.try_spend()
+            ):
+                raise error
+            
+            print(f"🔁 Reintentando {method} {url} (intento {attempt + 1}/{max_attempts}): {error}")
+            await asyncio.sleep(delay)
+    
+    async def _attempt(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        deadline: float
+    ) -> Tuple[int, Dict[str, Any], Any]:
+        """Un intento de solicitud HTTP limitado al plazo restante"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise ConnectionError(f"Plazo agotado para {url}")
+        
+        started_at = time.monotonic()
         try:
             async with self.session.request(
                 method=method,
                 url=url,
                 json=data,
-                headers=headers
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=min(remaining, self.timeout))
             ) as response:
                 response_text = await response.text()
+                get_resilience().get_latency(self.base_url).record(time.monotonic() - started_at)
                 
                 if response.status >= 400:
                     print(f"❌ Error HTTP {response.status}: {response_text}")
@@ -106,26 +257,131 @@ class APIClient:
                     )
                 
                 # Manejar diferentes tipos de respuesta
-                if response.status == 204:  # No Content
-                    return {}
+                if response.status in (204, 304):  # No Content / Not Modified
+                    return response.status, {}, response.headers
                 
                 if response_text:
                     # Intentar parsear como JSON
                     try:
-                        return json.loads(response_text)
+                        return response.status, json.loads(response_text), response.headers
                     except json.JSONDecodeError:
                         # Si no es JSON, devolver como texto
-                        return {"content": response_text, "content_type": "text"}
+                        return response.status, {"content": response_text, "content_type": "text"}, response.headers
                 
-                return {}
+                return response.status, {}, response.headers
                 
         except aiohttp.ClientError as e:
             print(f"❌ Error de conexión: {e}")
             raise ConnectionError(f"Error de conexión a {url}: {e}")
+        except asyncio.TimeoutError:
+            print(f"⏱️ Timeout llamando a {url}")
+            raise ConnectionError(f"Timeout llamando a {url}")
+    
+    async def _hedged_attempt(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        deadline: float
+    ) -> Tuple[int, Dict[str, Any], Any]:
+        """
+        GET con hedging: si el primer intento supera el percentil de latencia del
+        upstream se lanza un segundo y se usa la primera respuesta exitosa
+        """
+        registry = get_resilience()
+        hedge_delay = registry.get_latency(self.base_url).percentile(self.hedge_percentile)
+        
+        primary = asyncio.ensure_future(self._attempt('GET', url, None, headers, deadline))
+        if hedge_delay is None or hedge_delay >= deadline - time.monotonic():
+            return await primary
+        
+        done, _ = await asyncio.wait({primary}, timeout=hedge_delay)
+        if done or not registry.retry_budget.try_spend():
+            return await primary
+        
+        registry.hedges += 1
+        hedge = asyncio.ensure_future(self._attempt('GET', url, None, headers, deadline))
+        pending = {primary, hedge}
+        first_error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            registry.hedge_wins += 1
+                        return task.result()
+                    if first_error is None or task is primary:
+                        first_error = task.exception()
+            raise first_error
+        finally:
+            for task in pending:
+                task.cancel()
     
     async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        """Realizar solicitud GET"""
-        return await self._make_request('GET', endpoint, params=params, additional_headers=headers)
+        """
+        Realizar solicitud GET
+        
+        Con http_cache se reutilizan respuestas según Cache-Control/ETag del upstream y
+        con coalesce_gets se comparte la solicitud con GETs idénticos en vuelo.
+        """
+        if self.http_cache:
+            fetch = lambda: self._cached_get(endpoint, params, headers)
+        else:
+            fetch = lambda: self._make_request('GET', endpoint, params=params, additional_headers=headers)
+        
+        # Solo con sesiones del pool: una sesión propia se cierra al salir el solicitante original
+        if not (self.coalesce_gets and self.use_pool):
+            return await fetch()
+        
+        return await get_single_flight().do(self._request_key(endpoint, params, headers), fetch)
+    
+    async def _cached_get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """GET que sirve desde la caché mientras está vigente y luego revalida con If-None-Match"""
+        cache = get_http_cache()
+        key = self._request_key(endpoint, params, headers)
+        entry = cache.get(key)
+        
+        if entry is not None and entry.is_fresh():
+            cache.fresh_hits += 1
+            return copy.deepcopy(entry.data)
+        
+        request_headers = dict(headers or {})
+        if entry is not None and entry.etag:
+            request_headers['If-None-Match'] = entry.etag
+        
+        status, body, response_headers = await self._send_request(
+            'GET', endpoint, params=params, additional_headers=request_headers
+        )
+        
+        if status == 304 and entry is not None:
+            # Sin cambios: renovar la vigencia con los headers del 304
+            cache.revalidated += 1
+            cache.store(key, entry.data, response_headers, etag=entry.etag)
+            return copy.deepcopy(entry.data)
+        
+        cache.misses += 1
+        cache.store(key, body, response_headers)
+        return body
+    
+    def _request_key(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> tuple:
+        """Clave de la solicitud: URL completa y alcance de autenticación (huella de los headers)"""
+        request_headers = self._get_headers(headers)
+        # La identidad interna se firma por solicitud: no forma parte de la clave
+        request_headers.pop(INTERNAL_IDENTITY_HEADER, None)
+        auth_scope = hashlib.sha256(
+            json.dumps(sorted(request_headers.items())).encode("utf-8")
+        ).hexdigest()
+        return ('GET', self._build_url(endpoint, params), auth_scope)
     
     async def get_bytes(self, endpoint: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> bytes:
         """Realizar solicitud GET y retornar bytes (para archivos binarios)"""
@@ -133,28 +389,7 @@ class APIClient:
             raise RuntimeError("APIClient debe usarse como context manager")
         
         # Construir URL con parámetros codificados correctamente
-        url = urljoin(self.base_url, endpoint)
-        
-        # Codificar parámetros de query si existen
-        if params:
-            # Filtrar parámetros None y convertir a string
-            filtered_params = {}
-            for k, v in params.items():
-                if v is not None:
-                    # Manejar diferentes tipos de datos
-                    if isinstance(v, (list, tuple)):
-                        filtered_params[k] = v
-                    elif isinstance(v, bool):
-                        filtered_params[k] = str(v).lower()
-                    elif isinstance(v, (int, float)):
-                        filtered_params[k] = str(v)
-                    else:
-                        filtered_params[k] = str(v)
-            
-            if filtered_params:
-                encoded_params = urlencode(filtered_params, doseq=True, safe='T')
-                separator = '&' if '?' in url else '?'
-                url = f"{url}{separator}{encoded_params}"
+        url = self._build_url(endpoint, params)
         
         request_headers = self._get_headers(headers)
         
@@ -162,7 +397,8 @@ class APIClient:
             async with self.session.request(
                 method='GET',
                 url=url,
-                headers=request_headers
+                headers=request_headers,
+                timeout=self.client_timeout
             ) as response:
                 if response.status >= 400:
                     error_text = await response.text()
@@ -180,21 +416,83 @@ class APIClient:
             print(f"❌ Error de conexión: {e}")
             raise ConnectionError(f"Error de conexión a {url}: {e}")
     
+    async def stream(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = 64 * 1024
+    ) -> 'StreamedResponse':
+        """
+        Realizar solicitud GET sin leer el cuerpo (para descargas grandes)
+        
+        El cuerpo se consume con StreamedResponse.iter_chunks(). Con use_pool=True
+        la respuesta puede consumirse después de salir del context manager.
+        
+        Args:
+            endpoint: Endpoint a consultar
+            params: Parámetros de query
+            headers: Headers adicionales
+            chunk_size: Tamaño máximo de cada bloque en bytes
+            
+        Returns:
+            StreamedResponse: Respuesta abierta con los headers del upstream
+        """
+        if not self.session:
+            raise RuntimeError("APIClient debe usarse como context manager")
+        
+        url = self._build_url(endpoint, params)
+        request_headers = self._get_headers(headers)
+        # Sin límite total: una descarga larga no debe cortarse mientras sigan llegando datos
+        stream_timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout)
+        
+        try:
+            response = await self.session.request(
+                method='GET',
+                url=url,
+                headers=request_headers,
+                timeout=stream_timeout
+            )
+        except aiohttp.ClientError as e:
+            print(f"❌ Error de conexión: {e}")
+            raise ConnectionError(f"Error de conexión a {url}: {e}")
+        
+        if response.status >= 400:
+            try:
+                error_text = await response.text()
+            finally:
+                response.release()
+            print(f"❌ Error HTTP {response.status}: {error_text}")
+            raise HTTPError(
+                status_code=response.status,
+                message=error_text,
+                url=url
+            )
+        
+        return StreamedResponse(response, url, chunk_size)
+    
     async def post(self, endpoint: str, data: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Realizar solicitud POST"""
         return await self._make_request('POST', endpoint, data=data, additional_headers=headers)
     
-    async def put(self, endpoint: str, data: Dict[str, Any], params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        """Realizar solicitud PUT"""
-        return await self._make_request('PUT', endpoint, data=data, params=params, additional_headers=headers)
+    async def put(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """Realizar solicitud PUT (retry=True solo si el endpoint es idempotente)"""
+        return await self._make_request('PUT', endpoint, data=data, params=params, additional_headers=headers, retry=retry)
     
     async def patch(self, endpoint: str, data: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Realizar solicitud PATCH"""
         return await self._make_request('PATCH', endpoint, data=data, additional_headers=headers)
     
-    async def delete(self, endpoint: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        """Realizar solicitud DELETE"""
-        return await self._make_request('DELETE', endpoint, additional_headers=headers)
+    async def delete(self, endpoint: str, headers: Optional[Dict[str, str]] = None, retry: Optional[bool] = None) -> Dict[str, Any]:
+        """Realizar solicitud DELETE (retry=True solo si el endpoint es idempotente)"""
+        return await self._make_request('DELETE', endpoint, additional_headers=headers, retry=retry)
     
     async def head(self, endpoint: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Realizar solicitud HEAD"""
@@ -205,6 +503,42 @@ class APIClient:
         return await self._make_request('OPTIONS', endpoint, params=params, additional_headers=headers)
 
 
+class StreamedResponse:
+    """Respuesta HTTP abierta cuyo cuerpo se lee por bloques"""
+    
+    def __init__(self, response: aiohttp.ClientResponse, url: str, chunk_size: int):
+        self._response = response
+        self.url = url
+        self.chunk_size = chunk_size
+        self.status_code = response.status
+        self.headers = response.headers
+    
+    @property
+    def content_type(self) -> Optional[str]:
+        """Content-Type del upstream"""
+        return self.headers.get('Content-Type')
+    
+    @property
+    def content_disposition(self) -> Optional[str]:
+        """Content-Disposition del upstream"""
+        return self.headers.get('Content-Disposition')
+    
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        """Iterar el cuerpo por bloques liberando la conexión al terminar"""
+        try:
+            async for chunk in self._response.content.iter_chunked(self.chunk_size):
+                yield chunk
+        except aiohttp.ClientError as e:
+            print(f"❌ Error de conexión: {e}")
+            raise ConnectionError(f"Error de conexión a {self.url}: {e}")
+        finally:
+            self._response.release()
+    
+    async def close(self) -> None:
+        """Cerrar la conexión (si el consumidor abandona la lectura)"""
+        self._response.close()
+
+
 class HTTPError(Exception):
     """Excepción para errores HTTP"""
     
@@ -220,7 +554,20 @@ class ConnectionError(Exception):
     pass
 
 
+class CircuitOpenError(ConnectionError):
+    """El circuit breaker del upstream está abierto: la llamada se rechaza sin enviarse"""
+    pass
+
+
 # Función de conveniencia para crear cliente API
-def create_api_client(base_url: str, access_token: Optional[str] = None, timeout: int = 30) -> APIClient:
+def create_api_client(
+    base_url: str,
+    access_token: Optional[str] = None,
+    timeout: int = 30,
+    use_pool: bool = True,
+    coalesce_gets: Optional[bool] = None,
+    http_cache: bool = False,
+    hedge_gets: Optional[bool] = None
+) -> APIClient:
     """Crear un cliente API con la configuración especificada"""
-    return APIClient(base_url, access_token, timeout) 
\ No newline at end of file
+    return APIClient(base_url, access_token, timeout, use_pool, coalesce_gets, http_cache, hedge_gets) 
\ No newline at end of file
@@ -1,26 +1,134 @@
 """
 Cliente de autenticación reutilizable para microservicios
-Se comunica con Auth Service para validar tokens
+Valida tokens localmente (commons.token_verifier) y usa el Auth Service como respaldo
 """
 import httpx
+import logging
+from datetime import datetime
 from fastapi import Depends, HTTPException, Header
 from typing import Optional
+from jose import jwt, JWTError
 from dotenv import load_dotenv
 
 load_dotenv()
 
 from commons.config import config
+from commons.token_verifier import (
+    get_token_verifier, is_local_verification_enabled,
+    TokenVerificationError, CertificateFetchError
+)
+from commons.token_cache import TokenValidationCache
+from commons.internal_identity import verify_identity, set_current_identity
+
+logger = logging.getLogger(__name__)
 
 class AuthClient:
     """Cliente para comunicarse con Auth Service"""
     
-    def __init__(self, auth_service_url: Optional[str] = None, api_prefix: Optional[str] = None, timeout: Optional[int] = None):
+    def __init__(self, auth_service_url: Optional[str] = None, api_prefix: Optional[str] = None, timeout: Optional[int] = None, local_verification: Optional[bool] = None):
         self.auth_service_url = auth_service_url or config.AUTH_SERVICE_URL
         self.api_prefix = api_prefix or config.API_PREFIX
         self.timeout = timeout or config.AUTH_TIMEOUT
+        self.local_verification = local_verification if local_verification is not None else is_local_verification_enabled()
+        self.validation_cache = TokenValidationCache()
+    
+    async def _cached_validation(self, kind: str, token: str, validate) -> dict:
+        """
+        Memoizar el resultado de una validación por hash del token
+        
+        Solo los rechazos definitivos (401) se cachean, con TTL corto; los
+        errores de disponibilidad del Auth Service (503: 5xx, timeout o
+        error de transporte) no se cachean.
+        """
+        cached = self.validation_cache.get(kind, token)
+        if cached is not None:
+            is_valid, value = cached
+            if not is_valid:
+                raise HTTPException(status_code=401, detail=value)
+            return dict(value)
+        
+        try:
+            result = await validate(token)
+        except HTTPException as e:
+            if e.status_code == 401:
+                self.validation_cache.set(kind, token, False, e.detail)
+            raise
+        
+        self.validation_cache.set(kind, token, True, result)
+        return dict(result)
+    
+    @staticmethod
+    def _raise_for_validation_status(status_code: int) -> None:
+        """
+        Convertir una respuesta no exitosa del Auth Service en HTTPException
+        
+        Solo 401/403 son rechazos definitivos del token (401, cacheable); los
+        demás estados (5xx, 429, ...) indican que el Auth Service no pudo
+        validarlo y se devuelven como 503 para no cachearlos como inválidos.
+        """
+        if status_code in (401, 403):
+            raise HTTPException(
+                status_code=401,
+                detail={
+                    "error": "auth_error",
+                    "message": "Error al validar token",
+                    "error_code": "VALIDATION_ERROR"
+                }
+            )
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "service_error",
+                "message": f"Auth Service respondió {status_code} al validar el token",
+                "error_code": "AUTH_SERVICE_ERROR"
+            }
+        )
+    
+    async def _verify_token_locally(self, token: str) -> Optional[dict]:
+        """
+        Verificar token en el proceso (firma, audiencia, emisor y expiración)
+        
+        Returns:
+            Claims del token, o None si no hay certificados disponibles
+            (en ese caso se usa el Auth Service como respaldo)
+        """
+        try:
+            return await get_token_verifier().verify(token)
+        except TokenVerificationError as e:
+            raise HTTPException(
+                status_code=401,
+                detail={
+                    "error": "auth_error",
+                    "message": e.message,
+                    "error_code": e.error_code
+                }
+            )
+        except CertificateFetchError as e:
+            logger.warning(f"⚠️ Verificación local no disponible, usando Auth Service: {e}")
+            return None
     
     async def _validate_token_quick(self, token: str) -> dict:
-        """Validar token rápidamente con Auth Service (solo validez, sin datos completos)"""
+        """Validar token rápidamente (solo validez, sin datos completos)"""
+        return await self._cached_validation("quick", token, self._validate_token_quick_uncached)
+    
+    async def _validate_token_full(self, token: str) -> dict:
+        """Validar token completamente (incluye datos del usuario)"""
+        return await self._cached_validation("full", token, self._validate_token_full_uncached)
+    
+    async def _validate_token_quick_uncached(self, token: str) -> dict:
+        """Validar token rápidamente sin pasar por la caché"""
+        if self.local_verification:
+            claims = await self._verify_token_locally(token)
+            if claims is not None:
+                return {
+                    "valid": True,
+                    "message": "Token válido",
+                    "user_id": claims["uid"],
+                    "roles": claims.get("roles", []),
+                    "email": claims.get("email", ""),
+                    "display_name": claims.get("name", "")
+                }
+        
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.get(
@@ -32,7 +140,7 @@ class AuthClient:
                     data = response.json()
                     if data.get("valid"):
                         # Para validación rápida, solo retornamos info básica del token
-                        return {"valid": True, "message": "Token válido"}
+                        return self._quick_result_from_remote(data, token)
                     else:
                         raise HTTPException(
                             status_code=401,
@@ -43,14 +151,7 @@ class AuthClient:
                             }
                         )
                 else:
-                    raise HTTPException(
-                        status_code=401,
-                        detail={
-                            "error": "auth_error",
-                            "message": "Error al validar token",
-                            "error_code": "VALIDATION_ERROR"
-                        }
-                    )
+                    self._raise_for_validation_status(response.status_code)
         except httpx.TimeoutException:
             raise HTTPException(
                 status_code=503,
@@ -70,8 +171,46 @@ class AuthClient:
                 }
             )
 
-    async def _validate_token_full(self, token: str) -> dict:
-        """Validar token completamente con Auth Service (incluye datos del usuario)"""
+    @staticmethod
+    def _quick_result_from_remote(data: dict, token: str) -> dict:
+        """
+        Armar el resultado quick a partir de la respuesta del Auth Service
+        
+        validate-token-quick solo confirma la validez; el usuario se completa
+        con los claims del token (ya verificado por el Auth Service) para que
+        la identidad interna pueda propagarse también en este camino.
+        """
+        try:
+            claims = jwt.get_unverified_claims(token)
+        except JWTError:
+            claims = {}
+        return {
+            "valid": True,
+            "message": data.get("message", "Token válido"),
+            "user_id": data.get("user_id") or claims.get("user_id") or claims.get("sub"),
+            "roles": data.get("roles") or claims.get("roles", []),
+            "email": data.get("email") or claims.get("email", ""),
+            "display_name": data.get("display_name") or claims.get("name", "")
+        }
+    
+    async def _validate_token_full_uncached(self, token: str) -> dict:
+        """Validar token completamente sin pasar por la caché"""
+        if self.local_verification:
+            claims = await self._verify_token_locally(token)
+            if claims is not None:
+                # Mismo mapeo que FirebaseAuthProvider.verify_token en el Auth Service
+                auth_time = datetime.fromtimestamp(claims.get("auth_time", 0)).isoformat()
+                return {
+                    "user_id": claims["uid"],
+                    "email": claims.get("email", ""),
+                    "display_name": claims.get("name", ""),
+                    "email_verified": claims.get("email_verified", False),
+                    "custom_claims": claims.get("firebase", {}).get("identities", {}),
+                    "created_at": auth_time,
+                    "last_sign_in": auth_time,
+                    "roles": claims.get("roles", [])
+                }
+        
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.get(
@@ -93,14 +232,7 @@ class AuthClient:
                             }
                         )
                 else:
-                    raise HTTPException(
-                        status_code=401,
-                        detail={
-                            "error": "auth_error",
-                            "message": "Error al validar token",
-                            "error_code": "VALIDATION_ERROR"
-                        }
-                    )
+                    self._raise_for_validation_status(response.status_code)
         except httpx.TimeoutException:
             raise HTTPException(
                 status_code=503,
@@ -120,6 +252,37 @@ class AuthClient:
                 }
             )
 
+    def _validate_internal_identity(self, identity_header: Optional[str], token: str, full: bool = False) -> Optional[dict]:
+        """
+        Aceptar la identidad firmada por el gateway (verificación HMAC local)
+        
+        Returns:
+            Datos del usuario con la misma forma que la validación quick/full,
+            o None si no hay identidad válida y se debe validar el token
+        """
+        identity = verify_identity(identity_header, token)
+        if identity is None:
+            return None
+        
+        if full:
+            return {
+                "user_id": identity["user_id"],
+                "email": identity["email"],
+                "display_name": identity["display_name"],
+                "custom_claims": {"roles": identity["roles"]},
+                "roles": identity["roles"],
+                "internal_identity": True
+            }
+        return {
+            "valid": True,
+            "message": "Token válido",
+            "user_id": identity["user_id"],
+            "roles": identity["roles"],
+            "email": identity["email"],
+            "display_name": identity["display_name"],
+            "internal_identity": True
+        }
+    
     async def _validate_token(self, token: str) -> dict:
         """Validar token con Auth Service (método por defecto - usa validación rápida)"""
         return await self._validate_token_quick(token)
@@ -137,7 +300,10 @@ def create_auth_dependencies(auth_service_url: Optional[str] = None, api_prefix:
     """
     auth_client = AuthClient(auth_service_url, api_prefix)
     
-    async def require_auth(authorization: Optional[str] = Header(None)) -> dict:
+    async def require_auth(
+        authorization: Optional[str] = Header(None),
+        x_internal_identity: Optional[str] = Header(None)
+    ) -> dict:
         """Requerir autenticación (validación rápida - solo verifica token)"""
         if not authorization or not authorization.startswith("Bearer "):
             raise HTTPException(
@@ -150,11 +316,22 @@ def create_auth_dependencies(auth_service_url: Optional[str] = None, api_prefix:
             )
         
         token = authorization.replace("Bearer ", "")
-        # Usar validación rápida por defecto
-        result = await auth_client._validate_token_quick(token)
+        # Identidad firmada por el gateway: evita volver a validar el token
+        result = auth_client._validate_internal_identity(x_internal_identity, token)
+        if result is None:
+            # Usar validación rápida por defecto
+            result = await auth_client._validate_token_quick(token)
+        
+        # Propagar la identidad a las llamadas downstream de este request
+        set_current_identity(
+            result.get("user_id"), result.get("roles"), result.get("email"), result.get("display_name")
+        )
         return result
     
-    async def require_auth_full(authorization: Optional[str] = Header(None)) -> dict:
+    async def require_auth_full(
+        authorization: Optional[str] = Header(None),
+        x_internal_identity: Optional[str] = Header(None)
+    ) -> dict:
         """Requerir autenticación completa (incluye datos del usuario)"""
         if not authorization or not authorization.startswith("Bearer "):
             raise HTTPException(
@@ -167,14 +344,22 @@ def create_auth_dependencies(auth_service_url: Optional[str] = None, api_prefix:
             )
         
         token = authorization.replace("Bearer ", "")
-        # Usar validación completa para obtener datos del usuario
-        user = await auth_client._validate_token_full(token)
+        user = auth_client._validate_internal_identity(x_internal_identity, token, full=True)
+        if user is None:
+            # Usar validación completa para obtener datos del usuario
+            user = await auth_client._validate_token_full(token)
+        
+        roles = user.get("roles") or user.get("custom_claims", {}).get("roles", [])
+        set_current_identity(user.get("user_id"), roles, user.get("email"), user.get("display_name"))
         return user
     
     def require_role(required_role: str):
         """Requerir rol específico - retorna una función dependency"""
-        async def _require_role(authorization: Optional[str] = Header(None)) -> dict:
-            user = await require_auth_full(authorization)  # Usar validación completa para roles
+        async def _require_role(
+            authorization: Optional[str] = Header(None),
+            x_internal_identity: Optional[str] = Header(None)
+        ) -> dict:
+            user = await require_auth_full(authorization, x_internal_identity)  # Usar validación completa para roles
             
             # Verificar si el usuario tiene el rol requerido
             user_roles = user.get("custom_claims", {}).get("roles", [])
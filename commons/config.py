@@ -72,6 +72,9 @@ class APIConfig:
     FIREBASE_PROJECT_ID = os.getenv("FIREBASE_PROJECT_ID")
     FIREBASE_CREDENTIALS_PATH = os.getenv("FIREBASE_CREDENTIALS_PATH")
     
+    # Verificación local de ID tokens (evita la llamada al Auth Service)
+    AUTH_LOCAL_VERIFICATION = os.getenv("AUTH_LOCAL_VERIFICATION", "true").lower() == "true"
+    
     # Database
     USER_DATABASE_URL = os.getenv("USER_DATABASE_URL")
     LOCATION_DATABASE_URL = os.getenv("LOCATION_DATABASE_URL")
@@ -0,0 +1,226 @@
+"""
+Estrategias para el total de los listados paginados
+- exact: count(*) sobre la consulta filtrada (comportamiento histórico)
+- cached: el count exacto se guarda por filtro normalizado con un TTL corto y
+  se invalida cuando el proceso confirma escrituras sobre las tablas del listado
+- estimated: filas estimadas por el planificador de PostgreSQL (EXPLAIN), sin
+  recorrer la tabla; con estimaciones pequeñas se hace el count exacto
+
+Cada total se devuelve junto con el modo que realmente lo produjo, para que
+la respuesta pueda indicarlo.
+"""
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, Iterable, Literal, NamedTuple, Optional
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from .ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+EXACT = "exact"
+CACHED = "cached"
+ESTIMATED = "estimated"
+
+CountMode = Literal["exact", "cached", "estimated"]
+COUNT_MODES = (EXACT, CACHED, ESTIMATED)
+
+
+class TotalCount(NamedTuple):
+    """Total de un listado y el modo que lo produjo"""
+    value: int
+    mode: str
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) de una consulta, con sus parámetros enlazados"""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+class ListCounter:
+    """Calcula el total de un listado según el modo pedido"""
+
+    def __init__(self):
+        self.default_mode = os.getenv("LIST_COUNT_MODE", EXACT)
+        if self.default_mode not in COUNT_MODES:
+            logger.warning(f"⚠️ LIST_COUNT_MODE inválido ({self.default_mode}), usando {EXACT}")
+            self.default_mode = EXACT
+        self.exact_below = int(os.getenv("LIST_COUNT_ESTIMATE_EXACT_BELOW", "1000"))
+        self._cache = TTLCache(
+            max_size=int(os.getenv("LIST_COUNT_CACHE_MAX_SIZE", "1000")),
+            ttl_seconds=float(os.getenv("LIST_COUNT_CACHE_TTL", "30"))
+        )
+        # Generación por tabla: cada escritura confirmada la incrementa y deja
+        # inalcanzables los totales cacheados con la generación anterior
+        self._generations: Dict[str, int] = {}
+        self.exact = 0
+        self.cache_hits = 0
+        self.estimated = 0
+        self.estimate_fallbacks = 0
+        self.invalidations = 0
+
+    async def count(
+        self,
+        session,
+        query,
+        tables: Iterable[str],
+        mode: Optional[str] = None
+    ) -> TotalCount:
+        """
+        Calcular el total de la consulta filtrada
+
+        Args:
+            session: Sesión async en uso
+            query: SELECT con los filtros aplicados (sin orden ni paginación)
+            tables: Tablas que lee el listado (invalidan el total cacheado)
+            mode: exact | cached | estimated (None = LIST_COUNT_MODE)
+        """
+        mode = mode or self.default_mode
+
+        if mode == ESTIMATED:
+            estimate = await self._estimate(session, query)
+            if estimate is not None and estimate >= self.exact_below:
+                self.estimated += 1
+                return TotalCount(estimate, ESTIMATED)
+            # Sin plan (otro motor) o conjunto pequeño: el exacto es barato
+            return TotalCount(await self._exact(session, query), EXACT)
+
+        if mode == CACHED:
+            key = await self._cache_key(session, query, tables)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                return TotalCount(cached, CACHED)
+            total = await self._exact(session, query)
+            self._cache.set(key, total)
+            return TotalCount(total, EXACT)
+
+        return TotalCount(await self._exact(session, query), EXACT)
+
+    async def _exact(self, session, query) -> int:
+        self.exact += 1
+        result = await session.execute(select(func.count()).select_from(query.subquery()))
+        return result.scalar()
+
+    async def _estimate(self, session, query) -> Optional[int]:
+        """Filas estimadas por el planificador (None si no se pudo obtener el plan)"""
+        try:
+            connection = await session.connection()
+            if connection.dialect.name != "postgresql":
+                self.estimate_fallbacks += 1
+                return None
+            # En un SAVEPOINT: si EXPLAIN falla, la transacción sigue usable para el count exacto
+            async with session.begin_nested():
+                result = await session.execute(_Explain(query))
+                plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except Exception as e:
+            self.estimate_fallbacks += 1
+            logger.warning(f"⚠️ No se pudo estimar el total, se usa count exacto: {e}")
+            return None
+
+    async def _cache_key(self, session, query, tables: Iterable[str]) -> tuple:
+        """Clave del filtro normalizado: SQL compilado, parámetros y generación de las tablas"""
+        connection = await session.connection()
+        compiled = query.compile(dialect=connection.dialect)
+        params = repr(sorted(compiled.params.items()))
+        digest = hashlib.sha256(f"{compiled}|{params}".encode("utf-8")).hexdigest()
+        generations = tuple((table, self._generations.get(table, 0)) for table in sorted(set(tables)))
+        return digest, generations
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        """Invalidar los totales cacheados de las tablas escritas"""
+        for table in tables:
+            self._generations[table] = self._generations.get(table, 0) + 1
+            self.invalidations += 1
+
+    def get_stats(self) -> dict:
+        """Obtener métricas de los totales calculados"""
+        return {
+            "default_mode": self.default_mode,
+            "exact": self.exact,
+            "cache_hits": self.cache_hits,
+            "estimated": self.estimated,
+            "estimate_fallbacks": self.estimate_fallbacks,
+            "invalidations": self.invalidations,
+            "cache": self._cache.get_stats()
+        }
+
+
+# ----- Seguimiento de escrituras para invalidar el modo cached -----
+
+def _written_tables(session) -> set:
+    return session.info.setdefault("count_written_tables", set())
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_tables(session, flush_context) -> None:
+    """Registrar las tablas con filas nuevas, modificadas o borradas"""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None:
+            _written_tables(session).add(table.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_writes(orm_execute_state) -> None:
+    """Registrar la tabla de los INSERT/UPDATE/DELETE ejecutados como sentencia"""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None and getattr(table, "name", None):
+            _written_tables(orm_execute_state.session).add(table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session) -> None:
+    tables = session.info.pop("count_written_tables", None)
+    if tables and list_counter is not None:
+        list_counter.invalidate(tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session) -> None:
+    session.info.pop("count_written_tables", None)
+
+
+# Instancia global (una por proceso)
+list_counter: Optional[ListCounter] = None
+
+
+def get_list_counter() -> ListCounter:
+    """Obtener el contador global de totales de listados"""
+    global list_counter
+
+    if list_counter is None:
+        list_counter = ListCounter()
+    return list_counter
+
+
+__all__ = [
+    'EXACT',
+    'CACHED',
+    'ESTIMATED',
+    'CountMode',
+    'COUNT_MODES',
+    'TotalCount',
+    'ListCounter',
+    'list_counter',
+    'get_list_counter'
+]
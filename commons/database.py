@@ -1,27 +1,90 @@
 """
 Módulo común para la conexión a la base de datos
 """
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy import Delete, Insert, Update, event, text
+from sqlalchemy.sql.elements import TextClause
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+import asyncio
+import hashlib
+import itertools
+import logging
+import re
 import ssl
+import time
 from urllib.parse import quote_plus
-from typing import Optional
+from typing import Dict, List, Optional
 import os
 
+from .counting import get_list_counter
+from .db_metrics import DatabaseMetrics, InstrumentedQueuePool
+from .ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
 # Base declarativa común para todos los modelos
 Base = declarative_base()
 
+# Retraso de replicación en segundos (0 si la réplica ya aplicó todo lo recibido)
+REPLICA_LAG_QUERY = """
+SELECT CASE
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+
+class RoutingSession(Session):
+    """
+    Sesión que envía las lecturas a la réplica asignada y todo lo demás al primario
+    
+    Tras la primera escritura la sesión queda fijada al primario para leer lo
+    que acaba de escribir.
+    """
+    
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or _is_write(clause):
+            self.info["wrote"] = True
+        else:
+            replica = self.info.get("replica")
+            if replica is not None and not self.info.get("wrote"):
+                return replica
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+# Bloqueos de filas en SQL textual (SELECT ... FOR UPDATE/SHARE)
+_TEXT_LOCKING_CLAUSE = re.compile(r"\bfor\s+(update|share|no\s+key\s+update|key\s+share)\b", re.IGNORECASE)
+
+
+def _is_write(clause) -> bool:
+    """Indicar si la sentencia modifica datos o bloquea filas"""
+    if isinstance(clause, (Insert, Update, Delete)):
+        return True
+    if isinstance(clause, TextClause):
+        # text(): solo un SELECT sin bloqueos puede ir a la réplica
+        sql = clause.text.lstrip()
+        return sql[:6].lower() != "select" or _TEXT_LOCKING_CLAUSE.search(sql) is not None
+    return getattr(clause, "_for_update_arg", None) is not None
+
+
 class DatabaseManager:
     """Gestor de conexión a la base de datos"""
     
-    def __init__(self, database_url: Optional[str] = None, echo: Optional[bool] = None):
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        echo: Optional[bool] = None,
+        replica_urls: Optional[List[str]] = None
+    ):
         """
         Inicializar el gestor de base de datos
         
         Args:
             database_url: URL de conexión a la BD (opcional, usa la configuración por defecto)
             echo: Habilitar logs de SQL (opcional, usa la configuración por defecto)
+            replica_urls: URLs de réplicas de lectura (opcional, usa *_DATABASE_REPLICA_URLS)
         """
         # Si no se proporciona URL, intentar detectar automáticamente según el servicio
         if database_url is None:
@@ -36,6 +99,9 @@ class DatabaseManager:
                 # Fallback a DATABASE_URL genérica
                 database_url = os.getenv("DATABASE_URL", "")
         
+        if replica_urls is None:
+            replica_urls = self._detect_replica_urls()
+        
         self.database_url = database_url
         self.echo = echo if echo is not None else (os.getenv("DATABASE_ECHO", "false").lower() == "true")
         
@@ -49,16 +115,57 @@ class DatabaseManager:
                 connect_args["ssl"] = ssl_context
         
         # Convertir URL de PostgreSQL a async
-        if self.database_url.startswith('postgresql://'):
-            self.database_url = self.database_url.replace('postgresql://', 'postgresql+asyncpg://')
+        self.database_url = self._to_async_url(self.database_url)
+        
+        # Telemetría por engine (pool y consultas)
+        self.metrics: Dict[str, DatabaseMetrics] = {}
+        
+        self.engine = self._create_engine(self.database_url, connect_args, "primary")
         
+        # Réplicas de lectura (mismo pool y SSL que el primario)
+        self.replica_engines: List[AsyncEngine] = [
+            self._create_engine(self._to_async_url(url), connect_args, f"replica_{index}")
+            for index, url in enumerate(replica_urls)
+        ]
+        self.replica_max_lag = float(os.getenv("DATABASE_REPLICA_MAX_LAG", "5"))
+        self.replica_check_interval = float(os.getenv("DATABASE_REPLICA_CHECK_INTERVAL", "10"))
+        # Plazo máximo de la medición de retraso de cada réplica (una réplica colgada no bloquea requests)
+        self.replica_check_timeout = float(os.getenv("DATABASE_REPLICA_CHECK_TIMEOUT", "1"))
+        # Lecturas al primario durante esta ventana tras escribir (por flujo de requests)
+        self.replica_sticky_seconds = float(os.getenv("DATABASE_REPLICA_STICKY_SECONDS", "5"))
+        self._recent_writes = TTLCache(max_size=10000, ttl_seconds=self.replica_sticky_seconds)
+        self._replica_lag: Dict[int, Optional[float]] = {}
+        self._next_replica_check = 0.0
+        self._replica_check_lock = asyncio.Lock()
+        self._round_robin = itertools.count()
+        self.replica_sessions = 0
+        self.primary_fallbacks = 0
+        self.sticky_reads = 0
+
+        self.AsyncSessionLocal = sessionmaker(
+            bind=self.engine,
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            expire_on_commit=False,
+        )
+        
+        # Contar los checkouts del pool en la unidad de trabajo en curso
+        for engine in [self.engine, *self.replica_engines]:
+            event.listen(engine.sync_engine.pool, "checkout", _record_checkout)
+        
+        if self.replica_engines:
+            print(f"📚 {len(self.replica_engines)} réplica(s) de lectura configurada(s)")
+    
+    def _create_engine(self, url: str, connect_args: dict, name: str) -> AsyncEngine:
+        """Crear un engine async con la configuración del pool y su telemetría"""
         # Obtener configuración del pool
         pool_config = self.get_pool_config()
         
-        self.engine = create_async_engine(
-            self.database_url,
+        engine = create_async_engine(
+            url,
             echo=self.echo,
-            # Configuración del pool
+            # Configuración del pool (instrumentado para medir esperas y timeouts)
+            poolclass=InstrumentedQueuePool,
             pool_size=pool_config["pool_size"],
             max_overflow=pool_config["max_overflow"],
             pool_timeout=pool_config["pool_timeout"],
@@ -67,12 +174,123 @@ class DatabaseManager:
             # SSL solo si es necesario
             connect_args=connect_args,
         )
-
-        self.AsyncSessionLocal = sessionmaker(
-            bind=self.engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
+        
+        metrics = DatabaseMetrics(name)
+        metrics.instrument(engine)
+        self.metrics[name] = metrics
+        return engine
+    
+    def get_metrics(self) -> dict:
+        """Obtener la telemetría del pool y de las consultas de cada engine"""
+        return {
+            "pool_config": self.get_pool_config(),
+            "engines": {name: metrics.get_stats() for name, metrics in self.metrics.items()},
+            "replication": self.get_replica_stats()
+        }
+    
+    @staticmethod
+    def _to_async_url(url: str) -> str:
+        """Convertir URL de PostgreSQL al driver async"""
+        if url.startswith('postgresql://'):
+            return url.replace('postgresql://', 'postgresql+asyncpg://')
+        return url
+    
+    @staticmethod
+    def _detect_replica_urls() -> List[str]:
+        """Detectar las réplicas del servicio (URLs separadas por comas)"""
+        for prefix in ("USER", "LOCATION", "RESERVATION"):
+            if os.getenv(f"{prefix}_DATABASE_URL"):
+                value = os.getenv(f"{prefix}_DATABASE_REPLICA_URLS", "")
+                break
+        else:
+            value = os.getenv("DATABASE_REPLICA_URLS", "")
+        return [url.strip() for url in value.split(",") if url.strip()]
+    
+    async def create_session(self) -> AsyncSession:
+        """
+        Crear una sesión enrutada
+        
+        En contextos de solo lectura las consultas van a una réplica sana
+        (round-robin, con retraso <= DATABASE_REPLICA_MAX_LAG); si no hay
+        ninguna o el flujo escribió hace poco, todo va al primario.
+        """
+        flow_key = _flow_key.get()
+        replica = None
+        if self.replica_engines and _read_only.get():
+            if flow_key is not None and self._recent_writes.get(flow_key):
+                self.sticky_reads += 1
+            else:
+                replica = await self._choose_replica()
+                if replica is None:
+                    self.primary_fallbacks += 1
+                else:
+                    self.replica_sessions += 1
+        
+        return self.AsyncSessionLocal(info={
+            "replica": replica.sync_engine if replica is not None else None,
+            "flow_key": flow_key,
+            "manager": self
+        })
+    
+    async def _choose_replica(self) -> Optional[AsyncEngine]:
+        """Elegir la siguiente réplica sana (round-robin)"""
+        await self._check_replicas()
+        healthy = [
+            engine for index, engine in enumerate(self.replica_engines)
+            if self._replica_lag.get(index) is not None and self._replica_lag[index] <= self.replica_max_lag
+        ]
+        if not healthy:
+            return None
+        return healthy[next(self._round_robin) % len(healthy)]
+    
+    async def _check_replicas(self) -> None:
+        """Medir el retraso de las réplicas (como mucho una vez por intervalo)"""
+        if time.monotonic() < self._next_replica_check:
+            return
+        async with self._replica_check_lock:
+            if time.monotonic() < self._next_replica_check:
+                return
+            for index, engine in enumerate(self.replica_engines):
+                try:
+                    lag = await asyncio.wait_for(self._measure_replica_lag(engine), timeout=self.replica_check_timeout)
+                    self._replica_lag[index] = float(lag or 0)
+                    if self._replica_lag[index] > self.replica_max_lag:
+                        logger.warning(f"⚠️ Réplica {index} con retraso de {self._replica_lag[index]:.1f}s, se usa el primario")
+                except asyncio.TimeoutError:
+                    self._replica_lag[index] = None
+                    logger.warning(f"⚠️ Réplica {index} no respondió en {self.replica_check_timeout}s, se usa el primario")
+                except Exception as e:
+                    self._replica_lag[index] = None
+                    logger.warning(f"⚠️ Réplica {index} no disponible: {e}")
+            self._next_replica_check = time.monotonic() + self.replica_check_interval
+    
+    @staticmethod
+    async def _measure_replica_lag(engine: AsyncEngine) -> Optional[float]:
+        """Consultar el retraso de replicación de una réplica"""
+        async with engine.connect() as conn:
+            return (await conn.execute(text(REPLICA_LAG_QUERY))).scalar()
+    
+    def mark_written(self, flow_key: Optional[str]) -> None:
+        """Fijar las lecturas del flujo al primario durante la ventana configurada"""
+        if flow_key is not None and self.replica_engines:
+            self._recent_writes.set(flow_key, True)
+    
+    def get_replica_stats(self) -> dict:
+        """Obtener el estado de las réplicas y del enrutamiento de lecturas"""
+        return {
+            "replicas": [
+                {
+                    "index": index,
+                    "lag_seconds": self._replica_lag.get(index),
+                    "healthy": self._replica_lag.get(index) is not None
+                    and self._replica_lag[index] <= self.replica_max_lag
+                }
+                for index in range(len(self.replica_engines))
+            ],
+            "replica_sessions": self.replica_sessions,
+            "primary_fallbacks": self.primary_fallbacks,
+            "sticky_reads": self.sticky_reads
+        }
     
     async def create_tables(self, base: Optional[declarative_base] = None) -> None:
         """
@@ -124,6 +342,8 @@ class DatabaseManager:
     async def close(self) -> None:
         """Cerrar la conexión a la base de datos"""
         await self.engine.dispose()
+        for engine in self.replica_engines:
+            await engine.dispose()
 
     def get_pool_config(self) -> dict:
         """
@@ -172,6 +392,294 @@ class DatabaseManager:
             print(f"❌ Error al crear contexto SSL: {e}")
             return None
 
+class UnitOfWork:
+    """
+    Unidad de trabajo de un request: una sesión y una transacción compartidas
+    por todos los repositorios, con un único commit al final
+    
+    La sesión se abre en el primer uso, así que los requests que no tocan la
+    base de datos no consumen conexiones.
+    """
+    
+    def __init__(self, manager: DatabaseManager):
+        self.manager = manager
+        self.active = True
+        self.checkouts = 0
+        self._session: Optional[AsyncSession] = None
+    
+    async def get_session(self) -> "_UnitOfWorkSession":
+        """
+        Obtener la sesión compartida (la crea en el primer uso)
+        
+        Salvo en requests de solo lectura, cada operación de repositorio corre en
+        su propio SAVEPOINT: su rollback() deshace esa operación y no el trabajo
+        previo del request.
+        """
+        if self._session is None:
+            self._session = await self.manager.create_session()
+        savepoint = None if _read_only.get() else await self._session.begin_nested()
+        return _UnitOfWorkSession(self._session, savepoint)
+    
+    async def commit(self) -> None:
+        """Confirmar la transacción del request"""
+        if self._session is not None:
+            await self._session.commit()
+    
+    async def rollback(self) -> None:
+        """Deshacer la transacción del request"""
+        if self._session is not None:
+            await self._session.rollback()
+    
+    async def close(self) -> None:
+        """Cerrar la sesión y devolver la conexión al pool"""
+        self.active = False
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class _UnitOfWorkSession:
+    """
+    Sesión compartida que entregan los repositorios dentro de una unidad de trabajo
+    
+    commit() libera el SAVEPOINT de la operación (flush incluido, así que los
+    errores de integridad se detectan en el mismo punto que antes) y rollback()
+    vuelve a él; el commit real queda a cargo de la unidad de trabajo.
+    """
+    
+    def __init__(self, session: AsyncSession, savepoint=None):
+        self._session = session
+        self._savepoint = savepoint
+    
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+    
+    async def commit(self) -> None:
+        if self._savepoint is not None and self._savepoint.is_active:
+            await self._savepoint.commit()
+        else:
+            await self._session.flush()
+    
+    async def rollback(self) -> None:
+        if self._savepoint is not None:
+            if self._savepoint.is_active:
+                await self._savepoint.rollback()
+            # Ya liberado: el error se propaga y la unidad de trabajo deshace todo
+            return
+        # Request de solo lectura: no hay trabajo que perder
+        await self._session.rollback()
+    
+    async def close(self) -> None:
+        # La cierra la unidad de trabajo al terminar el request
+        pass
+
+
+# Unidad de trabajo del request en curso
+_current_unit_of_work: ContextVar[Optional[UnitOfWork]] = ContextVar("current_unit_of_work", default=None)
+
+# Enrutamiento de lecturas: intención de solo lectura y flujo (cliente) del request
+_read_only: ContextVar[bool] = ContextVar("db_read_only", default=False)
+_flow_key: ContextVar[Optional[str]] = ContextVar("db_flow_key", default=None)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _after_routing_commit(session) -> None:
+    """Tras confirmar una escritura, fijar el flujo al primario"""
+    if session.info.get("wrote") and session.info.get("manager") is not None:
+        session.info["manager"].mark_written(session.info.get("flow_key"))
+
+
+@contextmanager
+def read_only(flow_key: Optional[str] = None):
+    """
+    Marcar el bloque como solo lectura: las sesiones que se abran en él
+    pueden leer de una réplica
+    """
+    read_token = _read_only.set(True)
+    flow_token = _flow_key.set(flow_key) if flow_key is not None else None
+    try:
+        yield
+    finally:
+        _read_only.reset(read_token)
+        if flow_token is not None:
+            _flow_key.reset(flow_token)
+
+
+class UnitOfWorkStats:
+    """Métricas de checkouts de conexiones por request"""
+    
+    def __init__(self):
+        self.requests = 0
+        self.checkouts = 0
+        self.max_checkouts = 0
+        self.commits = 0
+        self.rollbacks = 0
+    
+    def record(self, unit_of_work: UnitOfWork, committed: bool) -> None:
+        self.requests += 1
+        self.checkouts += unit_of_work.checkouts
+        self.max_checkouts = max(self.max_checkouts, unit_of_work.checkouts)
+        if committed:
+            self.commits += 1
+        else:
+            self.rollbacks += 1
+    
+    def get_stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "checkouts": self.checkouts,
+            "avg_checkouts_per_request": round(self.checkouts / self.requests, 3) if self.requests else 0.0,
+            "max_checkouts_per_request": self.max_checkouts,
+            "commits": self.commits,
+            "rollbacks": self.rollbacks
+        }
+
+
+unit_of_work_stats = UnitOfWorkStats()
+
+
+def _record_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    """Listener del pool: sumar el checkout a la unidad de trabajo en curso"""
+    current = _current_unit_of_work.get()
+    if current is not None:
+        current.checkouts += 1
+
+
+def get_current_unit_of_work() -> Optional[UnitOfWork]:
+    """Obtener la unidad de trabajo activa del contexto actual (si hay una)"""
+    current = _current_unit_of_work.get()
+    return current if current is not None and current.active else None
+
+
+@asynccontextmanager
+async def unit_of_work(database_url: Optional[str] = None):
+    """
+    Abrir una unidad de trabajo: los get_db_session() del contexto comparten
+    sesión y transacción, que se confirma al salir (o se deshace si hay error)
+    """
+    current = get_current_unit_of_work()
+    if current is not None:
+        # Anidada: participa de la unidad de trabajo exterior
+        yield current
+        return
+    
+    uow = UnitOfWork(get_db_manager(database_url))
+    token = _current_unit_of_work.set(uow)
+    committed = False
+    try:
+        yield uow
+        await uow.commit()
+        committed = True
+    except BaseException:
+        await uow.rollback()
+        raise
+    finally:
+        await uow.close()
+        _current_unit_of_work.reset(token)
+        unit_of_work_stats.record(uow, committed)
+
+
+class UnitOfWorkMiddleware:
+    """
+    Middleware ASGI que abre una unidad de trabajo por request HTTP
+    
+    El commit (o rollback si el status es >= 400) se hace antes de enviar los
+    headers, de modo que un fallo al confirmar se devuelve como error. El
+    cuerpo de las respuestas en streaming se genera después, fuera de la
+    unidad de trabajo: debe leer con get_db_session(standalone=True).
+    """
+    
+    def __init__(self, app, database_url: Optional[str] = None):
+        self.app = app
+        self.database_url = database_url
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or get_current_unit_of_work() is not None:
+            await self.app(scope, receive, send)
+            return
+        
+        uow = UnitOfWork(get_db_manager(self.database_url))
+        token = _current_unit_of_work.set(uow)
+        finished = False
+        
+        async def finish(success: bool) -> None:
+            nonlocal finished
+            if finished:
+                return
+            finished = True
+            try:
+                if success:
+                    await uow.commit()
+                else:
+                    await uow.rollback()
+            finally:
+                await uow.close()
+                unit_of_work_stats.record(uow, success)
+                logger.debug(f"🗄️ {scope['method']} {scope['path']}: {uow.checkouts} checkouts de conexión")
+        
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and not finished:
+                await finish(message["status"] < 400)
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", []),
+                        (b"x-db-checkouts", str(uow.checkouts).encode("latin-1"))
+                    ]
+                }
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Si no llegó a enviarse una respuesta (excepción), deshacer
+            await finish(False)
+            _current_unit_of_work.reset(token)
+
+
+class ReadRoutingMiddleware:
+    """
+    Middleware ASGI que fija el contexto de enrutamiento de lecturas del request
+    
+    GET/HEAD corren en read_only(): sus sesiones pueden leer de una réplica. El
+    flujo se identifica por el token del cliente, para fijar al primario sus
+    lecturas tras escribir. No depende de la unidad de trabajo: aplica también a
+    las sesiones propias de get_db_session().
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        flow_key = _request_flow_key(scope)
+        if scope["method"] in ("GET", "HEAD"):
+            with read_only(flow_key):
+                await self.app(scope, receive, send)
+            return
+        
+        flow_token = _flow_key.set(flow_key)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _flow_key.reset(flow_token)
+
+
+def _request_flow_key(scope) -> Optional[str]:
+    """Identificar el flujo de requests de un cliente (hash de su Authorization)"""
+    for name, value in scope.get("headers", []):
+        if name == b"authorization":
+            return hashlib.sha256(value).hexdigest()
+    return None
+
+
+def get_unit_of_work_stats() -> dict:
+    """Obtener métricas de checkouts por request de las unidades de trabajo"""
+    return unit_of_work_stats.get_stats()
+
 # Instancia global del gestor de base de datos (se inicializará cuando se necesite)
 db_manager = None
 
@@ -189,12 +697,39 @@ async def create_tables(base: Optional[declarative_base] = None, database_url: O
     manager = get_db_manager(database_url)
     await manager.create_tables(base)
 
-async def get_db_session(database_url: Optional[str] = None) -> AsyncSession:
-    """Dependency para FastAPI (async)"""
+async def get_db_session(database_url: Optional[str] = None, standalone: bool = False) -> AsyncSession:
+    """
+    Dependency para FastAPI (async)
+    
+    Dentro de una unidad de trabajo entrega la sesión compartida del request;
+    fuera de ella (o con standalone=True, p. ej. para lecturas que siguen vivas
+    después de enviar los headers) abre una sesión propia como siempre.
+    """
+    current = None if standalone else get_current_unit_of_work()
+    if current is not None:
+        yield await current.get_session()
+        return
+    
     manager = get_db_manager(database_url)
-    async with manager.AsyncSessionLocal() as session:
+    session = await manager.create_session()
+    async with session:
         yield session
 
+def get_database_metrics() -> dict:
+    """
+    Obtener la telemetría de la base de datos del servicio
+    
+    No crea el gestor: en servicios sin base de datos (gateway) lo indica.
+    """
+    if db_manager is None:
+        return {"configured": False}
+    return {
+        "configured": True,
+        **db_manager.get_metrics(),
+        "unit_of_work": get_unit_of_work_stats(),
+        "list_counts": get_list_counter().get_stats()
+    }
+
 async def test_connection(database_url: Optional[str] = None) -> bool:
     """Probar conexión a la BD de forma asíncrona"""
     manager = get_db_manager(database_url)
@@ -208,6 +743,15 @@ __all__ = [
     'get_db_manager',
     'create_tables',
     'get_db_session',
+    'UnitOfWork',
+    'UnitOfWorkMiddleware',
+    'ReadRoutingMiddleware',
+    'unit_of_work',
+    'get_current_unit_of_work',
+    'get_unit_of_work_stats',
+    'RoutingSession',
+    'read_only',
+    'get_database_metrics',
     'test_connection',
     'get_pool_config'
 ]
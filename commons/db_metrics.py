@@ -0,0 +1,265 @@
+"""
+Telemetría del pool de conexiones y de las consultas SQL
+- InstrumentedQueuePool: mide la espera por conexión y los timeouts del pool
+- DatabaseMetrics: histogramas de espera y de latencia por sentencia, gauges
+  del pool y registro de consultas lentas con el SQL normalizado
+"""
+import logging
+import os
+import re
+import time
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime
+from typing import Dict, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+logger = logging.getLogger(__name__)
+
+# Límites de los buckets en milisegundos
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+QUERY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])\d+(?:\.\d+)?\b")
+# Placeholders de los drivers (?, $1::INTEGER, %(name)s)
+_PLACEHOLDER = r"(?:\?|\$\d+(?:::\w+(?:\[\])?)?|%\([^)]+\)s)"
+_IN_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+
+
+def normalize_sql(statement: str) -> str:
+    """Normalizar una sentencia: literales y listas IN como ?, espacios colapsados"""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class Histogram:
+    """Histograma con buckets fijos en milisegundos (conteos acumulados, como en Prometheus)"""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect_left(self.buckets, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        self.max = max(self.max, value_ms)
+
+    def get_stats(self) -> dict:
+        buckets = {}
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets[f"le_{bound}"] = cumulative
+        buckets["le_inf"] = self.count
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max, 3),
+            "buckets": buckets
+        }
+
+
+class StatementStats:
+    """Latencia acumulada de una sentencia normalizada"""
+
+    __slots__ = ("count", "total_ms", "max_ms", "errors")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.errors = 0
+
+    def to_dict(self, statement: str) -> dict:
+        return {
+            "statement": statement,
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "total_ms": round(self.total_ms, 3),
+            "errors": self.errors
+        }
+
+
+class DatabaseMetrics:
+    """Métricas de un engine: pool de conexiones y sentencias ejecutadas"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.slow_query_ms = float(os.getenv("DATABASE_SLOW_QUERY_MS", "500"))
+        self.max_statements = int(os.getenv("DATABASE_STATEMENT_STATS_MAX", "200"))
+        self.checkout_wait = Histogram(WAIT_BUCKETS_MS)
+        self.query_latency = Histogram(QUERY_BUCKETS_MS)
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.connections_created = 0
+        self.connections_invalidated = 0
+        self.query_errors = 0
+        self.statements: Dict[str, StatementStats] = {}
+        self.slow_queries = deque(maxlen=int(os.getenv("DATABASE_SLOW_QUERY_LOG_SIZE", "50")))
+        self._pool = None
+
+    def instrument(self, engine) -> None:
+        """Registrar los listeners en el engine async y su pool"""
+        sync_engine = engine.sync_engine
+        pool = sync_engine.pool
+        self._pool = pool
+        if isinstance(pool, InstrumentedQueuePool):
+            pool._metrics = self
+
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "invalidate", self._on_invalidate)
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(sync_engine, "handle_error", self._handle_error)
+        # Tras dispose() el engine usa un pool nuevo
+        event.listen(sync_engine, "engine_disposed", lambda _: self._track_pool(sync_engine))
+
+    def _track_pool(self, sync_engine) -> None:
+        self._pool = sync_engine.pool
+        if isinstance(self._pool, InstrumentedQueuePool):
+            self._pool._metrics = self
+
+    # ----- Pool -----
+
+    def record_checkout_wait(self, seconds: float) -> None:
+        self.checkout_wait.observe(seconds * 1000)
+
+    def record_checkout_timeout(self) -> None:
+        self.checkout_timeouts += 1
+        logger.warning(f"⏱️ Timeout esperando conexión del pool ({self.name})")
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        self.connections_created += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        self.checkouts += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        self.connections_invalidated += 1
+
+    # ----- Sentencias -----
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info.get("query_started_at")
+        if not started:
+            return
+        elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+        self._record_statement(statement, elapsed_ms, failed=False)
+
+    def _handle_error(self, exception_context) -> None:
+        conn = exception_context.connection
+        started = conn.info.get("query_started_at") if conn is not None else None
+        if not started:
+            return
+        elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+        self.query_errors += 1
+        self._record_statement(exception_context.statement or "", elapsed_ms, failed=True)
+
+    def _record_statement(self, statement: str, elapsed_ms: float, failed: bool) -> None:
+        self.query_latency.observe(elapsed_ms)
+        normalized = normalize_sql(statement)
+
+        stats = self.statements.get(normalized)
+        if stats is None:
+            if len(self.statements) >= self.max_statements:
+                normalized = "<other>"
+                stats = self.statements.get(normalized)
+            if stats is None:
+                stats = StatementStats()
+                self.statements[normalized] = stats
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+        if failed:
+            stats.errors += 1
+
+        if elapsed_ms >= self.slow_query_ms:
+            self.slow_queries.append({
+                "statement": normalized,
+                "duration_ms": round(elapsed_ms, 3),
+                "failed": failed,
+                "timestamp": datetime.utcnow().isoformat()
+            })
+            logger.warning(f"🐢 Consulta lenta ({elapsed_ms:.0f} ms, {self.name}): {normalized}")
+
+    # ----- Exportación -----
+
+    def get_pool_gauges(self) -> dict:
+        """Estado actual del pool (conexiones en uso, libres y overflow)"""
+        pool = self._pool
+        if pool is None or not hasattr(pool, "checkedout"):
+            return {}
+        return {
+            "size": pool.size(),
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            # overflow() es negativo mientras el pool base no está completo
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": getattr(pool, "_max_overflow", None)
+        }
+
+    def get_stats(self, top: int = 20) -> dict:
+        """Obtener todas las métricas del engine"""
+        statements = sorted(self.statements.items(), key=lambda item: item[1].total_ms, reverse=True)
+        return {
+            "pool": {
+                **self.get_pool_gauges(),
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "connections_created": self.connections_created,
+                "connections_invalidated": self.connections_invalidated,
+                "checkout_wait_ms": self.checkout_wait.get_stats()
+            },
+            "queries": {
+                "latency_ms": self.query_latency.get_stats(),
+                "errors": self.query_errors,
+                "slow_query_ms": self.slow_query_ms,
+                "top_statements": [stats.to_dict(statement) for statement, stats in statements[:top]],
+                "slow_queries": list(self.slow_queries)
+            }
+        }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Pool async que mide el tiempo de espera por una conexión y los timeouts"""
+
+    _metrics: Optional[DatabaseMetrics] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            if self._metrics is not None:
+                self._metrics.record_checkout_timeout()
+            raise
+        finally:
+            if self._metrics is not None:
+                self._metrics.record_checkout_wait(time.perf_counter() - started)
+
+
+__all__ = [
+    'normalize_sql',
+    'Histogram',
+    'StatementStats',
+    'DatabaseMetrics',
+    'InstrumentedQueuePool',
+    'WAIT_BUCKETS_MS',
+    'QUERY_BUCKETS_MS'
+]
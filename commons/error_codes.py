@@ -12,6 +12,7 @@ class ErrorCode(Enum):
     INVALID_REQUEST = "INVALID_REQUEST"
     MISSING_REQUIRED_FIELD = "MISSING_REQUIRED_FIELD"
     INVALID_FORMAT = "INVALID_FORMAT"
+    INVALID_CURSOR = "INVALID_CURSOR"
     
     # Errores de autenticación (401)
     UNAUTHORIZED = "UNAUTHORIZED"
@@ -95,6 +96,7 @@ def get_error_code_by_exception(exception: Exception) -> str:
     exception_mapping = {
         'ValidationError': ErrorCode.VALIDATION_ERROR.value,
         'ValueError': ErrorCode.VALIDATION_ERROR.value,
+        'InvalidCursorError': ErrorCode.INVALID_CURSOR.value,
         'TypeError': ErrorCode.VALIDATION_ERROR.value,
         'KeyError': ErrorCode.VALIDATION_ERROR.value,
         'AttributeError': ErrorCode.VALIDATION_ERROR.value,
@@ -116,6 +118,7 @@ def get_error_code_by_exception(exception: Exception) -> str:
         
         'DatabaseError': ErrorCode.DATABASE_ERROR.value,
         'ConnectionError': ErrorCode.EXTERNAL_SERVICE_ERROR.value,
+        'CircuitOpenError': ErrorCode.EXTERNAL_SERVICE_ERROR.value,
         'TimeoutError': ErrorCode.EXTERNAL_SERVICE_ERROR.value,
         
         # ===== RESERVATION SERVICE EXCEPTIONS =====
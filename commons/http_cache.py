@@ -0,0 +1,261 @@
+"""
+Validadores HTTP (ETag / Cache-Control) para datos de referencia
+- ETagMiddleware: emite ETag y Cache-Control en respuestas JSON y responde
+  304 Not Modified cuando el cliente envía un If-None-Match vigente
+- HTTPResponseCache: caché LRU en proceso de respuestas upstream que respeta
+  Cache-Control y revalida con If-None-Match
+"""
+import copy
+import hashlib
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from .ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+def compute_etag(body: bytes) -> str:
+    """Calcular un ETag débil a partir del cuerpo de la respuesta"""
+    return f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """Comparar If-None-Match contra un ETag (comparación débil, admite listas y *)"""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def _opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return _opaque(etag) in {_opaque(tag) for tag in if_none_match.split(",")}
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parsear un header Cache-Control en un diccionario de directivas"""
+    directives: Dict[str, Optional[str]] = {}
+    if not value:
+        return directives
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, argument = part.partition("=")
+        directives[name.strip().lower()] = argument.strip().strip('"') or None
+    return directives
+
+
+class ETagMiddleware:
+    """
+    Middleware ASGI que agrega validadores a las respuestas JSON de GET
+
+    Solo actúa sobre respuestas 200 con Content-Type JSON cuyas rutas empiezan
+    por alguno de los prefijos configurados. Las respuestas que ya traen ETag
+    (calculado por el endpoint) se respetan y solo se resuelve el 304.
+    """
+
+    def __init__(self, app, path_prefixes: Optional[Iterable[str]] = None, cache_control: str = "no-cache"):
+        """
+        Args:
+            app: Aplicación ASGI
+            path_prefixes: Prefijos de ruta a los que se aplica (None = todas)
+            cache_control: Valor de Cache-Control a emitir si el endpoint no define uno
+        """
+        self.app = app
+        self.path_prefixes = tuple(path_prefixes) if path_prefixes else None
+        self.cache_control = cache_control
+
+    def _applies(self, scope) -> bool:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return False
+        return self.path_prefixes is None or scope["path"].startswith(self.path_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if not self._applies(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = None
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if_none_match = value.decode("latin-1")
+                break
+
+        start_message: Optional[dict] = None
+        body_parts = []
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = {name.lower(): value for name, value in message.get("headers", [])}
+                content_type = headers.get(b"content-type", b"")
+                if message["status"] != 200 or b"json" not in content_type:
+                    # Respuestas de error, streaming o binarias: sin modificar
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            if message["type"] == "http.response.body":
+                body_parts.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    return
+                await self._send_with_validators(start_message, b"".join(body_parts), if_none_match, send)
+                return
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _send_with_validators(self, start_message: dict, body: bytes, if_none_match: Optional[str], send) -> None:
+        """Enviar la respuesta con ETag/Cache-Control o un 304 si el cliente ya la tiene"""
+        headers = [
+            (name, value) for name, value in start_message.get("headers", [])
+        ]
+        header_names = {name.lower() for name, _ in headers}
+
+        etag = None
+        for name, value in headers:
+            if name.lower() == b"etag":
+                etag = value.decode("latin-1")
+        if etag is None:
+            etag = compute_etag(body)
+            headers.append((b"etag", etag.encode("latin-1")))
+        if b"cache-control" not in header_names:
+            headers.append((b"cache-control", self.cache_control.encode("latin-1")))
+
+        if etag_matches(if_none_match, etag):
+            not_modified_headers = [
+                (name, value) for name, value in headers
+                if name.lower() not in (b"content-length", b"content-type")
+            ]
+            await send({"type": "http.response.start", "status": 304, "headers": not_modified_headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send({**start_message, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+class CachedResponse:
+    """Respuesta upstream cacheada con sus validadores"""
+
+    __slots__ = ("data", "etag", "fresh_until")
+
+    def __init__(self, data: Any, etag: Optional[str], fresh_until: float):
+        self.data = data
+        self.etag = etag
+        self.fresh_until = fresh_until
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.fresh_until
+
+
+class HTTPResponseCache:
+    """Caché de respuestas GET upstream que respeta Cache-Control y ETag"""
+
+    def __init__(self, max_size: int, retention_seconds: float):
+        """
+        Args:
+            max_size: Número máximo de respuestas (LRU)
+            retention_seconds: Tiempo que se conserva una respuesta vencida para revalidarla
+        """
+        self.retention_seconds = retention_seconds
+        self._cache = TTLCache(max_size=max_size, ttl_seconds=retention_seconds)
+        self.fresh_hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def get(self, key) -> Optional[CachedResponse]:
+        """Obtener la entrada cacheada (vigente o vencida pero revalidable)"""
+        return self._cache.get(key)
+
+    def store(self, key, data: Any, headers, etag: Optional[str] = None) -> Optional[CachedResponse]:
+        """
+        Guardar una respuesta según sus headers Cache-Control y ETag
+
+        Args:
+            key: Clave de la solicitud
+            data: Cuerpo parseado
+            headers: Headers de la respuesta upstream
+            etag: ETag a usar si la respuesta no trae uno (revalidación 304)
+
+        Returns:
+            La entrada guardada o None si la respuesta no es cacheable
+        """
+        directives = parse_cache_control(headers.get("Cache-Control"))
+        etag = headers.get("ETag") or etag
+
+        if "no-store" in directives:
+            self._cache.invalidate(lambda cached_key: cached_key == key)
+            return None
+
+        max_age = 0
+        if "no-cache" not in directives and directives.get("max-age"):
+            try:
+                max_age = max(int(directives["max-age"]), 0)
+            except ValueError:
+                max_age = 0
+
+        # Sin validador ni vigencia no hay forma de reutilizarla
+        if not etag and max_age == 0:
+            return None
+
+        entry = CachedResponse(copy.deepcopy(data), etag, time.monotonic() + max_age)
+        self._cache.set(key, entry, ttl_seconds=max(self.retention_seconds, max_age))
+        return entry
+
+    def clear(self) -> None:
+        """Vaciar la caché"""
+        self._cache.clear()
+
+    def get_stats(self) -> dict:
+        """Obtener estadísticas de uso"""
+        return {
+            "size": len(self._cache),
+            "max_size": self._cache.max_size,
+            "retention_seconds": self.retention_seconds,
+            "fresh_hits": self.fresh_hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses
+        }
+
+
+# Instancia global de la caché de respuestas (una por proceso)
+http_cache: Optional[HTTPResponseCache] = None
+
+
+def get_http_cache() -> HTTPResponseCache:
+    """Obtener la instancia global de la caché de respuestas HTTP"""
+    global http_cache
+
+    if http_cache is None:
+        http_cache = HTTPResponseCache(
+            max_size=int(os.getenv("HTTP_CACHE_MAX_SIZE", "500")),
+            retention_seconds=float(os.getenv("HTTP_CACHE_RETENTION", "600"))
+        )
+    return http_cache
+
+
+__all__ = [
+    'compute_etag',
+    'etag_matches',
+    'parse_cache_control',
+    'ETagMiddleware',
+    'CachedResponse',
+    'HTTPResponseCache',
+    'http_cache',
+    'get_http_cache'
+]
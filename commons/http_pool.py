@@ -0,0 +1,101 @@
+"""
+Registro de sesiones HTTP de larga vida compartidas por todo el proceso
+Mantiene una aiohttp.ClientSession por URL base de servicio upstream
+"""
+import os
+import logging
+from typing import Dict, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPClientPool:
+    """Registro de sesiones HTTP reutilizables (una por URL base)"""
+
+    def __init__(self):
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+
+    def get_pool_config(self) -> dict:
+        """
+        Obtener la configuración del pool de conexiones HTTP
+
+        Returns:
+            dict: Configuración del pool
+        """
+        return {
+            "limit": int(os.getenv("HTTP_POOL_LIMIT", "100")),
+            "limit_per_host": int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "30")),
+            "keepalive_timeout": float(os.getenv("HTTP_POOL_KEEPALIVE_TIMEOUT", "30")),
+            "ttl_dns_cache": int(os.getenv("HTTP_POOL_DNS_TTL", "300"))
+        }
+
+    def get_session(self, base_url: str) -> aiohttp.ClientSession:
+        """
+        Obtener (o crear) la sesión compartida para una URL base
+
+        Debe llamarse dentro de un event loop en ejecución.
+
+        Args:
+            base_url: URL base del servicio upstream
+
+        Returns:
+            aiohttp.ClientSession: Sesión con keep-alive y caché de DNS
+        """
+        key = base_url.rstrip('/')
+        session = self._sessions.get(key)
+
+        if session is None or session.closed:
+            pool_config = self.get_pool_config()
+            connector = aiohttp.TCPConnector(
+                limit=pool_config["limit"],
+                limit_per_host=pool_config["limit_per_host"],
+                keepalive_timeout=pool_config["keepalive_timeout"],
+                use_dns_cache=True,
+                ttl_dns_cache=pool_config["ttl_dns_cache"]
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[key] = session
+            logger.info(f"🔌 Sesión HTTP creada para {key}")
+
+        return session
+
+    async def close(self) -> None:
+        """Cerrar todas las sesiones registradas"""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+        if sessions:
+            logger.info(f"🔌 {len(sessions)} sesiones HTTP cerradas")
+
+
+# Instancia global del registro de sesiones (una por proceso)
+http_pool: Optional[HTTPClientPool] = None
+
+
+def get_http_pool() -> HTTPClientPool:
+    """Obtener la instancia global del registro de sesiones HTTP"""
+    global http_pool
+
+    if http_pool is None:
+        http_pool = HTTPClientPool()
+    return http_pool
+
+
+async def close_http_pool() -> None:
+    """Cerrar todas las sesiones del registro global"""
+    if http_pool is not None:
+        await http_pool.close()
+
+
+__all__ = [
+    'HTTPClientPool',
+    'http_pool',
+    'get_http_pool',
+    'close_http_pool'
+]
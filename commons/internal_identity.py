@@ -0,0 +1,173 @@
+"""
+Identidad interna firmada (HMAC) para llamadas entre servicios
+El gateway valida el bearer token una vez y propaga la identidad en un header
+de corta duración que los servicios downstream verifican localmente
+"""
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import os
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Header usado para propagar la identidad entre servicios
+INTERNAL_IDENTITY_HEADER = "X-Internal-Identity"
+
+# Identidad del request en curso: {"user_id", "roles", "email", "display_name"}
+_current_identity: ContextVar[Optional[dict]] = ContextVar("current_identity", default=None)
+
+
+def _get_secret() -> bytes:
+    return os.getenv("INTERNAL_IDENTITY_SECRET", "").encode("utf-8")
+
+
+def _get_ttl() -> int:
+    return int(os.getenv("INTERNAL_IDENTITY_TTL", "60"))
+
+
+def is_internal_identity_enabled() -> bool:
+    """La propagación solo se activa si hay un secreto compartido configurado"""
+    return bool(_get_secret())
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _token_hash(token: str) -> str:
+    """Huella del bearer token al que queda ligada la identidad"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+
+
+def sign_identity(
+    user_id: str,
+    roles: List[str],
+    token: str,
+    ttl_seconds: Optional[int] = None,
+    email: Optional[str] = None,
+    display_name: Optional[str] = None
+) -> str:
+    """
+    Firmar una identidad interna
+
+    Args:
+        user_id: UID del usuario autenticado
+        roles: Roles del usuario
+        token: Bearer token que acompaña la llamada (la identidad queda ligada a él)
+        ttl_seconds: Vigencia en segundos (opcional, usa INTERNAL_IDENTITY_TTL)
+        email: Email del usuario (opcional)
+        display_name: Nombre visible del usuario (opcional)
+
+    Returns:
+        str: Valor del header X-Internal-Identity
+    """
+    payload = {
+        "sub": user_id,
+        "roles": roles or [],
+        "exp": int(time.time()) + (ttl_seconds if ttl_seconds is not None else _get_ttl()),
+        "tkh": _token_hash(token),
+        "email": email or "",
+        "name": display_name or ""
+    }
+    body = _b64encode(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+    signature = hmac.new(_get_secret(), body.encode("ascii"), hashlib.sha256).digest()
+    return f"{body}.{_b64encode(signature)}"
+
+
+def verify_identity(header_value: Optional[str], token: str) -> Optional[dict]:
+    """
+    Verificar una identidad interna
+
+    Args:
+        header_value: Valor del header X-Internal-Identity
+        token: Bearer token recibido en la misma solicitud
+
+    Returns:
+        dict con user_id, roles, email y display_name, o None si el header no es válido
+    """
+    if not header_value or not is_internal_identity_enabled():
+        return None
+
+    try:
+        body, signature = header_value.split(".", 1)
+        expected = hmac.new(_get_secret(), body.encode("ascii"), hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, _b64decode(signature)):
+            logger.warning("⚠️ Identidad interna con firma inválida")
+            return None
+
+        payload = json.loads(_b64decode(body))
+    except (ValueError, TypeError):
+        logger.warning("⚠️ Identidad interna con formato inválido")
+        return None
+
+    if payload.get("exp", 0) < time.time():
+        return None
+    if not hmac.compare_digest(payload.get("tkh", ""), _token_hash(token)):
+        return None
+
+    return {
+        "user_id": payload.get("sub"),
+        "roles": payload.get("roles", []),
+        "email": payload.get("email", ""),
+        "display_name": payload.get("name", "")
+    }
+
+
+def set_current_identity(
+    user_id: Optional[str],
+    roles: Optional[List[str]] = None,
+    email: Optional[str] = None,
+    display_name: Optional[str] = None
+) -> None:
+    """Registrar la identidad autenticada del request en curso"""
+    if user_id:
+        _current_identity.set({
+            "user_id": user_id,
+            "roles": roles or [],
+            "email": email or "",
+            "display_name": display_name or ""
+        })
+
+
+def get_current_identity() -> Optional[dict]:
+    """Obtener la identidad autenticada del request en curso"""
+    return _current_identity.get()
+
+
+def build_identity_header(token: str) -> Optional[str]:
+    """
+    Construir el header de identidad para una llamada downstream
+
+    Returns:
+        Valor firmado, o None si no hay identidad o la propagación está deshabilitada
+    """
+    identity = _current_identity.get()
+    if identity is None or not token or not is_internal_identity_enabled():
+        return None
+    return sign_identity(
+        identity["user_id"],
+        identity["roles"],
+        token,
+        email=identity.get("email"),
+        display_name=identity.get("display_name")
+    )
+
+
+__all__ = [
+    'INTERNAL_IDENTITY_HEADER',
+    'is_internal_identity_enabled',
+    'sign_identity',
+    'verify_identity',
+    'set_current_identity',
+    'get_current_identity',
+    'build_identity_header'
+]
@@ -9,6 +9,7 @@ from datetime import datetime
 
 from .auth_client import AuthClient, auth_dependencies
 from .config import config
+from .internal_identity import INTERNAL_IDENTITY_HEADER, set_current_identity
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
@@ -102,9 +103,18 @@ async def auth_middleware(request: Request, call_next):
     logger.info(f"Token extraído (primeros 20 chars): {token[:20]}...")
     
     try:
-        # Validar token con el servicio de autenticación
-        logger.info(f"Validando token para ruta: {request.url.path}")
-        user_data = await auth_client._validate_token(token)
+        # Identidad firmada por el gateway: verificación HMAC local
+        user_data = auth_client._validate_internal_identity(
+            request.headers.get(INTERNAL_IDENTITY_HEADER), token
+        )
+        if user_data is None:
+            # Validar token con el servicio de autenticación
+            logger.info(f"Validando token para ruta: {request.url.path}")
+            user_data = await auth_client._validate_token(token)
+        
+        set_current_identity(
+            user_data.get("user_id"), user_data.get("roles"), user_data.get("email"), user_data.get("display_name")
+        )
         
         # Agregar información del usuario al request state
         request.state.user = user_data
@@ -0,0 +1,164 @@
+"""
+Paginación por cursor (keyset) para los listados
+El cursor es opaco para el cliente: codifica los valores de las claves de
+orden de la última fila entregada, de modo que la siguiente página se
+obtiene con un WHERE sobre el índice en lugar de OFFSET
+"""
+import base64
+import json
+from datetime import date, datetime, time
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import tuple_
+
+
+class InvalidCursorError(ValueError):
+    """El cursor recibido no es válido para este listado"""
+    pass
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    if isinstance(value, time):
+        return {"$t": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"$u": str(value)}
+    raise TypeError(f"Tipo no soportado en cursor: {type(value).__name__}")
+
+
+def _decode_value(obj: dict) -> Any:
+    if "$dt" in obj:
+        return datetime.fromisoformat(obj["$dt"])
+    if "$d" in obj:
+        return date.fromisoformat(obj["$d"])
+    if "$t" in obj:
+        return time.fromisoformat(obj["$t"])
+    if "$u" in obj:
+        return UUID(obj["$u"])
+    return obj
+
+
+def encode_cursor(kind: str, values: Sequence[Any]) -> str:
+    """
+    Codificar un cursor
+
+    Args:
+        kind: Listado al que pertenece (evita reutilizar cursores entre listados)
+        values: Valores de las claves de orden de la última fila
+    """
+    payload = json.dumps({"k": kind, "v": list(values)}, default=_encode_value, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, kind: str, size: int) -> List[Any]:
+    """
+    Decodificar un cursor y validar que corresponde al listado
+
+    Raises:
+        InvalidCursorError: Si el cursor está mal formado o es de otro listado
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")), object_hook=_decode_value)
+        values = payload["v"]
+        valid = payload["k"] == kind and isinstance(values, list) and len(values) == size
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError(f"Cursor inválido: {e}")
+
+    if not valid:
+        raise InvalidCursorError("Cursor inválido para este listado")
+    return values
+
+
+def _check_cursor_values(columns: Sequence[Any], values: Sequence[Any]) -> None:
+    """
+    Validar que cada valor del cursor corresponde al tipo de su columna
+
+    Raises:
+        InvalidCursorError: Si un valor no es del tipo de la columna (o es None
+            en una columna no nullable)
+    """
+    for column, value in zip(columns, values):
+        if value is None:
+            if not getattr(getattr(column, "expression", column), "nullable", True):
+                raise InvalidCursorError("Cursor inválido para este listado")
+            continue
+        try:
+            expected = column.type.python_type
+        except NotImplementedError:
+            continue
+        if expected is float and isinstance(value, int) and not isinstance(value, bool):
+            continue
+        if (
+            not isinstance(value, expected)
+            or (isinstance(value, bool) and expected is not bool)
+            or (isinstance(value, datetime) and expected is date)
+        ):
+            raise InvalidCursorError("Cursor inválido para este listado")
+
+
+def apply_keyset(
+    query,
+    kind: str,
+    columns: Sequence[Any],
+    cursor: Optional[str],
+    limit: int,
+    offset: int = 0,
+    descending: bool = False
+):
+    """
+    Ordenar por las claves y paginar por cursor (o por offset si no hay cursor)
+
+    Se pide una fila de más para saber si hay página siguiente (ver split_page).
+
+    Args:
+        query: SELECT con los filtros ya aplicados
+        kind: Identificador del listado para el cursor
+        columns: Claves de orden; la última debe ser única (normalmente id)
+        cursor: Cursor de la página anterior (None = primera página / modo offset)
+        limit: Tamaño de página
+        offset: Offset para el modo clásico (se ignora si hay cursor)
+        descending: Orden descendente en todas las claves
+    """
+    if cursor:
+        values = decode_cursor(cursor, kind, len(columns))
+        _check_cursor_values(columns, values)
+        keys = tuple_(*columns)
+        query = query.where(keys < tuple_(*values) if descending else keys > tuple_(*values))
+    elif offset:
+        query = query.offset(offset)
+
+    order = [column.desc() for column in columns] if descending else list(columns)
+    return query.order_by(*order).limit(limit + 1)
+
+
+def split_page(
+    rows: Sequence[Any],
+    kind: str,
+    limit: int,
+    key: Callable[[Any], Sequence[Any]]
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Recortar la fila extra de apply_keyset y generar el cursor siguiente
+
+    Returns:
+        (filas de la página, cursor de la página siguiente o None si es la última)
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(kind, key(rows[-1]))
+
+
+__all__ = [
+    'InvalidCursorError',
+    'encode_cursor',
+    'decode_cursor',
+    'apply_keyset',
+    'split_page'
+]
@@ -0,0 +1,220 @@
+"""
+Resiliencia para llamadas entre servicios
+- CircuitBreaker: corta las llamadas a un upstream degradado y lo sondea en half-open
+- RetryBudget: limita los reintentos (y hedges) a una fracción del tráfico total
+- LatencyTracker: percentiles de latencia por upstream para decidir cuándo hacer hedging
+"""
+import os
+import time
+from collections import deque
+from typing import Dict, Optional
+
+# Estados del circuit breaker
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker por upstream con sondeo half-open"""
+
+    def __init__(self, name: str, failure_threshold: int, recovery_timeout: float, half_open_max_calls: int = 1):
+        """
+        Args:
+            name: Identificador del upstream (URL base)
+            failure_threshold: Fallos consecutivos que abren el circuito
+            recovery_timeout: Segundos en abierto antes de permitir sondeos
+            half_open_max_calls: Sondeos simultáneos permitidos en half-open
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.half_open_calls = 0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        """Indicar si se puede llamar al upstream (reserva un sondeo en half-open)"""
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                self.rejected += 1
+                return False
+            self.state = HALF_OPEN
+            self.half_open_calls = 0
+
+        if self.state == HALF_OPEN:
+            if self.half_open_calls >= self.half_open_max_calls:
+                self.rejected += 1
+                return False
+            self.half_open_calls += 1
+
+        return True
+
+    def release(self) -> None:
+        """Liberar un sondeo reservado que terminó sin resultado (p. ej. cancelado)"""
+        if self.state == HALF_OPEN and self.half_open_calls > 0:
+            self.half_open_calls -= 1
+
+    def record_success(self) -> None:
+        """Registrar una llamada exitosa (cierra el circuito si estaba sondeando)"""
+        self.consecutive_failures = 0
+        if self.state != CLOSED:
+            self.state = CLOSED
+            self.half_open_calls = 0
+
+    def record_failure(self) -> None:
+        """Registrar un fallo (abre el circuito al superar el umbral o si falla un sondeo)"""
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self.half_open_calls = 0
+
+    def get_stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "rejected": self.rejected
+        }
+
+
+class RetryBudget:
+    """
+    Presupuesto global de reintentos
+
+    Cada solicitud original deposita `ratio` tokens y cada reintento o hedge
+    consume uno, de modo que en una degradación los reintentos no multiplican
+    la carga más allá de esa fracción. `min_per_second` garantiza un mínimo
+    de reintentos con poco tráfico.
+    """
+
+    def __init__(self, ratio: float, min_per_second: float, max_tokens: float = 100.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self._last_refill = time.monotonic()
+        self.spent = 0
+        self.exhausted = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.max_tokens, self.tokens + (now - self._last_refill) * self.min_per_second)
+        self._last_refill = now
+
+    def record_request(self) -> None:
+        """Registrar una solicitud original"""
+        self._refill()
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Consumir un token para un reintento/hedge; False si el presupuesto está agotado"""
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            self.spent += 1
+            return True
+        self.exhausted += 1
+        return False
+
+    def get_stats(self) -> dict:
+        self._refill()
+        return {
+            "tokens": round(self.tokens, 2),
+            "spent": self.spent,
+            "exhausted": self.exhausted
+        }
+
+
+class LatencyTracker:
+    """Ventana de latencias recientes de un upstream"""
+
+    def __init__(self, window: int = 500):
+        self._samples = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, percentile: float, min_samples: int = 20) -> Optional[float]:
+        """Percentil de la ventana o None si aún no hay muestras suficientes"""
+        if len(self._samples) < min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(int(round(percentile * (len(ordered) - 1))), len(ordered) - 1)
+        return ordered[index]
+
+
+class ResilienceRegistry:
+    """Breakers y latencias por upstream más el presupuesto global de reintentos"""
+
+    def __init__(self):
+        self.failure_threshold = int(os.getenv("HTTP_BREAKER_FAILURE_THRESHOLD", "5"))
+        self.recovery_timeout = float(os.getenv("HTTP_BREAKER_RECOVERY_TIMEOUT", "15"))
+        self.half_open_max_calls = int(os.getenv("HTTP_BREAKER_HALF_OPEN_CALLS", "1"))
+        self.retry_budget = RetryBudget(
+            ratio=float(os.getenv("HTTP_RETRY_BUDGET_RATIO", "0.1")),
+            min_per_second=float(os.getenv("HTTP_RETRY_BUDGET_MIN_PER_SECOND", "1"))
+        )
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._latencies: Dict[str, LatencyTracker] = {}
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def get_breaker(self, upstream: str) -> CircuitBreaker:
+        """Obtener (o crear) el breaker de un upstream"""
+        breaker = self._breakers.get(upstream)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                upstream,
+                self.failure_threshold,
+                self.recovery_timeout,
+                self.half_open_max_calls
+            )
+            self._breakers[upstream] = breaker
+        return breaker
+
+    def get_latency(self, upstream: str) -> LatencyTracker:
+        """Obtener (o crear) el registro de latencias de un upstream"""
+        tracker = self._latencies.get(upstream)
+        if tracker is None:
+            tracker = LatencyTracker()
+            self._latencies[upstream] = tracker
+        return tracker
+
+    def get_stats(self) -> dict:
+        """Obtener el estado de breakers, presupuesto de reintentos y hedging"""
+        return {
+            "breakers": {name: breaker.get_stats() for name, breaker in self._breakers.items()},
+            "retry_budget": self.retry_budget.get_stats(),
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins
+        }
+
+
+# Instancia global (una por proceso)
+resilience: Optional[ResilienceRegistry] = None
+
+
+def get_resilience() -> ResilienceRegistry:
+    """Obtener el registro global de resiliencia"""
+    global resilience
+
+    if resilience is None:
+        resilience = ResilienceRegistry()
+    return resilience
+
+
+__all__ = [
+    'CLOSED',
+    'OPEN',
+    'HALF_OPEN',
+    'CircuitBreaker',
+    'RetryBudget',
+    'LatencyTracker',
+    'ResilienceRegistry',
+    'resilience',
+    'get_resilience'
+]
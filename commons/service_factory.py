@@ -16,7 +16,10 @@ from pydantic import BaseModel
 
 from .config import config
 from .middleware import auth_middleware_dict
-from .database import create_tables, test_connection
+from .database import create_tables, test_connection, ReadRoutingMiddleware, UnitOfWorkMiddleware, get_database_metrics
+from .http_pool import close_http_pool
+from .pagination import InvalidCursorError
+from .token_verifier import get_token_verifier, is_local_verification_enabled
 
 
 class ServiceConfig:
@@ -80,7 +83,8 @@ def create_service_factory(
     custom_exception_handlers: Dict[type, Callable] = None,
     custom_middleware: List[Callable] = None,
     enable_auth: bool = True,
-    enable_auto_tables: bool = False
+    enable_auto_tables: bool = False,
+    enable_unit_of_work: bool = False
 ) -> FastAPI:
     """
     Factory para crear servicios FastAPI estandarizados
@@ -93,6 +97,11 @@ def create_service_factory(
         print(f"🚀 {service_config.service_name} iniciando...")
         print(f"📋 Configuración: {service_config.__dict__}")
         
+        # Precargar y refrescar en segundo plano los certificados de Firebase
+        if is_local_verification_enabled():
+            print("🔑 Verificación local de tokens habilitada")
+            get_token_verifier().start_background_refresh()
+        
         # Crear tablas automáticamente si está habilitado
         if enable_auto_tables and base_model:
             try:
@@ -112,6 +121,12 @@ def create_service_factory(
         
         # Shutdown
         print(f"🛑 {service_config.service_name} deteniendo...")
+        
+        if is_local_verification_enabled():
+            await get_token_verifier().stop_background_refresh()
+        
+        # Cerrar sesiones HTTP compartidas con otros servicios
+        await close_http_pool()
     
     # Crear aplicación FastAPI
     app = FastAPI(
@@ -164,6 +179,14 @@ def create_service_factory(
         for middleware in custom_middleware:
             app.add_middleware(middleware)
     
+    # Unidad de trabajo por request: una sesión y un commit compartidos por los repositorios
+    if enable_unit_of_work:
+        app.add_middleware(UnitOfWorkMiddleware, database_url=service_config.database_url or None)
+    
+    # Lecturas GET/HEAD a réplicas (exterior a la unidad de trabajo, funciona con o sin ella)
+    if service_config.database_url:
+        app.add_middleware(ReadRoutingMiddleware)
+    
     # Exception handlers estándar
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
@@ -190,6 +213,23 @@ def create_service_factory(
             content=error_response.model_dump()
         )
     
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+        """Cursor de paginación mal formado o de otro listado"""
+        from .error_codes import ErrorCode
+        
+        error_response = ErrorResponse(
+            message=str(exc),
+            error_code=ErrorCode.INVALID_CURSOR.value,
+            timestamp=datetime.utcnow().isoformat(),
+            path=request.url.path,
+            request_id=getattr(request.state, 'request_id', None)
+        )
+        return JSONResponse(
+            status_code=400,
+            content=error_response.model_dump()
+        )
+    
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         """Manejador de excepciones generales estándar"""
@@ -255,6 +295,11 @@ def create_service_factory(
             }
         }
     
+    @app.get("/db-metrics")
+    async def database_metrics():
+        """Telemetría del pool de conexiones y de las consultas (esperas, gauges, latencias, consultas lentas)"""
+        return get_database_metrics()
+    
     # Configurar OpenAPI personalizado con autenticación Bearer
     def custom_openapi():
         """Configuración personalizada de OpenAPI"""
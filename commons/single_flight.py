@@ -0,0 +1,90 @@
+"""
+Coalescencia de solicitudes idénticas en vuelo (single-flight)
+Las llamadas concurrentes con la misma clave comparten una sola ejecución
+upstream y reciben cada una su propia copia del resultado
+"""
+import asyncio
+import copy
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Agrupa llamadas concurrentes idénticas en una sola ejecución"""
+
+    def __init__(self):
+        # Clave -> tarea upstream en curso
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.requests = 0
+        self.upstream_calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Ejecutar factory una sola vez por clave entre las llamadas concurrentes
+
+        La llamada upstream corre en una tarea propia: si el solicitante que la
+        inició se cancela, el resto de los que esperan no se ve afectado.
+
+        Args:
+            key: Clave que identifica solicitudes equivalentes
+            factory: Función que crea la corrutina upstream
+
+        Returns:
+            Copia independiente del resultado (los que esperan pueden modificarlo)
+        """
+        self.requests += 1
+
+        task = self._in_flight.get(key)
+        if task is None:
+            self.upstream_calls += 1
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            self.coalesced += 1
+
+        result = await asyncio.shield(task)
+        # Todos, también quien inició la llamada, reciben una copia: el resultado
+        # de la tarea nunca se entrega, así que ningún solicitante ve cambios de otro
+        return copy.deepcopy(result)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """Quitar la tarea terminada del registro (si sigue siendo la vigente)"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Evitar el aviso de excepción no recuperada cuando nadie quedó esperando
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> dict:
+        """Obtener métricas de coalescencia"""
+        return {
+            "requests": self.requests,
+            "upstream_calls": self.upstream_calls,
+            "coalesced": self.coalesced,
+            "coalescing_ratio": round(self.coalesced / self.requests, 4) if self.requests else 0.0,
+            "in_flight": len(self._in_flight)
+        }
+
+
+# Instancia global (una por proceso)
+single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Obtener la instancia global de coalescencia de solicitudes"""
+    global single_flight
+
+    if single_flight is None:
+        single_flight = SingleFlight()
+    return single_flight
+
+
+__all__ = [
+    'SingleFlight',
+    'single_flight',
+    'get_single_flight'
+]
@@ -0,0 +1,111 @@
+"""
+Motor de disponibilidad de slots
+Resuelve solapamientos entre slots y reservas con intervalos ordenados una sola
+vez y búsqueda binaria, en lugar de comparar cada slot contra cada reserva
+"""
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+# Intervalo semiabierto [inicio, fin); los extremos pueden ser time, datetime o números
+Interval = Tuple[Any, Any]
+
+
+class IntervalIndex:
+    """Índice de intervalos ocupados para consultar solapamientos en O(log n)"""
+
+    def __init__(self, intervals: Iterable[Interval]):
+        """
+        Construir el índice
+
+        Args:
+            intervals: Intervalos ocupados [inicio, fin). Los vacíos o invertidos se ignoran
+        """
+        # (inicio, fin, posición original) de los intervalos válidos, ordenados por inicio
+        by_start = sorted(
+            (
+                (start, end, position)
+                for position, (start, end) in enumerate(intervals)
+                if start < end
+            ),
+            key=lambda interval: interval[0]
+        )
+
+        self._starts = [start for start, _, _ in by_start]
+        self._ends = sorted(end for _, end, _ in by_start)
+
+        # Máximo fin acumulado (y su posición original) entre los intervalos ordenados por inicio
+        self._max_end: List[Any] = []
+        self._max_end_position: List[int] = []
+        for start, end, position in by_start:
+            if not self._max_end or end > self._max_end[-1]:
+                self._max_end.append(end)
+                self._max_end_position.append(position)
+            else:
+                self._max_end.append(self._max_end[-1])
+                self._max_end_position.append(self._max_end_position[-1])
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def count_overlaps(self, start: Any, end: Any) -> int:
+        """
+        Contar los intervalos que se solapan con [start, end)
+
+        Un intervalo se solapa si empieza antes de end y termina después de start.
+        """
+        if start >= end:
+            return 0
+        # Empiezan antes de end, menos los que ya terminaron en start (también empezaron antes de end)
+        return bisect_left(self._starts, end) - bisect_right(self._ends, start)
+
+    def find_overlap(self, start: Any, end: Any) -> Optional[int]:
+        """
+        Obtener un intervalo que se solapa con [start, end)
+
+        Returns:
+            Posición original del intervalo (el que termina más tarde) o None si no hay solapamiento
+        """
+        if start >= end:
+            return None
+        candidates = bisect_left(self._starts, end)
+        if candidates and self._max_end[candidates - 1] > start:
+            return self._max_end_position[candidates - 1]
+        return None
+
+
+def find_overlaps(slots: Sequence[Interval], busy: Iterable[Interval]) -> List[Optional[int]]:
+    """
+    Para cada slot, obtener la posición de un intervalo ocupado que lo solapa
+
+    Args:
+        slots: Slots [inicio, fin) a verificar
+        busy: Intervalos ocupados (por ejemplo, reservas)
+
+    Returns:
+        Lista paralela a slots con la posición en busy o None si el slot está libre
+    """
+    index = IntervalIndex(busy)
+    return [index.find_overlap(start, end) for start, end in slots]
+
+
+def count_overlaps(slots: Sequence[Interval], busy: Iterable[Interval]) -> List[int]:
+    """
+    Para cada slot, contar cuántos intervalos ocupados lo solapan
+
+    Args:
+        slots: Slots [inicio, fin) a verificar
+        busy: Intervalos ocupados (por ejemplo, reservas)
+
+    Returns:
+        Lista paralela a slots con la cantidad de solapamientos
+    """
+    index = IntervalIndex(busy)
+    return [index.count_overlaps(start, end) for start, end in slots]
+
+
+__all__ = [
+    'Interval',
+    'IntervalIndex',
+    'find_overlaps',
+    'count_overlaps'
+]
@@ -0,0 +1,117 @@
+"""
+Caché LRU acotada para resultados de validación de tokens
+El TTL de cada entrada nunca supera la expiración (exp) del propio token
+"""
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from jose import jwt, JWTError
+
+
+class TokenValidationCache:
+    """Caché LRU de validaciones indexada por hash del token y tipo de validación"""
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        negative_ttl_seconds: Optional[int] = None
+    ):
+        """
+        Inicializar la caché
+
+        Args:
+            max_size: Número máximo de entradas (opcional, usa AUTH_CACHE_MAX_SIZE)
+            ttl_seconds: TTL máximo de resultados válidos (opcional, usa AUTH_CACHE_TTL)
+            negative_ttl_seconds: TTL de resultados inválidos (opcional, usa AUTH_CACHE_NEGATIVE_TTL)
+        """
+        self.max_size = max_size if max_size is not None else int(os.getenv("AUTH_CACHE_MAX_SIZE", "10000"))
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else int(os.getenv("AUTH_CACHE_TTL", "300"))
+        self.negative_ttl_seconds = negative_ttl_seconds if negative_ttl_seconds is not None else int(
+            os.getenv("AUTH_CACHE_NEGATIVE_TTL", "10")
+        )
+        # Clave: (tipo, hash) -> (expira_en, es_valido, valor)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, bool, Any]]" = OrderedDict()
+
+    @staticmethod
+    def _hash_token(token: str) -> str:
+        """Hash del token (nunca se guarda el token en claro)"""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _token_expiration(token: str) -> Optional[float]:
+        """Leer el claim exp sin verificar la firma (solo para acotar el TTL)"""
+        try:
+            exp = jwt.get_unverified_claims(token).get("exp")
+            return float(exp) if exp is not None else None
+        except (JWTError, TypeError, ValueError):
+            return None
+
+    def get(self, kind: str, token: str) -> Optional[Tuple[bool, Any]]:
+        """
+        Obtener un resultado cacheado
+
+        Args:
+            kind: Tipo de validación ("quick" o "full")
+            token: Token a consultar
+
+        Returns:
+            Tupla (es_valido, valor) o None si no hay entrada vigente
+        """
+        key = (kind, self._hash_token(token))
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, is_valid, value = entry
+        if time.time() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return is_valid, value
+
+    def set(self, kind: str, token: str, is_valid: bool, value: Any) -> None:
+        """
+        Guardar un resultado de validación
+
+        Args:
+            kind: Tipo de validación ("quick" o "full")
+            token: Token validado
+            is_valid: True si el token fue aceptado
+            value: Resultado (datos del usuario) o error a relanzar
+        """
+        if self.max_size <= 0:
+            return
+
+        now = time.time()
+        if is_valid:
+            expires_at = now + self.ttl_seconds
+            token_exp = self._token_expiration(token)
+            if token_exp is not None:
+                expires_at = min(expires_at, token_exp)
+        else:
+            expires_at = now + self.negative_ttl_seconds
+
+        if expires_at <= now:
+            return
+
+        key = (kind, self._hash_token(token))
+        self._entries[key] = (expires_at, is_valid, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Vaciar la caché"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ['TokenValidationCache']
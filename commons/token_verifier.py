@@ -0,0 +1,226 @@
+"""
+Verificación local de ID tokens de Firebase
+Valida firma RS256, audiencia, emisor y expiración sin llamar al Auth Service
+"""
+import asyncio
+import logging
+import os
+import re
+import time
+from typing import Dict, Optional
+
+import aiohttp
+from jose import jwt, JWTError, ExpiredSignatureError
+
+from .config import config
+from .http_pool import get_http_pool
+
+logger = logging.getLogger(__name__)
+
+
+class TokenVerificationError(Exception):
+    """Excepción para tokens que no superan la verificación local"""
+
+    def __init__(self, message: str, error_code: str = "INVALID_TOKEN"):
+        self.message = message
+        self.error_code = error_code
+        super().__init__(message)
+
+
+class CertificateFetchError(Exception):
+    """Excepción cuando no se pueden obtener los certificados de Google"""
+    pass
+
+
+class FirebaseTokenVerifier:
+    """Verificador local de ID tokens de Firebase con caché de certificados"""
+
+    CERTS_HOST = "https://www.googleapis.com"
+    CERTS_PATH = "/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+    ISSUER_PREFIX = "https://securetoken.google.com/"
+
+    def __init__(
+        self,
+        project_id: Optional[str] = None,
+        clock_skew_seconds: Optional[int] = None,
+        refresh_margin_seconds: Optional[int] = None
+    ):
+        """
+        Inicializar el verificador
+
+        Args:
+            project_id: ID del proyecto de Firebase (opcional, usa la configuración por defecto)
+            clock_skew_seconds: Tolerancia de reloj para exp/iat (opcional)
+            refresh_margin_seconds: Segundos antes de la expiración para refrescar certificados (opcional)
+        """
+        self.project_id = project_id or config.FIREBASE_PROJECT_ID
+        self.issuer = f"{self.ISSUER_PREFIX}{self.project_id}"
+        self.clock_skew_seconds = clock_skew_seconds if clock_skew_seconds is not None else int(
+            os.getenv("AUTH_TOKEN_CLOCK_SKEW", "60")
+        )
+        self.refresh_margin_seconds = refresh_margin_seconds if refresh_margin_seconds is not None else int(
+            os.getenv("AUTH_CERTS_REFRESH_MARGIN", "300")
+        )
+
+        self._certs: Dict[str, str] = {}
+        self._certs_expire_at: float = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # Certificados
+    # ------------------------------------------------------------------
+
+    async def _fetch_certs(self) -> None:
+        """Descargar los certificados de firma de Google y su max-age"""
+        session = get_http_pool().get_session(self.CERTS_HOST)
+        url = f"{self.CERTS_HOST}{self.CERTS_PATH}"
+
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status != 200:
+                    raise CertificateFetchError(f"HTTP {response.status} obteniendo certificados")
+                certs = await response.json(content_type=None)
+                cache_control = response.headers.get("Cache-Control", "")
+        except aiohttp.ClientError as e:
+            raise CertificateFetchError(f"Error de conexión obteniendo certificados: {e}")
+
+        match = re.search(r"max-age=(\d+)", cache_control)
+        max_age = int(match.group(1)) if match else 3600
+
+        self._certs = certs
+        self._certs_expire_at = time.time() + max_age
+        logger.info(f"🔑 {len(certs)} certificados de Firebase cargados (max-age={max_age}s)")
+
+    async def get_certs(self, force_refresh: bool = False) -> Dict[str, str]:
+        """
+        Obtener los certificados vigentes, descargándolos si expiraron
+
+        Args:
+            force_refresh: Forzar la descarga aunque la caché sea válida
+
+        Returns:
+            Dict[str, str]: Certificados PEM indexados por kid
+        """
+        if not force_refresh and self._certs and time.time() < self._certs_expire_at:
+            return self._certs
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            # Otro coroutine pudo refrescar mientras se esperaba el lock
+            if not force_refresh and self._certs and time.time() < self._certs_expire_at:
+                return self._certs
+            await self._fetch_certs()
+            return self._certs
+
+    async def _refresh_loop(self) -> None:
+        """Refrescar los certificados en segundo plano antes de que expiren"""
+        while True:
+            try:
+                await self.get_certs(force_refresh=True)
+                delay = max(self._certs_expire_at - time.time() - self.refresh_margin_seconds, 60)
+            except CertificateFetchError as e:
+                logger.warning(f"⚠️ No se pudieron refrescar los certificados: {e}")
+                delay = 60
+            await asyncio.sleep(delay)
+
+    def start_background_refresh(self) -> None:
+        """Iniciar la tarea de refresco de certificados (requiere event loop activo)"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop_background_refresh(self) -> None:
+        """Detener la tarea de refresco de certificados"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    # ------------------------------------------------------------------
+    # Verificación
+    # ------------------------------------------------------------------
+
+    async def verify(self, token: str) -> dict:
+        """
+        Verificar un ID token de Firebase localmente
+
+        Args:
+            token: ID token (JWT) emitido por Firebase
+
+        Returns:
+            dict: Claims decodificados del token
+
+        Raises:
+            TokenVerificationError: Si el token es inválido o expiró
+            CertificateFetchError: Si no se pudieron obtener los certificados
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except JWTError:
+            raise TokenVerificationError("Formato de token inválido")
+
+        if header.get("alg") != "RS256":
+            raise TokenVerificationError("Algoritmo de firma no soportado")
+
+        kid = header.get("kid")
+        certs = await self.get_certs()
+        if kid not in certs:
+            # Google rota las claves; reintentar una vez con certificados frescos
+            certs = await self.get_certs(force_refresh=True)
+            if kid not in certs:
+                raise TokenVerificationError("Token firmado con una clave desconocida")
+
+        try:
+            claims = jwt.decode(
+                token,
+                certs[kid],
+                algorithms=["RS256"],
+                audience=self.project_id,
+                issuer=self.issuer,
+                options={"verify_at_hash": False, "leeway": self.clock_skew_seconds}
+            )
+        except ExpiredSignatureError:
+            raise TokenVerificationError("Token expirado", "TOKEN_EXPIRED")
+        except JWTError as e:
+            raise TokenVerificationError(f"Token inválido: {e}")
+
+        if not claims.get("sub"):
+            raise TokenVerificationError("Token sin subject")
+        if claims.get("auth_time", 0) > time.time() + self.clock_skew_seconds:
+            raise TokenVerificationError("auth_time del token en el futuro")
+
+        claims["uid"] = claims["sub"]
+        return claims
+
+
+# Instancia global del verificador (se inicializará cuando se necesite)
+token_verifier: Optional[FirebaseTokenVerifier] = None
+
+
+def is_local_verification_enabled() -> bool:
+    """Indica si la verificación local de tokens está habilitada"""
+    return config.AUTH_LOCAL_VERIFICATION and bool(config.FIREBASE_PROJECT_ID)
+
+
+def get_token_verifier() -> FirebaseTokenVerifier:
+    """Obtener la instancia global del verificador de tokens"""
+    global token_verifier
+
+    if token_verifier is None:
+        token_verifier = FirebaseTokenVerifier()
+    return token_verifier
+
+
+__all__ = [
+    'FirebaseTokenVerifier',
+    'TokenVerificationError',
+    'CertificateFetchError',
+    'token_verifier',
+    'get_token_verifier',
+    'is_local_verification_enabled'
+]
@@ -0,0 +1,90 @@
+"""
+Caché en memoria con TTL y límite LRU
+Pensada para respuestas derivadas que se pueden recalcular (slots, datos de referencia)
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Caché LRU acotada en la que cada entrada expira tras un TTL"""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        """
+        Inicializar la caché
+
+        Args:
+            max_size: Número máximo de entradas (0 deshabilita la caché)
+            ttl_seconds: Vigencia por defecto de cada entrada
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # Clave -> (expira_en, valor)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Obtener un valor vigente o None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Guardar un valor (desaloja el menos usado si se supera max_size)"""
+        if self.max_size <= 0:
+            return
+
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Eliminar las entradas cuya clave cumple el predicado
+
+        Returns:
+            int: Cantidad de entradas eliminadas
+        """
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Vaciar la caché"""
+        self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """Obtener estadísticas de uso"""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ['TTLCache']
@@ -10,6 +10,7 @@ load_dotenv()
 
 from commons.config import config
 from commons.service_factory import create_service_factory, ServiceConfig, RouterConfig, run_service
+from commons.http_cache import ETagMiddleware
 from ..domain.exceptions import LocationDomainException
 from ..domain.dto.responses import ErrorResponse
 from .routes import country_router, state_router, city_router, local_router, branch_router, sector_router, sector_type_router, measurement_unit_router, ramp_router, ramp_schedule_router
@@ -69,7 +70,28 @@ def create_location_app():
         routers=routers,
         custom_exception_handlers=custom_exception_handlers,
         enable_auth=False,  # Deshabilitado temporalmente
-        enable_auto_tables=True  # Habilitar creación automática de tablas
+        enable_auto_tables=True,  # Habilitar creación automática de tablas
+        # Una sesión y un commit por request compartidos por los repositorios
+        enable_unit_of_work=os.getenv("DATABASE_UNIT_OF_WORK", "true").lower() == "true"
+    )
+    
+    # Validadores (ETag + Cache-Control) para los datos de referencia: el gateway
+    # los cachea y revalida con If-None-Match
+    reference_max_age = int(os.getenv("LOCATION_REFERENCE_MAX_AGE", "60"))
+    app.add_middleware(
+        ETagMiddleware,
+        path_prefixes=[
+            f"{config.API_PREFIX}{prefix}"
+            for prefix in ("/countries", "/states", "/cities", "/sector-types", "/measurement-units")
+        ],
+        cache_control=f"private, max-age={reference_max_age}"
+    )
+    # Sucursales y rampas se editan desde el gateway: sin vigencia, se revalidan
+    # siempre (304 si no cambiaron) para no servir datos viejos tras una escritura
+    app.add_middleware(
+        ETagMiddleware,
+        path_prefixes=[f"{config.API_PREFIX}{prefix}" for prefix in ("/branches", "/ramps")],
+        cache_control="no-cache"
     )
     
     return app
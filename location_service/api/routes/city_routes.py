@@ -2,7 +2,7 @@
 Rutas para gestión de ciudades
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from typing import List, Optional
 
 from ...domain.dto.requests import CreateCityRequest, UpdateCityRequest, CityFilterRequest
 from ...domain.dto.responses import CityResponse, CityListResponse
@@ -12,6 +12,7 @@ from ...application.use_cases import (
     UpdateCityUseCase, DeleteCityUseCase
 )
 from ..middleware import auth_middleware
+from commons.counting import CountMode
 
 router = APIRouter(tags=["Cities"])
 
@@ -36,9 +37,18 @@ def get_delete_city_use_case() -> DeleteCityUseCase:
 async def get_cities(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    count_mode: Optional[CountMode] = None,
     use_case: ListCitiesUseCase = Depends(get_list_cities_use_case)
 ):
-    filter_request = CityFilterRequest(skip=skip, limit=limit)
+    filter_request = CityFilterRequest(
+        limit=limit,
+        offset=skip,
+        cursor=cursor,
+        include_total=include_total,
+        count_mode=count_mode
+    )
     return await use_case.execute(filter_request)
 
 
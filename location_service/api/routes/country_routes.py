@@ -2,7 +2,7 @@
 Rutas para gestión de países
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from typing import List, Optional
 
 from ...domain.dto.requests import CreateCountryRequest, UpdateCountryRequest
 from ...domain.dto.responses import CountryResponse, CountryListResponse
@@ -13,6 +13,7 @@ from ...application.use_cases import (
 )
 from ...domain.dto.requests import CountryFilterRequest
 from ..middleware import auth_middleware
+from commons.counting import CountMode
 
 router = APIRouter(tags=["Countries"])
 
@@ -48,9 +49,18 @@ def get_delete_country_use_case() -> DeleteCountryUseCase:
 async def get_countries(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    count_mode: Optional[CountMode] = None,
     use_case: ListCountriesUseCase = Depends(get_list_countries_use_case)
 ):
-    filter_request = CountryFilterRequest(limit=limit, offset=skip)
+    filter_request = CountryFilterRequest(
+        limit=limit,
+        offset=skip,
+        cursor=cursor,
+        include_total=include_total,
+        count_mode=count_mode
+    )
     return await use_case.execute(filter_request)
 
 
@@ -15,6 +15,7 @@ from ...application.use_cases import (
     UpdateLocalUseCase, DeleteLocalUseCase
 )
 from ..middleware import auth_middleware
+from commons.counting import CountMode
 
 router = APIRouter(tags=["Locals"])
 
@@ -78,6 +79,9 @@ async def list_locals(
     is_active: Optional[bool] = Query(None, description="Filtrar por estado activo"),
     limit: int = Query(100, ge=1, le=1000, description="Límite de resultados"),
     offset: int = Query(0, ge=0, description="Offset para paginación"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora offset"),
+    include_total: bool = Query(True, description="Calcular el total de resultados"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated"),
     use_case: ListLocalsUseCase = Depends(get_list_locals_use_case),
     current_user=Depends(auth_middleware["require_auth"])
 ):
@@ -87,7 +91,10 @@ async def list_locals(
         code=code,
         is_active=is_active,
         limit=limit,
-        offset=offset
+        offset=offset,
+        cursor=cursor,
+        include_total=include_total,
+        count_mode=count_mode
     )
     
     return await use_case.execute(filter_request)
@@ -17,6 +17,8 @@ from ...domain.exceptions.ramp_exceptions import (
 )
 from ...infrastructure.container import container
 from ..middleware import auth_middleware
+from commons.pagination import InvalidCursorError
+from commons.counting import CountMode
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +96,9 @@ async def list_ramps(
     is_available: Optional[bool] = Query(None, description="Disponibilidad de la rampa"),
     skip: int = Query(0, ge=0, description="Número de registros a omitir"),
     limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora skip"),
+    include_total: bool = Query(True, description="Calcular el total de resultados"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated"),
     sort_by: Optional[str] = Query(None, description="Campo para ordenar"),
     sort_order: Optional[str] = Query(None, description="Orden (asc/desc)")
 ):
@@ -105,6 +110,9 @@ async def list_ramps(
             is_available=is_available,
             skip=skip,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            count_mode=count_mode,
             sort_by=sort_by,
             sort_order=sort_order
         )
@@ -112,6 +120,9 @@ async def list_ramps(
         use_case = container.list_ramps_use_case()
         result = await use_case.execute(request)
         return result
+    except InvalidCursorError:
+        # El handler global lo traduce a 400 INVALID_CURSOR
+        raise
     except Exception as e:
         logger.error(f"❌ Error inesperado en list_ramps: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -1,7 +1,7 @@
 """
 Rutas de API para horarios de rampas
 """
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Header, Response, status
 from typing import Optional, List
 from ...infrastructure.container import Container
 from ...domain.dto.requests.ramp_schedule_requests import (
@@ -14,13 +14,16 @@ from ...domain.dto.responses.ramp_schedule_responses import (
     RampScheduleCreatedResponse,
     RampScheduleUpdatedResponse,
     RampScheduleDeletedResponse,
-    RampScheduleListResponse
+    RampScheduleListResponse,
+    BranchRampSchedulesResponse
 )
 from ...domain.exceptions.ramp_schedule_exceptions import (
     RampScheduleNotFoundException,
     RampScheduleAlreadyExistsException
 )
 from ..middleware import auth_middleware
+from commons.pagination import InvalidCursorError
+from commons.counting import CountMode
 
 router = APIRouter()
 
@@ -77,6 +80,33 @@ async def get_ramp_schedules_by_ramp(
         )
 
 
+@router.get("/branch/{branch_id}", response_model=BranchRampSchedulesResponse)
+async def get_branch_ramp_schedules(
+    response: Response,
+    branch_id: int = Path(..., gt=0, description="ID de la sucursal"),
+    day_of_week: Optional[int] = Query(None, ge=1, le=7, description="Día de la semana (1=Lunes, 7=Domingo); omitir para toda la semana"),
+    is_active: Optional[bool] = Query(None, description="Filtrar por estado activo"),
+    if_none_match: Optional[str] = Header(None),
+    current_user=Depends(auth_middleware["require_auth"]),
+    container = Depends(get_container)
+):
+    """Obtener los horarios de todas las rampas de una sucursal (soporta If-None-Match)"""
+    try:
+        use_case = container.get_branch_ramp_schedules_use_case()
+        etag, result = await use_case.execute(branch_id, day_of_week, is_active, if_none_match)
+        
+        if result is None:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        
+        response.headers["ETag"] = etag
+        return result
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}"
+        )
+
+
 @router.get("/{schedule_id}", response_model=RampScheduleResponse)
 async def get_ramp_schedule(
     schedule_id: int = Path(..., gt=0, description="ID del horario"),
@@ -109,7 +139,10 @@ async def list_ramp_schedules(
     name: Optional[str] = Query(None, description="Filtrar por nombre del horario"),
     is_active: Optional[bool] = Query(None, description="Filtrar por estado activo"),
     limit: int = Query(100, ge=1, le=1000, description="Límite de resultados"),
-    offset: int = Query(0, ge=0, description="Offset para paginación")
+    offset: int = Query(0, ge=0, description="Offset para paginación"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora offset"),
+    include_total: bool = Query(True, description="Calcular el total de resultados"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated")
 ):
     """Listar horarios de rampas con filtros"""
     try:
@@ -119,12 +152,18 @@ async def list_ramp_schedules(
             name=name,
             is_active=is_active,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
+            count_mode=count_mode
         )
         
         use_case = container.list_ramp_schedules_use_case()
         result = await use_case.execute(filter_request)
         return result
+    except InvalidCursorError:
+        # El handler global lo traduce a 400 INVALID_CURSOR
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -12,6 +12,7 @@ from ...application.use_cases import (
     UpdateSectorUseCase, DeleteSectorUseCase
 )
 from ..middleware import auth_middleware
+from commons.counting import CountMode
 
 router = APIRouter(tags=["Sectors"])
 
@@ -58,6 +59,9 @@ async def get_sectors(
     is_active: Optional[bool] = Query(None, description="Filtrar por estado activo"),
     limit: int = Query(100, ge=1, le=1000, description="Límite de resultados"),
     offset: int = Query(0, ge=0, description="Offset para paginación"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora offset"),
+    include_total: bool = Query(True, description="Calcular el total de resultados"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated"),
     use_case: ListSectorsUseCase = Depends(get_list_sectors_use_case)
 ):
     """Listar sectores con filtros"""
@@ -67,7 +71,10 @@ async def get_sectors(
         sector_type_id=sector_type_id,
         is_active=is_active,
         limit=limit,
-        offset=offset
+        offset=offset,
+        cursor=cursor,
+        include_total=include_total,
+        count_mode=count_mode
     )
     return await use_case.execute(filter_request)
 
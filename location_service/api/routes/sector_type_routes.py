@@ -13,6 +13,7 @@ from ...application.use_cases import (
 )
 from ...domain.dto.requests import SectorTypeFilterRequest
 from ..middleware import auth_middleware
+from commons.counting import CountMode
 
 router = APIRouter(tags=["Sector Types"])
 
@@ -49,6 +50,9 @@ async def get_sector_types(
     code: Optional[str] = Query(None, description="Filtrar por código"),
     limit: int = Query(100, ge=1, le=1000, description="Límite de resultados"),
     offset: int = Query(0, ge=0, description="Offset para paginación"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora offset"),
+    include_total: bool = Query(True, description="Calcular el total de resultados"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated"),
     use_case: ListSectorTypesUseCase = Depends(get_list_sector_types_use_case)
 ):
     """Listar tipos de sector con filtros"""
@@ -56,7 +60,10 @@ async def get_sector_types(
         name=name,
         code=code,
         limit=limit,
-        offset=offset
+        offset=offset,
+        cursor=cursor,
+        include_total=include_total,
+        count_mode=count_mode
     )
     return await use_case.execute(filter_request)
 
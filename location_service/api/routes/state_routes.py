@@ -2,7 +2,7 @@
 Rutas para gestión de estados
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Header
-from typing import List
+from typing import List, Optional
 
 from ...domain.dto.requests import CreateStateRequest, UpdateStateRequest, StateFilterRequest
 from ...domain.dto.responses import StateResponse, StateListResponse
@@ -12,6 +12,7 @@ from ...application.use_cases import (
     UpdateStateUseCase, DeleteStateUseCase
 )
 from ..middleware import auth_middleware
+from commons.counting import CountMode
 
 router = APIRouter(tags=["States"])
 
@@ -36,9 +37,18 @@ def get_delete_state_use_case() -> DeleteStateUseCase:
 async def get_states(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    count_mode: Optional[CountMode] = None,
     use_case: ListStatesUseCase = Depends(get_list_states_use_case)
 ):
-    filter_request = StateFilterRequest(skip=skip, limit=limit)
+    filter_request = StateFilterRequest(
+        limit=limit,
+        offset=skip,
+        cursor=cursor,
+        include_total=include_total,
+        count_mode=count_mode
+    )
     return await use_case.execute(filter_request)
 
 
@@ -0,0 +1,81 @@
+"""
+Caso de uso para obtener los horarios de todas las rampas de una sucursal
+"""
+import hashlib
+from typing import Optional, Tuple
+from ...domain.interfaces.ramp_schedule_repository import RampScheduleRepository
+from ...domain.dto.responses.ramp_schedule_responses import (
+    RampScheduleResponse,
+    BranchRampSchedulesItem,
+    BranchRampSchedulesResponse
+)
+
+
+class GetBranchRampSchedulesUseCase:
+    """Caso de uso para obtener los horarios de todas las rampas de una sucursal"""
+    
+    def __init__(self, ramp_schedule_repository: RampScheduleRepository):
+        self.ramp_schedule_repository = ramp_schedule_repository
+    
+    async def get_etag(self, branch_id: int, day_of_week: Optional[int] = None, is_active: Optional[bool] = None) -> str:
+        """
+        Calcular el ETag de los horarios de la sucursal
+        
+        Se basa en la cantidad de horarios y la última modificación de horarios y
+        rampas, por lo que cambia al crear, editar o eliminar un horario.
+        """
+        total, last_modified = await self.ramp_schedule_repository.get_branch_version(branch_id, day_of_week)
+        version = f"{branch_id}:{day_of_week}:{is_active}:{total}:{last_modified.isoformat() if last_modified else ''}"
+        return f'W/"{hashlib.sha256(version.encode("utf-8")).hexdigest()[:32]}"'
+    
+    async def execute(
+        self,
+        branch_id: int,
+        day_of_week: Optional[int] = None,
+        is_active: Optional[bool] = None,
+        if_none_match: Optional[str] = None
+    ) -> Tuple[str, Optional[BranchRampSchedulesResponse]]:
+        """
+        Ejecutar el caso de uso
+        
+        Returns:
+            Tupla (etag, response). response es None si if_none_match coincide con el ETag vigente
+        """
+        etag = await self.get_etag(branch_id, day_of_week, is_active)
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return etag, None
+        
+        # Obtener horarios del repositorio (una sola consulta con join a rampas)
+        ramps_with_schedules = await self.ramp_schedule_repository.get_by_branch(branch_id, day_of_week, is_active)
+        
+        # Convertir a responses
+        items = [
+            BranchRampSchedulesItem(
+                ramp_id=ramp.id,
+                ramp_name=ramp.name,
+                is_available=ramp.is_available,
+                schedules=[
+                    RampScheduleResponse(
+                        id=schedule.id,
+                        ramp_id=schedule.ramp_id,
+                        day_of_week=schedule.day_of_week,
+                        day_name=schedule.get_day_name(),
+                        name=schedule.name,
+                        start_time=schedule.start_time,
+                        end_time=schedule.end_time,
+                        is_active=schedule.is_active,
+                        created_at=schedule.created_at,
+                        updated_at=schedule.updated_at
+                    )
+                    for schedule in schedules
+                ]
+            )
+            for ramp, schedules in ramps_with_schedules
+        ]
+        
+        return etag, BranchRampSchedulesResponse(
+            branch_id=branch_id,
+            day_of_week=day_of_week,
+            ramps=items,
+            total=sum(len(item.schedules) for item in items)
+        )
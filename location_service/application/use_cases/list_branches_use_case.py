@@ -36,13 +36,15 @@ class ListBranchesUseCase:
     async def execute(self, filter_request: BranchFilterRequest) -> BranchListResponse:
         """Ejecutar el caso de uso"""
         # Obtener sucursales del repositorio
-        branches, total = await self.branch_repository.list_all(filter_request)
+        branches, total, next_cursor = await self.branch_repository.list_all(filter_request)
         
 
         if not branches:
             return BranchListResponse(
                 branches=[],
-                total=total,
+                total=total.value if total is not None else None,
+                total_mode=total.mode if total is not None else None,
+                next_cursor=next_cursor,
                 limit=filter_request.limit,
                 offset=filter_request.offset
             )
@@ -104,7 +106,9 @@ class ListBranchesUseCase:
         
         return BranchListResponse(
             branches=branch_responses,
-            total=total,
+            total=total.value if total is not None else None,
+            total_mode=total.mode if total is not None else None,
+            next_cursor=next_cursor,
             limit=filter_request.limit,
             offset=filter_request.offset
         ) 
\ No newline at end of file
@@ -26,7 +26,7 @@ class ListCitiesUseCase:
         """Ejecutar el caso de uso"""
         
         # Obtener ciudades del repositorio
-        cities, total = await self.city_repository.get_all(filter_request)
+        cities, total, next_cursor = await self.city_repository.get_all(filter_request)
         
         # Convertir a DTOs de respuesta con información relacionada
         city_responses = []
@@ -60,7 +60,9 @@ class ListCitiesUseCase:
         # Retornar respuesta
         return CityListResponse(
             cities=city_responses,
-            total=total,
+            total=total.value if total is not None else None,
+            total_mode=total.mode if total is not None else None,
+            next_cursor=next_cursor,
             limit=filter_request.limit,
             offset=filter_request.offset
         ) 
\ No newline at end of file
@@ -17,7 +17,7 @@ class ListCountriesUseCase:
         """Ejecutar el caso de uso"""
         
         # Obtener países del repositorio
-        countries, total = await self.country_repository.get_all(filter_request)
+        countries, total, next_cursor = await self.country_repository.get_all(filter_request)
         
         # Convertir a DTOs de respuesta
         country_responses = [
@@ -36,7 +36,9 @@ class ListCountriesUseCase:
         # Retornar respuesta
         return CountryListResponse(
             countries=country_responses,
-            total=total,
+            total=total.value if total is not None else None,
+            total_mode=total.mode if total is not None else None,
+            next_cursor=next_cursor,
             limit=filter_request.limit,
             offset=filter_request.offset
         ) 
\ No newline at end of file
@@ -15,7 +15,7 @@ class ListLocalsUseCase:
     async def execute(self, filter_request: LocalFilterRequest) -> LocalListResponse:
         """Ejecutar el caso de uso"""
         # Obtener locales del repositorio
-        locals, total = await self.local_repository.list_all(filter_request)
+        locals, total, next_cursor = await self.local_repository.list_all(filter_request)
         
         # Convertir a responses
         local_responses = [
@@ -35,7 +35,9 @@ class ListLocalsUseCase:
         
         return LocalListResponse(
             locals=local_responses,
-            total=total,
+            total=total.value if total is not None else None,
+            total_mode=total.mode if total is not None else None,
+            next_cursor=next_cursor,
             limit=filter_request.limit,
             offset=filter_request.offset
         ) 
\ No newline at end of file
@@ -16,7 +16,7 @@ class ListMeasurementUnitsUseCase:
     
     async def execute(self, filter_request: MeasurementUnitFilterRequest) -> MeasurementUnitListResponse:
         """Ejecutar el caso de uso"""
-        measurement_units, total = await self.measurement_unit_repository.list_all(filter_request)
+        measurement_units, total, next_cursor = await self.measurement_unit_repository.list_all(filter_request)
         
         # Convertir entidades a responses
         items = [
@@ -34,7 +34,9 @@ class ListMeasurementUnitsUseCase:
         
         return MeasurementUnitListResponse(
             items=items,
-            total=total,
+            total=total.value if total is not None else None,
+            total_mode=total.mode if total is not None else None,
+            next_cursor=next_cursor,
             limit=filter_request.limit,
             offset=filter_request.offset
         ) 
\ No newline at end of file
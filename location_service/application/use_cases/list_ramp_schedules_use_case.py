@@ -16,7 +16,7 @@ class ListRampSchedulesUseCase:
         """Ejecutar el caso de uso"""
         
         # Obtener horarios del repositorio
-        schedules, total = await self.ramp_schedule_repository.list(filter_request)
+        schedules, total, next_cursor = await self.ramp_schedule_repository.list(filter_request)
         
         # Convertir a responses
         schedule_responses = [
@@ -40,7 +40,9 @@ class ListRampSchedulesUseCase:
         
         return RampScheduleListResponse(
             schedules=schedule_responses,
-            total=total,
+            total=total.value if total is not None else None,
+            total_mode=total.mode if total is not None else None,
+            next_cursor=next_cursor,
             page=page,
             size=len(schedule_responses)
         )
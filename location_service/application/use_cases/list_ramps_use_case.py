@@ -19,7 +19,7 @@ class ListRampsUseCase:
         """Ejecutar el caso de uso"""
         
         # Obtener rampas del repositorio
-        ramps, total = await self.ramp_repository.list(filter_request)
+        ramps, total, next_cursor = await self.ramp_repository.list(filter_request)
         
         # Convertir a DTOs de respuesta
         ramp_responses = [
@@ -37,7 +37,9 @@ class ListRampsUseCase:
         # Retornar respuesta
         return RampListResponse(
             ramps=ramp_responses,
-            total=total,
+            total=total.value if total is not None else None,
+            total_mode=total.mode if total is not None else None,
+            next_cursor=next_cursor,
             skip=filter_request.skip,
             limit=filter_request.limit
         ) 
\ No newline at end of file
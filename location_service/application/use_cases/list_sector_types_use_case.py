@@ -16,7 +16,7 @@ class ListSectorTypesUseCase:
         """Ejecutar el caso de uso"""
         
         # Obtener tipos de sector del repositorio
-        sector_types, total = await self.sector_type_repository.list(filter_request)
+        sector_types, total, next_cursor = await self.sector_type_repository.list(filter_request)
         
         # Convertir a DTOs de respuesta
         sector_type_responses = [
@@ -40,7 +40,9 @@ class ListSectorTypesUseCase:
         # Retornar respuesta
         return SectorTypeListResponse(
             sector_types=sector_type_responses,
-            total=total,
+            total=total.value if total is not None else None,
+            total_mode=total.mode if total is not None else None,
+            next_cursor=next_cursor,
             page=page,
             size=filter_request.limit
         ) 
\ No newline at end of file
@@ -19,7 +19,7 @@ class ListSectorsUseCase:
         """Ejecutar el caso de uso"""
         
         # Obtener sectores del repositorio
-        sectors, total = await self.sector_repository.list(filter_request)
+        sectors, total, next_cursor = await self.sector_repository.list(filter_request)
         
         # Convertir a respuestas
         sector_responses = []
@@ -45,7 +45,9 @@ class ListSectorsUseCase:
         # Retornar respuesta
         return SectorListResponse(
             sectors=sector_responses,
-            total=total,
+            total=total.value if total is not None else None,
+            total_mode=total.mode if total is not None else None,
+            next_cursor=next_cursor,
             page=page,
             size=filter_request.limit
         ) 
\ No newline at end of file
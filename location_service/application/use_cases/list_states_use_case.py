@@ -19,7 +19,7 @@ class ListStatesUseCase:
         """Ejecutar el caso de uso"""
         
         # Obtener estados del repositorio
-        states, total = await self.state_repository.get_all(filter_request)
+        states, total, next_cursor = await self.state_repository.get_all(filter_request)
         
         # Convertir a DTOs de respuesta con información relacionada
         state_responses = []
@@ -43,7 +43,9 @@ class ListStatesUseCase:
         # Retornar respuesta
         return StateListResponse(
             states=state_responses,
-            total=total,
+            total=total.value if total is not None else None,
+            total_mode=total.mode if total is not None else None,
+            next_cursor=next_cursor,
             limit=filter_request.limit,
             offset=filter_request.offset
         ) 
\ No newline at end of file
@@ -3,6 +3,7 @@ DTOs de requests para sucursales
 """
 from typing import Optional, List
 from pydantic import BaseModel, Field, validator
+from commons.counting import CountMode
 
 
 class CreateBranchRequest(BaseModel):
@@ -67,4 +68,7 @@ class BranchFilterRequest(BaseModel):
     city_id: Optional[int] = Field(None, description="Filtrar por ciudad")
     is_active: Optional[bool] = Field(None, description="Filtrar por estado activo")
     limit: int = Field(100, ge=1, le=1000, description="Límite de resultados")
-    offset: int = Field(0, ge=0, description="Offset para paginación") 
\ No newline at end of file
+    offset: int = Field(0, ge=0, description="Offset para paginación")
+    cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (ignora offset)")
+    include_total: bool = Field(True, description="Calcular el total de resultados")
+    count_mode: Optional[CountMode] = Field(None, description="Modo del total: exact, cached o estimated (None = LIST_COUNT_MODE)")
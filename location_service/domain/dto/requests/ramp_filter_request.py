@@ -3,6 +3,7 @@ DTO para request de filtro de rampas
 """
 from pydantic import BaseModel, Field
 from typing import Optional
+from commons.counting import CountMode
 
 
 class RampFilterRequest(BaseModel):
@@ -12,6 +13,9 @@ class RampFilterRequest(BaseModel):
     name: Optional[str] = Field(None, description="Nombre de la rampa")
     is_available: Optional[bool] = Field(None, description="Disponibilidad de la rampa")
     skip: int = Field(0, ge=0, description="Número de registros a omitir")
+    cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (ignora skip)")
+    include_total: bool = Field(True, description="Calcular el total de resultados")
+    count_mode: Optional[CountMode] = Field(None, description="Modo del total: exact, cached o estimated (None = LIST_COUNT_MODE)")
     limit: int = Field(100, ge=1, le=1000, description="Número máximo de registros")
     sort_by: Optional[str] = Field(None, description="Campo para ordenar")
     sort_order: Optional[str] = Field(None, description="Orden (asc/desc)")
@@ -3,6 +3,7 @@ DTOs de requests para rampas
 """
 from pydantic import BaseModel, Field, validator
 from typing import Optional
+from commons.counting import CountMode
 
 
 class CreateRampRequest(BaseModel):
@@ -38,4 +39,7 @@ class RampFilterRequest(BaseModel):
     branch_id: Optional[int] = Field(None, gt=0, description="Filtrar por sucursal")
     is_available: Optional[bool] = Field(None, description="Filtrar por disponibilidad")
     limit: int = Field(100, ge=1, le=1000, description="Límite de resultados")
-    offset: int = Field(0, ge=0, description="Offset para paginación") 
\ No newline at end of file
+    offset: int = Field(0, ge=0, description="Offset para paginación")
+    cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (ignora offset)")
+    include_total: bool = Field(True, description="Calcular el total de resultados")
+    count_mode: Optional[CountMode] = Field(None, description="Modo del total: exact, cached o estimated (None = LIST_COUNT_MODE)")
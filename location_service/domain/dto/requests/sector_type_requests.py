@@ -4,6 +4,7 @@ DTOs de requests para tipos de sector
 from pydantic import BaseModel, Field, validator
 from typing import Optional
 from ...entities.measurement_unit import MeasurementUnit
+from commons.counting import CountMode
 
 
 class CreateSectorTypeRequest(BaseModel):
@@ -70,4 +71,7 @@ class SectorTypeFilterRequest(BaseModel):
     code: Optional[str] = Field(None, description="Filtrar por código")
     is_active: Optional[bool] = Field(None, description="Filtrar por estado activo")
     limit: int = Field(100, ge=1, le=1000, description="Límite de resultados")
-    offset: int = Field(0, ge=0, description="Offset para paginación") 
\ No newline at end of file
+    offset: int = Field(0, ge=0, description="Offset para paginación")
+    cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (ignora offset)")
+    include_total: bool = Field(True, description="Calcular el total de resultados")
+    count_mode: Optional[CountMode] = Field(None, description="Modo del total: exact, cached o estimated (None = LIST_COUNT_MODE)")
@@ -24,9 +24,11 @@ class CityResponse(BaseModel):
 class CityListResponse(BaseModel):
     """Response para lista de ciudades"""
     cities: List[CityResponse] = Field(..., description="Lista de ciudades")
-    total: int = Field(..., description="Total de ciudades")
+    total: Optional[int] = Field(None, description="Total de ciudades (None si include_total=false)")
+    total_mode: Optional[str] = Field(None, description="Modo que produjo el total: exact, cached o estimated")
     limit: int = Field(..., description="Límite de resultados")
     offset: int = Field(..., description="Offset para paginación")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)")
 
 class CityCreatedResponse(BaseModel):
     """Response para ciudad creada"""
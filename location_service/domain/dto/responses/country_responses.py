@@ -21,9 +21,11 @@ class CountryResponse(BaseModel):
 class CountryListResponse(BaseModel):
     """Response para lista de países"""
     countries: List[CountryResponse] = Field(..., description="Lista de países")
-    total: int = Field(..., description="Total de países")
+    total: Optional[int] = Field(None, description="Total de países (None si include_total=false)")
+    total_mode: Optional[str] = Field(None, description="Modo que produjo el total: exact, cached o estimated")
     limit: int = Field(..., description="Límite de resultados")
     offset: int = Field(..., description="Offset para paginación")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)")
 
 class CountryCreatedResponse(BaseModel):
     """Response para país creado"""
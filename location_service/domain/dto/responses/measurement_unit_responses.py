@@ -23,9 +23,11 @@ class MeasurementUnitResponse(BaseModel):
 class MeasurementUnitListResponse(BaseModel):
     """Response para lista de unidades de medida"""
     items: List[MeasurementUnitResponse] = Field(..., description="Lista de unidades de medida")
-    total: int = Field(..., description="Total de unidades de medida")
+    total: Optional[int] = Field(None, description="Total de unidades de medida (None si include_total=false)")
+    total_mode: Optional[str] = Field(None, description="Modo que produjo el total: exact, cached o estimated")
     limit: int = Field(..., description="Límite de resultados")
     offset: int = Field(..., description="Offset para paginación")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)")
 
 
 class MeasurementUnitCreatedResponse(BaseModel):
@@ -41,9 +41,27 @@ class RampScheduleResponse(BaseModel):
 class RampScheduleListResponse(BaseModel):
     """DTO para lista de horarios de rampas"""
     schedules: List[RampScheduleResponse] = Field(..., description="Lista de horarios")
-    total: int = Field(..., description="Total de horarios")
+    total: Optional[int] = Field(None, description="Total de horarios (None si include_total=false)")
+    total_mode: Optional[str] = Field(None, description="Modo que produjo el total: exact, cached o estimated")
     page: int = Field(..., description="Página actual")
     size: int = Field(..., description="Tamaño de la página")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)")
+
+
+class BranchRampSchedulesItem(BaseModel):
+    """DTO con los horarios de una rampa dentro de la sucursal"""
+    ramp_id: int = Field(..., description="ID de la rampa")
+    ramp_name: str = Field(..., description="Nombre de la rampa")
+    is_available: bool = Field(..., description="Disponibilidad de la rampa")
+    schedules: List[RampScheduleResponse] = Field(..., description="Horarios de la rampa")
+
+
+class BranchRampSchedulesResponse(BaseModel):
+    """DTO para los horarios de todas las rampas de una sucursal"""
+    branch_id: int = Field(..., description="ID de la sucursal")
+    day_of_week: Optional[int] = Field(None, description="Día de la semana consultado (None = toda la semana)")
+    ramps: List[BranchRampSchedulesItem] = Field(..., description="Rampas con sus horarios")
+    total: int = Field(..., description="Total de horarios")
 
 
 class RampScheduleCreatedResponse(BaseModel):
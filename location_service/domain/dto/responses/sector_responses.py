@@ -24,9 +24,11 @@ class SectorResponse(BaseModel):
 class SectorListResponse(BaseModel):
     """DTO para lista de sectores"""
     sectors: List[SectorResponse] = Field(..., description="Lista de sectores")
-    total: int = Field(..., description="Total de sectores")
+    total: Optional[int] = Field(None, description="Total de sectores (None si include_total=false)")
+    total_mode: Optional[str] = Field(None, description="Modo que produjo el total: exact, cached o estimated")
     page: int = Field(..., description="Página actual")
     size: int = Field(..., description="Tamaño de la página")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)")
 
 
 class SectorCreatedResponse(BaseModel):
@@ -24,9 +24,11 @@ class SectorTypeResponse(BaseModel):
 class SectorTypeListResponse(BaseModel):
     """DTO para lista de tipos de sector"""
     sector_types: List[SectorTypeResponse] = Field(..., description="Lista de tipos de sector")
-    total: int = Field(..., description="Total de tipos de sector")
+    total: Optional[int] = Field(None, description="Total de tipos de sector (None si include_total=false)")
+    total_mode: Optional[str] = Field(None, description="Modo que produjo el total: exact, cached o estimated")
     page: int = Field(..., description="Página actual")
     size: int = Field(..., description="Tamaño de la página")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)")
 
 
 class SectorTypeCreatedResponse(BaseModel):
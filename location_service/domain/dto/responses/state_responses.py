@@ -22,9 +22,11 @@ class StateResponse(BaseModel):
 class StateListResponse(BaseModel):
     """Response para lista de estados"""
     states: List[StateResponse] = Field(..., description="Lista de estados")
-    total: int = Field(..., description="Total de estados")
+    total: Optional[int] = Field(None, description="Total de estados (None si include_total=false)")
+    total_mode: Optional[str] = Field(None, description="Modo que produjo el total: exact, cached o estimated")
     limit: int = Field(..., description="Límite de resultados")
     offset: int = Field(..., description="Offset para paginación")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)")
 
 class StateCreatedResponse(BaseModel):
     """Response para estado creado"""
@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from ..entities.branch import Branch
 from ..dto.requests.branch_requests import BranchFilterRequest
+from commons.counting import TotalCount
 
 
 class BranchRepository(ABC):
@@ -26,7 +27,7 @@ class BranchRepository(ABC):
         pass
     
     @abstractmethod
-    async def list_all(self, filter_request: BranchFilterRequest) -> tuple[List[Branch], int]:
+    async def list_all(self, filter_request: BranchFilterRequest) -> tuple[List[Branch], Optional[TotalCount], Optional[str]]:
         """Listar todas las sucursales con filtros"""
         pass
     
@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from ..entities.city import City
 from ..dto.requests.city_requests import CityFilterRequest
+from commons.counting import TotalCount
 
 class CityRepository(ABC):
     """Interfaz para el repositorio de ciudades"""
@@ -35,7 +36,7 @@ class CityRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_all(self, filter_request: CityFilterRequest) -> tuple[List[City], int]:
+    async def get_all(self, filter_request: CityFilterRequest) -> tuple[List[City], Optional[TotalCount], Optional[str]]:
         """Obtener todas las ciudades con filtros y paginación"""
         pass
     
@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from ..entities.country import Country
 from ..dto.requests.country_requests import CountryFilterRequest
+from commons.counting import TotalCount
 
 class CountryRepository(ABC):
     """Interfaz para el repositorio de países"""
@@ -25,7 +26,7 @@ class CountryRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_all(self, filter_request: CountryFilterRequest) -> tuple[List[Country], int]:
+    async def get_all(self, filter_request: CountryFilterRequest) -> tuple[List[Country], Optional[TotalCount], Optional[str]]:
         """Obtener todos los países con filtros y paginación"""
         pass
     
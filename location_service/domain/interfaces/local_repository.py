@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from ..entities.local import Local
 from ..dto.requests.local_requests import LocalFilterRequest
+from commons.counting import TotalCount
 
 
 class LocalRepository(ABC):
@@ -26,7 +27,7 @@ class LocalRepository(ABC):
         pass
     
     @abstractmethod
-    async def list_all(self, filter_request: LocalFilterRequest) -> tuple[List[Local], int]:
+    async def list_all(self, filter_request: LocalFilterRequest) -> tuple[List[Local], Optional[TotalCount], Optional[str]]:
         """Listar todos los locales con filtros"""
         pass
     
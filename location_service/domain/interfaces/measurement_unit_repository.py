@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from ..entities.measurement_unit_entity import MeasurementUnit
 from ..dto.requests.measurement_unit_requests import MeasurementUnitFilterRequest
+from commons.counting import TotalCount
 
 
 class MeasurementUnitRepository(ABC):
@@ -26,7 +27,7 @@ class MeasurementUnitRepository(ABC):
         pass
     
     @abstractmethod
-    async def list_all(self, filter_request: MeasurementUnitFilterRequest) -> tuple[List[MeasurementUnit], int]:
+    async def list_all(self, filter_request: MeasurementUnitFilterRequest) -> tuple[List[MeasurementUnit], Optional[TotalCount], Optional[str]]:
         """Listar todas las unidades de medida con filtros"""
         pass
     
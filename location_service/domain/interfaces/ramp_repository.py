@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from ..entities.ramp import Ramp
 from ..dto.requests.ramp_requests import RampFilterRequest
+from commons.counting import TotalCount
 
 
 class RampRepository(ABC):
@@ -26,7 +27,7 @@ class RampRepository(ABC):
         pass
     
     @abstractmethod
-    async def list(self, filter_request: RampFilterRequest) -> tuple[List[Ramp], int]:
+    async def list(self, filter_request: RampFilterRequest) -> tuple[List[Ramp], Optional[TotalCount], Optional[str]]:
         """Listar rampas con filtros y paginación"""
         pass
     
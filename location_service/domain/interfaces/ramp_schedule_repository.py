@@ -2,9 +2,12 @@
 Interfaz del repositorio para horarios de rampas
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
+from ..entities.ramp import Ramp
 from ..entities.ramp_schedule import RampSchedule
 from ..dto.requests.ramp_schedule_requests import RampScheduleFilterRequest
+from commons.counting import TotalCount
 
 
 class RampScheduleRepository(ABC):
@@ -31,7 +34,22 @@ class RampScheduleRepository(ABC):
         pass
     
     @abstractmethod
-    async def list(self, filter_request: RampScheduleFilterRequest) -> tuple[List[RampSchedule], int]:
+    async def get_by_branch(
+        self,
+        branch_id: int,
+        day_of_week: Optional[int] = None,
+        is_active: Optional[bool] = None
+    ) -> List[Tuple[Ramp, List[RampSchedule]]]:
+        """Obtener los horarios de todas las rampas de una sucursal (un día o toda la semana)"""
+        pass
+    
+    @abstractmethod
+    async def get_branch_version(self, branch_id: int, day_of_week: Optional[int] = None) -> Tuple[int, Optional[datetime]]:
+        """Obtener cantidad de horarios y última modificación (horarios o rampas) de una sucursal"""
+        pass
+    
+    @abstractmethod
+    async def list(self, filter_request: RampScheduleFilterRequest) -> tuple[List[RampSchedule], Optional[TotalCount], Optional[str]]:
         """Listar horarios con filtros y paginación"""
         pass
     
@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from ..entities.sector import Sector
 from ..dto.requests.sector_requests import SectorFilterRequest
+from commons.counting import TotalCount
 
 
 class SectorRepository(ABC):
@@ -26,7 +27,7 @@ class SectorRepository(ABC):
         pass
     
     @abstractmethod
-    async def list(self, filter_request: SectorFilterRequest) -> tuple[List[Sector], int]:
+    async def list(self, filter_request: SectorFilterRequest) -> tuple[List[Sector], Optional[TotalCount], Optional[str]]:
         """Listar sectores con filtros y paginación"""
         pass
     
@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from ..entities.sector_type import SectorType
 from ..dto.requests.sector_type_requests import SectorTypeFilterRequest
+from commons.counting import TotalCount
 
 class SectorTypeRepository(ABC):
     @abstractmethod
@@ -20,7 +21,7 @@ class SectorTypeRepository(ABC):
         pass
 
     @abstractmethod
-    async def list(self, filter_request: SectorTypeFilterRequest) -> tuple[List[SectorType], int]:
+    async def list(self, filter_request: SectorTypeFilterRequest) -> tuple[List[SectorType], Optional[TotalCount], Optional[str]]:
         pass
 
     @abstractmethod
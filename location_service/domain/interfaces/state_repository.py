@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from ..entities.state import State
 from ..dto.requests.state_requests import StateFilterRequest
+from commons.counting import TotalCount
 
 class StateRepository(ABC):
     """Interfaz para el repositorio de estados"""
@@ -30,7 +31,7 @@ class StateRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_all(self, filter_request: StateFilterRequest) -> tuple[List[State], int]:
+    async def get_all(self, filter_request: StateFilterRequest) -> tuple[List[State], Optional[TotalCount], Optional[str]]:
         """Obtener todos los estados con filtros y paginación"""
         pass
     
@@ -77,6 +77,7 @@ from ..application.use_cases.list_ramp_schedules_use_case import ListRampSchedul
 from ..application.use_cases.update_ramp_schedule_use_case import UpdateRampScheduleUseCase
 from ..application.use_cases.delete_ramp_schedule_use_case import DeleteRampScheduleUseCase
 from ..application.use_cases.get_ramp_schedules_by_ramp_use_case import GetRampSchedulesByRampUseCase
+from ..application.use_cases.get_branch_ramp_schedules_use_case import GetBranchRampSchedulesUseCase
 
 
 class Container(containers.DeclarativeContainer):
@@ -415,6 +416,11 @@ class Container(containers.DeclarativeContainer):
         GetRampSchedulesByRampUseCase,
         ramp_schedule_repository=ramp_schedule_repository
     )
+    
+    get_branch_ramp_schedules_use_case = providers.Factory(
+        GetBranchRampSchedulesUseCase,
+        ramp_schedule_repository=ramp_schedule_repository
+    )
 
 
 # Instancia global del contenedor
@@ -3,14 +3,18 @@ Implementación del repositorio para sucursales
 """
 from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, or_, select, func, text
+from sqlalchemy import and_, or_, select, text
 from sqlalchemy.orm import selectinload
 from ...domain.interfaces.branch_repository import BranchRepository
 from ...domain.entities.branch import Branch
 from ...domain.dto.requests.branch_requests import BranchFilterRequest
 from ..models.branch import Branch as BranchModel
 from commons.database import get_db_session
+from commons.pagination import apply_keyset, split_page
+from commons.counting import TotalCount, get_list_counter
 
+# Identificador del cursor del listado (orden por nombre, id como desempate)
+BRANCHES_CURSOR = "branches"
 
 class BranchRepositoryImpl(BranchRepository):
     """Implementación del repositorio para sucursales"""
@@ -126,7 +130,7 @@ class BranchRepositoryImpl(BranchRepository):
                 sectors=[sector.id for sector in branch_model.sectors]
             )
     
-    async def list_all(self, filter_request: BranchFilterRequest) -> Tuple[List[Branch], int]:
+    async def list_all(self, filter_request: BranchFilterRequest) -> Tuple[List[Branch], Optional[TotalCount], Optional[str]]:
         """Listar todas las sucursales con filtros"""
         async for session in get_db_session():
             query = select(BranchModel)
@@ -153,13 +157,25 @@ class BranchRepositoryImpl(BranchRepository):
             if filter_request.is_active is not None:
                 query = query.where(BranchModel.is_active == filter_request.is_active)
             
-            # Contar total
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await session.execute(count_query)
-            total = total_result.scalar()
+            # Total según el modo pedido (exacto, cacheado o estimado; opcional)
+            total = None
+            if filter_request.include_total:
+                total = await get_list_counter().count(
+                    session,
+                    query,
+                    [BranchModel.__tablename__],
+                    filter_request.count_mode
+                )
             
-            # Aplicar paginación y ordenamiento
-            query = query.offset(filter_request.offset).limit(filter_request.limit).order_by(BranchModel.name)
+            # Aplicar ordenamiento y paginación (cursor por nombre/id u offset)
+            query = apply_keyset(
+                query,
+                BRANCHES_CURSOR,
+                [BranchModel.name, BranchModel.id],
+                filter_request.cursor,
+                filter_request.limit,
+                offset=filter_request.offset
+            )
             
             # Cargar relaciones
             query = query.options(
@@ -168,7 +184,12 @@ class BranchRepositoryImpl(BranchRepository):
             )
             
             result = await session.execute(query)
-            branch_models = result.scalars().all()
+            branch_models, next_cursor = split_page(
+                result.scalars().all(),
+                BRANCHES_CURSOR,
+                filter_request.limit,
+                lambda model: (model.name, model.id)
+            )
             
             # Convertir a entidades del dominio
             branches = [
@@ -190,7 +211,7 @@ class BranchRepositoryImpl(BranchRepository):
                 for model in branch_models
             ]
             
-            return branches, total
+            return branches, total, next_cursor
     
     async def update(self, branch_id: int, branch: Branch) -> Optional[Branch]:
         """Actualizar una sucursal"""
@@ -3,7 +3,7 @@ Implementación del repositorio para ciudades
 """
 from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from ...domain.entities.city import City
@@ -12,6 +12,11 @@ from ...domain.dto.requests.city_requests import CityFilterRequest
 from ..models.city import City as CityModel
 from ..models.state import State as StateModel
 from commons.database import get_db_session
+from commons.pagination import apply_keyset, split_page
+from commons.counting import TotalCount, get_list_counter
+
+# Identificador del cursor del listado (orden por nombre, id como desempate)
+CITIES_CURSOR = "cities"
 
 class CityRepositoryImpl(CityRepository):
     """Implementación del repositorio de ciudades"""
@@ -61,7 +66,7 @@ class CityRepositoryImpl(CityRepository):
                 updated_at=city_model.updated_at
             )
     
-    async def get_all(self, filter_request: CityFilterRequest) -> Tuple[List[City], int]:
+    async def get_all(self, filter_request: CityFilterRequest) -> Tuple[List[City], Optional[TotalCount], Optional[str]]:
         """Obtener todas las ciudades con filtros y paginación"""
         async for session in get_db_session():
             query = select(CityModel)
@@ -79,16 +84,33 @@ class CityRepositoryImpl(CityRepository):
             if filter_request.is_active is not None:
                 query = query.where(CityModel.is_active == filter_request.is_active)
             
-            # Contar total
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await session.execute(count_query)
-            total = total_result.scalar()
+            # Total según el modo pedido (exacto, cacheado o estimado; opcional)
+            total = None
+            if filter_request.include_total:
+                total = await get_list_counter().count(
+                    session,
+                    query,
+                    [CityModel.__tablename__],
+                    filter_request.count_mode
+                )
             
-            # Aplicar paginación y ordenamiento
-            query = query.offset(filter_request.offset).limit(filter_request.limit).order_by(CityModel.name)
+            # Aplicar ordenamiento y paginación (cursor por nombre/id u offset)
+            query = apply_keyset(
+                query,
+                CITIES_CURSOR,
+                [CityModel.name, CityModel.id],
+                filter_request.cursor,
+                filter_request.limit,
+                offset=filter_request.offset
+            )
             
             result = await session.execute(query)
-            city_models = result.scalars().all()
+            city_models, next_cursor = split_page(
+                result.scalars().all(),
+                CITIES_CURSOR,
+                filter_request.limit,
+                lambda model: (model.name, model.id)
+            )
             
             # Convertir a entidades del dominio
             cities = [
@@ -104,7 +126,7 @@ class CityRepositoryImpl(CityRepository):
                 for model in city_models
             ]
             
-            return cities, total
+            return cities, total, next_cursor
     
     async def get_by_name(self, name: str) -> Optional[City]:
         """Obtener ciudad por nombre"""
@@ -3,13 +3,17 @@ Implementación del repositorio para países
 """
 from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from ...domain.interfaces.country_repository import CountryRepository
 from ...domain.entities.country import Country
 from ...domain.dto.requests.country_requests import CountryFilterRequest
 from ..models.country import Country as CountryModel
 from commons.database import get_db_session
+from commons.pagination import apply_keyset, split_page
+from commons.counting import TotalCount, get_list_counter
 
+# Identificador del cursor del listado (orden por nombre, id como desempate)
+COUNTRIES_CURSOR = "countries"
 
 class CountryRepositoryImpl(CountryRepository):
     """Implementación del repositorio para países"""
@@ -82,7 +86,7 @@ class CountryRepositoryImpl(CountryRepository):
                 updated_at=country_model.updated_at
             )
     
-    async def get_all(self, filter_request: CountryFilterRequest) -> Tuple[List[Country], int]:
+    async def get_all(self, filter_request: CountryFilterRequest) -> Tuple[List[Country], Optional[TotalCount], Optional[str]]:
         """Obtener todos los países con filtros y paginación"""
         async for session in get_db_session():
             query = select(CountryModel)
@@ -97,16 +101,33 @@ class CountryRepositoryImpl(CountryRepository):
             if filter_request.is_active is not None:
                 query = query.where(CountryModel.is_active == filter_request.is_active)
             
-            # Contar total
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await session.execute(count_query)
-            total = total_result.scalar()
+            # Total según el modo pedido (exacto, cacheado o estimado; opcional)
+            total = None
+            if filter_request.include_total:
+                total = await get_list_counter().count(
+                    session,
+                    query,
+                    [CountryModel.__tablename__],
+                    filter_request.count_mode
+                )
             
-            # Aplicar paginación y ordenamiento
-            query = query.offset(filter_request.offset).limit(filter_request.limit).order_by(CountryModel.name)
+            # Aplicar ordenamiento y paginación (cursor por nombre/id u offset)
+            query = apply_keyset(
+                query,
+                COUNTRIES_CURSOR,
+                [CountryModel.name, CountryModel.id],
+                filter_request.cursor,
+                filter_request.limit,
+                offset=filter_request.offset
+            )
             
             result = await session.execute(query)
-            country_models = result.scalars().all()
+            country_models, next_cursor = split_page(
+                result.scalars().all(),
+                COUNTRIES_CURSOR,
+                filter_request.limit,
+                lambda model: (model.name, model.id)
+            )
             
             # Convertir a entidades del dominio
             countries = [
@@ -121,7 +142,7 @@ class CountryRepositoryImpl(CountryRepository):
                 for model in country_models
             ]
             
-            return countries, total
+            return countries, total, next_cursor
     
     async def update(self, country_id: int, country: Country) -> Optional[Country]:
         """Actualizar un país"""
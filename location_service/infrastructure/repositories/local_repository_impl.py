@@ -3,13 +3,17 @@ Implementación del repositorio para locales
 """
 from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, or_, select, func
+from sqlalchemy import and_, or_, select
 from ...domain.interfaces.local_repository import LocalRepository
 from ...domain.entities.local import Local
 from ...domain.dto.requests.local_requests import LocalFilterRequest
 from ..models.local import Local as LocalModel
 from commons.database import get_db_session
+from commons.pagination import apply_keyset, split_page
+from commons.counting import TotalCount, get_list_counter
 
+# Identificador del cursor del listado (orden por nombre, id como desempate)
+LOCALS_CURSOR = "locals"
 
 class LocalRepositoryImpl(LocalRepository):
     """Implementación del repositorio para locales"""
@@ -88,7 +92,7 @@ class LocalRepositoryImpl(LocalRepository):
                 updated_at=local_model.updated_at
             )
     
-    async def list_all(self, filter_request: LocalFilterRequest) -> Tuple[List[Local], int]:
+    async def list_all(self, filter_request: LocalFilterRequest) -> Tuple[List[Local], Optional[TotalCount], Optional[str]]:
         """Listar todos los locales con filtros"""
         async for session in get_db_session():
             query = select(LocalModel)
@@ -103,16 +107,33 @@ class LocalRepositoryImpl(LocalRepository):
             if filter_request.is_active is not None:
                 query = query.where(LocalModel.is_active == filter_request.is_active)
             
-            # Contar total
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await session.execute(count_query)
-            total = total_result.scalar()
+            # Total según el modo pedido (exacto, cacheado o estimado; opcional)
+            total = None
+            if filter_request.include_total:
+                total = await get_list_counter().count(
+                    session,
+                    query,
+                    [LocalModel.__tablename__],
+                    filter_request.count_mode
+                )
             
-            # Aplicar paginación y ordenamiento
-            query = query.offset(filter_request.offset).limit(filter_request.limit).order_by(LocalModel.name)
+            # Aplicar ordenamiento y paginación (cursor por nombre/id u offset)
+            query = apply_keyset(
+                query,
+                LOCALS_CURSOR,
+                [LocalModel.name, LocalModel.id],
+                filter_request.cursor,
+                filter_request.limit,
+                offset=filter_request.offset
+            )
             
             result = await session.execute(query)
-            local_models = result.scalars().all()
+            local_models, next_cursor = split_page(
+                result.scalars().all(),
+                LOCALS_CURSOR,
+                filter_request.limit,
+                lambda model: (model.name, model.id)
+            )
             
             # Convertir a entidades del dominio
             locals = [
@@ -130,7 +151,7 @@ class LocalRepositoryImpl(LocalRepository):
                 for model in local_models
             ]
             
-            return locals, total
+            return locals, total, next_cursor
     
     async def update(self, local_id: int, local: Local) -> Optional[Local]:
         """Actualizar un local"""
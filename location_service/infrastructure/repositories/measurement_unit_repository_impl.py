@@ -3,13 +3,17 @@ Implementación del repositorio para unidades de medida
 """
 from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, or_, select, func
+from sqlalchemy import and_, or_, select
 from ...domain.interfaces.measurement_unit_repository import MeasurementUnitRepository
 from ...domain.entities.measurement_unit_entity import MeasurementUnit
 from ...domain.dto.requests.measurement_unit_requests import MeasurementUnitFilterRequest
 from ..models.measurement_unit import MeasurementUnit as MeasurementUnitModel
 from commons.database import get_db_session
+from commons.pagination import apply_keyset, split_page
+from commons.counting import TotalCount, get_list_counter
 
+# Identificador del cursor del listado (orden por nombre, id como desempate)
+MEASUREMENT_UNITS_CURSOR = "measurement_units"
 
 class MeasurementUnitRepositoryImpl(MeasurementUnitRepository):
     """Implementación del repositorio para unidades de medida"""
@@ -86,7 +90,7 @@ class MeasurementUnitRepositoryImpl(MeasurementUnitRepository):
                 updated_at=measurement_unit_model.updated_at
             )
     
-    async def list_all(self, filter_request: MeasurementUnitFilterRequest) -> Tuple[List[MeasurementUnit], int]:
+    async def list_all(self, filter_request: MeasurementUnitFilterRequest) -> Tuple[List[MeasurementUnit], Optional[TotalCount], Optional[str]]:
         """Listar todas las unidades de medida con filtros"""
         async for session in get_db_session():
             query = select(MeasurementUnitModel)
@@ -101,16 +105,33 @@ class MeasurementUnitRepositoryImpl(MeasurementUnitRepository):
             if filter_request.is_active is not None:
                 query = query.where(MeasurementUnitModel.is_active == filter_request.is_active)
             
-            # Contar total
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await session.execute(count_query)
-            total = total_result.scalar()
+            # Total según el modo pedido (exacto, cacheado o estimado; opcional)
+            total = None
+            if filter_request.include_total:
+                total = await get_list_counter().count(
+                    session,
+                    query,
+                    [MeasurementUnitModel.__tablename__],
+                    filter_request.count_mode
+                )
             
-            # Aplicar paginación y ordenamiento
-            query = query.offset(filter_request.offset).limit(filter_request.limit).order_by(MeasurementUnitModel.name)
+            # Aplicar ordenamiento y paginación (cursor por nombre/id u offset)
+            query = apply_keyset(
+                query,
+                MEASUREMENT_UNITS_CURSOR,
+                [MeasurementUnitModel.name, MeasurementUnitModel.id],
+                filter_request.cursor,
+                filter_request.limit,
+                offset=filter_request.offset
+            )
             
             result = await session.execute(query)
-            measurement_unit_models = result.scalars().all()
+            measurement_unit_models, next_cursor = split_page(
+                result.scalars().all(),
+                MEASUREMENT_UNITS_CURSOR,
+                filter_request.limit,
+                lambda model: (model.name, model.id)
+            )
             
             # Convertir a entidades del dominio
             measurement_units = [
@@ -126,7 +147,7 @@ class MeasurementUnitRepositoryImpl(MeasurementUnitRepository):
                 for model in measurement_unit_models
             ]
             
-            return measurement_units, total
+            return measurement_units, total, next_cursor
     
     async def update(self, measurement_unit_id: int, measurement_unit: MeasurementUnit) -> Optional[MeasurementUnit]:
         """Actualizar una unidad de medida"""
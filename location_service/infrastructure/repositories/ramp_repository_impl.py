@@ -3,13 +3,17 @@ Implementación del repositorio para rampas
 """
 from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from ...domain.interfaces.ramp_repository import RampRepository
 from ...domain.entities.ramp import Ramp
 from ...domain.dto.requests.ramp_requests import RampFilterRequest
 from ..models.ramp import Ramp as RampModel
 from commons.database import get_db_session
+from commons.pagination import apply_keyset, split_page
+from commons.counting import TotalCount, get_list_counter
 
+# Identificador del cursor del listado (orden por nombre, id como desempate)
+RAMPS_CURSOR = "ramps"
 
 class RampRepositoryImpl(RampRepository):
     """Implementación del repositorio para rampas"""
@@ -78,7 +82,7 @@ class RampRepositoryImpl(RampRepository):
                 updated_at=ramp_model.updated_at
             )
     
-    async def list(self, filter_request: RampFilterRequest) -> Tuple[List[Ramp], int]:
+    async def list(self, filter_request: RampFilterRequest) -> Tuple[List[Ramp], Optional[TotalCount], Optional[str]]:
         """Listar rampas con filtros y paginación"""
         async for session in get_db_session():
             query = select(RampModel)
@@ -93,16 +97,33 @@ class RampRepositoryImpl(RampRepository):
             if filter_request.is_available is not None:
                 query = query.where(RampModel.is_available == filter_request.is_available)
             
-            # Contar total
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await session.execute(count_query)
-            total = total_result.scalar()
+            # Total según el modo pedido (exacto, cacheado o estimado; opcional)
+            total = None
+            if filter_request.include_total:
+                total = await get_list_counter().count(
+                    session,
+                    query,
+                    [RampModel.__tablename__],
+                    filter_request.count_mode
+                )
             
-            # Aplicar paginación y ordenamiento
-            query = query.offset(filter_request.skip).limit(filter_request.limit).order_by(RampModel.name)
+            # Aplicar ordenamiento y paginación (cursor por nombre/id u offset)
+            query = apply_keyset(
+                query,
+                RAMPS_CURSOR,
+                [RampModel.name, RampModel.id],
+                filter_request.cursor,
+                filter_request.limit,
+                offset=filter_request.skip
+            )
             
             result = await session.execute(query)
-            ramp_models = result.scalars().all()
+            ramp_models, next_cursor = split_page(
+                result.scalars().all(),
+                RAMPS_CURSOR,
+                filter_request.limit,
+                lambda model: (model.name, model.id)
+            )
             
             # Convertir a entidades del dominio
             ramps = [
@@ -117,7 +138,7 @@ class RampRepositoryImpl(RampRepository):
                 for model in ramp_models
             ]
             
-            return ramps, total
+            return ramps, total, next_cursor
     
     async def get_by_branch_id(self, branch_id: int) -> List[Ramp]:
         """Obtener todas las rampas de una sucursal"""
@@ -1,15 +1,23 @@
 """
 Implementación del repositorio para horarios de rampas
 """
-from typing import List, Optional, Tuple
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
 from ...domain.interfaces.ramp_schedule_repository import RampScheduleRepository
+from ...domain.entities.ramp import Ramp
 from ...domain.entities.ramp_schedule import RampSchedule
 from ...domain.entities.day_of_week import DayOfWeek
 from ...domain.dto.requests.ramp_schedule_requests import RampScheduleFilterRequest
 from ..models.ramp_schedule import RampSchedule as RampScheduleModel
+from ..models.ramp import Ramp as RampModel
 from commons.database import get_db_session
+from commons.pagination import apply_keyset, split_page
+from commons.counting import TotalCount, get_list_counter
+
+# Identificador del cursor del listado (orden por rampa, día y hora, id como desempate)
+RAMP_SCHEDULES_CURSOR = "ramp_schedules"
 
 
 class RampScheduleRepositoryImpl(RampScheduleRepository):
@@ -120,12 +128,90 @@ class RampScheduleRepositoryImpl(RampScheduleRepository):
                 for schedule_model in schedule_models
             ]
     
-    async def list(self, filter_request: RampScheduleFilterRequest) -> Tuple[List[RampSchedule], int]:
+    async def get_by_branch(
+        self,
+        branch_id: int,
+        day_of_week: Optional[int] = None,
+        is_active: Optional[bool] = None
+    ) -> List[Tuple[Ramp, List[RampSchedule]]]:
+        """Obtener los horarios de todas las rampas de una sucursal en una sola consulta"""
+        async for session in get_db_session():
+            filters = [RampModel.branch_id == branch_id]
+            
+            if day_of_week is not None:
+                filters.append(RampScheduleModel.day_of_week == day_of_week)
+            
+            if is_active is not None:
+                filters.append(RampScheduleModel.is_active == is_active)
+            
+            query = select(RampScheduleModel, RampModel).join(
+                RampModel, RampScheduleModel.ramp_id == RampModel.id
+            ).where(and_(*filters)).order_by(
+                RampModel.id,
+                RampScheduleModel.day_of_week,
+                RampScheduleModel.start_time
+            )
+            
+            result = await session.execute(query)
+            
+            # Agrupar horarios por rampa conservando el orden
+            ramps: Dict[int, Tuple[Ramp, List[RampSchedule]]] = {}
+            for schedule_model, ramp_model in result.all():
+                if ramp_model.id not in ramps:
+                    ramps[ramp_model.id] = (
+                        Ramp(
+                            id=ramp_model.id,
+                            name=ramp_model.name,
+                            is_available=ramp_model.is_available,
+                            branch_id=ramp_model.branch_id,
+                            created_at=ramp_model.created_at,
+                            updated_at=ramp_model.updated_at
+                        ),
+                        []
+                    )
+                
+                ramps[ramp_model.id][1].append(RampSchedule(
+                    id=schedule_model.id,
+                    ramp_id=schedule_model.ramp_id,
+                    day_of_week=schedule_model.day_of_week,
+                    name=schedule_model.name,
+                    start_time=schedule_model.start_time,
+                    end_time=schedule_model.end_time,
+                    is_active=schedule_model.is_active,
+                    created_at=schedule_model.created_at,
+                    updated_at=schedule_model.updated_at
+                ))
+            
+            return list(ramps.values())
+    
+    async def get_branch_version(self, branch_id: int, day_of_week: Optional[int] = None) -> Tuple[int, Optional[datetime]]:
+        """Obtener cantidad de horarios y última modificación (horarios o rampas) de una sucursal"""
+        async for session in get_db_session():
+            filters = [RampModel.branch_id == branch_id]
+            
+            if day_of_week is not None:
+                filters.append(RampScheduleModel.day_of_week == day_of_week)
+            
+            # updated_at es NULL hasta la primera modificación: usar created_at en ese caso
+            query = select(
+                func.count(RampScheduleModel.id),
+                func.max(func.coalesce(RampScheduleModel.updated_at, RampScheduleModel.created_at)),
+                func.max(func.coalesce(RampModel.updated_at, RampModel.created_at))
+            ).select_from(RampScheduleModel).join(
+                RampModel, RampScheduleModel.ramp_id == RampModel.id
+            ).where(and_(*filters))
+            
+            result = await session.execute(query)
+            total, schedules_updated_at, ramps_updated_at = result.one()
+            
+            timestamps = [ts for ts in (schedules_updated_at, ramps_updated_at) if ts is not None]
+            return total, max(timestamps) if timestamps else None
+    
+    async def list(self, filter_request: RampScheduleFilterRequest) -> Tuple[List[RampSchedule], Optional[TotalCount], Optional[str]]:
         """Listar horarios con filtros y paginación"""
         async for session in get_db_session():
             # Construir query base
             query = select(RampScheduleModel)
-            count_query = select(func.count(RampScheduleModel.id))
             
             # Aplicar filtros
             filters = []
@@ -144,22 +230,40 @@ class RampScheduleRepositoryImpl(RampScheduleRepository):
             
             if filters:
                 query = query.where(and_(*filters))
-                count_query = count_query.where(and_(*filters))
             
-            # Obtener total
-            count_result = await session.execute(count_query)
-            total = count_result.scalar()
+            # Total según el modo pedido (exacto, cacheado o estimado; opcional)
+            total = None
+            if filter_request.include_total:
+                total = await get_list_counter().count(
+                    session,
+                    query,
+                    [RampScheduleModel.__tablename__],
+                    filter_request.count_mode
+                )
             
-            # Aplicar ordenamiento y paginación
-            query = query.order_by(
-                RampScheduleModel.ramp_id,
-                RampScheduleModel.day_of_week,
-                RampScheduleModel.start_time
-            ).limit(filter_request.limit).offset(filter_request.offset)
+            # Aplicar ordenamiento y paginación (cursor u offset)
+            query = apply_keyset(
+                query,
+                RAMP_SCHEDULES_CURSOR,
+                [
+                    RampScheduleModel.ramp_id,
+                    RampScheduleModel.day_of_week,
+                    RampScheduleModel.start_time,
+                    RampScheduleModel.id
+                ],
+                filter_request.cursor,
+                filter_request.limit,
+                offset=filter_request.offset
+            )
             
             # Ejecutar query
             result = await session.execute(query)
-            schedule_models = result.scalars().all()
+            schedule_models, next_cursor = split_page(
+                result.scalars().all(),
+                RAMP_SCHEDULES_CURSOR,
+                filter_request.limit,
+                lambda model: (model.ramp_id, model.day_of_week, model.start_time, model.id)
+            )
             
             schedules = [
                 RampSchedule(
@@ -176,7 +280,7 @@ class RampScheduleRepositoryImpl(RampScheduleRepository):
                 for schedule_model in schedule_models
             ]
             
-            return schedules, total
+            return schedules, total, next_cursor
     
     async def update(self, schedule: RampSchedule) -> RampSchedule:
         """Actualizar un horario"""
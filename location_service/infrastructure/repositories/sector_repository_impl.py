@@ -3,14 +3,18 @@ Implementación del repositorio para sectores
 """
 from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from ...domain.interfaces.sector_repository import SectorRepository
 from ...domain.entities.sector import Sector
 from ...domain.dto.requests.sector_requests import SectorFilterRequest
 from ..models.sector import Sector as SectorModel
 from commons.database import get_db_session
+from commons.pagination import apply_keyset, split_page
+from commons.counting import TotalCount, get_list_counter
 from ...domain.entities.measurement_unit import MeasurementUnit
 
+# Identificador del cursor del listado (orden por nombre, id como desempate)
+SECTORS_CURSOR = "sectors"
 
 class SectorRepositoryImpl(SectorRepository):
     """Implementación del repositorio para sectores"""
@@ -87,7 +91,7 @@ class SectorRepositoryImpl(SectorRepository):
                 updated_at=sector_model.updated_at
             )
     
-    async def list(self, filter_request: SectorFilterRequest) -> Tuple[List[Sector], int]:
+    async def list(self, filter_request: SectorFilterRequest) -> Tuple[List[Sector], Optional[TotalCount], Optional[str]]:
         """Listar sectores con filtros y paginación"""
         async for session in get_db_session():
             query = select(SectorModel)
@@ -105,16 +109,33 @@ class SectorRepositoryImpl(SectorRepository):
             if filter_request.is_active is not None:
                 query = query.where(SectorModel.is_active == filter_request.is_active)
             
-            # Contar total
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await session.execute(count_query)
-            total = total_result.scalar()
+            # Total según el modo pedido (exacto, cacheado o estimado; opcional)
+            total = None
+            if filter_request.include_total:
+                total = await get_list_counter().count(
+                    session,
+                    query,
+                    [SectorModel.__tablename__],
+                    filter_request.count_mode
+                )
             
-            # Aplicar paginación y ordenamiento
-            query = query.offset(filter_request.offset).limit(filter_request.limit).order_by(SectorModel.name)
+            # Aplicar ordenamiento y paginación (cursor por nombre/id u offset)
+            query = apply_keyset(
+                query,
+                SECTORS_CURSOR,
+                [SectorModel.name, SectorModel.id],
+                filter_request.cursor,
+                filter_request.limit,
+                offset=filter_request.offset
+            )
             
             result = await session.execute(query)
-            sector_models = result.scalars().all()
+            sector_models, next_cursor = split_page(
+                result.scalars().all(),
+                SECTORS_CURSOR,
+                filter_request.limit,
+                lambda model: (model.name, model.id)
+            )
             
             # Convertir a entidades del dominio
             sectors = [
@@ -131,7 +152,7 @@ class SectorRepositoryImpl(SectorRepository):
                 for model in sector_models
             ]
             
-            return sectors, total
+            return sectors, total, next_cursor
     
     async def get_by_branch_id(self, branch_id: int) -> List[Sector]:
         """Obtener todos los sectores de una sucursal"""
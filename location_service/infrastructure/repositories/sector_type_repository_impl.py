@@ -3,7 +3,7 @@ Implementación del repositorio para tipos de sector
 """
 from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from ...domain.interfaces.sector_type_repository import SectorTypeRepository
@@ -12,7 +12,11 @@ from ...domain.dto.requests.sector_type_requests import SectorTypeFilterRequest
 from ...domain.exceptions import SectorTypeNotFoundException, SectorTypeAlreadyExistsException
 from ..models.sector_type import SectorType as SectorTypeModel
 from commons.database import get_db_session
+from commons.pagination import apply_keyset, split_page
+from commons.counting import TotalCount, get_list_counter
 
+# Identificador del cursor del listado (orden por nombre, id como desempate)
+SECTOR_TYPES_CURSOR = "sector_types"
 
 class SectorTypeRepositoryImpl(SectorTypeRepository):
     """Implementación del repositorio para tipos de sector"""
@@ -101,7 +105,7 @@ class SectorTypeRepositoryImpl(SectorTypeRepository):
                 updated_at=sector_type_model.updated_at
             )
     
-    async def list(self, filter_request: SectorTypeFilterRequest) -> Tuple[List[SectorType], int]:
+    async def list(self, filter_request: SectorTypeFilterRequest) -> Tuple[List[SectorType], Optional[TotalCount], Optional[str]]:
         """Listar tipos de sector con filtros y paginación"""
         async for session in get_db_session():
             query = select(SectorTypeModel)
@@ -116,16 +120,33 @@ class SectorTypeRepositoryImpl(SectorTypeRepository):
             if filter_request.is_active is not None:
                 query = query.where(SectorTypeModel.is_active == filter_request.is_active)
             
-            # Contar total
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await session.execute(count_query)
-            total = total_result.scalar()
+            # Total según el modo pedido (exacto, cacheado o estimado; opcional)
+            total = None
+            if filter_request.include_total:
+                total = await get_list_counter().count(
+                    session,
+                    query,
+                    [SectorTypeModel.__tablename__],
+                    filter_request.count_mode
+                )
             
-            # Aplicar paginación y ordenamiento
-            query = query.offset(filter_request.offset).limit(filter_request.limit).order_by(SectorTypeModel.name)
+            # Aplicar ordenamiento y paginación (cursor por nombre/id u offset)
+            query = apply_keyset(
+                query,
+                SECTOR_TYPES_CURSOR,
+                [SectorTypeModel.name, SectorTypeModel.id],
+                filter_request.cursor,
+                filter_request.limit,
+                offset=filter_request.offset
+            )
             
             result = await session.execute(query)
-            sector_type_models = result.scalars().all()
+            sector_type_models, next_cursor = split_page(
+                result.scalars().all(),
+                SECTOR_TYPES_CURSOR,
+                filter_request.limit,
+                lambda model: (model.name, model.id)
+            )
             
             # Convertir a entidades del dominio
             sector_types = [
@@ -143,7 +164,7 @@ class SectorTypeRepositoryImpl(SectorTypeRepository):
                 for model in sector_type_models
             ]
             
-            return sector_types, total
+            return sector_types, total, next_cursor
     
     async def update(self, sector_type: SectorType) -> SectorType:
         """Actualizar un tipo de sector"""
@@ -3,13 +3,17 @@ Implementación del repositorio para estados
 """
 from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from ...domain.interfaces.state_repository import StateRepository
 from ...domain.entities.state import State
 from ...domain.dto.requests.state_requests import StateFilterRequest
 from ..models.state import State as StateModel
 from commons.database import get_db_session
+from commons.pagination import apply_keyset, split_page
+from commons.counting import TotalCount, get_list_counter
 
+# Identificador del cursor del listado (orden por nombre, id como desempate)
+STATES_CURSOR = "states"
 
 class StateRepositoryImpl(StateRepository):
     """Implementación del repositorio para estados"""
@@ -86,7 +90,7 @@ class StateRepositoryImpl(StateRepository):
                 updated_at=state_model.updated_at
             )
     
-    async def get_all(self, filter_request: StateFilterRequest) -> Tuple[List[State], int]:
+    async def get_all(self, filter_request: StateFilterRequest) -> Tuple[List[State], Optional[TotalCount], Optional[str]]:
         """Obtener todos los estados con filtros y paginación"""
         async for session in get_db_session():
             query = select(StateModel)
@@ -104,16 +108,33 @@ class StateRepositoryImpl(StateRepository):
             if filter_request.is_active is not None:
                 query = query.where(StateModel.is_active == filter_request.is_active)
             
-            # Contar total
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await session.execute(count_query)
-            total = total_result.scalar()
+            # Total según el modo pedido (exacto, cacheado o estimado; opcional)
+            total = None
+            if filter_request.include_total:
+                total = await get_list_counter().count(
+                    session,
+                    query,
+                    [StateModel.__tablename__],
+                    filter_request.count_mode
+                )
             
-            # Aplicar paginación y ordenamiento
-            query = query.offset(filter_request.offset).limit(filter_request.limit).order_by(StateModel.name)
+            # Aplicar ordenamiento y paginación (cursor por nombre/id u offset)
+            query = apply_keyset(
+                query,
+                STATES_CURSOR,
+                [StateModel.name, StateModel.id],
+                filter_request.cursor,
+                filter_request.limit,
+                offset=filter_request.offset
+            )
             
             result = await session.execute(query)
-            state_models = result.scalars().all()
+            state_models, next_cursor = split_page(
+                result.scalars().all(),
+                STATES_CURSOR,
+                filter_request.limit,
+                lambda model: (model.name, model.id)
+            )
             
             # Convertir a entidades del dominio
             states = [
@@ -129,7 +150,7 @@ class StateRepositoryImpl(StateRepository):
                 for model in state_models
             ]
             
-            return states, total
+            return states, total, next_cursor
     
     async def get_by_country_id(self, country_id: int) -> List[State]:
         """Obtener estados por país"""
@@ -74,7 +74,9 @@ def create_reservation_app():
         base_model=Base,  # ✅ Habilitar ORM con modelos de Reservation Service
         routers=routers,
         enable_auth=False,  # Deshabilitado para usar dependencias
-        enable_auto_tables=True  # ✅ Habilitar creación automática de tablas
+        enable_auto_tables=True,  # ✅ Habilitar creación automática de tablas
+        # Una sesión y un commit por request compartidos por los repositorios
+        enable_unit_of_work=os.getenv("DATABASE_UNIT_OF_WORK", "true").lower() == "true"
     )
     
     return app
@@ -2,7 +2,8 @@
 Rutas para reservas
 """
 import logging
-from fastapi import APIRouter, Depends, HTTPException, Query, status, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from typing import Optional
 from datetime import datetime
 
@@ -12,6 +13,7 @@ from ...domain.dto.requests.reservation_filter_request import ReservationFilterR
 from ...domain.dto.requests.reject_reservation_request import RejectReservationRequest
 from ...domain.dto.requests.complete_reservation_request import CompleteReservationRequest
 from ...domain.dto.requests.reservation_period_request import ReservationPeriodRequest
+from ...domain.dto.requests.busy_ramps_request import BusyRampsRequest
 from ...domain.dto.requests.export_reservations_request import ExportReservationsRequest
 from ...domain.dto.responses.reservation_response import ReservationResponse
 from ...domain.dto.responses.reservation_detail_response import ReservationDetailResponse
@@ -19,6 +21,9 @@ from ...domain.dto.responses.reservation_list_response import ReservationListRes
 from ...domain.dto.responses.reservation_summary_response import ReservationSummaryResponse
 from ...domain.dto.responses.reservation_summary_list_response import ReservationSummaryListResponse
 from ...domain.dto.responses.reservation_period_response import ReservationPeriodResponse
+from ...domain.dto.responses.busy_ramps_response import BusyRampsResponse
+from commons.pagination import InvalidCursorError
+from commons.counting import CountMode
 from ...domain.exceptions.reservation_exceptions import (
     ReservationNotFoundException,
     ReservationAlreadyExistsException,
@@ -147,6 +152,54 @@ async def get_reservations_by_period(
         )
 
 
+@router.get("/busy-ramps", response_model=BusyRampsResponse)
+async def get_busy_ramps(
+    branch_id: int = Query(..., description="ID de la sucursal"),
+    start_time: datetime = Query(..., description="Fecha y hora de inicio (YYYY-MM-DD HH:MM:SS)"),
+    end_time: datetime = Query(..., description="Fecha y hora de fin (YYYY-MM-DD HH:MM:SS)"),
+    container: Container = Depends(get_container),
+    current_user=Depends(auth_middleware["require_auth"])
+):
+    """
+    Obtener las rampas ocupadas por reservas activas de una sucursal en un período.
+    
+    Args:
+        branch_id: ID de la sucursal
+        start_time: Fecha y hora de inicio del período
+        end_time: Fecha y hora de fin del período
+    
+    Returns:
+        BusyRampsResponse: IDs de las rampas ocupadas
+    """
+    try:
+        logger.info(f"🚧 GET /reservations/busy-ramps - branch_id: {branch_id}, start_time: {start_time}, end_time: {end_time}")
+        
+        request = BusyRampsRequest(
+            branch_id=branch_id,
+            start_time=start_time,
+            end_time=end_time
+        )
+        
+        use_case = container.get_busy_ramps_use_case()
+        result = await use_case.execute(request)
+        
+        logger.info(f"✅ {result.total} rampas ocupadas en el período")
+        return result
+        
+    except ValueError as e:
+        logger.warning(f"⚠️ Datos de entrada inválidos: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": str(e), "error_code": "INVALID_INPUT"}
+        )
+    except Exception as e:
+        logger.error(f"❌ Error inesperado en get_busy_ramps: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"message": "Error interno del servidor", "error_code": "INTERNAL_ERROR"}
+        )
+
+
 @router.get("/{reservation_id}", response_model=ReservationDetailResponse)
 async def get_reservation(
     reservation_id: int,
@@ -205,11 +258,14 @@ async def list_reservations(
     # Paginación
     page: int = Query(1, ge=1, description="Número de página"),
     limit: int = Query(10, ge=1, le=100, description="Elementos por página"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora page"),
+    include_total: bool = Query(True, description="Calcular total y páginas"),
+    count_mode: Optional[CountMode] = Query(None, description="Modo del total: exact, cached o estimated"),
     
     container = Depends(get_container),
     current_user=Depends(auth_middleware["require_auth"])
 ):
-    """Listar reservas con filtros y paginación"""
+    """Listar reservas con filtros y paginación (por página o por cursor)"""
     try:
         from datetime import datetime
         
@@ -278,13 +334,19 @@ async def list_reservations(
             order_code=order_code,
             cargo_type=cargo_type,
             page=page,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            count_mode=count_mode
         )
         
         use_case = get_list_reservations_use_case()
         result = await use_case.execute(request)
         
         return result
+    except InvalidCursorError:
+        # El handler global lo traduce a 400 INVALID_CURSOR
+        raise
     except ValueError as e:
         logger.error(f"❌ Error de formato de fecha: {str(e)}")
         raise HTTPException(
@@ -528,10 +590,10 @@ async def export_reservations_csv(
         )
         
         use_case = container.export_reservations_csv_use_case()
-        csv_bytes = await use_case.execute(request)
+        csv_chunks = await use_case.execute(request)
         
-        return Response(
-            content=csv_bytes,
+        return StreamingResponse(
+            csv_chunks,
             media_type="text/csv; charset=utf-8",
             headers={
                 "Content-Disposition": "attachment; filename=reservas.csv"
@@ -617,10 +679,10 @@ async def export_reservations_xlsx(
         )
         
         use_case = container.export_reservations_xlsx_use_case()
-        xlsx_bytes = await use_case.execute(request)
+        xlsx_chunks = await use_case.execute(request)
         
-        return Response(
-            content=xlsx_bytes,
+        return StreamingResponse(
+            xlsx_chunks,
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={
                 "Content-Disposition": "attachment; filename=reservas.xlsx"
@@ -12,11 +12,13 @@ from ...domain.dto.requests.schedule_requests import (
     CreateBranchScheduleRequest,
     UpdateBranchScheduleRequest,
     GetAvailableSlotsRequest,
+    GetAvailableSlotsRangeRequest,
     GetBranchSchedulesRequest
 )
 from ...domain.dto.responses.schedule_responses import (
     BranchScheduleResponse,
     AvailableSlotsResponse,
+    AvailableSlotsRangeResponse,
     BranchScheduleListResponse,
     CreateBranchScheduleResponse,
     UpdateBranchScheduleResponse,
@@ -142,6 +144,48 @@ async def get_available_slots(
         )
 
 
+@router.get("/available-slots/range", response_model=AvailableSlotsRangeResponse)
+async def get_available_slots_range(
+    branch_id: int = Query(..., gt=0, description="ID de la sucursal"),
+    start_date: date = Query(..., description="Fecha inicial del rango"),
+    end_date: date = Query(..., description="Fecha final del rango (inclusive)"),
+    container: Container = Depends(get_container),
+    current_user=Depends(auth_middleware["require_auth"])
+):
+    """Obtener slots disponibles para cada día de un rango de fechas"""
+    logger.info(f"🚀 Endpoint get_available_slots_range llamado con branch_id: {branch_id}, rango: {start_date}..{end_date}")
+    
+    try:
+        request = GetAvailableSlotsRangeRequest(
+            branch_id=branch_id,
+            start_date=start_date,
+            end_date=end_date
+        )
+        
+        use_case = container.get_available_slots_range_use_case()
+        result = await use_case.execute(request)
+        logger.info(f"📊 Resultado: {len(result.days)} días, {result.total_slots} slots totales, {result.available_slots} disponibles")
+        
+        return result
+    except ValidationError as e:
+        logger.warning(f"⚠️ Error de validación de Pydantic: {str(e)}")
+        error_message = str(e)
+        if "No se puede consultar disponibilidad para fechas pasadas" in error_message:
+            error_code = ErrorCode.PAST_DATE.value
+        else:
+            error_code = ErrorCode.VALIDATION_ERROR.value
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": error_message, "error_code": error_code}
+        )
+    except Exception as e:
+        logger.error(f"❌ Error inesperado en get_available_slots_range: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"message": "Error interno del servidor", "error_code": "INTERNAL_ERROR"}
+        )
+
+
 @router.get("/{schedule_id}", response_model=BranchScheduleResponse)
 async def get_branch_schedule(
     schedule_id: int,
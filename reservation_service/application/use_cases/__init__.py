@@ -6,6 +6,7 @@ from .update_branch_schedule_use_case import UpdateBranchScheduleUseCase
 from .delete_branch_schedule_use_case import DeleteBranchScheduleUseCase
 from .delete_branch_schedule_with_validation_use_case import DeleteBranchScheduleWithValidationUseCase
 from .get_available_slots_use_case import GetAvailableSlotsUseCase
+from .get_available_slots_range_use_case import GetAvailableSlotsRangeUseCase
 from .validate_schedule_changes_use_case import ValidateScheduleChangesUseCase
 
 # Casos de uso para reservas
@@ -17,6 +18,7 @@ from .delete_reservation_use_case import DeleteReservationUseCase
 from .complete_reservation_use_case import CompleteReservationUseCase
 from .reject_reservation_use_case import RejectReservationUseCase
 from .get_reservations_by_period_use_case import GetReservationsByPeriodUseCase
+from .get_busy_ramps_use_case import GetBusyRampsUseCase
 from .export_reservations_csv_use_case import ExportReservationsCsvUseCase
 from .export_reservations_xlsx_use_case import ExportReservationsXlsxUseCase
 
@@ -35,6 +37,7 @@ __all__ = [
     "DeleteBranchScheduleUseCase",
     "DeleteBranchScheduleWithValidationUseCase",
     "GetAvailableSlotsUseCase",
+    "GetAvailableSlotsRangeUseCase",
     "ValidateScheduleChangesUseCase",
     # Reservas
     "CreateReservationUseCase",
@@ -45,6 +48,7 @@ __all__ = [
     "CompleteReservationUseCase",
     "RejectReservationUseCase",
     "GetReservationsByPeriodUseCase",
+    "GetBusyRampsUseCase",
     "ExportReservationsCsvUseCase",
     "ExportReservationsXlsxUseCase",
     # Main Reservations
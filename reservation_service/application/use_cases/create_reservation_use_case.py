@@ -11,7 +11,6 @@ from ...domain.entities.order_number import OrderNumber
 from ...domain.entities.customer_data import CustomerData
 from ...domain.entities.branch_data import BranchData
 from ...domain.entities.sector_data import SectorData
-from ...domain.entities.main_reservation import MainReservation
 from ...domain.entities.reservation_status import ReservationStatus
 from ...domain.dto.requests.create_reservation_request import CreateReservationRequest
 from ...domain.dto.responses.reservation_response import ReservationResponse
@@ -114,20 +113,12 @@ class CreateReservationUseCase:
                 ramp_id=None
             )
             
-            # Guardar la reserva principal
-            logger.info("💾 Guardando reserva principal en BD...")
-            saved_reservation = await self.reservation_repository.create(reservation)
-            logger.info(f"✅ Reserva principal guardada con ID: {saved_reservation.id}")
-            
-            # Crear main_reservations para cada sector
-            logger.info(f"📋 Creando {len(request.sector_data)} main_reservations...")
-            main_reservations_created = []
-            
+            # Convertir los sectores a entidades (uno por main_reservation)
+            sectors = []
             for sector_item in request.sector_data:
                 logger.info(f"🔄 Procesando sector {sector_item.sector_id} con rampa {sector_item.ramp_id}")
                 
-                # Convertir sector_data a entidad
-                sector_data_entity = SectorData(
+                sectors.append(SectorData(
                     sector_id=sector_item.sector_id,
                     name=sector_item.name,
                     description=sector_item.description,
@@ -142,22 +133,15 @@ class CreateReservationUseCase:
                     order_numbers=getattr(sector_item, 'order_numbers', None),
                     ramp_id=sector_item.ramp_id,
                     ramp_name=sector_item.ramp_name
-                )
-                
-                # Crear MainReservation
-                main_reservation = MainReservation(
-                    sector_id=sector_item.sector_id,
-                    reservation_id=saved_reservation.id,
-                    sector_data=sector_data_entity,
-                    reservation_date=request.reservation_date,
-                    start_time=request.start_time,
-                    end_time=request.end_time
-                )
-                
-                # Guardar main_reservation
-                created_main_reservation = await self.main_reservation_repository.create(main_reservation)
-                main_reservations_created.append(created_main_reservation)
-                logger.info(f"✅ MainReservation creada con ID: {created_main_reservation.id}")
+                ))
+            
+            # Guardar reserva, pedidos y main_reservations en una sola transacción
+            logger.info(f"💾 Guardando reserva y {len(sectors)} main_reservations en BD...")
+            saved_reservation, main_reservations_created = await self.reservation_repository.create_with_main_reservations(
+                reservation,
+                sectors
+            )
+            logger.info(f"✅ Reserva principal guardada con ID: {saved_reservation.id}")
             
             logger.info(f"✅ {len(main_reservations_created)} main_reservations creadas")
             
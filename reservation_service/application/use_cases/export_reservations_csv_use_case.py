@@ -4,13 +4,12 @@ Use case para exportar reservas a CSV
 import logging
 import csv
 import io
-from datetime import datetime
-from typing import List
+import os
+from typing import AsyncIterator
 from ...domain.dto.requests.export_reservations_request import ExportReservationsRequest
 from ...domain.dto.requests.reservation_filter_request import ReservationFilterRequest
 from ...domain.interfaces.reservation_repository import ReservationRepository
-from ...domain.interfaces.main_reservation_repository import MainReservationRepository
-from .list_reservations_use_case import ListReservationsUseCase
+from .reservation_export import EXPORT_HEADERS, build_export_filter_request, build_export_row
 
 logger = logging.getLogger(__name__)
 
@@ -20,152 +19,51 @@ class ExportReservationsCsvUseCase:
     
     def __init__(
         self,
-        reservation_repository: ReservationRepository,
-        main_reservation_repository: MainReservationRepository
+        reservation_repository: ReservationRepository
     ):
         self.reservation_repository = reservation_repository
-        self.main_reservation_repository = main_reservation_repository
-        self.list_reservations_use_case = ListReservationsUseCase(
-            reservation_repository=reservation_repository,
-            main_reservation_repository=main_reservation_repository
-        )
+        self.chunk_size = int(os.getenv("EXPORT_CHUNK_SIZE", "500"))
     
-    def _parse_date(self, date_str: str) -> datetime:
-        """Función helper para parsear fechas en diferentes formatos"""
-        if not date_str or not date_str.strip():
-            return None
-            
-        date_str = date_str.strip()
-        
-        try:
-            # Formato YYYY-MM-DD
-            if len(date_str) == 10 and date_str.count('-') == 2:
-                return datetime.strptime(date_str, "%Y-%m-%d")
-            
-            # Formato YYYY-MM-DD HH:MM:SS
-            elif len(date_str) == 19 and date_str.count('-') == 2 and date_str.count(':') == 2:
-                return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-            
-            # Formato YYYY-MM-DDTHH:MM:SS (ISO sin zona horaria)
-            elif 'T' in date_str and date_str.count(':') == 2:
-                date_str_std = date_str.replace('T', ' ')
-                return datetime.strptime(date_str_std, "%Y-%m-%d %H:%M:%S")
-            
-            # Formato YYYY-MM-DDTHH:MM:SS.SSS (ISO con milisegundos)
-            elif 'T' in date_str and '.' in date_str:
-                date_str_std = date_str.replace('T', ' ')
-                return datetime.strptime(date_str_std, "%Y-%m-%d %H:%M:%S.%f")
-            
-            # Intentar formato ISO estándar
-            else:
-                return datetime.fromisoformat(date_str)
-                
-        except ValueError as e:
-            raise ValueError(f"Formato de fecha inválido: {date_str}. Formatos soportados: YYYY-MM-DD, YYYY-MM-DD HH:MM:SS, YYYY-MM-DDTHH:MM:SS")
-    
-    def _format_status(self, status: str) -> str:
-        """Formatear el estado de la reserva a español"""
-        status_map = {
-            "PENDING": "Pendiente",
-            "CONFIRMED": "Confirmado",
-            "CANCELLED": "Cancelado",
-            "COMPLETED": "Finalizado",
-            "RESCHEDULING_REQUIRED": "Reagendado"
-        }
-        return status_map.get(status, status)
-    
-    async def execute(self, request: ExportReservationsRequest) -> bytes:
-        """Ejecutar el caso de uso y retornar el contenido CSV como bytes"""
-        logger.info("🚀 ExportReservationsCsvUseCase.execute() iniciado")
+    async def _generate_csv(self, filter_request: ReservationFilterRequest) -> AsyncIterator[bytes]:
+        """Generar el CSV por bloques a medida que se leen las reservas"""
+        output = io.StringIO()
+        writer = csv.writer(output)
+        total = 0
         
         try:
-            # Parsear fechas
-            date_from = None
-            date_to = None
-            
-            if request.reservation_date_from:
-                date_from = self._parse_date(request.reservation_date_from)
-            if request.reservation_date_to:
-                date_to = self._parse_date(request.reservation_date_to)
-            
-            # Crear request para el filtro (mapear company_name a customer_name)
-            export_request = ReservationFilterRequest(
-                user_id=request.user_id,
-                customer_id=request.customer_id,
-                branch_id=request.branch_id,
-                branch_name=request.branch_name,
-                branch_code=request.branch_code,
-                sector_id=request.sector_id,
-                sector_name=request.sector_name,
-                customer_name=request.company_name,  # Mapear company_name a customer_name (el repositorio usa customer_name para filtrar company_name)
-                customer_email=None,
-                reservation_date_from=date_from,
-                reservation_date_to=date_to,
-                status=request.reservation_status,
-                order_code=request.order_code,
-                cargo_type=request.cargo_type,
-                page=1,
-                limit=100  # Límite alto para obtener todas las reservas
-            )
-            
-            # Obtener reservas usando el caso de uso de listado
-            result = await self.list_reservations_use_case.execute(export_request)
-            reservations = result.items
-            
-            logger.info(f"📊 Exportando {len(reservations)} reservas a CSV")
-            
-            # Crear buffer en memoria para el CSV
-            output = io.StringIO()
-            writer = csv.writer(output)
-            
             # Escribir encabezados
-            writer.writerow([
-                "proveedor",
-                "fecha",
-                "hora",
-                "carga",
-                "estado",
-                "sucursal"
-            ])
+            writer.writerow(EXPORT_HEADERS)
             
-            # Escribir datos
-            for reservation in reservations:
-                # Formatear fecha
-                fecha = ""
-                if reservation.reservation_date:
-                    fecha = reservation.reservation_date.strftime("%Y-%m-%d")
-                
-                # Formatear hora
-                hora = ""
-                if reservation.start_time:
-                    if isinstance(reservation.start_time, datetime):
-                        hora = reservation.start_time.strftime("%H:%M")
-                    else:
-                        hora = str(reservation.start_time)
+            async for reservations in self.reservation_repository.stream(filter_request, self.chunk_size):
+                for reservation in reservations:
+                    writer.writerow(build_export_row(reservation))
+                total += len(reservations)
                 
-                # Formatear estado
-                estado = self._format_status(reservation.status or "")
-                
-                writer.writerow([
-                    reservation.customer_data.company_name or "",
-                    fecha,
-                    hora,
-                    reservation.cargo_type or "",
-                    estado,
-                    reservation.branch_data.code or ""
-                ])
-            
-            # Obtener el contenido del CSV y convertir a bytes
-            csv_content = output.getvalue()
-            output.close()
+                # Entregar el bloque y vaciar el buffer
+                yield output.getvalue().encode('utf-8')
+                output.seek(0)
+                output.truncate(0)
             
-            # Convertir a bytes con encoding UTF-8
-            csv_bytes = csv_content.encode('utf-8')
+            remaining = output.getvalue()
+            if remaining:
+                yield remaining.encode('utf-8')
             
-            logger.info("✅ Exportación a CSV completada exitosamente")
-            return csv_bytes
+            logger.info(f"✅ Exportación a CSV completada exitosamente ({total} reservas)")
             
         except Exception as e:
             logger.error(f"❌ Error al exportar reservas a CSV: {str(e)}", exc_info=True)
             raise
-
+        finally:
+            output.close()
+    
+    async def execute(self, request: ExportReservationsRequest) -> AsyncIterator[bytes]:
+        """
+        Ejecutar el caso de uso y retornar el contenido CSV como iterador de bytes
+        
+        Los filtros se validan antes de devolver el iterador, de modo que los
+        errores de formato de fecha se reportan antes de empezar a transmitir.
+        """
+        logger.info("🚀 ExportReservationsCsvUseCase.execute() iniciado")
+        
+        filter_request = build_export_filter_request(request)
+        return self._generate_csv(filter_request)
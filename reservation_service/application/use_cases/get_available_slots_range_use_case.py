@@ -0,0 +1,43 @@
+"""
+Use case para obtener slots disponibles de un rango de fechas
+"""
+from ...domain.dto.requests.schedule_requests import GetAvailableSlotsRangeRequest
+from ...domain.dto.responses.schedule_responses import AvailableSlotsRangeResponse
+from ...domain.interfaces.schedule_repository import ScheduleRepository
+from .get_available_slots_use_case import build_available_slots_response, get_branch_name
+
+
+class GetAvailableSlotsRangeUseCase:
+    """Caso de uso para obtener slots disponibles de varios días"""
+    
+    def __init__(self, schedule_repository: ScheduleRepository):
+        self.schedule_repository = schedule_repository
+    
+    async def execute(self, request: GetAvailableSlotsRangeRequest) -> AvailableSlotsRangeResponse:
+        """
+        Ejecutar el caso de uso
+        
+        A diferencia de la consulta de un día, los días sin horario configurado
+        no generan error: se devuelven sin slots. Las fechas pasadas las rechaza
+        la validación de GetAvailableSlotsRangeRequest.
+        """
+        slots_by_date = await self.schedule_repository.get_available_slots_range(
+            request.branch_id,
+            request.start_date,
+            request.end_date
+        )
+        
+        days = [
+            build_available_slots_response(request.branch_id, slot_date, slots)
+            for slot_date, slots in slots_by_date.items()
+        ]
+        
+        return AvailableSlotsRangeResponse(
+            branch_id=request.branch_id,
+            branch_name=get_branch_name(request.branch_id),
+            start_date=request.start_date,
+            end_date=request.end_date,
+            days=days,
+            total_slots=sum(day.total_slots for day in days),
+            available_slots=sum(day.available_slots for day in days)
+        )
@@ -54,30 +54,44 @@ class GetAvailableSlotsUseCase:
             request.schedule_date
         )
         
-        # Convertir a DTOs de respuesta
-        slot_responses = [self.to_slot_response(slot) for slot in available_slots]
-        
-        # TODO: Obtener nombre de la sucursal desde location_service
-        branch_name = f"Sucursal {request.branch_id}"
-        
-        return AvailableSlotsResponseDTO(
-            branch_id=request.branch_id,
-            branch_name=branch_name,
-            date=datetime.combine(request.schedule_date, datetime.min.time()),
-            day_of_week=day_of_week_number,
-            day_name=DayOfWeek.get_name(day_of_week_number),
-            slots=slot_responses,
-            total_slots=len(slot_responses),
-            available_slots=len([slot for slot in slot_responses if slot.is_available])
-        )
+        # Convertir a DTO de respuesta
+        return build_available_slots_response(request.branch_id, request.schedule_date, available_slots)
     
     def to_slot_response(self, slot: TimeSlot) -> TimeSlotResponse:
         """Convertir slot a DTO de respuesta"""
-        return TimeSlotResponse(
-            start_time=slot.start_time,
-            end_time=slot.end_time,
-            is_available=slot.is_available,
-            reservation_id=slot.reservation_id,
-            duration_minutes=slot.duration_minutes(),
-            duration_hours=slot.duration_hours()
-        ) 
\ No newline at end of file
+        return to_slot_response(slot)
+
+
+def get_branch_name(branch_id: int) -> str:
+    """Nombre de la sucursal para las respuestas de disponibilidad"""
+    # TODO: Obtener nombre de la sucursal desde location_service
+    return f"Sucursal {branch_id}"
+
+
+def to_slot_response(slot: TimeSlot) -> TimeSlotResponse:
+    """Convertir slot a DTO de respuesta"""
+    return TimeSlotResponse(
+        start_time=slot.start_time,
+        end_time=slot.end_time,
+        is_available=slot.is_available,
+        reservation_id=slot.reservation_id,
+        duration_minutes=slot.duration_minutes(),
+        duration_hours=slot.duration_hours()
+    )
+
+
+def build_available_slots_response(branch_id: int, slot_date: date, slots: List[TimeSlot]) -> AvailableSlotsResponseDTO:
+    """Construir la respuesta de disponibilidad de un día (compartida con la consulta por rango)"""
+    day_of_week_number = slot_date.isoweekday()
+    slot_responses = [to_slot_response(slot) for slot in slots]
+    
+    return AvailableSlotsResponseDTO(
+        branch_id=branch_id,
+        branch_name=get_branch_name(branch_id),
+        date=datetime.combine(slot_date, datetime.min.time()),
+        day_of_week=day_of_week_number,
+        day_name=DayOfWeek.get_name(day_of_week_number),
+        slots=slot_responses,
+        total_slots=len(slot_responses),
+        available_slots=len([slot for slot in slot_responses if slot.is_available])
+    ) 
\ No newline at end of file
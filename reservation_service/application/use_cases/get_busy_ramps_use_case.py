@@ -0,0 +1,47 @@
+"""
+Use case para obtener las rampas ocupadas en un período
+"""
+import logging
+
+from ...domain.interfaces.reservation_repository import ReservationRepository
+from ...domain.dto.requests.busy_ramps_request import BusyRampsRequest
+from ...domain.dto.responses.busy_ramps_response import BusyRampsResponse
+
+logger = logging.getLogger(__name__)
+
+
+class GetBusyRampsUseCase:
+    """Use case para obtener las rampas con reservas activas en un período"""
+    
+    def __init__(self, reservation_repository: ReservationRepository):
+        """
+        Inicializar use case
+        
+        Args:
+            reservation_repository: Repositorio de reservas
+        """
+        self.reservation_repository = reservation_repository
+    
+    async def execute(self, request: BusyRampsRequest) -> BusyRampsResponse:
+        """
+        Ejecutar el use case
+        
+        Args:
+            request: Request con sucursal y período
+            
+        Returns:
+            BusyRampsResponse con los IDs de rampas ocupadas
+        """
+        logger.info(f"🔍 Obteniendo rampas ocupadas de la sucursal {request.branch_id}")
+        logger.info(f"📅 Período: {request.start_time} - {request.end_time}")
+        
+        busy_ramp_ids = await self.reservation_repository.get_busy_ramp_ids(
+            branch_id=request.branch_id,
+            start_time=request.start_time,
+            end_time=request.end_time
+        )
+        
+        return BusyRampsResponse(
+            busy_ramp_ids=busy_ramp_ids,
+            total=len(busy_ramp_ids)
+        )
@@ -41,8 +41,8 @@ class GetReservationUseCase:
             
             # Obtener las main_reservations asociadas
             logger.info(f"🔍 Buscando main_reservations para reservation_id: {reservation_id}")
-            main_reservations, _ = await self.main_reservation_repository.list(
-                reservation_id=reservation_id
+            main_reservations = await self.main_reservation_repository.list_by_reservation_ids(
+                [reservation_id]
             )
             logger.info(f"✅ Se encontraron {len(main_reservations)} main_reservations")
             
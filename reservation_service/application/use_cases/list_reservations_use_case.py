@@ -1,7 +1,7 @@
 """
 Use case para listar reservas
 """
-from typing import List
+from typing import Dict, List
 from ...domain.dto.requests.reservation_filter_request import ReservationFilterRequest
 from ...domain.dto.responses.reservation_list_response import ReservationListResponse
 from ...domain.dto.responses.reservation_response import ReservationResponse
@@ -24,28 +24,43 @@ class ListReservationsUseCase:
         """Ejecutar el caso de uso"""
         
         # Obtener reservas con filtros
-        reservations, total = await self.reservation_repository.list(request)
+        reservations, total, next_cursor = await self.reservation_repository.list(request)
+        
+        # Obtener las main_reservations de toda la página en una sola consulta
+        main_reservations_by_reservation = await self.get_main_reservations_by_reservation(reservations)
         
         # Convertir a DTOs de respuesta
         reservation_responses = []
         for reservation in reservations:
-            # Obtener las main_reservations asociadas
-            main_reservations, _ = await self.main_reservation_repository.list(
-                reservation_id=reservation.id
+            reservation_response = await self.to_response(
+                reservation,
+                main_reservations_by_reservation.get(reservation.id, [])
             )
-            reservation_response = await self.to_response(reservation, main_reservations)
             reservation_responses.append(reservation_response)
         
-        # Calcular páginas
-        pages = (total + request.limit - 1) // request.limit
+        # Calcular páginas (sobre el total aproximado si el modo es estimated)
+        pages = (total.value + request.limit - 1) // request.limit if total is not None else None
         
         return ReservationListResponse(
             items=reservation_responses,
-            total=total,
+            total=total.value if total is not None else None,
+            total_mode=total.mode if total is not None else None,
             page=request.page,
             size=request.limit,
-            pages=pages
+            pages=pages,
+            next_cursor=next_cursor
+        )
+    
+    async def get_main_reservations_by_reservation(self, reservations: List) -> Dict[int, List]:
+        """Cargar las main_reservations de varias reservas y agruparlas por reservation_id"""
+        main_reservations = await self.main_reservation_repository.list_by_reservation_ids(
+            [reservation.id for reservation in reservations]
         )
+        
+        grouped: Dict[int, List] = {}
+        for main_res in main_reservations:
+            grouped.setdefault(main_res.reservation_id, []).append(main_res)
+        return grouped
     
     async def to_response(self, reservation, main_reservations: List) -> ReservationResponse:
         """Convertir entidad a DTO de respuesta completa"""
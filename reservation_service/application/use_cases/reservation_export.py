@@ -0,0 +1,133 @@
+"""
+Helpers compartidos por las exportaciones de reservas (CSV y XLSX)
+"""
+from datetime import datetime
+from typing import List, Optional
+from ...domain.dto.requests.export_reservations_request import ExportReservationsRequest
+from ...domain.dto.requests.reservation_filter_request import ReservationFilterRequest
+from ...domain.entities.reservation import Reservation
+
+# Columnas de la exportación (mismo orden que build_export_row)
+EXPORT_HEADERS = [
+    "proveedor",
+    "fecha",
+    "hora",
+    "carga",
+    "estado",
+    "sucursal"
+]
+
+# Estados de la reserva en español
+STATUS_LABELS = {
+    "PENDING": "Pendiente",
+    "CONFIRMED": "Confirmado",
+    "CANCELLED": "Cancelado",
+    "COMPLETED": "Finalizado",
+    "RESCHEDULING_REQUIRED": "Reagendado"
+}
+
+
+def parse_export_date(date_str: str) -> Optional[datetime]:
+    """Función helper para parsear fechas en diferentes formatos"""
+    if not date_str or not date_str.strip():
+        return None
+        
+    date_str = date_str.strip()
+    
+    try:
+        # Formato YYYY-MM-DD
+        if len(date_str) == 10 and date_str.count('-') == 2:
+            return datetime.strptime(date_str, "%Y-%m-%d")
+        
+        # Formato YYYY-MM-DD HH:MM:SS
+        elif len(date_str) == 19 and date_str.count('-') == 2 and date_str.count(':') == 2:
+            return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+        
+        # Formato YYYY-MM-DDTHH:MM:SS (ISO sin zona horaria)
+        elif 'T' in date_str and date_str.count(':') == 2:
+            date_str_std = date_str.replace('T', ' ')
+            return datetime.strptime(date_str_std, "%Y-%m-%d %H:%M:%S")
+        
+        # Formato YYYY-MM-DDTHH:MM:SS.SSS (ISO con milisegundos)
+        elif 'T' in date_str and '.' in date_str:
+            date_str_std = date_str.replace('T', ' ')
+            return datetime.strptime(date_str_std, "%Y-%m-%d %H:%M:%S.%f")
+        
+        # Intentar formato ISO estándar
+        else:
+            return datetime.fromisoformat(date_str)
+            
+    except ValueError:
+        raise ValueError(f"Formato de fecha inválido: {date_str}. Formatos soportados: YYYY-MM-DD, YYYY-MM-DD HH:MM:SS, YYYY-MM-DDTHH:MM:SS")
+
+
+def format_status(status: str) -> str:
+    """Formatear el estado de la reserva a español"""
+    return STATUS_LABELS.get(status, status)
+
+
+def build_export_filter_request(request: ExportReservationsRequest) -> ReservationFilterRequest:
+    """Construir el filtro del repositorio a partir del request de exportación"""
+    # Parsear fechas
+    date_from = None
+    date_to = None
+    
+    if request.reservation_date_from:
+        date_from = parse_export_date(request.reservation_date_from)
+    if request.reservation_date_to:
+        date_to = parse_export_date(request.reservation_date_to)
+    
+    # Mapear company_name a customer_name (el repositorio usa customer_name para filtrar company_name)
+    return ReservationFilterRequest(
+        user_id=request.user_id,
+        customer_id=request.customer_id,
+        branch_id=request.branch_id,
+        branch_name=request.branch_name,
+        branch_code=request.branch_code,
+        sector_id=request.sector_id,
+        sector_name=request.sector_name,
+        customer_name=request.company_name,
+        customer_email=None,
+        reservation_date_from=date_from,
+        reservation_date_to=date_to,
+        status=request.reservation_status,
+        order_code=request.order_code,
+        cargo_type=request.cargo_type
+    )
+
+
+def build_export_row(reservation: Reservation) -> List[str]:
+    """Convertir una reserva en una fila de la exportación"""
+    # Formatear fecha
+    fecha = ""
+    if reservation.reservation_date:
+        fecha = reservation.reservation_date.strftime("%Y-%m-%d")
+    
+    # Formatear hora
+    hora = ""
+    if reservation.start_time:
+        if isinstance(reservation.start_time, datetime):
+            hora = reservation.start_time.strftime("%H:%M")
+        else:
+            hora = str(reservation.start_time)
+    
+    # Formatear estado
+    estado = format_status(reservation.status.value if reservation.status else "")
+    
+    return [
+        reservation.customer_data.company_name or "",
+        fecha,
+        hora,
+        reservation.cargo_type or "",
+        estado,
+        reservation.branch_data.code or ""
+    ]
+
+
+__all__ = [
+    'EXPORT_HEADERS',
+    'parse_export_date',
+    'format_status',
+    'build_export_filter_request',
+    'build_export_row'
+]
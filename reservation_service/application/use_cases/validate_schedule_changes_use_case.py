@@ -146,40 +146,18 @@ class ValidateScheduleChangesUseCase:
         """Obtener reservas activas que podrían verse afectadas"""
         logger.info(f"🔄 Obteniendo reservas afectadas para branch_id: {branch_id}, day_of_week: {day_of_week}")
         
-        all_reservations = []
-        page = 1
-        limit = 100  # Usar el límite máximo permitido
+        # Crear filtro para obtener reservas activas de esta sucursal
+        filter_request = ReservationFilterRequest(
+            branch_id=branch_id,
+            status="PENDING,CONFIRMED"  # Solo reservas activas
+        )
         
-        while True:
-            logger.info(f"📝 Obteniendo página {page} de reservas...")
-            
-            # Crear filtro para obtener reservas activas de esta sucursal
-            filter_request = ReservationFilterRequest(
-                branch_id=branch_id,
-                status="PENDING,CONFIRMED",  # Solo reservas activas
-                page=page,
-                limit=limit
-            )
-            
-            # Obtener reservas de esta página
-            reservations, total = await self.reservation_repository.list(filter_request)
-            logger.info(f"📊 Página {page}: {len(reservations)} reservas de {total} total")
-            
-            # Si no hay más reservas, terminar
-            if not reservations:
-                logger.info("✅ No hay más reservas para obtener")
-                break
-            
-            # Agregar reservas de esta página
-            all_reservations.extend(reservations)
-            
-            # Si ya obtuvimos todas las reservas, terminar
-            if len(all_reservations) >= total:
-                logger.info(f"✅ Todas las reservas obtenidas: {len(all_reservations)}")
-                break
-            
-            # Ir a la siguiente página
-            page += 1
+        # Recorrer todas las reservas en bloques (sin count ni OFFSET por página)
+        all_reservations = []
+        async for chunk in self.reservation_repository.stream(filter_request):
+            all_reservations.extend(chunk)
+            logger.info(f"📝 Bloque de {len(chunk)} reservas ({len(all_reservations)} acumuladas)")
+        logger.info(f"✅ Todas las reservas obtenidas: {len(all_reservations)}")
         
         # Filtrar por día de la semana
         logger.info("🔄 Filtrando reservas por día de la semana...")
@@ -0,0 +1,22 @@
+"""
+Request DTO para obtener las rampas ocupadas en un período
+"""
+from pydantic import BaseModel, Field, field_validator
+from datetime import datetime
+
+
+class BusyRampsRequest(BaseModel):
+    """Request para obtener las rampas ocupadas de una sucursal en un período"""
+    
+    branch_id: int = Field(..., gt=0, description="ID de la sucursal")
+    start_time: datetime = Field(..., description="Fecha y hora de inicio del período (YYYY-MM-DD HH:MM:SS)")
+    end_time: datetime = Field(..., description="Fecha y hora de fin del período (YYYY-MM-DD HH:MM:SS)")
+    
+    @field_validator("end_time")
+    @classmethod
+    def validate_end_after_start(cls, v, info):
+        """Validar que la fecha de fin sea posterior a la de inicio"""
+        start_time = info.data.get("start_time")
+        if start_time and v <= start_time:
+            raise ValueError("La fecha de fin debe ser posterior a la fecha de inicio")
+        return v
@@ -5,6 +5,8 @@ from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 
+from commons.counting import CountMode
+
 
 class ReservationFilterRequest(BaseModel):
     """Request para filtrar reservas"""
@@ -42,6 +44,9 @@ class ReservationFilterRequest(BaseModel):
     # Paginación
     page: int = Field(1, ge=1, description="Número de página")
     limit: int = Field(10, ge=1, le=100, description="Elementos por página")
+    cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (ignora page)")
+    include_total: bool = Field(True, description="Calcular el total de resultados")
+    count_mode: Optional[CountMode] = Field(None, description="Modo del total: exact, cached o estimated (None = LIST_COUNT_MODE)")
     
     @property
     def offset(self) -> int:
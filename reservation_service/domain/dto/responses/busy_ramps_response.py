@@ -0,0 +1,12 @@
+"""
+Response DTO para las rampas ocupadas en un período
+"""
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class BusyRampsResponse(BaseModel):
+    """Response con los IDs de rampas ocupadas en el período"""
+    
+    busy_ramp_ids: List[int] = Field(default_factory=list, description="IDs de rampas con reservas activas en el período")
+    total: int = Field(..., description="Cantidad de rampas ocupadas")
@@ -2,7 +2,7 @@
 Response DTO para lista de reservas
 """
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 
 from .reservation_response import ReservationResponse
 
@@ -10,7 +10,9 @@ from .reservation_response import ReservationResponse
 class ReservationListResponse(BaseModel):
     """Response para lista de reservas con paginación"""
     items: List[ReservationResponse] = Field(..., description="Lista de reservas")
-    total: int = Field(..., description="Total de reservas")
+    total: Optional[int] = Field(None, description="Total de reservas (None si include_total=false)")
+    total_mode: Optional[str] = Field(None, description="Modo que produjo el total: exact, cached o estimated")
     page: int = Field(..., description="Página actual")
     size: int = Field(..., description="Tamaño de la página")
-    pages: int = Field(..., description="Total de páginas") 
\ No newline at end of file
+    pages: Optional[int] = Field(None, description="Total de páginas (None si include_total=false)")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)") 
\ No newline at end of file
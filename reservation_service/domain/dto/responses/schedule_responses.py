@@ -1,4 +1,4 @@
-from datetime import datetime, time
+from datetime import date, datetime, time
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
@@ -59,6 +59,17 @@ class AvailableSlotsResponse(BaseModel):
         }
 
 
+class AvailableSlotsRangeResponse(BaseModel):
+    """Respuesta con slots disponibles para cada día de un rango"""
+    branch_id: int = Field(..., description="ID de la sucursal")
+    branch_name: str = Field(..., description="Nombre de la sucursal")
+    start_date: date = Field(..., description="Fecha inicial del rango")
+    end_date: date = Field(..., description="Fecha final del rango (inclusive)")
+    days: List[AvailableSlotsResponse] = Field(..., description="Resumen y slots de cada día")
+    total_slots: int = Field(..., description="Total de slots en el rango")
+    available_slots: int = Field(..., description="Slots disponibles en el rango")
+
+
 class BranchScheduleListResponse(BaseModel):
     """Respuesta con lista de horarios de sucursal"""
     schedules: List[BranchScheduleResponse] = Field(..., description="Lista de horarios")
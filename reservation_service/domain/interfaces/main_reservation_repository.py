@@ -47,6 +47,19 @@ class MainReservationRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def list_by_reservation_ids(self, reservation_ids: List[int]) -> List[MainReservation]:
+        """
+        Obtener en una sola consulta las main_reservations de varias reservas
+        
+        Args:
+            reservation_ids: IDs de las reservas padre
+            
+        Returns:
+            List[MainReservation]: main_reservations de todas las reservas indicadas
+        """
+        pass
+    
     @abstractmethod
     async def update(self, main_reservation: MainReservation) -> MainReservation:
         """Actualizar una main_reservation"""
@@ -2,10 +2,13 @@
 Interfaz para el repositorio de reservas
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, List, Optional, Tuple
 from datetime import datetime
 from ..entities.reservation import Reservation
+from ..entities.main_reservation import MainReservation
+from ..entities.sector_data import SectorData
 from ..dto.requests.reservation_filter_request import ReservationFilterRequest
+from commons.counting import TotalCount
 
 
 class ReservationRepository(ABC):
@@ -16,14 +19,31 @@ class ReservationRepository(ABC):
         """Crear una nueva reserva"""
         pass
     
+    @abstractmethod
+    async def create_with_main_reservations(
+        self,
+        reservation: Reservation,
+        sectors: List[SectorData]
+    ) -> Tuple[Reservation, List[MainReservation]]:
+        """
+        Crear una reserva, sus números de pedido y una main_reservation por sector
+        en una única transacción (todo o nada)
+        """
+        pass
+    
     @abstractmethod
     async def get_by_id(self, reservation_id: int) -> Optional[Reservation]:
         """Obtener una reserva por ID"""
         pass
     
     @abstractmethod
-    async def list(self, filter_request: ReservationFilterRequest) -> Tuple[List[Reservation], int]:
-        """Listar reservas con filtros y paginación"""
+    async def list(self, filter_request: ReservationFilterRequest) -> Tuple[List[Reservation], Optional[TotalCount], Optional[str]]:
+        """Listar reservas con filtros y paginación (reservas, total opcional, cursor siguiente)"""
+        pass
+    
+    @abstractmethod
+    def stream(self, filter_request: ReservationFilterRequest, chunk_size: int = 500) -> AsyncIterator[List[Reservation]]:
+        """Recorrer en bloques todas las reservas que cumplen los filtros (sin paginación)"""
         pass
     
     @abstractmethod
@@ -84,4 +104,9 @@ class ReservationRepository(ABC):
     @abstractmethod
     async def get_by_period(self, branch_id: int, start_time: datetime, end_time: datetime, status: Optional[str] = None) -> List[Reservation]:
         """Obtener reservas por período de tiempo en una sucursal"""
-        pass 
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def get_busy_ramp_ids(self, branch_id: int, start_time: datetime, end_time: datetime) -> List[int]:
+        """Obtener los IDs de rampas ocupadas por reservas activas de la sucursal en un período"""
+        pass
@@ -2,7 +2,7 @@
 Interfaz para el repositorio de horarios
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import date, datetime
 
 from ..entities.branch_schedule import BranchSchedule
@@ -56,6 +56,12 @@ class ScheduleRepository(ABC):
         """Obtener slots disponibles para una fecha específica"""
         pass
     
+    @abstractmethod
+    async def get_available_slots_range(self, branch_id: int, start_date: date,
+                                        end_date: date) -> Dict[date, List[TimeSlot]]:
+        """Obtener slots de cada día de un rango (ambos extremos inclusive)"""
+        pass
+    
     @abstractmethod
     async def check_slot_availability(self, branch_id: int, target_date: date, 
                                     start_time: str, end_time: str) -> bool:
@@ -65,4 +71,10 @@ class ScheduleRepository(ABC):
     @abstractmethod
     async def get_reservations_for_date(self, branch_id: int, target_date: date) -> List[Reservation]:
         """Obtener reservas existentes para una fecha específica"""
-        pass 
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def get_reservations_for_range(self, branch_id: int, start_date: date,
+                                         end_date: date) -> List[Reservation]:
+        """Obtener reservas existentes entre dos fechas (ambas inclusive)"""
+        pass
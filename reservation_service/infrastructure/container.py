@@ -11,6 +11,7 @@ from ..application.use_cases import (
     ListBranchSchedulesUseCase,
     DeleteBranchScheduleUseCase,
     GetAvailableSlotsUseCase,
+    GetAvailableSlotsRangeUseCase,
     ValidateScheduleChangesUseCase,
     UpdateBranchScheduleUseCase,
     DeleteBranchScheduleWithValidationUseCase,
@@ -23,6 +24,7 @@ from ..application.use_cases import (
     CompleteReservationUseCase,
     RejectReservationUseCase,
     GetReservationsByPeriodUseCase,
+    GetBusyRampsUseCase,
     ExportReservationsCsvUseCase,
     ExportReservationsXlsxUseCase,
     # Casos de uso de main_reservations
@@ -81,6 +83,11 @@ class Container(containers.DeclarativeContainer):
         schedule_repository=schedule_repository
     )
     
+    get_available_slots_range_use_case = providers.Factory(
+        GetAvailableSlotsRangeUseCase,
+        schedule_repository=schedule_repository
+    )
+    
     # Casos de uso de validación de cambios
     validate_schedule_changes_use_case = providers.Factory(
         ValidateScheduleChangesUseCase,
@@ -145,16 +152,19 @@ class Container(containers.DeclarativeContainer):
         reservation_repository=reservation_repository
     )
     
+    get_busy_ramps_use_case = providers.Factory(
+        GetBusyRampsUseCase,
+        reservation_repository=reservation_repository
+    )
+    
     export_reservations_csv_use_case = providers.Factory(
         ExportReservationsCsvUseCase,
-        reservation_repository=reservation_repository,
-        main_reservation_repository=main_reservation_repository
+        reservation_repository=reservation_repository
     )
     
     export_reservations_xlsx_use_case = providers.Factory(
         ExportReservationsXlsxUseCase,
-        reservation_repository=reservation_repository,
-        main_reservation_repository=main_reservation_repository
+        reservation_repository=reservation_repository
     )
     
     # Casos de uso de main_reservations
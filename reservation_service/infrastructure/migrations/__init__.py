@@ -0,0 +1,12 @@
+"""
+Migraciones idempotentes del Reservation Service
+metadata.create_all solo crea tablas nuevas: los cambios sobre tablas
+existentes se aplican con estos scripts (ver start_migrations.py)
+"""
+from .ramp_period_exclusion import upgrade as upgrade_ramp_period_exclusion
+
+MIGRATIONS = [
+    ("ramp_period_exclusion", upgrade_ramp_period_exclusion),
+]
+
+__all__ = ['MIGRATIONS', 'upgrade_ramp_period_exclusion']
@@ -0,0 +1,73 @@
+"""
+Migración: rangos de período (TSRANGE) y exclusión de rampas solapadas
+Agrega a las tablas existentes lo que los modelos crean en instalaciones nuevas:
+- reservations.period y su índice GiST
+- main_reservations.period, main_reservations.is_active y su índice GiST
+- restricción excl_main_reservations_ramp_period (requiere btree_gist)
+
+Todas las sentencias son idempotentes: se puede ejecutar varias veces.
+"""
+import logging
+
+from sqlalchemy import text
+
+from ..models.main_reservation import RAMP_PERIOD_EXCLUSION
+
+logger = logging.getLogger(__name__)
+
+STATEMENTS = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gist",
+
+    # reservations.period
+    """
+    ALTER TABLE reservations
+        ADD COLUMN IF NOT EXISTS period tsrange
+        GENERATED ALWAYS AS (tsrange(start_time, end_time, '[)')) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_reservations_period ON reservations USING gist (period)",
+
+    # main_reservations.period / is_active
+    """
+    ALTER TABLE main_reservations
+        ADD COLUMN IF NOT EXISTS period tsrange
+        GENERATED ALWAYS AS (tsrange(start_time, end_time, '[)')) STORED
+    """,
+    "ALTER TABLE main_reservations ADD COLUMN IF NOT EXISTS is_active boolean NOT NULL DEFAULT true",
+    "CREATE INDEX IF NOT EXISTS ix_main_reservations_period ON main_reservations USING gist (period)",
+
+    # is_active refleja el estado de la reserva padre (PENDING o CONFIRMED)
+    """
+    UPDATE main_reservations AS m
+    SET is_active = (r.status::text IN ('PENDING', 'CONFIRMED'))
+    FROM reservations AS r
+    WHERE r.id = m.reservation_id
+      AND m.is_active IS DISTINCT FROM (r.status::text IN ('PENDING', 'CONFIRMED'))
+    """,
+
+    # Falla si ya existen main_reservations activas solapadas en la misma rampa:
+    # deben resolverse a mano antes de volver a ejecutar la migración
+    f"""
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = '{RAMP_PERIOD_EXCLUSION}') THEN
+            ALTER TABLE main_reservations
+                ADD CONSTRAINT {RAMP_PERIOD_EXCLUSION}
+                EXCLUDE USING gist (ramp_id WITH =, period WITH &&)
+                WHERE (is_active AND ramp_id > 0);
+        END IF;
+    END
+    $$
+    """,
+]
+
+
+async def upgrade(connection) -> None:
+    """
+    Aplicar la migración
+
+    Args:
+        connection: Conexión async dentro de una transacción (engine.begin())
+    """
+    for statement in STATEMENTS:
+        await connection.execute(text(statement))
+    logger.info("✅ Migración ramp_period_exclusion aplicada")
@@ -4,13 +4,17 @@ Modelo de base de datos para la tabla principal de reservas (main_reservations)
 import logging
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey, JSON, Computed, Index, DDL, event, text
+from sqlalchemy.dialects.postgresql import TSRANGE, ExcludeConstraint
 from sqlalchemy.orm import relationship
 
 from .base import Base
 
 logger = logging.getLogger(__name__)
 
+# Nombre de la restricción que impide reservar la misma rampa en horarios solapados
+RAMP_PERIOD_EXCLUSION = "excl_main_reservations_ramp_period"
+
 
 # Importar la entidad de dominio de forma lazy para evitar imports circulares
 if TYPE_CHECKING:
@@ -21,6 +25,17 @@ class MainReservationModel(Base):
     """Modelo de base de datos para main_reservations"""
 
     __tablename__ = "main_reservations"
+    __table_args__ = (
+        Index("ix_main_reservations_period", "period", postgresql_using="gist"),
+        # Dos main_reservations activas no pueden ocupar la misma rampa en horarios solapados
+        ExcludeConstraint(
+            ("ramp_id", "="),
+            ("period", "&&"),
+            name=RAMP_PERIOD_EXCLUSION,
+            using="gist",
+            where=text("is_active AND ramp_id > 0")
+        ),
+    )
 
     # Clave primaria
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -40,6 +55,12 @@ class MainReservationModel(Base):
     start_time = Column(DateTime, nullable=False, index=True)
     end_time = Column(DateTime, nullable=False, index=True)
 
+    # Rango [start_time, end_time) calculado por la BD (indexado con GiST)
+    period = Column(TSRANGE, Computed("tsrange(start_time, end_time, '[)')", persisted=True))
+
+    # Refleja si la reserva padre está PENDING o CONFIRMED (usado por la restricción de exclusión)
+    is_active = Column(Boolean, nullable=False, default=True, server_default=text("true"))
+
     # Relaciones
     reservation = relationship("ReservationModel", backref="main_reservations")
 
@@ -115,3 +136,9 @@ class MainReservationModel(Base):
         )
 
 
+# La restricción de exclusión combina "=" sobre enteros con "&&" sobre rangos en GiST
+event.listen(
+    MainReservationModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist")
+)
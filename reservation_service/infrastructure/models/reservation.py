@@ -3,7 +3,8 @@ Modelo de base de datos para reservas
 """
 import logging
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Float, JSON, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Float, JSON, Computed, Index, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import TSRANGE
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -22,6 +23,9 @@ class ReservationModel(Base):
     """Modelo de base de datos para reservas"""
     
     __tablename__ = "reservations"
+    __table_args__ = (
+        Index("ix_reservations_period", "period", postgresql_using="gist"),
+    )
     
     # Clave primaria
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -44,6 +48,9 @@ class ReservationModel(Base):
     start_time = Column(DateTime, nullable=False, index=True)
     end_time = Column(DateTime, nullable=False, index=True)
     
+    # Rango [start_time, end_time) calculado por la BD (indexado con GiST)
+    period = Column(TSRANGE, Computed("tsrange(start_time, end_time, '[)')", persisted=True))
+    
     # Estado y metadatos
     status = Column(SQLEnum(ReservationStatus), default=ReservationStatus.PENDING, nullable=False, index=True)
     notes = Column(Text, nullable=True)
@@ -10,12 +10,22 @@ import logging
 from ...domain.entities.main_reservation import MainReservation
 from ...domain.interfaces.main_reservation_repository import MainReservationRepository
 from ...infrastructure.models.main_reservation import MainReservationModel
+from ...infrastructure.models.reservation import ReservationModel
+from .reservation_repository_impl import ACTIVE_STATUSES
 from commons.database import get_db_session
 
 # Configurar logging
 logger = logging.getLogger(__name__)
 
 
+async def _parent_is_active(session: AsyncSession, reservation_id: int) -> bool:
+    """Indica si la reserva padre está PENDING o CONFIRMED (valor de is_active)"""
+    result = await session.execute(
+        select(ReservationModel.status).where(ReservationModel.id == reservation_id)
+    )
+    return result.scalar_one_or_none() in ACTIVE_STATUSES
+
+
 class MainReservationRepositoryImpl(MainReservationRepository):
     """Implementación del repositorio para main_reservations"""
     
@@ -35,6 +45,7 @@ class MainReservationRepositoryImpl(MainReservationRepository):
             try:
                 # Convertir entidad de dominio a modelo de BD
                 main_reservation_model = MainReservationModel.from_domain(main_reservation)
+                main_reservation_model.is_active = await _parent_is_active(session, main_reservation_model.reservation_id)
                 logger.info("✅ MainReservationModel creado correctamente")
                 
                 session.add(main_reservation_model)
@@ -141,6 +152,31 @@ class MainReservationRepositoryImpl(MainReservationRepository):
             
             return main_reservations, total
     
+    async def list_by_reservation_ids(self, reservation_ids: List[int]) -> List[MainReservation]:
+        """
+        Obtener en una sola consulta las main_reservations de varias reservas
+        
+        Args:
+            reservation_ids: IDs de las reservas padre
+            
+        Returns:
+            List[MainReservation]: main_reservations de todas las reservas indicadas
+        """
+        if not reservation_ids:
+            return []
+        
+        async for session in get_db_session():
+            query = select(MainReservationModel).where(
+                MainReservationModel.reservation_id.in_(set(reservation_ids))
+            ).order_by(MainReservationModel.reservation_id, MainReservationModel.start_time)
+            
+            result = await session.execute(query)
+            main_reservation_models = result.scalars().all()
+            
+            logger.info(f"📋 MainReservationRepositoryImpl.list_by_reservation_ids(): {len(main_reservation_models)} registros para {len(reservation_ids)} reservas")
+            
+            return [model.to_domain() for model in main_reservation_models]
+    
     async def update(self, main_reservation: MainReservation) -> MainReservation:
         """Actualizar una main_reservation"""
         logger.info(f"🔄 MainReservationRepositoryImpl.update() iniciado para ID: {main_reservation.id}")
@@ -168,6 +204,7 @@ class MainReservationRepositoryImpl(MainReservationRepository):
                 main_reservation_model.reservation_date = updated_model.reservation_date
                 main_reservation_model.start_time = updated_model.start_time
                 main_reservation_model.end_time = updated_model.end_time
+                main_reservation_model.is_active = await _parent_is_active(session, updated_model.reservation_id)
                 main_reservation_model.updated_at = datetime.utcnow()
                 
                 logger.info("✅ Campos actualizados correctamente")
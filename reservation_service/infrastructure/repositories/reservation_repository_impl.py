@@ -1,23 +1,147 @@
 """
 Implementación del repositorio de reservas
 """
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, List, Optional, Tuple
 from datetime import datetime, date
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, insert, update, and_, or_, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 import logging
 
 from ...domain.entities.reservation import Reservation
+from ...domain.entities.main_reservation import MainReservation
+from ...domain.entities.sector_data import SectorData
 from ...domain.entities.reservation_status import ReservationStatus
 from ...domain.dto.requests.reservation_filter_request import ReservationFilterRequest
 from ...domain.interfaces.reservation_repository import ReservationRepository
-from ...domain.exceptions.reservation_exceptions import ReservationNotFoundException
+from ...domain.exceptions.reservation_exceptions import ReservationNotFoundException, ReservationConflictException
 from ...infrastructure.models.reservation import ReservationModel, ReservationOrderNumberModel
+from ...infrastructure.models.main_reservation import MainReservationModel, RAMP_PERIOD_EXCLUSION
 from commons.database import get_db_session
+from commons.pagination import apply_keyset, split_page
+from commons.counting import TotalCount, get_list_counter
 
 # Configurar logging
 logger = logging.getLogger(__name__)
 
+
+def _select_reservations():
+    """SELECT de reservas con order_numbers cargados en una sola consulta IN adicional"""
+    return select(ReservationModel).options(selectinload(ReservationModel.order_numbers))
+
+
+def _apply_filters(query, filter_request: ReservationFilterRequest):
+    """Aplicar los filtros de ReservationFilterRequest a una consulta de reservas"""
+    # Aplicar filtros
+    conditions = []
+    
+    if filter_request.user_id:
+        conditions.append(ReservationModel.user_id == filter_request.user_id)
+    
+    if filter_request.customer_id:
+        conditions.append(ReservationModel.customer_id == filter_request.customer_id)
+    
+    if filter_request.branch_id:
+        conditions.append(ReservationModel.branch_id == filter_request.branch_id)
+    
+    if filter_request.sector_id:
+        conditions.append(ReservationModel.sector_id == filter_request.sector_id)
+    
+    if filter_request.branch_name:
+        conditions.append(ReservationModel.branch_data['name'].astext.ilike(f"%{filter_request.branch_name}%"))
+    
+    if filter_request.branch_code:
+        # Usar filtro exacto para branch_code con sintaxis correcta de PostgreSQL JSON
+        conditions.append(func.json_extract_path_text(ReservationModel.branch_data, 'code') == filter_request.branch_code)
+    
+    if filter_request.sector_name:
+        conditions.append(ReservationModel.sector_data['name'].astext.ilike(f"%{filter_request.sector_name}%"))
+    
+    if filter_request.customer_name:
+        conditions.append(ReservationModel.customer_data['company_name'].astext.ilike(f"%{filter_request.customer_name}%"))
+    
+    if filter_request.customer_email:
+        conditions.append(ReservationModel.customer_data['email'].astext.ilike(f"%{filter_request.customer_email}%"))
+    
+    if filter_request.reservation_date_from:
+        conditions.append(ReservationModel.reservation_date >= filter_request.reservation_date_from)
+    
+    if filter_request.reservation_date_to:
+        conditions.append(ReservationModel.reservation_date <= filter_request.reservation_date_to)
+    
+    if filter_request.status:
+        # Manejar múltiples estados separados por comas
+        if "," in filter_request.status:
+            status_list = [status.strip() for status in filter_request.status.split(",")]
+            status_conditions = []
+            for status_str in status_list:
+                try:
+                    status_enum = ReservationStatus(status_str)
+                    status_conditions.append(ReservationModel.status == status_enum)
+                except ValueError:
+                    logger.warning(f"⚠️ Estado inválido ignorado: {status_str}")
+            
+            if status_conditions:
+                conditions.append(or_(*status_conditions))
+        else:
+            # Estado único
+            try:
+                status_enum = ReservationStatus(filter_request.status)
+                conditions.append(ReservationModel.status == status_enum)
+            except ValueError:
+                logger.warning(f"⚠️ Estado inválido ignorado: {filter_request.status}")
+    
+    if filter_request.order_code:
+        # Para el filtro de order_code necesitamos hacer un join
+        query = query.join(ReservationOrderNumberModel)
+        conditions.append(ReservationOrderNumberModel.code.ilike(f"%{filter_request.order_code}%"))
+    
+    if filter_request.cargo_type:
+        conditions.append(ReservationModel.cargo_type.ilike(f"%{filter_request.cargo_type}%"))
+    
+    # Aplicar condiciones si existen
+    if conditions:
+        query = query.where(and_(*conditions))
+    
+    return query
+
+
+# Claves del cursor del listado de reservas (orden del listado, id como desempate)
+RESERVATIONS_CURSOR = "reservations"
+
+
+def _reservation_sort_keys():
+    return [ReservationModel.reservation_date, ReservationModel.start_time, ReservationModel.id]
+
+
+# Tablas que lee el listado (sus escrituras invalidan los totales cacheados)
+_RESERVATION_TABLES = (ReservationModel.__tablename__, ReservationOrderNumberModel.__tablename__)
+
+
+# Estados que ocupan rampa/sector
+ACTIVE_STATUSES = [ReservationStatus.PENDING, ReservationStatus.CONFIRMED]
+
+
+def _overlaps(start_time: datetime, end_time: datetime):
+    """Condición de solapamiento [start_time, end_time) contra el período de la reserva (usa el índice GiST)"""
+    return ReservationModel.period.op("&&")(func.tsrange(start_time, end_time, '[)'))
+
+
+def _is_ramp_overlap(error: IntegrityError) -> bool:
+    """Indica si el error proviene de la restricción de exclusión de rampas"""
+    return RAMP_PERIOD_EXCLUSION in str(error.orig)
+
+
+async def _sync_main_reservations_active(session: AsyncSession, reservation_id: int, status: ReservationStatus) -> None:
+    """Propagar a las main_reservations si la reserva sigue ocupando sus rampas"""
+    await session.execute(
+        update(MainReservationModel)
+        .where(MainReservationModel.reservation_id == reservation_id)
+        .values(is_active=status in ACTIVE_STATUSES)
+    )
+
+
 class ReservationRepositoryImpl(ReservationRepository):
     """Implementación del repositorio para reservas"""
     
@@ -66,119 +190,168 @@ class ReservationRepositoryImpl(ReservationRepository):
                 await session.rollback()
                 raise
     
+    async def create_with_main_reservations(
+        self,
+        reservation: Reservation,
+        sectors: List[SectorData]
+    ) -> Tuple[Reservation, List[MainReservation]]:
+        """
+        Crear una reserva, sus números de pedido y una main_reservation por sector
+        en una única transacción (todo o nada)
+        
+        Args:
+            reservation: Reserva principal a crear
+            sectors: Datos de cada sector (incluye ramp_id y ramp_name)
+            
+        Returns:
+            Tuple[Reservation, List[MainReservation]]: Reserva creada y sus main_reservations
+        """
+        logger.info(f"💾 ReservationRepositoryImpl.create_with_main_reservations() iniciado ({len(sectors)} sectores)")
+        
+        async for session in get_db_session():
+            try:
+                reservation_model = ReservationModel.from_domain(reservation)
+                for order in reservation.order_numbers:
+                    reservation_model.order_numbers.append(ReservationOrderNumberModel(
+                        code=order.code,
+                        description=order.description
+                    ))
+                
+                session.add(reservation_model)
+                # Flush para obtener el ID de la reserva sin confirmar la transacción
+                await session.flush()
+                logger.info(f"✅ Reserva insertada con ID: {reservation_model.id}")
+                
+                main_reservation_rows = []
+                for sector in sectors:
+                    main_reservation_model = MainReservationModel.from_domain(MainReservation(
+                        sector_id=sector.sector_id,
+                        reservation_id=reservation_model.id,
+                        sector_data=sector,
+                        reservation_date=reservation.reservation_date,
+                        start_time=reservation.start_time,
+                        end_time=reservation.end_time
+                    ))
+                    main_reservation_rows.append({
+                        column.name: getattr(main_reservation_model, column.name)
+                        for column in MainReservationModel.__table__.columns
+                        if column.name not in ("id", "period", "is_active")
+                    })
+                
+                main_reservation_models = []
+                if main_reservation_rows:
+                    # Un único INSERT ... RETURNING para todas las main_reservations
+                    result = await session.scalars(
+                        insert(MainReservationModel).returning(MainReservationModel, sort_by_parameter_order=True),
+                        main_reservation_rows
+                    )
+                    main_reservation_models = result.all()
+                
+                await session.commit()
+                await session.refresh(reservation_model)
+                await session.refresh(reservation_model, attribute_names=['order_numbers'])
+                logger.info(f"✅ Reserva {reservation_model.id} y {len(main_reservation_models)} main_reservations confirmadas")
+                
+                return (
+                    reservation_model.to_domain(),
+                    [model.to_domain() for model in main_reservation_models]
+                )
+                
+            except IntegrityError as e:
+                await session.rollback()
+                if _is_ramp_overlap(e):
+                    logger.warning(f"⚠️ Rampa ya reservada en el horario {reservation.start_time} - {reservation.end_time}")
+                    raise ReservationConflictException(
+                        "Una de las rampas seleccionadas ya está reservada en ese horario",
+                        branch_id=reservation.branch_data.branch_id,
+                        sector_id=reservation.sector_data.sector_id
+                    )
+                logger.error(f"❌ Error de integridad en ReservationRepositoryImpl.create_with_main_reservations(): {str(e)}", exc_info=True)
+                raise
+            except Exception as e:
+                logger.error(f"❌ Error en ReservationRepositoryImpl.create_with_main_reservations(): {str(e)}", exc_info=True)
+                await session.rollback()
+                raise
+    
     async def get_by_id(self, reservation_id: int) -> Optional[Reservation]:
         """Obtener una reserva por ID"""
         async for session in get_db_session():
             result = await session.execute(
-                select(ReservationModel).where(ReservationModel.id == reservation_id)
+                _select_reservations().where(ReservationModel.id == reservation_id)
             )
             reservation_model = result.scalar_one_or_none()
             
             if not reservation_model:
                 return None
             
-            # Cargar explícitamente las relaciones
-            await session.refresh(reservation_model, attribute_names=['order_numbers'])
-            
             return reservation_model.to_domain()
     
-    async def list(self, filter_request: ReservationFilterRequest) -> Tuple[List[Reservation], int]:
-        """Listar reservas con filtros y paginación"""
+    async def list(self, filter_request: ReservationFilterRequest) -> Tuple[List[Reservation], Optional[TotalCount], Optional[str]]:
+        """
+        Listar reservas con filtros y paginación
+        
+        Con cursor la página se obtiene por keyset sobre (reservation_date,
+        start_time, id) en lugar de OFFSET; el total solo se calcula si se pide
+        y se devuelve junto con el modo que lo produjo.
+        """
         async for session in get_db_session():
-            # Construir la consulta base
-            query = select(ReservationModel)
-            
-            # Aplicar filtros
-            conditions = []
-            
-            if filter_request.user_id:
-                conditions.append(ReservationModel.user_id == filter_request.user_id)
-            
-            if filter_request.customer_id:
-                conditions.append(ReservationModel.customer_id == filter_request.customer_id)
-            
-            if filter_request.branch_id:
-                conditions.append(ReservationModel.branch_id == filter_request.branch_id)
-            
-            if filter_request.sector_id:
-                conditions.append(ReservationModel.sector_id == filter_request.sector_id)
-            
-            if filter_request.branch_name:
-                conditions.append(ReservationModel.branch_data['name'].astext.ilike(f"%{filter_request.branch_name}%"))
-            
-            if filter_request.branch_code:
-                # Usar filtro exacto para branch_code con sintaxis correcta de PostgreSQL JSON
-                conditions.append(func.json_extract_path_text(ReservationModel.branch_data, 'code') == filter_request.branch_code)
-            
-            if filter_request.sector_name:
-                conditions.append(ReservationModel.sector_data['name'].astext.ilike(f"%{filter_request.sector_name}%"))
-            
-            if filter_request.customer_name:
-                conditions.append(ReservationModel.customer_data['company_name'].astext.ilike(f"%{filter_request.customer_name}%"))
-            
-            if filter_request.customer_email:
-                conditions.append(ReservationModel.customer_data['email'].astext.ilike(f"%{filter_request.customer_email}%"))
-            
-            if filter_request.reservation_date_from:
-                conditions.append(ReservationModel.reservation_date >= filter_request.reservation_date_from)
-            
-            if filter_request.reservation_date_to:
-                conditions.append(ReservationModel.reservation_date <= filter_request.reservation_date_to)
-            
-            if filter_request.status:
-                # Manejar múltiples estados separados por comas
-                if "," in filter_request.status:
-                    status_list = [status.strip() for status in filter_request.status.split(",")]
-                    status_conditions = []
-                    for status_str in status_list:
-                        try:
-                            status_enum = ReservationStatus(status_str)
-                            status_conditions.append(ReservationModel.status == status_enum)
-                        except ValueError:
-                            logger.warning(f"⚠️ Estado inválido ignorado: {status_str}")
-                    
-                    if status_conditions:
-                        conditions.append(or_(*status_conditions))
-                else:
-                    # Estado único
-                    try:
-                        status_enum = ReservationStatus(filter_request.status)
-                        conditions.append(ReservationModel.status == status_enum)
-                    except ValueError:
-                        logger.warning(f"⚠️ Estado inválido ignorado: {filter_request.status}")
-            
-            if filter_request.order_code:
-                # Para el filtro de order_code necesitamos hacer un join
-                query = query.join(ReservationOrderNumberModel)
-                conditions.append(ReservationOrderNumberModel.code.ilike(f"%{filter_request.order_code}%"))
-            
-            if filter_request.cargo_type:
-                conditions.append(ReservationModel.cargo_type.ilike(f"%{filter_request.cargo_type}%"))
-            
-            # Aplicar condiciones si existen
-            if conditions:
-                query = query.where(and_(*conditions))
-            
-            # Contar total
-            count_query = select(func.count()).select_from(query.subquery())
-            result = await session.execute(count_query)
-            total = result.scalar()
-            
-            # Aplicar paginación y ordenamiento
-            query = query.offset(filter_request.offset).limit(filter_request.limit)
-            query = query.order_by(ReservationModel.reservation_date.desc(), ReservationModel.start_time.desc())
+            # Construir la consulta base con los filtros
+            query = _apply_filters(_select_reservations(), filter_request)
+            
+            # Total según el modo pedido (exacto, cacheado o estimado; opcional)
+            total = None
+            if filter_request.include_total:
+                total = await get_list_counter().count(
+                    session,
+                    query,
+                    _RESERVATION_TABLES,
+                    filter_request.count_mode
+                )
+            
+            # Aplicar ordenamiento y paginación (cursor u offset)
+            query = apply_keyset(
+                query,
+                RESERVATIONS_CURSOR,
+                _reservation_sort_keys(),
+                filter_request.cursor,
+                filter_request.limit,
+                offset=filter_request.offset,
+                descending=True
+            )
             
             # Ejecutar consulta
             result = await session.execute(query)
-            reservation_models = result.scalars().all()
-            
-            # Cargar explícitamente las relaciones para cada modelo
-            for model in reservation_models:
-                await session.refresh(model, attribute_names=['order_numbers'])
+            reservation_models, next_cursor = split_page(
+                result.scalars().all(),
+                RESERVATIONS_CURSOR,
+                filter_request.limit,
+                lambda model: (model.reservation_date, model.start_time, model.id)
+            )
             
             reservations = [model.to_domain() for model in reservation_models]
             
-            return reservations, total
+            return reservations, total, next_cursor
+    
+    async def stream(self, filter_request: ReservationFilterRequest, chunk_size: int = 500) -> AsyncIterator[List[Reservation]]:
+        """
+        Recorrer todas las reservas que cumplen los filtros (sin paginación)
+        
+        Usa un cursor del lado del servidor y entrega bloques de chunk_size
+        reservas, de modo que la memoria no depende del tamaño del resultado.
+        Abre su propia sesión: el CSV se genera después de que la unidad de
+        trabajo del request se confirma y se cierra.
+        """
+        async for session in get_db_session(standalone=True):
+            query = _apply_filters(_select_reservations(), filter_request)
+            query = query.order_by(
+                ReservationModel.reservation_date.desc(),
+                ReservationModel.start_time.desc(),
+                ReservationModel.id.desc()
+            ).execution_options(yield_per=chunk_size)
+            
+            result = await session.stream_scalars(query)
+            async for partition in result.partitions():
+                yield [model.to_domain() for model in partition]
     
     async def update(self, reservation: Reservation) -> Reservation:
         """Actualizar una reserva"""
@@ -267,7 +440,19 @@ class ReservationRepositoryImpl(ReservationRepository):
                 )
                 session.add(order_model)
             
-            await session.commit()
+            await _sync_main_reservations_active(session, reservation.id, reservation.status)
+            
+            try:
+                await session.commit()
+            except IntegrityError as e:
+                await session.rollback()
+                if _is_ramp_overlap(e):
+                    raise ReservationConflictException(
+                        f"Las rampas de la reserva {reservation.id} ya están ocupadas en ese horario",
+                        branch_id=reservation.branch_data.branch_id,
+                        sector_id=reservation.sector_data.sector_id
+                    )
+                raise
             await session.refresh(reservation_model)
             
             # Cargar explícitamente las relaciones
@@ -324,44 +509,30 @@ class ReservationRepositoryImpl(ReservationRepository):
     async def exists_conflict(self, branch_id: int, sector_id: int, start_time: datetime, end_time: datetime, exclude_id: Optional[int] = None) -> bool:
         """Verificar si existe un conflicto de horario"""
         async for session in get_db_session():
-            query = select(ReservationModel).where(
+            query = select(ReservationModel.id).where(
                 and_(
                     ReservationModel.branch_id == branch_id,
                     ReservationModel.sector_id == sector_id,
-                    ReservationModel.status.in_([ReservationStatus.PENDING, ReservationStatus.CONFIRMED]),
-                    or_(
-                        # Caso 1: La nueva reserva empieza durante una reserva existente
-                        and_(start_time >= ReservationModel.start_time, start_time < ReservationModel.end_time),
-                        # Caso 2: La nueva reserva termina durante una reserva existente
-                        and_(end_time > ReservationModel.start_time, end_time <= ReservationModel.end_time),
-                        # Caso 3: La nueva reserva contiene completamente una reserva existente
-                        and_(start_time <= ReservationModel.start_time, end_time >= ReservationModel.end_time)
-                    )
+                    ReservationModel.status.in_(ACTIVE_STATUSES),
+                    _overlaps(start_time, end_time)
                 )
             )
             
             if exclude_id:
                 query = query.where(ReservationModel.id != exclude_id)
             
-            result = await session.execute(query)
+            result = await session.execute(query.limit(1))
             return result.scalar_one_or_none() is not None
     
     async def check_conflicts(self, branch_id: int, sector_id: int, start_time: datetime, end_time: datetime, exclude_reservation_id: Optional[int] = None) -> List[Reservation]:
         """Verificar conflictos de horario y retornar las reservas que causan conflicto"""
         async for session in get_db_session():
-            query = select(ReservationModel).where(
+            query = _select_reservations().where(
                 and_(
                     ReservationModel.branch_id == branch_id,
                     ReservationModel.sector_id == sector_id,
-                    ReservationModel.status.in_([ReservationStatus.PENDING, ReservationStatus.CONFIRMED]),
-                    or_(
-                        # Caso 1: La nueva reserva empieza durante una reserva existente
-                        and_(start_time >= ReservationModel.start_time, start_time < ReservationModel.end_time),
-                        # Caso 2: La nueva reserva termina durante una reserva existente
-                        and_(end_time > ReservationModel.start_time, end_time <= ReservationModel.end_time),
-                        # Caso 3: La nueva reserva contiene completamente una reserva existente
-                        and_(start_time <= ReservationModel.start_time, end_time >= ReservationModel.end_time)
-                    )
+                    ReservationModel.status.in_(ACTIVE_STATUSES),
+                    _overlaps(start_time, end_time)
                 )
             )
             
@@ -371,78 +542,59 @@ class ReservationRepositoryImpl(ReservationRepository):
             result = await session.execute(query)
             reservation_models = result.scalars().all()
             
-            # Cargar explícitamente las relaciones para cada modelo
-            for model in reservation_models:
-                await session.refresh(model, attribute_names=['order_numbers'])
-            
             return [model.to_domain() for model in reservation_models]
     
     async def get_conflicting_reservation(self, branch_id: int, sector_id: int, start_time: datetime, end_time: datetime, exclude_id: Optional[int] = None) -> Optional[Reservation]:
         """Obtener la reserva que causa conflicto de horario"""
         async for session in get_db_session():
-            query = select(ReservationModel).where(
+            query = _select_reservations().where(
                 and_(
                     ReservationModel.branch_id == branch_id,
                     ReservationModel.sector_id == sector_id,
-                    ReservationModel.status.in_([ReservationStatus.PENDING, ReservationStatus.CONFIRMED]),
-                    or_(
-                        and_(start_time >= ReservationModel.start_time, start_time < ReservationModel.end_time),
-                        and_(end_time > ReservationModel.start_time, end_time <= ReservationModel.end_time),
-                        and_(start_time <= ReservationModel.start_time, end_time >= ReservationModel.end_time)
-                    )
+                    ReservationModel.status.in_(ACTIVE_STATUSES),
+                    _overlaps(start_time, end_time)
                 )
             )
             
             if exclude_id:
                 query = query.where(ReservationModel.id != exclude_id)
             
-            result = await session.execute(query)
+            result = await session.execute(query.order_by(ReservationModel.start_time).limit(1))
             reservation_model = result.scalar_one_or_none()
             
             if not reservation_model:
                 return None
             
-            # Cargar explícitamente las relaciones
-            await session.refresh(reservation_model, attribute_names=['order_numbers'])
-            
             return reservation_model.to_domain()
     
     async def get_by_user_id(self, user_id: int, limit: int = 10) -> List[Reservation]:
         """Obtener reservas por usuario"""
         async for session in get_db_session():
-            query = select(ReservationModel).where(
+            query = _select_reservations().where(
                 ReservationModel.user_id == user_id
             ).order_by(ReservationModel.reservation_date.desc(), ReservationModel.start_time.desc()).limit(limit)
             
             result = await session.execute(query)
             reservation_models = result.scalars().all()
             
-            # Cargar explícitamente las relaciones para cada modelo
-            for model in reservation_models:
-                await session.refresh(model, attribute_names=['order_numbers'])
-            
             return [model.to_domain() for model in reservation_models]
     
     async def get_by_customer_id(self, customer_id: int, limit: int = 10) -> List[Reservation]:
         """Obtener reservas por cliente"""
         async for session in get_db_session():
-            query = select(ReservationModel).where(
+            query = _select_reservations().where(
                 ReservationModel.customer_id == customer_id
             ).order_by(ReservationModel.reservation_date.desc(), ReservationModel.start_time.desc()).limit(limit)
             
             result = await session.execute(query)
             reservation_models = result.scalars().all()
             
-            # Cargar explícitamente las relaciones para cada modelo
-            for model in reservation_models:
-                await session.refresh(model, attribute_names=['order_numbers'])
-            
             return [model.to_domain() for model in reservation_models]
     
     async def get_by_branch_id(self, branch_id: int, date_from: Optional[datetime] = None, date_to: Optional[datetime] = None) -> List[Reservation]:
         """Obtener reservas por sucursal"""
         async for session in get_db_session():
-            query = select(ReservationModel).where(
+            query = _select_reservations().where(
                 ReservationModel.branch_id == branch_id
             )
             
@@ -457,16 +609,12 @@ class ReservationRepositoryImpl(ReservationRepository):
             result = await session.execute(query)
             reservation_models = result.scalars().all()
             
-            # Cargar explícitamente las relaciones para cada modelo
-            for model in reservation_models:
-                await session.refresh(model, attribute_names=['order_numbers'])
-            
             return [model.to_domain() for model in reservation_models]
     
     async def get_by_sector_id(self, sector_id: int, date_from: Optional[datetime] = None, date_to: Optional[datetime] = None) -> List[Reservation]:
         """Obtener reservas por sector"""
         async for session in get_db_session():
-            query = select(ReservationModel).where(
+            query = _select_reservations().where(
                 ReservationModel.sector_id == sector_id
             )
             
@@ -481,16 +629,12 @@ class ReservationRepositoryImpl(ReservationRepository):
             result = await session.execute(query)
             reservation_models = result.scalars().all()
             
-            # Cargar explícitamente las relaciones para cada modelo
-            for model in reservation_models:
-                await session.refresh(model, attribute_names=['order_numbers'])
-            
             return [model.to_domain() for model in reservation_models]
     
     async def get_active_reservations(self, branch_id: Optional[int] = None, sector_id: Optional[int] = None) -> List[Reservation]:
         """Obtener reservas activas (pendientes o confirmadas)"""
         async for session in get_db_session():
-            query = select(ReservationModel).where(
+            query = _select_reservations().where(
                 ReservationModel.status.in_([ReservationStatus.PENDING, ReservationStatus.CONFIRMED])
             )
             
@@ -505,10 +649,6 @@ class ReservationRepositoryImpl(ReservationRepository):
             result = await session.execute(query)
             reservation_models = result.scalars().all()
             
-            # Cargar explícitamente las relaciones para cada modelo
-            for model in reservation_models:
-                await session.refresh(model, attribute_names=['order_numbers'])
-            
             return [model.to_domain() for model in reservation_models]
     
     async def update_status(self, reservation_id: int, status: str) -> bool:
@@ -523,8 +663,19 @@ class ReservationRepositoryImpl(ReservationRepository):
             
             reservation_model.status = ReservationStatus(status)
             reservation_model.updated_at = datetime.utcnow()
+            await _sync_main_reservations_active(session, reservation_id, reservation_model.status)
             
-            await session.commit()
+            try:
+                await session.commit()
+            except IntegrityError as e:
+                await session.rollback()
+                if _is_ramp_overlap(e):
+                    raise ReservationConflictException(
+                        f"Las rampas de la reserva {reservation_id} ya están ocupadas en ese horario",
+                        branch_id=reservation_model.branch_id,
+                        sector_id=reservation_model.sector_id
+                    )
+                raise
             
             return True
     
@@ -534,7 +685,7 @@ class ReservationRepositoryImpl(ReservationRepository):
         
         async for session in get_db_session():
             # Construir la consulta base
-            query = select(ReservationModel).where(
+            query = _select_reservations().where(
                 and_(
                     ReservationModel.branch_id == branch_id,
                     # Verificar que haya solapamiento de períodos
@@ -558,8 +709,30 @@ class ReservationRepositoryImpl(ReservationRepository):
             
             logger.info(f"✅ Se encontraron {len(reservation_models)} reservas en el período")
             
-            # Cargar explícitamente las relaciones para cada modelo
-            for model in reservation_models:
-                await session.refresh(model, attribute_names=['order_numbers'])
+            return [model.to_domain() for model in reservation_models]
+    
+    async def get_busy_ramp_ids(self, branch_id: int, start_time: datetime, end_time: datetime) -> List[int]:
+        """Obtener los IDs de rampas ocupadas por reservas activas de la sucursal en [start_time, end_time)"""
+        logger.info(f"🚧 Obteniendo rampas ocupadas de la sucursal {branch_id} entre {start_time} y {end_time}")
+        
+        async for session in get_db_session():
+            # Una sola consulta: el solapamiento usa el índice GiST de main_reservations.period
+            query = (
+                select(MainReservationModel.ramp_id)
+                .join(ReservationModel, ReservationModel.id == MainReservationModel.reservation_id)
+                .where(
+                    and_(
+                        ReservationModel.branch_id == branch_id,
+                        ReservationModel.status.in_(ACTIVE_STATUSES),
+                        MainReservationModel.period.op("&&")(func.tsrange(start_time, end_time, '[)'))
+                    )
+                )
+                .distinct()
+                .order_by(MainReservationModel.ramp_id)
+            )
+            
+            result = await session.execute(query)
+            ramp_ids = list(result.scalars().all())
             
-            return [model.to_domain() for model in reservation_models] 
\ No newline at end of file
+            logger.info(f"✅ Rampas ocupadas: {ramp_ids}")
+            return ramp_ids
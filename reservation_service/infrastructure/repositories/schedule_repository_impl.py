@@ -1,8 +1,8 @@
 """
 Implementación del repositorio de horarios
 """
-from typing import List, Optional
-from datetime import date, datetime, time
+from typing import Dict, List, Optional
+from datetime import date, datetime, time, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_, func
 import logging
@@ -14,7 +14,9 @@ from ...domain.entities.reservation import Reservation
 from ...domain.interfaces.schedule_repository import ScheduleRepository
 from ...infrastructure.models.schedule import BranchScheduleModel
 from ...infrastructure.models.reservation import ReservationModel
+from .reservation_repository_impl import _select_reservations
 from commons.database import get_db_session
+from commons.slot_engine import IntervalIndex
 from ...domain.entities.reservation_status import ReservationStatus
 
 # Configurar logging
@@ -171,26 +173,62 @@ class ScheduleRepositoryImpl(ScheduleRepository):
         logger.info(f"📊 Encontradas {len(existing_reservations)} reservas existentes")
         
         # Marcar slots ocupados
-        for slot in base_slots:
-            for reservation in existing_reservations:
-                # Usar start_time y end_time directamente (son datetime)
-                reservation_start = reservation.start_time.time()
-                reservation_end = reservation.end_time.time()
-                
-                logger.debug(f"🔍 Comparando slot {slot.start_time}-{slot.end_time} con reserva {reservation_start}-{reservation_end}")
-                
-                # Verificar si hay solapamiento
-                if (slot.start_time < reservation_end and slot.end_time > reservation_start):
-                    slot.is_available = False
-                    slot.reservation_id = reservation.id
-                    logger.debug(f"❌ Slot {slot.start_time}-{slot.end_time} marcado como ocupado por reserva {reservation.id}")
-                    break
+        self._mark_occupied_slots(base_slots, existing_reservations)
         
         available_count = len([slot for slot in base_slots if slot.is_available])
         logger.info(f"✅ Slots disponibles: {available_count}/{len(base_slots)}")
         
         return base_slots
     
+    async def get_available_slots_range(self, branch_id: int, start_date: date,
+                                        end_date: date) -> Dict[date, List[TimeSlot]]:
+        """
+        Obtener slots de cada día de un rango (ambos extremos inclusive)
+        
+        Consulta los horarios de la sucursal y las reservas del rango una sola vez
+        y genera los slots de cada día en memoria.
+        """
+        logger.info(f"🔍 Obteniendo slots disponibles para branch_id: {branch_id}, rango: {start_date}..{end_date}")
+        
+        # Horarios activos de la sucursal por día de la semana (una sola consulta)
+        schedules = await self.list_by_branch(branch_id, is_active=True)
+        schedules_by_day = {schedule.day_of_week: schedule for schedule in schedules}
+        
+        # Reservas del rango agrupadas por fecha (una sola consulta)
+        reservations_by_date: Dict[date, List[Reservation]] = {}
+        for reservation in await self.get_reservations_for_range(branch_id, start_date, end_date):
+            reservations_by_date.setdefault(reservation.reservation_date.date(), []).append(reservation)
+        
+        slots_by_date: Dict[date, List[TimeSlot]] = {}
+        current_date = start_date
+        while current_date <= end_date:
+            schedule = schedules_by_day.get(DayOfWeek(current_date.isoweekday()))
+            if schedule is None:
+                slots_by_date[current_date] = []
+            else:
+                base_slots = schedule.generate_time_slots()
+                self._mark_occupied_slots(base_slots, reservations_by_date.get(current_date, []))
+                slots_by_date[current_date] = base_slots
+            current_date += timedelta(days=1)
+        
+        total_slots = sum(len(slots) for slots in slots_by_date.values())
+        logger.info(f"✅ {total_slots} slots generados para {len(slots_by_date)} días")
+        
+        return slots_by_date
+    
+    def _mark_occupied_slots(self, slots: List[TimeSlot], reservations: List[Reservation]) -> None:
+        """Marcar como ocupados los slots que se solapan con alguna reserva del día"""
+        # Reservas indexadas una sola vez por hora de inicio
+        reservation_index = IntervalIndex(
+            (reservation.start_time.time(), reservation.end_time.time())
+            for reservation in reservations
+        )
+        for slot in slots:
+            position = reservation_index.find_overlap(slot.start_time, slot.end_time)
+            if position is not None:
+                slot.is_available = False
+                slot.reservation_id = reservations[position].id
+    
     async def check_slot_availability(self, branch_id: int, target_date: date, 
                                     start_time: str, end_time: str) -> bool:
         """Verificar si un slot específico está disponible"""
@@ -210,18 +248,24 @@ class ScheduleRepositoryImpl(ScheduleRepository):
     
     async def get_reservations_for_date(self, branch_id: int, target_date: date) -> List[Reservation]:
         """Obtener reservas existentes para una fecha específica"""
+        return await self.get_reservations_for_range(branch_id, target_date, target_date)
+    
+    async def get_reservations_for_range(self, branch_id: int, start_date: date,
+                                         end_date: date) -> List[Reservation]:
+        """Obtener reservas existentes entre dos fechas (ambas inclusive)"""
         async for session in get_db_session():
-            logger.info(f"🔍 Buscando reservas para branch_id: {branch_id}, fecha: {target_date}")
+            logger.info(f"🔍 Buscando reservas para branch_id: {branch_id}, rango: {start_date}..{end_date}")
             
-            # Convertir target_date a datetime para comparar con reservation_date
-            target_datetime = datetime.combine(target_date, datetime.min.time())
-            next_day_datetime = datetime.combine(target_date.replace(day=target_date.day + 1), datetime.min.time())
+            # Convertir las fechas a datetime para comparar con reservation_date
+            start_datetime = datetime.combine(start_date, datetime.min.time())
+            end_datetime = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
             
-            stmt = select(ReservationModel).where(
+            # order_numbers se cargan con un SELECT IN (to_domain los lee; un lazy load fallaría en async)
+            stmt = _select_reservations().where(
                 and_(
                     ReservationModel.branch_id == branch_id,
-                    ReservationModel.reservation_date >= target_datetime,
-                    ReservationModel.reservation_date < next_day_datetime,
+                    ReservationModel.reservation_date >= start_datetime,
+                    ReservationModel.reservation_date < end_datetime,
                     ReservationModel.status.in_([ReservationStatus.CONFIRMED, ReservationStatus.PENDING])
                 )
             )
@@ -230,6 +274,6 @@ class ScheduleRepositoryImpl(ScheduleRepository):
             result = await session.execute(stmt)
             reservation_models = result.scalars().all()
             
-            logger.info(f"✅ Encontradas {len(reservation_models)} reservas para la fecha")
+            logger.info(f"✅ Encontradas {len(reservation_models)} reservas en el rango")
             
-            return [model.to_domain() for model in reservation_models] 
\ No newline at end of file
+            return [model.to_domain() for model in reservation_models]
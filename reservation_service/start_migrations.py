@@ -0,0 +1,41 @@
+"""
+Script para aplicar las migraciones del Reservation Service sobre una BD existente
+Uso: python start_migrations.py
+"""
+import asyncio
+import os
+import sys
+
+from dotenv import load_dotenv
+
+# Agregar el directorio raíz al path para poder importar commons y reservation_service
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+load_dotenv()
+
+from commons.database import get_db_manager
+from reservation_service.infrastructure.migrations import MIGRATIONS
+
+
+async def main():
+    if not os.getenv("RESERVATION_DATABASE_URL"):
+        print("❌ Error: RESERVATION_DATABASE_URL no configurado en .env")
+        sys.exit(1)
+
+    manager = get_db_manager(os.getenv("RESERVATION_DATABASE_URL"))
+    try:
+        for name, upgrade in MIGRATIONS:
+            print(f"🔄 Aplicando migración {name}...")
+            # Cada migración en su propia transacción
+            async with manager.engine.begin() as connection:
+                await upgrade(connection)
+            print(f"✅ Migración {name} aplicada")
+    except Exception as e:
+        print(f"❌ Error aplicando migraciones: {e}")
+        sys.exit(1)
+    finally:
+        await manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
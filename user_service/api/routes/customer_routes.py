@@ -30,6 +30,7 @@ from ...domain.exceptions.user_exceptions import (
 from ..middleware import auth_middleware
 from commons.error_utils import raise_not_found_error, raise_internal_error, raise_conflict_error
 from commons.error_codes import ErrorCode
+from commons.pagination import InvalidCursorError
 
 router = APIRouter(tags=["Customers"])
 
@@ -114,6 +115,7 @@ async def get_customers(
     is_active: Optional[bool] = Query(None, description="Filtrar por estado activo"),
     ruc: Optional[str] = Query(None, description="Filtrar por RUC"),
     address_id: Optional[UUID] = Query(None, description="Filtrar por ID de dirección"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (next_cursor); ignora skip"),
     db: AsyncSession = Depends(get_db_session)
 ):
     """Obtener todos los customers con filtros opcionales"""
@@ -127,10 +129,11 @@ async def get_customers(
             company_name=company_name,
             is_active=is_active,
             ruc=ruc,
-            address_id=address_id
+            address_id=address_id,
+            cursor=cursor
         )
         return result
-    except UserException as e:
+    except (UserException, InvalidCursorError) as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error inesperado: {str(e)}")
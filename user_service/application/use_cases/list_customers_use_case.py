@@ -6,6 +6,7 @@ from uuid import UUID
 from ...domain.interfaces.customer_repository import CustomerRepository
 from ...domain.dto.responses.customer_responses import CustomerListResponse, CustomerResponse
 from ...domain.exceptions.user_exceptions import UserException
+from commons.pagination import InvalidCursorError
 
 class ListCustomersUseCase:
     """Caso de uso para listar customers"""
@@ -21,18 +22,20 @@ class ListCustomersUseCase:
         company_name: Optional[str] = None,
         is_active: Optional[bool] = None,
         ruc: Optional[str] = None,
-        address_id: Optional[UUID] = None
+        address_id: Optional[UUID] = None,
+        cursor: Optional[str] = None
     ) -> CustomerListResponse:
         """Ejecutar el caso de uso"""
         try:
-            customers = await self.customer_repository.get_all(
+            customers, next_cursor = await self.customer_repository.get_all(
                 skip=skip, 
                 limit=limit,
                 username=username,
                 company_name=company_name,
                 is_active=is_active,
                 ruc=ruc,
-                address_id=address_id
+                address_id=address_id,
+                cursor=cursor
             )
             total = len(customers)  # TODO: Implementar count en repository
             
@@ -42,10 +45,11 @@ class ListCustomersUseCase:
                 customers=customer_responses,
                 total=total,
                 skip=skip,
-                limit=limit
+                limit=limit,
+                next_cursor=next_cursor
             )
             
-        except UserException:
+        except (UserException, InvalidCursorError):
             raise
         except Exception as e:
             raise UserException(f"Error inesperado al listar customers: {str(e)}") 
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 Implementación del repositorio de Customer
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete
@@ -15,6 +15,10 @@ from ...domain.exceptions.user_exceptions import (
     CustomerUsernameAlreadyExistsException
 )
 from ...infrastructure.models.customer import CustomerDB
+from commons.pagination import apply_keyset, split_page
+
+# Identificador del cursor del listado (orden por id)
+CUSTOMERS_CURSOR = "customers"
 
 
 class CustomerRepositoryImpl(CustomerRepository):
@@ -152,9 +156,15 @@ class CustomerRepositoryImpl(CustomerRepository):
         company_name: Optional[str] = None,
         is_active: Optional[bool] = None,
         ruc: Optional[str] = None,
-        address_id: Optional[UUID] = None
-    ) -> List[Customer]:
-        """Obtener todos los customers con filtros opcionales"""
+        address_id: Optional[UUID] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Customer], Optional[str]]:
+        """
+        Obtener todos los customers con filtros opcionales
+        
+        Con cursor la página se obtiene por keyset sobre el id en lugar de OFFSET.
+        Retorna la página y el cursor de la siguiente (None si es la última).
+        """
         query = select(CustomerDB)
         
         if username:
@@ -172,9 +182,14 @@ class CustomerRepositoryImpl(CustomerRepository):
         if address_id:
             query = query.where(CustomerDB.address_id == address_id)
         
-        query = query.offset(skip).limit(limit)
+        query = apply_keyset(query, CUSTOMERS_CURSOR, [CustomerDB.id], cursor, limit, offset=skip)
         result = await self.session.execute(query)
-        customers_db = result.scalars().all()
+        customers_db, next_cursor = split_page(
+            result.scalars().all(),
+            CUSTOMERS_CURSOR,
+            limit,
+            lambda customer_db: (customer_db.id,)
+        )
 
         return [
             Customer(
@@ -191,7 +206,7 @@ class CustomerRepositoryImpl(CustomerRepository):
                 is_active=customer_db.is_active
             )
             for customer_db in customers_db
-        ]
+        ], next_cursor
 
     async def update(self, customer_id: UUID, update_data: dict) -> Optional[Customer]:
         """Actualizar un customer"""
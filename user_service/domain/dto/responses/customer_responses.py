@@ -27,7 +27,8 @@ class CustomerListResponse(BaseModel):
     customers: List[CustomerResponse] = Field(..., description="Lista de clientes")
     total: int = Field(..., description="Total de clientes")
     skip: int = Field(..., description="Número de elementos omitidos")
-    limit: int = Field(..., description="Límite de elementos por página") 
+    limit: int = Field(..., description="Límite de elementos por página")
+    next_cursor: Optional[str] = Field(None, description="Cursor de la página siguiente (None si es la última)")
 
 class CustomerUpdatedResponse(BaseModel):
     """Response para actualizar un cliente"""
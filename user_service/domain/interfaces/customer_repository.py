@@ -2,7 +2,7 @@
 Interfaz del repositorio de Customer
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from ...domain.entities.customer import Customer
 
@@ -39,9 +39,10 @@ class CustomerRepository(ABC):
         company_name: Optional[str] = None,
         is_active: Optional[bool] = None,
         ruc: Optional[str] = None,
-        address_id: Optional[UUID] = None
-    ) -> List[Customer]:
-        """Obtener todos los customers con filtros opcionales"""
+        address_id: Optional[UUID] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Customer], Optional[str]]:
+        """Obtener todos los customers con filtros opcionales (página y cursor siguiente)"""
         pass
 
     @abstractmethod
@@ -16,8 +16,9 @@ async def create_tables():
     await db_manager.create_tables(Base)
 
 async def get_db_session() -> AsyncSession:
-    """Dependency para FastAPI (async)"""
-    async with db_manager.AsyncSessionLocal() as session:
+    """Dependency para FastAPI (async); en GET/HEAD la sesión puede leer de una réplica"""
+    session = await db_manager.create_session()
+    async with session:
         yield session
 
 async def test_connection() -> bool: